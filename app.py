@@ -2,8 +2,9 @@
 
 import os
 import sys
-import json
+import hashlib
 import tempfile
+from datetime import datetime
 from pathlib import Path
 
 # Add src so permitting_agent is importable when not installed (e.g. Render, python app.py)
@@ -17,6 +18,33 @@ from flask import Flask, jsonify, render_template, request, redirect, url_for, s
 app = Flask(__name__)
 app.secret_key = os.environ.get("SECRET_KEY", "dev-secret-change-in-production")
 
+MAX_CASES_PAGE = 500
+MAX_RUNS_PAGE = 500
+_intake_services: dict = {}
+_portal_runners: dict = {}
+
+
+def _intake_service():
+    """One IntakeService (and case store connection pool) per DATA_DIR, shared across requests."""
+    from permitting_agent.intake import IntakeService
+    data_dir = Path(os.environ.get("DATA_DIR", "data"))
+    svc = _intake_services.get(data_dir)
+    if svc is None:
+        svc = _intake_services[data_dir] = IntakeService(data_dir=data_dir)
+    return svc
+
+
+def _portal_runner():
+    """One PortalRunner (and run store connection pool) per DATA_DIR. The web process only creates runs and
+    records decisions; `permitting portal-runs work` executes them, so no request ever waits on a browser.
+    """
+    from permitting_agent.portal_automation import PortalRunner, RunStore
+    data_dir = Path(os.environ.get("DATA_DIR", "data"))
+    runner = _portal_runners.get(data_dir)
+    if runner is None:
+        runner = _portal_runners[data_dir] = PortalRunner(RunStore(data_dir / "portal_runs.db"))
+    return runner
+
 
 @app.route("/")
 def index():
@@ -51,13 +79,27 @@ def submit_online_crawl():
     crawled = False
     fields = list(DEFAULT_SUBMIT_FIELDS)
     try:
-        from permitting_agent.portal_crawl import crawl_form_fields
+        from permitting_agent.portal_crawl import FormSchemaCache, discover_form_schema
         from urllib.parse import urlparse
         parsed = urlparse(portal_url)
         if parsed.scheme and parsed.netloc:
-            raw = crawl_form_fields(portal_url)
-            if raw:
-                fields = [{"name": f["name"], "label": f["label"], "type": f.get("type", "text"), "required": f.get("required", False), "value": "", "placeholder": ""} for f in raw]
+            # Follows the portal's wizard pages; the schema is cached per URL under DATA_DIR/form_schemas
+            cache = FormSchemaCache(Path(os.environ.get("DATA_DIR", "data")) / "form_schemas")
+            schema = discover_form_schema(portal_url, cache=cache)
+            if schema.fields:
+                pages = [p.title or f"Page {i + 1}" for i, p in enumerate(schema.pages)]
+                fields = [
+                    {
+                        "name": f.name,
+                        "label": f.label,
+                        "type": f.type,
+                        "required": f.required,
+                        "value": "",
+                        "placeholder": "",
+                        "page": pages[f.page] if len(pages) > 1 else "",
+                    }
+                    for f in schema.fields
+                ]
                 crawled = True
     except Exception:
         pass
@@ -157,8 +199,23 @@ def fill_application_parse():
                 tmp_path = Path(tmp.name)
             try:
                 from permitting_agent.document_review.parsers import parse_document
-                result = parse_document(tmp_path)
-                if result.success and result.artifact and result.artifact.extracted_fields:
+                # Fillable PDFs: exact fields from the AcroForm; flat ones fall back to text heuristics
+                result = parse_document(tmp_path, mode="auto")
+                if result.success and result.artifact and result.artifact.form_fields:
+                    fields = [
+                        {
+                            "name": ff.name,
+                            "label": ff.label,
+                            "value": ff.value or "",
+                            "placeholder": "",
+                            "type": ff.type,
+                            "options": ff.options,
+                            "required": ff.required,
+                        }
+                        for ff in result.artifact.form_fields
+                        if not ff.read_only and ff.type != "signature"
+                    ]
+                elif result.success and result.artifact and result.artifact.extracted_fields:
                     for ef in result.artifact.extracted_fields:
                         fields.append({
                             "name": ef.name,
@@ -190,8 +247,9 @@ def fill_application_done():
     data = {k.replace("field_", ""): v for k, v in request.form.items() if k.startswith("field_") and v}
     session["filled_application_data"] = data
     if action == "download":
+        from permitting_agent.serialization import dumps
         return Response(
-            json.dumps(data, indent=2),
+            dumps(data, pretty=True),
             mimetype="application/json",
             headers={"Content-Disposition": "attachment; filename=application-data.json"},
         )
@@ -208,7 +266,6 @@ def create_case():
     if not jurisdiction or not address:
         return redirect(url_for("index"))
     try:
-        from permitting_agent.intake import IntakeService
         from permitting_agent.models import IntakeRequest, SiteDetails, ScopeOfWork, ScopeKind
         kind = ScopeKind(scope) if scope in ("small_cell", "fiber", "both") else ScopeKind.SMALL_CELL
         request_obj = IntakeRequest(
@@ -216,9 +273,7 @@ def create_case():
             site=SiteDetails(address=address, jurisdiction=jurisdiction),
             scope=ScopeOfWork(kind=kind),
         )
-        data_dir = Path(os.environ.get("DATA_DIR", "data"))
-        svc = IntakeService(data_dir=data_dir)
-        case = svc.create_case(request_obj)
+        case = _intake_service().create_case(request_obj)
         return render_template(
             "success.html",
             case_id=case.id,
@@ -230,6 +285,132 @@ def create_case():
         return render_template("index.html", error=str(e)), 422
 
 
+@app.route("/api/cases")
+def api_cases():
+    """Keyset-paginated case query: ?jurisdiction=&scope=&status=&created_from=&created_to=&limit=&cursor=&order=asc|desc.
+    Responses carry an ETag; send it back as If-None-Match to get 304 when the page is unchanged.
+    """
+    args = request.args
+    try:
+        limit = int(args.get("limit", 50))
+        if not 1 <= limit <= MAX_CASES_PAGE:
+            raise ValueError(f"limit must be between 1 and {MAX_CASES_PAGE}")
+        order = args.get("order", "asc")
+        if order not in ("asc", "desc"):
+            raise ValueError("order must be asc or desc")
+        created_from = datetime.fromisoformat(args["created_from"]) if args.get("created_from") else None
+        created_to = datetime.fromisoformat(args["created_to"]) if args.get("created_to") else None
+        cases, next_cursor = _intake_service().list_cases(
+            jurisdiction=args.get("jurisdiction") or None,
+            scope=args.get("scope") or None,
+            status=args.get("status") or None,
+            created_from=created_from,
+            created_to=created_to,
+            limit=limit,
+            cursor=args.get("cursor") or None,
+            descending=order == "desc",
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    from permitting_agent.serialization import dumps
+    body = dumps({"cases": cases, "count": len(cases), "next_cursor": next_cursor}, pretty=False)
+    etag = hashlib.sha1(body).hexdigest()
+    if etag in request.if_none_match:
+        return Response(status=304, headers={"ETag": f'"{etag}"'})
+    return Response(body, mimetype="application/json", headers={"ETag": f'"{etag}"', "Cache-Control": "no-cache"})
+
+
+# ----- Portal runs (approve each step from the web; a worker does the browsing) -----
+
+def _portal_run_response(run, status=200):
+    from permitting_agent.serialization import dump_json
+    return Response(dump_json(run, pretty=False), status=status, mimetype="application/json")
+
+
+@app.route("/api/portal-runs", methods=["POST"])
+def api_portal_runs_create():
+    """Start a portal submission for a case: {"case_id", "portal_url"?, "approve_each_step"?}. The run waits
+    (status awaiting_approval) at every step that needs a person; approve or reject it with the endpoints below.
+    """
+    from permitting_agent.adapters import get_adapter
+    from permitting_agent.portal_automation.service import case_documents
+    body = request.get_json(silent=True) or {}
+    case_id = str(body.get("case_id") or "").strip()
+    if not case_id:
+        return jsonify({"error": "case_id is required"}), 400
+    case = _intake_service().get_case(case_id)
+    if case is None:
+        return jsonify({"error": f"unknown case: {case_id}"}), 404
+    portal_url = body.get("portal_url")
+    if not portal_url:
+        adapter = get_adapter(case.request.jurisdiction)
+        portal_url = adapter.research_portal().portal_url if adapter else None
+    run = _portal_runner().start(
+        case_id,
+        portal_url=portal_url,
+        documents=case_documents(case),
+        approve_each_step=bool(body.get("approve_each_step", True)),
+    )
+    return _portal_run_response(run, 201)
+
+
+@app.route("/api/portal-runs")
+def api_portal_runs():
+    """Runs, oldest change first: ?status=awaiting_approval is the queue of steps waiting for a person."""
+    from permitting_agent.models import RunStatus
+    from permitting_agent.serialization import dumps
+    try:
+        status = RunStatus(request.args["status"]) if request.args.get("status") else None
+        limit = int(request.args.get("limit", 100))
+        if not 1 <= limit <= MAX_RUNS_PAGE:
+            raise ValueError(f"limit must be between 1 and {MAX_RUNS_PAGE}")
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    runs = _portal_runner().store.list(status=status, case_id=request.args.get("case_id") or None, limit=limit)
+    return Response(dumps({"runs": runs, "count": len(runs)}, pretty=False), mimetype="application/json")
+
+
+@app.route("/api/portal-runs/<run_id>")
+def api_portal_run(run_id):
+    run = _portal_runner().store.get(run_id)
+    if run is None:
+        return jsonify({"error": f"unknown run: {run_id}"}), 404
+    return _portal_run_response(run)
+
+
+@app.route("/api/portal-runs/<run_id>/approve", methods=["POST"])
+def api_portal_run_approve(run_id):
+    return _decide_portal_run(run_id, True)
+
+
+@app.route("/api/portal-runs/<run_id>/reject", methods=["POST"])
+def api_portal_run_reject(run_id):
+    return _decide_portal_run(run_id, False)
+
+
+def _decide_portal_run(run_id, approved):
+    """Record the decision on {"step", "actor"?} and return at once: 409 unless that step is the one pending."""
+    from permitting_agent.models import CaseEventKind
+    from permitting_agent.portal_automation.runs import RunStateError
+    body = request.get_json(silent=True) or {}
+    step = str(body.get("step") or "").strip()
+    if not step:
+        return jsonify({"error": "step is required"}), 400
+    actor = body.get("actor") or "web"
+    try:
+        run = _portal_runner().store.decide(run_id, step, approved, actor=actor)
+    except KeyError:
+        return jsonify({"error": f"unknown run: {run_id}"}), 404
+    except RunStateError as e:
+        return jsonify({"error": str(e)}), 409
+    kind = CaseEventKind.SUBMISSION_STEP_APPROVED if approved else CaseEventKind.SUBMISSION_STEP_DECLINED
+    try:
+        _intake_service().record_event(run.case_id, kind, {"step": step, "run": run.id}, actor=actor)
+    except KeyError:
+        pass
+    return _portal_run_response(run)
+
+
 @app.route("/jurisdictions")
 def adapters_page():
     try:
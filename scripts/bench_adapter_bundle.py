@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Adapter bundle benchmark: open + single lookup vs reading every spec file.
+
+Generates N declarative jurisdiction specs, compiles them into one bundle, then times:
+  - compile (validate all + write)
+  - open bundle and list ids (header + index only)
+  - first get of one jurisdiction's adapter (decode one spec)
+  - baseline: validate every JSON spec file (what loading without a bundle costs)
+
+Usage:
+  python scripts/bench_adapter_bundle.py --jurisdictions 5000
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+repo_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(repo_root / "src"))
+
+from permitting_agent.adapters.bundle import AdapterBundle, compile_bundle
+from permitting_agent.adapters.declarative import find_spec_files, load_spec_file
+
+
+def _spec(i: int) -> dict:
+    host = f"https://town{i}.example.gov"
+    return {
+        "jurisdiction_id": f"town_of_bench_{i}",
+        "name": f"Town of Bench {i}",
+        "state": "TX",
+        "aliases": [f"Bench {i}"],
+        "checklists": {
+            scope: [{"id": f"item_{j}", "label": f"Checklist item {j}", "typical_format": "PDF"} for j in range(8)]
+            for scope in ("small_cell", "fiber", "default")
+        },
+        "requirements": [
+            {"key": f"req_{j}", "label": f"Requirement {j}", "value": "$250", "certainty": "cited",
+             "sources": [{"url": f"{host}/permits", "fetched_at": "2025-01-01T00:00:00"}]}
+            for j in range(6)
+        ],
+        "portal_url": f"{host}/apply",
+        "contacts": [
+            {"role": role, "email": f"{role}@town{i}.example.gov", "source_url": f"{host}/contact",
+             "discovered_at": "2025-01-01T00:00:00"}
+            for role in ("planning", "engineering", "row", "clerk")
+        ],
+    }
+
+
+def _ms(start: float) -> float:
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jurisdictions", type=int, default=5000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        src = Path(tmp) / "specs"
+        src.mkdir()
+        for i in range(args.jurisdictions):
+            (src / f"town_{i}.json").write_text(json.dumps(_spec(i)))
+        out = Path(tmp) / "adapters.bundle"
+
+        t = time.perf_counter()
+        compile_bundle(src, out)
+        compile_ms = _ms(t)
+
+        t = time.perf_counter()
+        bundle = AdapterBundle(out)
+        count = len(bundle.ids())
+        open_ms = _ms(t)
+
+        t = time.perf_counter()
+        adapter = bundle.adapter(f"town_of_bench_{args.jurisdictions // 2}")
+        adapter.get_checklist("fiber")
+        lookup_ms = _ms(t)
+        bundle.close()
+
+        t = time.perf_counter()
+        for path in find_spec_files(src):
+            load_spec_file(path)
+        all_files_ms = _ms(t)
+        size_kb = out.stat().st_size // 1024
+
+    print(f"jurisdictions={count} bundle={size_kb}KB")
+    print(f"  compile (validate + write)  : {compile_ms:9.1f} ms")
+    print(f"  open bundle + list ids      : {open_ms:9.1f} ms")
+    print(f"  first lookup of one adapter : {lookup_ms:9.2f} ms")
+    print(f"  baseline: load every spec   : {all_files_ms:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
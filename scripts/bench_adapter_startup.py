@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Adapter registry startup benchmark: lazy manifest vs importing every adapter module.
+
+Generates N synthetic adapter modules exposed through ``permitting_agent.adapters`` entry
+points, then times fresh interpreters doing:
+  - list_adapters()                 (manifest only; should import no adapter module)
+  - get_adapter() for one adapter   (imports exactly one module)
+  - eager import of all N modules   (what a hard-coded registry costs)
+
+Usage:
+  python scripts/bench_adapter_startup.py --adapters 300 --runs 5 --max-ms 400
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+repo_root = Path(__file__).resolve().parent.parent
+
+ADAPTER_TEMPLATE = '''
+from permitting_agent.adapters.sample_jurisdiction import SampleJurisdictionAdapter
+
+
+class Adapter{i}(SampleJurisdictionAdapter):
+    """Synthetic adapter {i}."""
+
+    CHECKLIST_NOTES = {notes!r}
+
+    @property
+    def jurisdiction_name(self) -> str:
+        return "Bench City {i}"
+
+    @property
+    def jurisdiction_id(self) -> str:
+        return "bench_city_{i}"
+'''
+
+
+def _write_plugins(root: Path, count: int) -> None:
+    pkg = root / "bench_adapters"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("")
+    lines = ["[permitting_agent.adapters]"]
+    for i in range(count):
+        # Some bulk per module so import cost resembles a real adapter with data tables
+        notes = [f"requirement {i}-{j}" for j in range(50)]
+        (pkg / f"city_{i}.py").write_text(ADAPTER_TEMPLATE.format(i=i, notes=notes))
+        lines.append(f"bench_city_{i} = bench_adapters.city_{i}:Adapter{i}")
+    dist = root / "bench_adapters-0.0.dist-info"
+    dist.mkdir()
+    (dist / "METADATA").write_text("Metadata-Version: 2.1\nName: bench-adapters\nVersion: 0.0\n")
+    (dist / "entry_points.txt").write_text("\n".join(lines) + "\n")
+
+
+def _time_subprocess(code: str, env: dict[str, str], runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        proc = subprocess.run([sys.executable, "-B", "-c", code], env=env, capture_output=True, text=True)
+        samples.append((time.perf_counter() - start) * 1000)
+        if proc.returncode != 0:
+            raise SystemExit(proc.stderr)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--adapters", type=int, default=300)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-ms", type=float, default=0.0, help="Fail if lazy list_adapters startup exceeds this")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        _write_plugins(root, args.adapters)
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join([str(root), str(repo_root / "src")])
+
+        baseline = _time_subprocess("import permitting_agent.adapters", env, args.runs)
+        lazy_list = _time_subprocess(
+            "import sys\n"
+            "from permitting_agent.adapters import list_adapters\n"
+            f"assert len(list_adapters()) >= {args.adapters}\n"
+            "assert not any(m.startswith('bench_adapters.') for m in sys.modules)\n",
+            env,
+            args.runs,
+        )
+        lazy_get = _time_subprocess(
+            "from permitting_agent.adapters import get_adapter\n"
+            "assert get_adapter('bench_city_0') is not None\n",
+            env,
+            args.runs,
+        )
+        eager = _time_subprocess(
+            "import importlib\n"
+            "import permitting_agent.adapters\n"
+            f"for i in range({args.adapters}):\n"
+            "    importlib.import_module(f'bench_adapters.city_{i}')\n",
+            env,
+            args.runs,
+        )
+
+    print(f"adapters={args.adapters} runs={args.runs} (median wall ms per fresh interpreter)")
+    print(f"  import permitting_agent.adapters : {baseline:8.1f}")
+    print(f"  list_adapters() (lazy)          : {lazy_list:8.1f}")
+    print(f"  get_adapter() one jurisdiction  : {lazy_get:8.1f}")
+    print(f"  eager import of all adapters    : {eager:8.1f}")
+    if args.max_ms and lazy_list > args.max_ms:
+        raise SystemExit(f"list_adapters startup {lazy_list:.1f}ms exceeds budget {args.max_ms:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
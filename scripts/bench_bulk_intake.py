@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Bulk intake benchmark: rows/s and peak memory for CSV and GeoJSON rollout lists.
+
+Peak memory (tracemalloc) should stay flat as --rows grows: rows are streamed and
+committed in --batch-size transactions.
+
+Usage:
+  python scripts/bench_bulk_intake.py --rows 20000 --batch-size 500
+"""
+
+import argparse
+import csv
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+repo_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(repo_root / "src"))
+
+from permitting_agent.intake import IntakeService, import_cases
+
+
+def _write_inputs(tmp: Path, rows: int) -> tuple[Path, Path]:
+    csv_path = tmp / "rollout.csv"
+    with open(csv_path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["jurisdiction", "address", "scope", "lat", "lon", "pole_id"])
+        for i in range(rows):
+            # Poles ~45 m apart along a diagonal
+            writer.writerow(["City of Sample", f"{i} Pole Rd", "small_cell", 34 + i * 3e-4, -118.2 - i * 3e-4, f"P-{i}"])
+    geojson_path = tmp / "rollout.geojson"
+    with open(geojson_path, "w") as f:
+        f.write('{"type": "FeatureCollection", "features": [\n')
+        for i in range(rows):
+            feature = {
+                "type": "Feature",
+                "properties": {"jurisdiction": "City of Sample", "address": f"{i} Fiber Way", "scope": "fiber"},
+                "geometry": {"type": "Point", "coordinates": [-118.2 - i * 3e-4, 34 + i * 3e-4]},
+            }
+            f.write(("," if i else "") + json.dumps(feature) + "\n")
+        f.write("]}\n")
+    return csv_path, geojson_path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        inputs = _write_inputs(tmp_path, args.rows)
+        print(f"rows={args.rows} batch_size={args.batch_size}")
+        for src in inputs:
+            # Timing and memory are separate runs: tracemalloc slows SQLite-heavy code a lot
+            svc = IntakeService(data_dir=tmp_path / f"time_{src.suffix[1:]}")
+            t = time.perf_counter()
+            report = import_cases(svc, src, batch_size=args.batch_size)
+            elapsed = time.perf_counter() - t
+            svc.store.close()
+            svc = IntakeService(data_dir=tmp_path / f"mem_{src.suffix[1:]}")
+            tracemalloc.start()
+            import_cases(svc, src, batch_size=args.batch_size)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            svc.store.close()
+            print(
+                f"  {src.suffix:9s}: {report.created:,} cases in {elapsed:5.1f} s "
+                f"({report.created / elapsed:,.0f} rows/s), peak {peak / 2**20:.1f} MiB"
+            )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Case store benchmark: bulk load, id lookups and indexed queries on a large SQLite store.
+
+Loads N cases into a fresh SQLite store in batched transactions, then times:
+  - get by id (random ids)
+  - newest-first page of one jurisdiction's cases (indexed)
+  - jurisdiction + scope filter (indexed)
+  - a keyset (cursor) page from the middle of the store, newest first
+  - appending a case event vs rewriting the whole case, reads with pending events, and
+    appends from several threads at once
+and, for comparison, the same jurisdiction query against the legacy JSON directory on a
+smaller sample (it must open every file).
+
+Usage:
+  python scripts/bench_case_store.py --cases 100000
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+repo_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(repo_root / "src"))
+
+from permitting_agent.intake import JsonCaseStore, SqliteCaseStore
+from permitting_agent.models import (
+    CaseEvent,
+    CaseEventKind,
+    IntakeCase,
+    IntakeRequest,
+    ScopeKind,
+    ScopeOfWork,
+    SiteDetails,
+)
+
+T0 = datetime(2024, 1, 1)
+SCOPES = [ScopeKind.SMALL_CELL, ScopeKind.FIBER, ScopeKind.BOTH]
+
+
+def _case(i: int, jurisdictions: int) -> IntakeCase:
+    jurisdiction = f"Town of Bench {i % jurisdictions}"
+    request = IntakeRequest(
+        jurisdiction=jurisdiction,
+        site=SiteDetails(address=f"{i} Pole Rd", jurisdiction=jurisdiction, lat=30 + i * 1e-5, lon=-97 - i * 1e-5),
+        scope=ScopeOfWork(kind=SCOPES[i % 3]),
+    )
+    created = T0 + timedelta(seconds=i)
+    return IntakeCase(id=f"c{i:08d}", request=request, created_at=created, updated_at=created)
+
+
+def _timed(fn, runs: int) -> tuple[float, float]:
+    samples = []
+    for _ in range(runs):
+        t = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.95) - 1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cases", type=int, default=100_000)
+    parser.add_argument("--jurisdictions", type=int, default=500)
+    parser.add_argument("--json-sample", type=int, default=5000, help="Cases in the legacy JSON comparison")
+    parser.add_argument("--pending", type=int, default=20, help="Unsnapshotted events per case for the replay read")
+    parser.add_argument("--threads", type=int, default=4, help="Concurrent event writers")
+    args = parser.parse_args()
+    rng = random.Random(0)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SqliteCaseStore(Path(tmp) / "cases.db")
+        t = time.perf_counter()
+        batch = []
+        for i in range(args.cases):
+            batch.append(_case(i, args.jurisdictions))
+            if len(batch) == 1000:
+                store.save_many(batch)
+                batch = []
+        store.save_many(batch)
+        load_s = time.perf_counter() - t
+
+        get = _timed(lambda: store.get(f"c{rng.randrange(args.cases):08d}"), 2000)
+        by_j = _timed(lambda: store.query(jurisdiction=f"Town of Bench {rng.randrange(args.jurisdictions)}", limit=50), 500)
+        by_js = _timed(
+            lambda: store.query(jurisdiction=f"town of bench {rng.randrange(args.jurisdictions)}", scope="fiber", limit=50), 500
+        )
+        deep = T0 + timedelta(seconds=args.cases // 2)
+        keyset = _timed(lambda: store.query(after=(deep, "c"), descending=True, limit=50), 500)
+
+        def step_event(case_id: str) -> CaseEvent:
+            return CaseEvent(case_id=case_id, kind=CaseEventKind.SUBMISSION_STEP_APPROVED, data={"step": "upload"})
+
+        append = _timed(lambda: store.append([step_event(f"c{rng.randrange(args.cases):08d}")]), 1000)
+
+        def rewrite() -> None:
+            case = store.get(f"c{rng.randrange(args.cases):08d}")
+            case.meta.setdefault("approved_steps", []).append("upload")
+            store.save(case)
+
+        rewrite_t = _timed(rewrite, 1000)
+        hot = [f"c{i:08d}" for i in rng.sample(range(args.cases), 200)]
+        store.compact(min_events=1)
+        store.append(step_event(case_id) for case_id in hot for _ in range(args.pending))
+        replay_get = _timed(lambda: store.get(rng.choice(hot)), 500)
+        store.compact(min_events=1)
+        snap_get = _timed(lambda: store.get(rng.choice(hot)), 500)
+
+        per_thread = 500
+        threads = [
+            threading.Thread(target=lambda: [store.append([step_event(hot[0])]) for _ in range(per_thread)])
+            for _ in range(args.threads)
+        ]
+        t = time.perf_counter()
+        for th in threads:
+            th.start()
+        for th in threads:
+            th.join()
+        concurrent_s = time.perf_counter() - t
+        store.close()
+
+        legacy = JsonCaseStore(Path(tmp) / "cases")
+        legacy.save_many(_case(i, args.jurisdictions) for i in range(args.json_sample))
+        json_q = _timed(lambda: legacy.query(jurisdiction="Town of Bench 7", limit=50), 3)
+
+    print(f"cases={args.cases} jurisdictions={args.jurisdictions}")
+    print(f"  bulk load (1000/txn)           : {load_s:8.1f} s ({args.cases / load_s:,.0f} cases/s)")
+    print(f"  get by id          p50/p95     : {get[0]:8.3f} / {get[1]:.3f} ms")
+    print(f"  jurisdiction page  p50/p95     : {by_j[0]:8.3f} / {by_j[1]:.3f} ms")
+    print(f"  jurisdiction+scope p50/p95     : {by_js[0]:8.3f} / {by_js[1]:.3f} ms")
+    print(f"  keyset page mid-store (desc)   : {keyset[0]:8.3f} / {keyset[1]:.3f} ms")
+    print(f"  append one event   p50/p95     : {append[0]:8.3f} / {append[1]:.3f} ms")
+    print(f"  rewrite whole case p50/p95     : {rewrite_t[0]:8.3f} / {rewrite_t[1]:.3f} ms")
+    print(f"  {f'get, {args.pending} pending events':<31}: {replay_get[0]:8.3f} / {replay_get[1]:.3f} ms")
+    print(f"  get after compaction           : {snap_get[0]:8.3f} / {snap_get[1]:.3f} ms")
+    appends = args.threads * per_thread
+    print(f"  {f'{args.threads} threads -> one case':<31}: {appends / concurrent_s:8,.0f} events/s")
+    print(f"  legacy JSON dir query ({args.json_sample} cases): {json_q[0]:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Contact index benchmark: merge contacts across jurisdictions and re-verify them against a mock
+city staff directory (no real city servers).
+
+Crawls --directory-pages mock directory pages once, merges the contacts into a fresh index under
+--jurisdictions jurisdictions (regional staff listed everywhere), then ages them past the refresh
+window and re-verifies: first with every page unchanged (conditional GETs answered 304), then
+with --edited pages changed. Reports requests made against the full recrawl they replace.
+
+Usage:
+  python scripts/bench_contact_refresh.py --directory-pages 313 --staff-per-page 20 --edited 15
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+repo_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(repo_root / "src"))
+sys.path.insert(0, str(repo_root))
+
+from permitting_agent.outreach import ContactCrawler, ContactIndex
+from tests.mock_portal import MockPortal, MockPortalConfig
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--directory-pages", type=int, default=313)
+    parser.add_argument("--staff-per-page", type=int, default=20)
+    parser.add_argument("--jurisdictions", type=int, default=3)
+    parser.add_argument("--edited", type=int, default=15, help="Directory pages changed before the second refresh")
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    config = MockPortalConfig(page_count=5, directory_pages=args.directory_pages, staff_per_page=args.staff_per_page)
+    now = datetime.utcnow()
+    with MockPortal(config) as portal, tempfile.TemporaryDirectory() as tmp:
+        crawler = ContactCrawler(concurrency=args.concurrency, max_pages=100_000)
+        before = portal.request_count
+        contact_list = asyncio.run(crawler.crawl("City 0", [portal.url + "/directory/"]))
+        crawl_requests, crawl_s = portal.request_count - before, crawler.stats.elapsed_s
+
+        index = ContactIndex(Path(tmp) / "contacts.db")
+        start = time.perf_counter()
+        for j in range(args.jurisdictions):
+            index.add(contact_list.model_copy(update={"jurisdiction": f"City {j}"}), now=now, validators=crawler.stats.validators)
+        merge_s = time.perf_counter() - start
+        counts = index.counts(now=now)
+        print(
+            f"contacts={counts['active']} source pages={counts['sources']} "
+            f"({len(contact_list.contacts) * args.jurisdictions} sightings in {args.jurisdictions} jurisdictions, "
+            f"merged in {merge_s * 1000:.0f} ms)"
+        )
+        print(f"  full crawl: {crawl_requests} requests in {crawl_s:.2f} s")
+
+        for label, when in (("unchanged", now + timedelta(days=31)), ("edited", now + timedelta(days=62))):
+            if label == "edited":
+                for page in range(0, args.directory_pages, max(1, args.directory_pages // max(args.edited, 1)))[: args.edited]:
+                    portal.remove_staff(page, 0)
+            before, not_modified = portal.request_count, portal.not_modified_count
+            report = asyncio.run(index.refresh(timedelta(days=30), crawler, now=when))
+            print(
+                f"  refresh ({label}): {portal.request_count - before} requests "
+                f"({portal.not_modified_count - not_modified} answered 304) in {report.elapsed_s:.2f} s; "
+                f"verified {report.verified}, changed pages {report.changed}, removed {report.removed}"
+            )
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
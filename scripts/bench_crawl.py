@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""Crawl load benchmark against the local mock portal (no real city servers).
+
+Measures pages/second, p50/p95 fetch latency and peak Python memory for:
+  - portal research crawl (robots.txt + fetch_page over the whole synthetic site)
+  - portal_crawl.crawl_form_fields on a large application form
+  - portal_crawl.FormDiscovery over a multi-page wizard: one page at a time, concurrent, then
+    served from the schema cache
+
+Usage:
+  python scripts/bench_crawl.py --pages 500 --depth 4 --form-fields 400 --json bench.json
+  python scripts/bench_crawl.py --wizard-pages 8 --wizard-delay 0.15
+"""
+
+import argparse
+import json
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import deque
+from pathlib import Path
+from urllib.parse import urljoin, urlparse
+
+repo_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(repo_root / "src"))
+sys.path.insert(0, str(repo_root))
+
+import httpx
+from bs4 import BeautifulSoup
+
+from permitting_agent.portal_crawl import FormDiscovery, FormSchemaCache, crawl_form_fields, discover_form_schema
+from permitting_agent.portal_research.crawler import can_fetch, fetch_page, get_robots_parser
+from tests.mock_portal import MockPortal, MockPortalConfig
+
+
+def _p95(values: list[float]) -> float:
+    if not values:
+        return 0.0
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=20)[-1]
+
+
+def _summary(name: str, latencies: list[float], elapsed: float, peak_bytes: int, **extra) -> dict:
+    return {
+        "name": name,
+        "pages": len(latencies),
+        "elapsed_s": round(elapsed, 4),
+        "pages_per_s": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(statistics.median(latencies) * 1000, 2) if latencies else 0.0,
+        "p95_ms": round(_p95(latencies) * 1000, 2),
+        "peak_mem_kb": peak_bytes // 1024,
+        **extra,
+    }
+
+
+def bench_research_crawl(portal: MockPortal, rate_limit_rps: float) -> dict:
+    """BFS over the site using the portal_research crawler primitives."""
+    latencies: list[float] = []
+    skipped_robots = 0
+    not_ok = 0
+    origin = urlparse(portal.url).netloc
+    tracemalloc.start()
+    start = time.perf_counter()
+    with httpx.Client() as client:
+        robots = get_robots_parser(portal.url, client=client)
+        seen = {portal.url + "/"}
+        queue = deque(seen)
+        last_fetch: float | None = None
+        while queue:
+            url = queue.popleft()
+            if not can_fetch(robots, url):
+                skipped_robots += 1
+                continue
+            t0 = time.perf_counter()
+            body, _source = fetch_page(url, client=client, rate_limit_rps=rate_limit_rps, last_fetch_time=last_fetch)
+            last_fetch = time.monotonic()
+            latencies.append(time.perf_counter() - t0)
+            if body is None:
+                not_ok += 1
+                continue
+            if url.endswith(".pdf"):
+                continue
+            for a in BeautifulSoup(body, "html.parser").find_all("a", href=True):
+                nxt = urljoin(url, a["href"])
+                if urlparse(nxt).netloc == origin and nxt not in seen:
+                    seen.add(nxt)
+                    queue.append(nxt)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return _summary("research_crawl", latencies, elapsed, peak, skipped_robots=skipped_robots, not_ok=not_ok)
+
+
+def bench_form_fields(portal: MockPortal, repeat: int) -> dict:
+    """Repeatedly crawl the large application form with a shared client."""
+    latencies: list[float] = []
+    field_count = 0
+    tracemalloc.start()
+    start = time.perf_counter()
+    with httpx.Client() as client:
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            fields = crawl_form_fields(f"{portal.url}/apply", client=client)
+            latencies.append(time.perf_counter() - t0)
+            field_count = max(field_count, len(fields))
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return _summary("crawl_form_fields", latencies, elapsed, peak, fields=field_count)
+
+
+def bench_form_discovery(portal: MockPortal, concurrency: int, name: str) -> dict:
+    """Discover the whole /wizard/ application once."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    discovery = FormDiscovery(concurrency=concurrency)
+    schema = asyncio.run(discovery.discover(f"{portal.url}/wizard/0"))
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    latencies = [elapsed / max(discovery.stats.fetched, 1)] * discovery.stats.fetched
+    return _summary(name, latencies, elapsed, peak, form_pages=len(schema.pages), fields=len(schema.fields))
+
+
+def bench_cached_schema(portal: MockPortal, repeat: int) -> dict:
+    """discover_form_schema behind a FormSchemaCache: one crawl, then cache hits."""
+    url = f"{portal.url}/wizard/0"
+    latencies: list[float] = []
+    tracemalloc.start()
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = FormSchemaCache(Path(tmp))
+        discover_form_schema(url, cache=cache)
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            schema = discover_form_schema(url, cache=cache)
+            latencies.append(time.perf_counter() - t0)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return _summary("form_schema_cached", latencies, elapsed, peak, fields=len(schema.fields))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--form-fields", type=int, default=300)
+    parser.add_argument("--form-repeat", type=int, default=20)
+    parser.add_argument("--slow-delay", type=float, default=0.05)
+    parser.add_argument("--throttle-every", type=int, default=0)
+    parser.add_argument("--pdf-kb", type=int, default=1024)
+    parser.add_argument("--rps", type=float, default=0.0, help="Crawler rate limit; 0 = unthrottled")
+    parser.add_argument("--wizard-pages", type=int, default=8, help="Steps of the multi-page application")
+    parser.add_argument("--wizard-delay", type=float, default=0.1, help="Mock portal seconds per wizard page")
+    parser.add_argument("--json", type=Path, default=None, help="Also write results as JSON")
+    args = parser.parse_args()
+
+    config = MockPortalConfig(
+        page_count=args.pages,
+        link_depth=args.depth,
+        slow_delay=args.slow_delay,
+        throttle_every=args.throttle_every,
+        pdf_bytes=args.pdf_kb * 1024,
+        form_field_count=args.form_fields,
+        wizard_pages=args.wizard_pages,
+        wizard_delay=args.wizard_delay,
+    )
+    with MockPortal(config) as portal:
+        results = [
+            bench_research_crawl(portal, args.rps),
+            bench_form_fields(portal, args.form_repeat),
+            bench_form_discovery(portal, 1, "form_discovery_seq"),
+            bench_form_discovery(portal, 8, "form_discovery"),
+            bench_cached_schema(portal, args.form_repeat),
+        ]
+    for r in results:
+        extra = {k: v for k, v in r.items() if k not in ("name", "pages", "elapsed_s", "pages_per_s", "p50_ms", "p95_ms", "peak_mem_kb")}
+        print(
+            f"{r['name']:<20} pages={r['pages']:<6} {r['pages_per_s']:>8} pages/s  "
+            f"p50={r['p50_ms']}ms p95={r['p95_ms']}ms  peak={r['peak_mem_kb']}KB  {extra}"
+        )
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
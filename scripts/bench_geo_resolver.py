@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Spatial resolver benchmark: index build time and per-point latency over synthetic boundaries.
+
+Builds N irregular "city" polygons (V vertices each) inside M counties and resolves random
+points one at a time and in a batch.
+
+Usage:
+  python scripts/bench_geo_resolver.py --cities 2000 --vertices 400 --points 100000
+"""
+
+import argparse
+import math
+import random
+import sys
+import time
+from pathlib import Path
+
+repo_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(repo_root / "src"))
+
+from permitting_agent.geo import JurisdictionResolver
+
+
+def _blob(cx: float, cy: float, r: float, n: int, rng: random.Random) -> list[list[float]]:
+    ring = []
+    for i in range(n):
+        a = 2 * math.pi * i / n
+        rr = r * (1 + 0.5 * (rng.random() - 0.5))
+        ring.append([cx + rr * math.cos(a), cy + rr * math.sin(a)])
+    return ring + [ring[0]]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cities", type=int, default=2000)
+    parser.add_argument("--counties", type=int, default=100)
+    parser.add_argument("--vertices", type=int, default=400)
+    parser.add_argument("--points", type=int, default=100000)
+    args = parser.parse_args()
+
+    rng = random.Random(11)
+    features = []
+    side = math.ceil(math.sqrt(args.counties))
+    for k in range(args.counties):
+        x0, y0 = -120 + (k % side), 30 + (k // side)
+        square = [[x0, y0], [x0 + 1, y0], [x0 + 1, y0 + 1], [x0, y0 + 1], [x0, y0]]
+        features.append({"type": "Feature", "properties": {"jurisdiction_id": f"county_{k}", "level": "county"},
+                         "geometry": {"type": "Polygon", "coordinates": [square]}})
+    for k in range(args.cities):
+        cx, cy = rng.uniform(-120, -120 + side), rng.uniform(30, 30 + side)
+        features.append({"type": "Feature", "properties": {"jurisdiction_id": f"city_{k}", "level": "municipal"},
+                         "geometry": {"type": "Polygon", "coordinates": [_blob(cx, cy, 0.05, args.vertices, rng)]}})
+
+    t = time.perf_counter()
+    resolver = JurisdictionResolver(features)
+    build_s = time.perf_counter() - t
+    points = [(rng.uniform(30, 30 + side), rng.uniform(-120, -120 + side)) for _ in range(args.points)]
+
+    t = time.perf_counter()
+    for lat, lon in points:
+        resolver.resolve(lat, lon)
+    single_us = (time.perf_counter() - t) / len(points) * 1e6
+    t = time.perf_counter()
+    results = resolver.resolve_many(points)
+    batch_us = (time.perf_counter() - t) / len(points) * 1e6
+    in_city = sum(1 for r in results if r and r[0].level == "municipal")
+
+    print(f"jurisdictions={len(resolver)} vertices/city={args.vertices} cell={resolver.cell_size:.4f}deg")
+    print(f"  build          : {build_s:8.2f} s")
+    print(f"  resolve()      : {single_us:8.2f} us/point")
+    print(f"  resolve_many() : {batch_us:8.2f} us/point  ({in_city} of {len(points)} points in a city)")
+
+
+if __name__ == "__main__":
+    main()
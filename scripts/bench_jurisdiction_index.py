@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Jurisdiction name index benchmark: build time and per-lookup latency at US scale.
+
+Builds a JurisdictionIndex of N synthetic jurisdictions (cities, towns and counties across
+all states) and times exact, variant-spelling and misspelled (fuzzy) lookups.
+
+Usage:
+  python scripts/bench_jurisdiction_index.py --jurisdictions 20000 --lookups 5000
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+repo_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(repo_root / "src"))
+
+from permitting_agent.adapters.index import US_STATES, JurisdictionIndex
+
+SYLLABLES = ["san", "ta", "mar", "ville", "ton", "wood", "spring", "field", "lake", "bur", "ford",
+             "ham", "ley", "ridge", "dale", "port", "glen", "mont", "clair", "ash", "oak", "bel", "ros"]
+
+
+def _synthetic(n: int, rng: random.Random) -> list[tuple[str, str, str]]:
+    states = sorted(set(US_STATES.values()))
+    seen: set[str] = set()
+    out = []
+    while len(out) < n:
+        core = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))).title()
+        kind = rng.choice(["City", "City", "Town", "County"])
+        state = rng.choice(states)
+        jid = f"{kind}_of_{core}_{state}".lower()
+        if jid in seen:
+            continue
+        seen.add(jid)
+        out.append((jid, f"{kind} of {core}", state))
+    return out
+
+
+def _typo(text: str, rng: random.Random) -> str:
+    i = rng.randrange(1, len(text) - 1)
+    return text[:i] + text[i + 1] + text[i] + text[i + 2:]
+
+
+def _time_lookups(index: JurisdictionIndex, names: list[str]) -> tuple[float, float, float]:
+    samples = []
+    hits = 0
+    for name in names:
+        t0 = time.perf_counter()
+        if index.lookup(name) is not None:
+            hits += 1
+        samples.append((time.perf_counter() - t0) * 1e6)
+    return statistics.median(samples), statistics.quantiles(samples, n=20)[-1], hits / len(names)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jurisdictions", type=int, default=20000)
+    parser.add_argument("--lookups", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    data = _synthetic(args.jurisdictions, rng)
+    start = time.perf_counter()
+    index = JurisdictionIndex()
+    for jid, name, state in data:
+        index.add(jid, [name], state=state)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    sample = [rng.choice(data) for _ in range(args.lookups)]
+    cases = {
+        "exact id": [jid for jid, _, _ in sample],
+        "variant": [f"{name.split(' of ', 1)[1]} {name.split(' ', 1)[0]}, {state.upper()}" for _, name, state in sample],
+        "misspelled": [f"{_typo(name, rng)}, {state.upper()}" for _, name, state in sample],
+    }
+    print(f"jurisdictions={len(index)} build={build_ms:.0f}ms")
+    for label, names in cases.items():
+        p50, p95, hit_rate = _time_lookups(index, names)
+        print(f"  {label:<11} p50={p50:7.1f}us p95={p95:7.1f}us hit_rate={hit_rate:.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Outreach draft benchmark: bulk rendering for thousands of jurisdictions, streamed vs collected.
+
+Writes synthetic contact list JSON files (four roles each) and a template directory with
+per-jurisdiction overrides for a fraction of them, then compares:
+  - collect: render every OutreachDraft into one list and dump it as a JSON array
+  - stream:  render from compiled, cached templates straight into an mbox file
+Peak memory (tracemalloc, separate run) should stay flat for the streamed path as
+--jurisdictions grows.
+
+Usage:
+  python scripts/bench_outreach_drafts.py --jurisdictions 5000
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+repo_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(repo_root / "src"))
+
+from permitting_agent.models import Contact, ContactList
+from permitting_agent.outreach import MboxWriter, OutreachService, TemplateLibrary, iter_contact_lists
+from permitting_agent.serialization import dumps, write_model
+
+ROLES = ("planning", "engineering", "row", "clerk")
+
+
+def _setup(tmp: Path, jurisdictions: int, overrides: float) -> tuple[Path, Path]:
+    contacts_dir = tmp / "contacts"
+    templates_dir = tmp / "templates"
+    (templates_dir).mkdir()
+    (templates_dir / "default.txt").write_text(
+        "Subject: Permit inquiry - $jurisdiction\n\nHello $contact_name,\n\n"
+        "We are preparing telecom permit applications within $jurisdiction.\n" * 3
+    )
+    every = max(1, int(1 / overrides)) if overrides > 0 else 0
+    for i in range(jurisdictions):
+        name = f"Town of Bench {i}"
+        contacts = [Contact(role=r, name=f"{r.title()} {i}", email=f"{r}@bench{i}.gov") for r in ROLES]
+        write_model(contacts_dir / f"Town_of_Bench_{i}_contacts.json", ContactList(jurisdiction=name, contacts=contacts))
+        if every and i % every == 0:
+            override = templates_dir / f"town_of_bench_{i}"
+            override.mkdir()
+            (override / "planning.txt").write_text(f"Subject: Planning {i} - $jurisdiction\n\nHi $contact_name\n")
+    return contacts_dir, templates_dir
+
+
+def _collect(svc: OutreachService, contacts_dir: Path, out: Path) -> int:
+    drafts = [d for cl in iter_contact_lists([contacts_dir]) for d in svc.draft_emails(cl)]
+    out.write_bytes(dumps(drafts, pretty=False))
+    return len(drafts)
+
+
+def _stream(svc: OutreachService, contacts_dir: Path, out: Path) -> int:
+    with MboxWriter(out) as writer:
+        return svc.write_drafts(iter_contact_lists([contacts_dir]), writer).drafts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jurisdictions", type=int, default=5000)
+    parser.add_argument("--overrides", type=float, default=0.1, help="Fraction of jurisdictions with their own template")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        contacts_dir, templates_dir = _setup(tmp, args.jurisdictions, args.overrides)
+        svc = OutreachService(output_dir=tmp, templates=TemplateLibrary(templates_dir))
+        print(f"jurisdictions={args.jurisdictions} templates={len(svc.templates.names())}")
+        for label, fn, out in (("collect", _collect, tmp / "drafts.json"), ("stream ", _stream, tmp / "drafts.mbox")):
+            t = time.perf_counter()
+            drafts = fn(svc, contacts_dir, out)
+            elapsed = time.perf_counter() - t
+            tracemalloc.start()
+            fn(svc, contacts_dir, out)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(
+                f"  {label}: {drafts} drafts in {elapsed:6.2f} s ({drafts / elapsed:8,.0f}/s),"
+                f" peak {peak / 2**20:6.1f} MiB, output {out.stat().st_size / 2**20:.1f} MiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Outreach send benchmark: drain a queue of municipal inquiries into a local SMTP sink.
+
+Queues --messages drafts spread over --domains recipient domains, then sends them with the
+given per-domain interval and connection count against a sink that takes --smtp-delay
+seconds per message (and optionally answers 451 to every Nth message). Reports wall time,
+throughput, retries and the smallest gap seen between two messages to one domain, which
+must never be below --domain-interval.
+
+Usage:
+  python scripts/bench_outreach_send.py --messages 1000 --domains 250 --domain-interval 20
+"""
+
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+
+repo_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(repo_root / "src"))
+sys.path.insert(0, str(repo_root))
+
+from permitting_agent.models import OutreachDraft
+from permitting_agent.outreach.delivery import DeliveryPolicy, DeliveryQueue, SmtpSettings, send_queued
+from tests.smtp_sink import SmtpSink, SmtpSinkConfig
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=1000)
+    parser.add_argument("--domains", type=int, default=250)
+    parser.add_argument("--domain-interval", type=float, default=20.0)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--smtp-delay", type=float, default=0.05, help="Sink seconds per message")
+    parser.add_argument("--temp-fail-every", type=int, default=0)
+    args = parser.parse_args()
+
+    drafts = [
+        OutreachDraft(
+            to_role="planning",
+            subject=f"Permit inquiry {i}",
+            body="Hello,\n\nWe are preparing a small cell permit application.\n" * 5,
+            contact_ids=[f"inquiry{i}@city{i % args.domains}.gov"],
+            jurisdiction=f"City {i % args.domains}",
+        )
+        for i in range(args.messages)
+    ]
+    policy = DeliveryPolicy(
+        domain_interval=args.domain_interval, concurrency=args.concurrency, backoff_base=1.0, backoff_max=4.0
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = DeliveryQueue(Path(tmp) / "outbox.db")
+        queue.enqueue_drafts(drafts, "permits@acme.example")
+        config = SmtpSinkConfig(delay=args.smtp_delay, temp_fail_every=args.temp_fail_every)
+        with SmtpSink(config) as sink:
+            report = send_queued(queue, SmtpSettings(host="127.0.0.1", port=sink.port, timeout=10), policy)
+            while report.remaining:
+                more = send_queued(queue, SmtpSettings(host="127.0.0.1", port=sink.port, timeout=10), policy)
+                report.sent += more.sent
+                report.retried += more.retried
+                report.remaining = more.remaining
+                report.elapsed_s += more.elapsed_s
+        queue.close()
+
+    by_domain: dict[str, list[float]] = {}
+    for m in sink.messages:
+        by_domain.setdefault(m.recipients[0].rpartition("@")[2], []).append(m.received_at)
+    gaps = [b - a for times in by_domain.values() for a, b in zip(sorted(times), sorted(times)[1:])]
+    per_domain = args.messages / args.domains
+    floor = (per_domain - 1) * args.domain_interval
+    print(f"messages={args.messages} domains={args.domains} interval={args.domain_interval}s concurrency={args.concurrency}")
+    print(f"  sent {report.sent} in {report.elapsed_s:.1f} s ({report.sent / report.elapsed_s:.1f}/s)")
+    print(f"  retries {report.retried}, failed {report.failed}, SMTP connections {sink.connections}")
+    print(f"  smallest same-domain gap {min(gaps, default=0):.2f} s (lower bound for the run: {floor:.0f} s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Drawing-set parsing benchmark: extract_text on every page vs skipping pages without a text layer.
+
+Builds a plan set of mostly scanned sheets (a page-size image over a heavy vector overlay), a few
+text sheets and mixed sheets with a text title block, then times the old path (extract_text on
+every page) against parse_pdf, which classifies each page from its content stream first.
+
+Usage:
+  python scripts/bench_plan_review.py --sheets 40 --text-every 8 --path-ops 8000
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+repo_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(repo_root / "src"))
+sys.path.insert(0, str(repo_root))
+
+from pypdf import PdfReader
+
+from permitting_agent.document_review.parsers import parse_pdf
+from tests.pdf_forms import write_plan_set
+
+
+def _extract_all(path: Path) -> str:
+    return "\n\n".join(page.extract_text() for page in PdfReader(str(path)).pages)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sheets", type=int, default=40)
+    parser.add_argument("--text-every", type=int, default=8, help="every Nth sheet is text, the one after it mixed")
+    parser.add_argument("--path-ops", type=int, default=8000, help="vector line segments per scanned sheet")
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    layout = "".join(
+        "t" if i % args.text_every == 0 else "m" if i % args.text_every == 1 else "i" for i in range(args.sheets)
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        plans = write_plan_set(Path(tmp) / "plans.pdf", layout, args.path_ops)
+        t = time.perf_counter()
+        for _ in range(args.runs):
+            _extract_all(plans)
+        every_page = (time.perf_counter() - t) / args.runs * 1000
+        t = time.perf_counter()
+        for _ in range(args.runs):
+            artifact = parse_pdf(plans).artifact
+        classified = (time.perf_counter() - t) / args.runs * 1000
+
+    kinds = Counter(p.kind for p in artifact.pages)
+    extracted = sum(p.extracted for p in artifact.pages)
+    print(f"sheets: {args.sheets} ({', '.join(f'{k} {n}' for k, n in sorted(kinds.items()))}); extracted {extracted}")
+    print(f"extract every page   {every_page:9.1f} ms")
+    print(f"classify then skip   {classified:9.1f} ms  ({every_page / classified:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Batch submission benchmark: a 300-case rollout across 12 portals, one case at a time vs the batch scheduler.
+
+No browser: a simulated engine spends --step-ms on every step (what page loads and uploads cost
+in a real portal) and a simulated reviewer answers the approval queue, taking --approval-ms per
+answer. The reviewer approves every waiting request for a step at once (``a`` in the CLI) but
+confirms each final submit individually. Compare elapsed time with the time the reviewer spent:
+when the scheduler keeps enough flows waiting, the two converge and approvals are the bottleneck.
+
+Usage:
+  python scripts/bench_portal_batch.py --cases 300 --portals 12 --step-ms 150 --approval-ms 20
+"""
+
+import argparse
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+repo_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(repo_root / "src"))
+
+from permitting_agent.portal_automation.batch import ApprovalQueue, BatchScheduler, BatchStore
+from permitting_agent.portal_automation.engine import FlowSession, StepResult
+
+
+class SimulatedEngine:
+    """Every step takes ``step_s``; thread-safe like the real engine's blocking API."""
+
+    def __init__(self, step_s: float):
+        self.step_s = step_s
+
+    def open_session(self, documents, credentials=None, **options) -> FlowSession:
+        return FlowSession(None, None, dict(documents), credentials)
+
+    def run_step(self, session: FlowSession, step: dict) -> StepResult:
+        time.sleep(self.step_s)
+        return StepResult(step["id"], "done", self.step_s * 1000)
+
+    def close_session(self, session: FlowSession) -> None:
+        pass
+
+
+def reviewer(approvals: ApprovalQueue, approval_s: float, done: threading.Event, busy: list[float]) -> None:
+    while not done.is_set():
+        req = approvals.get(timeout=0.05)
+        if req is None:
+            continue
+        time.sleep(approval_s)
+        busy[0] += approval_s
+        if req.danger or not approvals.approve_matching(req.step["id"]):
+            approvals.resolve(req.id, True)
+
+
+def run(args: argparse.Namespace, cases: int, workers: int, portal_limit: int, label: str) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        store = BatchStore(Path(tmp) / "portal_batches.db")
+        portals = [f"https://permits{i}.example.gov/apply" for i in range(args.portals)]
+        store.add("bench", [(f"case{i}", portals[i % args.portals], {}) for i in range(cases)])
+        approvals = ApprovalQueue()
+        scheduler = BatchScheduler(
+            store, approvals, engine=SimulatedEngine(args.step_ms / 1000), portal_limit=portal_limit, workers=workers
+        )
+        done, busy = threading.Event(), [0.0]
+        thread = threading.Thread(target=reviewer, args=(approvals, args.approval_ms / 1000, done, busy))
+        thread.start()
+        report = scheduler.run("bench")
+        done.set()
+        thread.join()
+        store.close()
+    print(
+        f"  {label:<24}: {report.elapsed_s:6.1f} s, {report.counts['completed']} completed, "
+        f"reviewer busy {busy[0]:.1f} s ({busy[0] / report.elapsed_s:.0%}), "
+        f"{report.approvals} approvals, max {report.max_parallel} flows at once"
+    )
+    if cases < args.cases:
+        print(f"  {'':<24}  ~{report.elapsed_s * args.cases / cases:.0f} s extrapolated to {args.cases} cases")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cases", type=int, default=300)
+    parser.add_argument("--portals", type=int, default=12)
+    parser.add_argument("--step-ms", type=float, default=150.0, help="Simulated browser time per step")
+    parser.add_argument("--approval-ms", type=float, default=20.0, help="Simulated reviewer time per answer")
+    parser.add_argument("--portal-limit", type=int, default=2)
+    parser.add_argument("--workers", type=int, default=24)
+    parser.add_argument("--sequential-cases", type=int, default=30, help="Cases timed one at a time (then extrapolated)")
+    args = parser.parse_args()
+
+    print(f"cases={args.cases} portals={args.portals} step={args.step_ms} ms approval={args.approval_ms} ms")
+    run(args, min(args.cases, args.sequential_cases), 1, 1, "one case at a time")
+    run(args, args.cases, args.workers, args.portal_limit, f"scheduler ({args.workers} workers)")
+
+
+if __name__ == "__main__":
+    main()
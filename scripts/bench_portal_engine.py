@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Portal engine benchmark: submit --flows applications to the mock portal with one warm browser vs a launch per flow.
+
+Every flow logs in, uploads two documents, acknowledges the fee and submits against the local
+mock portal (``/portal/apply`` in tests/mock_portal.py, logins taking --login-delay seconds);
+approvals are auto-accepted. The pooled run keeps one Chromium process and gives each flow a fresh
+context; the baseline launches and closes a browser for every flow, which is what a naive per-case
+script does. A third run adds a SessionStore so only the first flow logs in.
+
+Requires ``playwright install chromium`` (and ``cryptography`` for the saved-login run).
+
+Usage:
+  python scripts/bench_portal_engine.py --flows 20 --pool-size 4
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+repo_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(repo_root / "src"))
+sys.path.insert(0, str(repo_root))
+
+from permitting_agent.portal_automation import BrowserPool, PlaywrightEngine, PortalAutomationService, SessionStore
+from permitting_agent.portal_automation.engine import chromium_available
+from tests.mock_portal import MockPortal, MockPortalConfig
+
+LOGIN = ("bench@example.com", "bench")
+
+
+def run(
+    portal: MockPortal,
+    documents: dict[str, Path],
+    flows: int,
+    pooled: bool,
+    pool_size: int,
+    store: SessionStore | None = None,
+) -> list[float]:
+    times = []
+    engine = PlaywrightEngine(BrowserPool(size=pool_size)) if pooled else None
+    try:
+        for i in range(flows):
+            started = time.perf_counter()
+            flow_engine = engine or PlaywrightEngine(BrowserPool(size=1, warm=0))
+            try:
+                svc = PortalAutomationService(
+                    approval_callback=lambda name, step: True, engine=flow_engine, credentials=LOGIN, session_store=store
+                )
+                result = svc.run_flow(f"case{i}", portal_url=portal.url + "/portal/apply", documents=documents)
+            finally:
+                if engine is None:
+                    flow_engine.close()
+            if result["status"] != "completed":
+                raise SystemExit(f"flow {i} {result['status']}: {result.get('error')}")
+            times.append(time.perf_counter() - started)
+    finally:
+        if engine is not None:
+            engine.close()
+    return times
+
+
+def _fernet_key() -> bytes:
+    try:
+        from cryptography.fernet import Fernet
+    except ImportError as e:
+        raise RuntimeError("cryptography not installed") from e
+    return Fernet.generate_key()
+
+
+def report(label: str, times: list[float]) -> None:
+    p95 = sorted(times)[max(0, int(len(times) * 0.95) - 1)]
+    print(
+        f"  {label:<23}: {sum(times):.2f} s total, median {statistics.median(times) * 1000:.0f} ms/flow, "
+        f"p95 {p95 * 1000:.0f} ms, first {times[0] * 1000:.0f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--flows", type=int, default=20)
+    parser.add_argument("--pool-size", type=int, default=4)
+    parser.add_argument("--doc-kb", type=int, default=256, help="Size of each uploaded document")
+    parser.add_argument("--login-delay", type=float, default=1.0, help="Mock portal seconds per login")
+    args = parser.parse_args()
+
+    if not chromium_available():
+        print("Chromium is not installed; run `playwright install chromium` first.")
+        return
+    with tempfile.TemporaryDirectory() as tmp, MockPortal(MockPortalConfig(portal_login=LOGIN, login_delay=args.login_delay)) as portal:
+        documents = {"application": Path(tmp) / "application.pdf", "site_plan": Path(tmp) / "site_plan.pdf"}
+        for path in documents.values():
+            path.write_bytes(b"%PDF-1.4\n" + b"0" * (args.doc_kb * 1024))
+        print(f"flows={args.flows} pool size={args.pool_size} documents={args.doc_kb} KB each login={args.login_delay}s")
+        report("launch per flow", run(portal, documents, args.flows, pooled=False, pool_size=1))
+        report("warm pool", run(portal, documents, args.flows, pooled=True, pool_size=args.pool_size))
+        logins = portal.logins
+        try:
+            store = SessionStore(Path(tmp), key=_fernet_key())
+        except RuntimeError as e:
+            print(f"  warm pool + saved login: skipped ({e})")
+        else:
+            report("warm pool + saved login", run(portal, documents, args.flows, True, args.pool_size, store))
+            print(f"  logins with saved sessions: {portal.logins - logins} of {args.flows} flows")
+        print(f"  submissions recorded by the mock portal: {len(portal.submissions)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Portal network policy benchmark: asset-heavy mock portal flows with everything loaded vs blocked + cached.
+
+The mock portal's pages (tests/mock_portal.py with ``portal_assets``) pull in --assets images and
+map tiles, a font, an analytics tag and theme CSS/JS, each --asset-kb large and answered after
+--asset-delay seconds. Runs --flows submissions on one warm browser, first loading everything,
+then with a NetworkPolicy (cold asset cache on the first flow, warm afterwards), and reports time
+per flow, bytes the portal served and what the policy says it saved.
+
+Requires ``playwright install chromium``.
+
+Usage:
+  python scripts/bench_portal_network.py --flows 10 --assets 30 --asset-kb 80 --asset-delay 0.02
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+repo_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(repo_root / "src"))
+sys.path.insert(0, str(repo_root))
+
+from permitting_agent.portal_automation import (
+    AssetCache,
+    BrowserPool,
+    NetworkPolicy,
+    PlaywrightEngine,
+    PortalAutomationService,
+)
+from permitting_agent.portal_automation.engine import chromium_available
+from tests.mock_portal import MockPortal, MockPortalConfig
+
+
+def run(portal: MockPortal, documents: dict[str, Path], flows: int, policy: NetworkPolicy | None, label: str) -> None:
+    served_before = sum(portal.asset_requests.values())
+    times, saved_bytes, saved_ms, blocked = [], 0, 0.0, 0
+    with PlaywrightEngine(BrowserPool(size=1), network=policy) as engine:
+        svc = PortalAutomationService(approval_callback=lambda name, step: True, engine=engine)
+        for i in range(flows):
+            started = time.perf_counter()
+            result = svc.run_flow(f"case{i}", portal_url=portal.url + "/portal/apply", documents=documents)
+            if result["status"] != "completed":
+                raise SystemExit(f"flow {i} {result['status']}: {result.get('error')}")
+            times.append(time.perf_counter() - started)
+            network = result.get("network", {})
+            saved_bytes += network.get("bytes_saved", 0)
+            saved_ms += network.get("ms_saved", 0.0)
+            blocked += network.get("blocked", 0)
+    served = sum(portal.asset_requests.values()) - served_before
+    print(
+        f"  {label:<18}: median {statistics.median(times) * 1000:.0f} ms/flow, first {times[0] * 1000:.0f} ms, "
+        f"{served} asset responses from the portal"
+    )
+    if policy is not None:
+        print(f"  {'':<18}  {blocked} requests blocked, {saved_bytes / 1024:.0f} KB / {saved_ms:.0f} ms served from cache")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--flows", type=int, default=10)
+    parser.add_argument("--assets", type=int, default=30, help="Images and map tiles per portal page")
+    parser.add_argument("--asset-kb", type=int, default=80)
+    parser.add_argument("--asset-delay", type=float, default=0.02, help="Mock portal seconds per asset")
+    args = parser.parse_args()
+
+    if not chromium_available():
+        print("Chromium is not installed; run `playwright install chromium` first.")
+        return
+    config = MockPortalConfig(portal_assets=args.assets, asset_bytes=args.asset_kb * 1024, asset_delay=args.asset_delay)
+    with tempfile.TemporaryDirectory() as tmp, MockPortal(config) as portal:
+        documents = {"application": Path(tmp) / "application.pdf", "site_plan": Path(tmp) / "site_plan.pdf"}
+        for path in documents.values():
+            path.write_bytes(b"%PDF-1.4\n" + b"0" * 64 * 1024)
+        print(f"flows={args.flows} assets/page={args.assets} asset size={args.asset_kb} KB delay={args.asset_delay}s")
+        run(portal, documents, args.flows, None, "load everything")
+        policy = NetworkPolicy(cache=AssetCache(Path(tmp) / "asset_cache"))
+        run(portal, documents, args.flows, policy, "block + cache")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Serialization benchmark: round-trip cost for cases, reports and research results.
+
+Compares the old path (model_dump -> json.dumps(indent=2) / json.loads -> model_validate)
+with permitting_agent.serialization (straight to/from bytes), pretty and compact.
+
+Usage:
+  python scripts/bench_serialization.py --runs 2000
+"""
+
+import argparse
+import json
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+repo_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(repo_root / "src"))
+
+from permitting_agent.models import (
+    Certainty,
+    Citation,
+    GapItem,
+    IntakeCase,
+    IntakeRequest,
+    PermitRequirement,
+    PortalResearchResult,
+    ResearchSource,
+    ScopeKind,
+    ScopeOfWork,
+    SiteDetails,
+    WhatsNeededReport,
+)
+from permitting_agent.serialization import dump_json, load_json
+
+
+def _samples() -> dict:
+    case = IntakeCase(
+        id="abc12345",
+        request=IntakeRequest(
+            jurisdiction="City of Sample",
+            site=SiteDetails(address="123 Main St", jurisdiction="City of Sample", lat=34.01, lon=-118.29, extra={"pole_id": "P-1"}),
+            scope=ScopeOfWork(kind=ScopeKind.BOTH, description="Small cell on existing pole"),
+            existing_doc_paths=[Path(f"/docs/plan_{i}.pdf") for i in range(5)],
+        ),
+        meta={"resolved_jurisdictions": [{"jurisdiction_id": "city_of_sample", "name": "City of Sample", "level": "municipal"}]},
+    )
+    citations = [Citation(page=i, section_heading=f"Section {i}", source_file="plans.pdf", excerpt="x" * 200) for i in range(20)]
+    report = WhatsNeededReport(
+        case_id="abc12345",
+        documents_reviewed=[f"/docs/plan_{i}.pdf" for i in range(5)],
+        gaps=[GapItem(checklist_item_id=f"item_{i}", checklist_label=f"Item {i}", status="missing", evidence=citations[:3]) for i in range(15)],
+        summary="Found 5 document(s).",
+        citations=citations,
+    )
+    source = ResearchSource(url="https://cityofsample.gov/permits", fetched_at=datetime(2025, 1, 1), snippet="y" * 500)
+    research = PortalResearchResult(
+        jurisdiction="City of Sample",
+        requirements=[
+            PermitRequirement(key=f"req_{i}", label=f"Requirement {i}", value="$250", certainty=Certainty.CITED, sources=[source])
+            for i in range(25)
+        ],
+        portal_url="https://cityofsample.gov/apply",
+        sources=[source] * 10,
+    )
+    return {"case": case, "report": report, "research": research}
+
+
+def _time(fn, runs: int) -> float:
+    t = time.perf_counter()
+    for _ in range(runs):
+        fn()
+    return (time.perf_counter() - t) / runs * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'model':10s} {'old (us)':>10s} {'pretty (us)':>12s} {'compact (us)':>13s} {'bytes pretty/compact':>22s}")
+    for name, model in _samples().items():
+        cls = type(model)
+
+        def old():
+            text = json.dumps(model.model_dump(mode="json"), indent=2)
+            return cls.model_validate(json.loads(text))
+
+        def new(pretty: bool):
+            return load_json(cls, dump_json(model, pretty=pretty))
+
+        assert old() == new(True) == new(False) == model
+        print(
+            f"{name:10s} {_time(old, args.runs):10.1f} {_time(lambda: new(True), args.runs):12.1f}"
+            f" {_time(lambda: new(False), args.runs):13.1f}"
+            f" {len(dump_json(model, pretty=True)):>12,d}/{len(dump_json(model, pretty=False)):,d}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Site dedup benchmark: per-insert duplicate check cost as the site index grows.
+
+Fills a SiteIndex with N existing sites (a grid of poles ~45 m apart), then times
+check_and_add for new sites: half near-duplicates of existing poles (a few meters off,
+re-spelled address), half genuinely new.
+
+Usage:
+  python scripts/bench_site_dedup.py --sites 200000
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+repo_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(repo_root / "src"))
+
+from permitting_agent.intake import SiteIndex
+from permitting_agent.models import SiteDetails
+
+SPACING_DEG = 4e-4
+
+
+def _site(i: int, side: int, jitter: float = 0.0, suffix: str = "Street") -> SiteDetails:
+    row, col = divmod(i, side)
+    return SiteDetails(
+        address=f"{i} Pole {suffix}",
+        jurisdiction="City of Sample",
+        lat=34 + row * SPACING_DEG + jitter,
+        lon=-118.5 + col * SPACING_DEG + jitter,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sites", type=int, default=200_000)
+    parser.add_argument("--checks", type=int, default=2000)
+    args = parser.parse_args()
+    side = int(args.sites**0.5) + 1
+    rng = random.Random(0)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index = SiteIndex(Path(tmp) / "sites.db")
+        t = time.perf_counter()
+        batch = []
+        for i in range(args.sites):
+            batch.append((f"c{i}", _site(i, side)))
+            if len(batch) == 5000:
+                index.add_many(batch)
+                batch = []
+        index.add_many(batch)
+        fill_s = time.perf_counter() - t
+
+        samples, flagged = [], 0
+        for n in range(args.checks):
+            i = rng.randrange(args.sites)
+            site = _site(i, side, jitter=5e-5, suffix="St.") if n % 2 else _site(args.sites + n, side)
+            t = time.perf_counter()
+            flagged += bool(index.check_and_add(f"new{n}", site))
+            samples.append((time.perf_counter() - t) * 1e6)
+        index.close()
+
+    samples.sort()
+    print(f"indexed sites={args.sites:,} (filled in {fill_s:.1f} s), radius={index.radius_m} m, geohash precision={index.precision}")
+    print(f"  check_and_add p50/p95 : {statistics.median(samples):7.0f} / {samples[int(len(samples) * 0.95)]:.0f} us")
+    print(f"  flagged               : {flagged} of {args.checks} ({args.checks // 2} planted near-duplicates)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,26 @@
 """Pluggable jurisdiction adapters for portal research, outreach, checklists."""
 
-from permitting_agent.adapters.base import JurisdictionAdapter
-from permitting_agent.adapters.registry import get_adapter, list_adapters
+from permitting_agent.adapters.base import AsyncJurisdictionAdapter, JurisdictionAdapter
+from permitting_agent.adapters.index import NameMatch
+from permitting_agent.adapters.registry import (
+    get_adapter,
+    get_async_adapter,
+    list_adapters,
+    match_jurisdiction,
+    register_alias,
+    register_bundle,
+    resolve_jurisdiction_id,
+)
 
 __all__ = [
+    "AsyncJurisdictionAdapter",
     "JurisdictionAdapter",
+    "NameMatch",
     "get_adapter",
+    "get_async_adapter",
     "list_adapters",
+    "match_jurisdiction",
+    "register_alias",
+    "register_bundle",
+    "resolve_jurisdiction_id",
 ]
@@ -1,5 +1,6 @@
-"""Base interface for pluggable jurisdiction adapters."""
+"""Base interfaces for pluggable jurisdiction adapters (sync and async) and shims between them."""
 
+import asyncio
 from abc import ABC, abstractmethod
 
 from permitting_agent.models import (
@@ -43,3 +44,86 @@ class JurisdictionAdapter(ABC):
     def discover_contacts(self) -> ContactList:
         """Discover key contacts from official sources; return list with source URLs."""
         ...
+
+
+class AsyncJurisdictionAdapter(ABC):
+    """Async adapter contract for jurisdictions whose research or contact discovery does real I/O.
+    Lets research, outreach and checklist loading for many jurisdictions overlap on one event loop.
+    """
+
+    @property
+    @abstractmethod
+    def jurisdiction_name(self) -> str:
+        """Display name for the jurisdiction (e.g. 'City of Sample')."""
+        ...
+
+    @property
+    @abstractmethod
+    def jurisdiction_id(self) -> str:
+        """Stable id used in config and case storage (e.g. 'city_of_sample')."""
+        ...
+
+    @abstractmethod
+    async def get_checklist(self, scope: ScopeKind) -> Checklist:
+        """Return the permit checklist for this jurisdiction and scope."""
+        ...
+
+    @abstractmethod
+    async def research_portal(self) -> PortalResearchResult:
+        """Crawl/scrape official pages for requirements, fees, portal link (robots.txt, rate limits)."""
+        ...
+
+    @abstractmethod
+    async def discover_contacts(self) -> ContactList:
+        """Discover key contacts from official sources; return list with source URLs."""
+        ...
+
+
+class SyncAdapterShim(AsyncJurisdictionAdapter):
+    """Async view of a sync JurisdictionAdapter: each call runs in a worker thread so it can't block the loop."""
+
+    def __init__(self, adapter: JurisdictionAdapter):
+        self.adapter = adapter
+
+    @property
+    def jurisdiction_name(self) -> str:
+        return self.adapter.jurisdiction_name
+
+    @property
+    def jurisdiction_id(self) -> str:
+        return self.adapter.jurisdiction_id
+
+    async def get_checklist(self, scope: ScopeKind) -> Checklist:
+        return await asyncio.to_thread(self.adapter.get_checklist, scope)
+
+    async def research_portal(self) -> PortalResearchResult:
+        return await asyncio.to_thread(self.adapter.research_portal)
+
+    async def discover_contacts(self) -> ContactList:
+        return await asyncio.to_thread(self.adapter.discover_contacts)
+
+
+class AsyncAdapterShim(JurisdictionAdapter):
+    """Sync view of an AsyncJurisdictionAdapter for existing callers. Uses asyncio.run, so it must not
+    be called from inside a running event loop (use the async adapter directly there).
+    """
+
+    def __init__(self, adapter: AsyncJurisdictionAdapter):
+        self.adapter = adapter
+
+    @property
+    def jurisdiction_name(self) -> str:
+        return self.adapter.jurisdiction_name
+
+    @property
+    def jurisdiction_id(self) -> str:
+        return self.adapter.jurisdiction_id
+
+    def get_checklist(self, scope: ScopeKind) -> Checklist:
+        return asyncio.run(self.adapter.get_checklist(scope))
+
+    def research_portal(self) -> PortalResearchResult:
+        return asyncio.run(self.adapter.research_portal())
+
+    def discover_contacts(self) -> ContactList:
+        return asyncio.run(self.adapter.discover_contacts())
@@ -0,0 +1,133 @@
+"""Compiled adapter bundle: many declarative jurisdiction specs in one memory-mapped file.
+
+Layout::
+
+    MAGIC (8 bytes) | index offset (u64) | index length (u64)
+    spec 0 JSON | spec 1 JSON | ...
+    index JSON: {"version": 1, "entries": {id: [offset, length, name, state, aliases]}}
+
+Opening a bundle reads only the header and the index; a spec's bytes are sliced from the
+memory map and validated when that jurisdiction is first requested.
+"""
+
+import mmap
+import os
+import struct
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from permitting_agent.adapters.declarative import (
+    DeclarativeAdapter,
+    JurisdictionSpec,
+    find_spec_files,
+    load_spec_file,
+    spec_to_json_bytes,
+)
+from permitting_agent.serialization import dumps, load_json, loads
+
+MAGIC = b"PABNDL01"
+BUNDLE_VERSION = 1
+_HEADER = struct.Struct("<8sQQ")
+
+
+class BundleError(ValueError):
+    """Invalid spec files at build time, or a corrupt bundle at load time."""
+
+
+def compile_bundle(src: Path | list[Path], out_path: Path) -> list[str]:
+    """Validate all spec files and write one bundle. Returns compiled ids; raises BundleError listing every problem."""
+    paths = [p for s in (src if isinstance(src, list) else [src]) for p in find_spec_files(Path(s))]
+    specs: dict[str, JurisdictionSpec] = {}
+    origin: dict[str, Path] = {}
+    errors: list[str] = []
+    for path in paths:
+        try:
+            spec = load_spec_file(path)
+        except ValidationError as e:
+            errors.extend(f"{path}: {err['loc']}: {err['msg']}" for err in e.errors())
+            continue
+        except (ValueError, RuntimeError, OSError) as e:
+            errors.append(f"{path}: {e}")
+            continue
+        if spec.jurisdiction_id in specs:
+            errors.append(f"{path}: duplicate jurisdiction_id {spec.jurisdiction_id!r} (also in {origin[spec.jurisdiction_id]})")
+            continue
+        specs[spec.jurisdiction_id] = spec
+        origin[spec.jurisdiction_id] = path
+    if errors:
+        raise BundleError("Invalid adapter specs:\n" + "\n".join(errors))
+
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out_path.with_suffix(out_path.suffix + ".tmp")
+    entries: dict[str, list] = {}
+    with open(tmp, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, 0, 0))
+        for jurisdiction_id in sorted(specs):
+            spec = specs[jurisdiction_id]
+            data = spec_to_json_bytes(spec)
+            entries[jurisdiction_id] = [f.tell(), len(data), spec.name, spec.state, spec.aliases]
+            f.write(data)
+        index = dumps({"version": BUNDLE_VERSION, "entries": entries}, pretty=False)
+        index_offset = f.tell()
+        f.write(index)
+        f.seek(0)
+        f.write(_HEADER.pack(MAGIC, index_offset, len(index)))
+    os.replace(tmp, out_path)
+    return sorted(specs)
+
+
+class AdapterBundle:
+    """Read-only view of a compiled bundle. Specs are decoded one at a time, on demand."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        self._mm: mmap.mmap | None = None
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, index_offset, index_length = _HEADER.unpack_from(self._mm, 0)
+            if magic != MAGIC:
+                raise BundleError(f"{self.path}: not an adapter bundle")
+            index = loads(self._mm[index_offset : index_offset + index_length])
+            if index.get("version") != BUNDLE_VERSION:
+                raise BundleError(f"{self.path}: unsupported bundle version {index.get('version')}")
+        except BundleError:
+            self.close()
+            raise
+        except (struct.error, ValueError) as e:
+            self.close()
+            raise BundleError(f"{self.path}: corrupt bundle ({e})") from e
+        self._entries: dict[str, list] = index["entries"]
+        self._specs: dict[str, JurisdictionSpec] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, jurisdiction_id: str) -> bool:
+        return jurisdiction_id in self._entries
+
+    def ids(self) -> list[str]:
+        return list(self._entries)
+
+    def metadata(self, jurisdiction_id: str) -> tuple[str, str | None, list[str]]:
+        """(name, state, aliases) from the index, without decoding the spec."""
+        _, _, name, state, aliases = self._entries[jurisdiction_id]
+        return name, state, aliases
+
+    def load_spec(self, jurisdiction_id: str) -> JurisdictionSpec:
+        spec = self._specs.get(jurisdiction_id)
+        if spec is None:
+            offset, length = self._entries[jurisdiction_id][:2]
+            spec = self._specs[jurisdiction_id] = load_json(JurisdictionSpec, self._mm[offset : offset + length])
+        return spec
+
+    def adapter(self, jurisdiction_id: str) -> DeclarativeAdapter:
+        return DeclarativeAdapter(self.load_spec(jurisdiction_id))
+
+    def close(self) -> None:
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        self._file.close()
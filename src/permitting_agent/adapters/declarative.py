@@ -0,0 +1,123 @@
+"""Declarative jurisdiction adapters defined in YAML/JSON data files instead of Python classes."""
+
+from datetime import datetime
+from pathlib import Path
+
+from pydantic import BaseModel, Field, field_validator
+
+from permitting_agent.models import (
+    Checklist,
+    ChecklistItem,
+    Contact,
+    ContactList,
+    PermitRequirement,
+    PortalResearchResult,
+    ResearchSource,
+)
+from permitting_agent.models.intake import ScopeKind
+from permitting_agent.adapters.base import JurisdictionAdapter
+from permitting_agent.serialization import dump_json, read_model
+
+SPEC_SUFFIXES = (".json", ".yaml", ".yml")
+
+
+class JurisdictionSpec(BaseModel):
+    """Data-file definition of one jurisdiction: checklists, requirements, portal, contacts."""
+
+    jurisdiction_id: str
+    name: str
+    state: str | None = None
+    aliases: list[str] = Field(default_factory=list)
+    # Checklist items by scope (small_cell | fiber | both); "default" applies to any scope
+    checklists: dict[str, list[ChecklistItem]] = Field(default_factory=dict)
+    requirements: list[PermitRequirement] = Field(default_factory=list)
+    portal_url: str | None = None
+    application_steps: list[str] = Field(default_factory=list)
+    sources: list[ResearchSource] = Field(default_factory=list)
+    contacts: list[Contact] = Field(default_factory=list)
+    verified_at: datetime | None = None  # when the data was last checked against official sources
+    notes: str | None = None
+
+    @field_validator("jurisdiction_id")
+    @classmethod
+    def _id_is_normalized(cls, v: str) -> str:
+        if not v or v != v.strip().lower().replace(" ", "_").replace("-", "_"):
+            raise ValueError("jurisdiction_id must be lowercase with underscores (e.g. 'city_of_sample')")
+        return v
+
+    @field_validator("checklists")
+    @classmethod
+    def _known_scopes(cls, v: dict[str, list[ChecklistItem]]) -> dict[str, list[ChecklistItem]]:
+        allowed = {k.value for k in ScopeKind} | {"default"}
+        unknown = set(v) - allowed
+        if unknown:
+            raise ValueError(f"unknown checklist scope(s): {sorted(unknown)}; expected {sorted(allowed)}")
+        return v
+
+
+class DeclarativeAdapter(JurisdictionAdapter):
+    """Adapter backed by a JurisdictionSpec. Returns the spec's data; never crawls."""
+
+    def __init__(self, spec: JurisdictionSpec):
+        self.spec = spec
+
+    @property
+    def jurisdiction_name(self) -> str:
+        return self.spec.name
+
+    @property
+    def jurisdiction_id(self) -> str:
+        return self.spec.jurisdiction_id
+
+    def get_checklist(self, scope: ScopeKind) -> Checklist:
+        scope_str = scope.value if isinstance(scope, ScopeKind) else str(scope)
+        items = self.spec.checklists.get(scope_str) or self.spec.checklists.get("default") or []
+        return Checklist(jurisdiction=self.spec.name, scope=scope_str, items=list(items))
+
+    def research_portal(self) -> PortalResearchResult:
+        return PortalResearchResult(
+            jurisdiction=self.spec.name,
+            researched_at=self.spec.verified_at or datetime.utcnow(),
+            requirements=list(self.spec.requirements),
+            portal_url=self.spec.portal_url,
+            application_steps=list(self.spec.application_steps),
+            sources=list(self.spec.sources),
+            raw_notes=self.spec.notes,
+        )
+
+    def discover_contacts(self) -> ContactList:
+        urls = list(dict.fromkeys(c.source_url for c in self.spec.contacts if c.source_url))
+        return ContactList(
+            jurisdiction=self.spec.name,
+            generated_at=self.spec.verified_at or datetime.utcnow(),
+            contacts=list(self.spec.contacts),
+            source_urls=urls,
+        )
+
+
+def load_spec_file(path: Path) -> JurisdictionSpec:
+    """Read and validate one spec from a .json or .yaml/.yml file."""
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix == ".json":
+        return read_model(path, JurisdictionSpec)
+    if suffix in (".yaml", ".yml"):
+        try:
+            import yaml
+        except ImportError as e:
+            raise RuntimeError("YAML adapter specs need PyYAML: pip install 'permitting-agent[yaml]'") from e
+        return JurisdictionSpec.model_validate(yaml.safe_load(path.read_text(encoding="utf-8")))
+    raise ValueError(f"Unsupported spec format: {suffix}")
+
+
+def find_spec_files(src: Path) -> list[Path]:
+    """Spec files under a directory (recursive), or the path itself if it is a file."""
+    src = Path(src)
+    if src.is_file():
+        return [src]
+    return sorted(p for p in src.rglob("*") if p.suffix.lower() in SPEC_SUFFIXES)
+
+
+def spec_to_json_bytes(spec: JurisdictionSpec) -> bytes:
+    """Compact JSON encoding used inside adapter bundles."""
+    return dump_json(spec, pretty=False, exclude_none=True)
@@ -0,0 +1,256 @@
+"""Jurisdiction name index: canonical ids, aliases, state qualifiers, trigram fuzzy fallback.
+
+Names are parsed into ``(kind, core, state)`` so that "City of Sample", "Sample City",
+"CITY OF SAMPLE" and "City of Sample, CA" all reduce to ``("city", "sample", ...)``.
+Exact lookups are dict hits; misses fall back to trigram similarity over an inverted
+index, re-scored with edit distance for short names, which stays well under a millisecond
+per lookup at ~20k jurisdictions.
+
+A state or kind given in the query must agree with the entry's: "City of Sample, TX" does not
+match a CA entry, nor one whose state is unknown. ``match`` returns a scored ``NameMatch``;
+fuzzy matches score below 1.0 because a misspelling and a different jurisdiction with a
+similar name ("City of Simple") look the same, so callers decide whether to accept them.
+"""
+
+import re
+from collections import Counter
+from dataclasses import dataclass
+
+US_STATES: dict[str, str] = {
+    "alabama": "al", "alaska": "ak", "arizona": "az", "arkansas": "ar", "california": "ca",
+    "colorado": "co", "connecticut": "ct", "delaware": "de", "district of columbia": "dc",
+    "florida": "fl", "georgia": "ga", "hawaii": "hi", "idaho": "id", "illinois": "il",
+    "indiana": "in", "iowa": "ia", "kansas": "ks", "kentucky": "ky", "louisiana": "la",
+    "maine": "me", "maryland": "md", "massachusetts": "ma", "michigan": "mi", "minnesota": "mn",
+    "mississippi": "ms", "missouri": "mo", "montana": "mt", "nebraska": "ne", "nevada": "nv",
+    "new hampshire": "nh", "new jersey": "nj", "new mexico": "nm", "new york": "ny",
+    "north carolina": "nc", "north dakota": "nd", "ohio": "oh", "oklahoma": "ok", "oregon": "or",
+    "pennsylvania": "pa", "rhode island": "ri", "south carolina": "sc", "south dakota": "sd",
+    "tennessee": "tn", "texas": "tx", "utah": "ut", "vermont": "vt", "virginia": "va",
+    "washington": "wa", "west virginia": "wv", "wisconsin": "wi", "wyoming": "wy",
+}
+_STATE_CODES = frozenset(US_STATES.values())
+
+# Government kinds recognized as "<kind> of X" or "X <kind>"
+KINDS = ("city and county", "city", "town", "township", "village", "borough", "county", "parish")
+_ABBREVIATIONS = {"st": "saint", "ste": "sainte", "mt": "mount", "ft": "fort", "twp": "township"}
+
+_NON_ALNUM = re.compile(r"[^a-z0-9,]+")
+
+DEFAULT_FUZZY_THRESHOLD = 0.5  # trigram Jaccard
+DEFAULT_EDIT_THRESHOLD = 0.75  # 1 - edit_distance / max(len)
+_FUZZY_CANDIDATES = 16
+_EDIT_MIN_JACCARD = 0.3
+_MAX_POSTING = 1000  # trigrams shared by more cores than this don't help pick candidates
+
+
+@dataclass(frozen=True)
+class NameMatch:
+    """How a free-text name resolved: the id (None if unknown or ambiguous), method and score."""
+
+    jurisdiction_id: str | None
+    score: float = 0.0  # 1.0 for exact and parsed-name matches, similarity for fuzzy ones
+    method: str = "none"  # exact | name | fuzzy | none
+    candidates: tuple[str, ...] = ()  # the tied ids of an ambiguous match
+
+    @property
+    def ambiguous(self) -> bool:
+        return self.jurisdiction_id is None and len(self.candidates) > 1
+
+    @property
+    def certain(self) -> bool:
+        """Matched by id, alias or parsed name: safe to use without asking."""
+        return self.jurisdiction_id is not None and self.method != "fuzzy"
+
+
+@dataclass(frozen=True)
+class ParsedName:
+    """A jurisdiction name reduced to comparable parts."""
+
+    kind: str | None
+    core: str
+    state: str | None
+
+
+def parse_jurisdiction_name(name: str) -> ParsedName:
+    """Split a free-text jurisdiction name into kind, core name and two-letter state."""
+    text = _NON_ALNUM.sub(" ", name.strip().lower().replace("_", " ").replace("-", " "))
+    state: str | None = None
+    if "," in text:
+        head, _, tail = text.rpartition(",")
+        tail = " ".join(tail.split())
+        if tail in _STATE_CODES or tail in US_STATES:
+            state = US_STATES.get(tail, tail)
+            text = head
+        text = text.replace(",", " ")
+    tokens = [_ABBREVIATIONS.get(t, t) for t in text.split()]
+    if state is None and len(tokens) > 1 and tokens[-1] in _STATE_CODES:
+        state = tokens.pop()
+
+    kind: str | None = None
+    joined = " ".join(tokens)
+    for k in KINDS:
+        prefix = f"{k} of "
+        if joined.startswith(prefix):
+            kind = k
+            joined = joined[len(prefix):]
+            break
+    if kind is None:  # "City of Kansas City": the trailing "city" is part of the name
+        for k in KINDS:
+            suffix = f" {k}"
+            if joined.endswith(suffix):
+                kind = k
+                joined = joined[: -len(suffix)]
+                break
+    return ParsedName(kind=kind, core=joined.strip(), state=state)
+
+
+def _trigrams(text: str) -> set[str]:
+    padded = f"  {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class JurisdictionIndex:
+    """In-memory index from jurisdiction names and aliases to canonical jurisdiction ids."""
+
+    def __init__(
+        self,
+        fuzzy_threshold: float = DEFAULT_FUZZY_THRESHOLD,
+        edit_threshold: float = DEFAULT_EDIT_THRESHOLD,
+    ):
+        self.fuzzy_threshold = fuzzy_threshold
+        self.edit_threshold = edit_threshold
+        self._ids: set[str] = set()
+        self._exact: dict[str, str] = {}  # normalized full name / alias -> id
+        self._by_core: dict[str, list[tuple[str, ParsedName]]] = {}
+        self._core_trigrams: dict[str, frozenset[str]] = {}
+        # "<state>|<trigram>" -> cores; state "" for stateless entries, "*" for all entries
+        self._postings: dict[str, list[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, jurisdiction_id: str) -> bool:
+        return jurisdiction_id in self._ids
+
+    def add(self, jurisdiction_id: str, names: tuple[str, ...] | list[str] = (), state: str | None = None) -> None:
+        """Index a jurisdiction id under its own id, display names and aliases."""
+        self._ids.add(jurisdiction_id)
+        state = US_STATES.get(state.lower(), state.lower()) if state else None
+        for name in (jurisdiction_id, *names):
+            self._exact.setdefault(_exact_key(name), jurisdiction_id)
+            parsed = parse_jurisdiction_name(name)
+            if parsed.state is None and state is not None:
+                parsed = ParsedName(parsed.kind, parsed.core, state)
+            if not parsed.core:
+                continue
+            entries = self._by_core.setdefault(parsed.core, [])
+            if (jurisdiction_id, parsed) not in entries:
+                entries.append((jurisdiction_id, parsed))
+            grams = self._core_trigrams.get(parsed.core)
+            if grams is None:
+                grams = self._core_trigrams[parsed.core] = frozenset(_trigrams(parsed.core))
+            for partition in ("*", parsed.state or ""):
+                for g in grams:
+                    postings = self._postings.setdefault(f"{partition}|{g}", [])
+                    if not postings or postings[-1] != parsed.core:
+                        postings.append(parsed.core)
+
+    def lookup(self, name: str, *, fuzzy: bool = True, min_score: float = 0.0) -> str | None:
+        """Return the canonical id for name, or None when unknown, ambiguous or scored below ``min_score``."""
+        match = self.match(name, fuzzy=fuzzy)
+        return match.jurisdiction_id if match.score >= min_score else None
+
+    def match(self, name: str, *, fuzzy: bool = True) -> NameMatch:
+        """Resolve name to a scored ``NameMatch`` (see the module docstring)."""
+        hit = self._exact.get(_exact_key(name))
+        if hit is not None:
+            return NameMatch(hit, 1.0, "exact")
+        query = parse_jurisdiction_name(name)
+        if not query.core:
+            return NameMatch(None)
+        winners = _best_matches(self._by_core.get(query.core, ()), query)
+        if winners or not fuzzy:
+            return _name_match(winners, 1.0, "name")
+        return self._fuzzy(query)
+
+    def _fuzzy(self, query: ParsedName) -> NameMatch:
+        grams = _trigrams(query.core)
+        partitions = (query.state,) if query.state else ("*",)
+        lists = [
+            postings
+            for partition in partitions
+            for g in grams
+            if (postings := self._postings.get(f"{partition}|{g}"))
+        ]
+        selective = [p for p in lists if len(p) <= _MAX_POSTING] or lists
+        counts: Counter[str] = Counter()
+        for postings in selective:
+            counts.update(postings)
+        best_score = 0.0
+        best_cores: list[str] = []
+        for core, _ in counts.most_common(_FUZZY_CANDIDATES):
+            core_grams = self._core_trigrams[core]
+            jaccard = len(grams & core_grams) / len(grams | core_grams)
+            longest = max(len(query.core), len(core))
+            if jaccard >= self.fuzzy_threshold:
+                score = jaccard
+            elif jaccard >= _EDIT_MIN_JACCARD and abs(len(query.core) - len(core)) <= (1 - self.edit_threshold) * longest:
+                # Short names lose most trigrams to a single typo; confirm with edit distance
+                similarity = 1.0 - _edit_distance(query.core, core) / longest
+                score = similarity if similarity >= self.edit_threshold else 0.0
+            else:
+                score = 0.0
+            if score > best_score:
+                best_score, best_cores = score, [core]
+            elif score == best_score and score > 0:
+                best_cores.append(core)
+        if not best_cores:
+            return NameMatch(None)
+        candidates = [e for core in best_cores for e in self._by_core[core]]
+        return _name_match(_best_matches(candidates, query), round(best_score, 3), "fuzzy")
+
+
+def _edit_distance(a: str, b: str) -> int:
+    """Optimal string alignment distance (Levenshtein plus adjacent transpositions)."""
+    prev2: list[int] = []
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                cur[j] = min(cur[j], prev2[j - 2] + 1)
+        prev2, prev = prev, cur
+    return prev[len(b)]
+
+
+def _exact_key(name: str) -> str:
+    return " ".join(_NON_ALNUM.sub(" ", name.lower().replace("_", " ").replace(",", " ")).split())
+
+
+def _name_match(winners: list[str], score: float, method: str) -> NameMatch:
+    if len(winners) == 1:
+        return NameMatch(winners[0], score, method)
+    return NameMatch(None, 0.0, method if winners else "none", tuple(winners))
+
+
+def _best_matches(entries, query: ParsedName) -> list[str]:
+    """The best ids among entries sharing a core: one, several when tied, none if all were filtered out.
+    A state or kind in the query must be the entry's too.
+    """
+    scored: dict[str, int] = {}
+    for jurisdiction_id, parsed in entries:
+        if query.state and query.state != parsed.state:
+            continue
+        if query.kind and query.kind != parsed.kind:
+            continue
+        score = (2 if query.state and query.state == parsed.state else 0) + (
+            1 if query.kind and query.kind == parsed.kind else 0
+        )
+        scored[jurisdiction_id] = max(score, scored.get(jurisdiction_id, -1))
+    if not scored:
+        return []
+    top = max(scored.values())
+    return [j for j, s in scored.items() if s == top]
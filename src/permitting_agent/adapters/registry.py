@@ -1,32 +1,198 @@
-"""Registry for pluggable jurisdiction adapters."""
+"""Registry for pluggable jurisdiction adapters.
 
-from permitting_agent.adapters.base import JurisdictionAdapter
-from permitting_agent.adapters.sample_jurisdiction import SampleJurisdictionAdapter
+Adapters are known through a manifest of ``jurisdiction_id -> "module:ClassName"`` targets:
+the built-in adapters below plus any installed package exposing the
+``permitting_agent.adapters`` entry-point group, e.g. in its pyproject.toml::
 
-# Register adapters by jurisdiction_id (normalized: lower, spaces -> underscores)
-_REGISTRY: dict[str, type[JurisdictionAdapter]] = {
-    "city_of_sample": SampleJurisdictionAdapter,
+    [project.entry-points."permitting_agent.adapters"]
+    city_of_example = "example_adapters.city_of_example:CityOfExampleAdapter"
+
+Declarative jurisdictions compiled into adapter bundles (see ``adapters.bundle``) join the
+manifest through ``register_bundle`` or the ``PERMITTING_ADAPTER_BUNDLES`` environment
+variable (paths separated by ``os.pathsep``); Python adapters take precedence on id clashes.
+A bundle from the environment that can't be read is skipped with a ``RuntimeWarning``.
+
+Adapter modules are imported only when ``get_adapter`` first asks for that jurisdiction;
+``list_adapters`` reads the manifest and imports nothing. Free-text names ("Sample City",
+"City of Sample, CA") resolve to ids through a ``JurisdictionIndex`` of ids, aliases and
+state qualifiers; adapter instances are cached per id. ``get_adapter`` only uses certain
+matches: a fuzzy match ("City of Sampel", but also "City of Simple") is a suggestion, which
+``match_jurisdiction`` returns with its score for the caller to offer or refuse.
+"""
+
+import os
+import warnings
+from functools import partial
+from importlib.metadata import EntryPoint, entry_points
+from pathlib import Path
+from typing import Callable
+
+from permitting_agent.adapters.base import (
+    AsyncAdapterShim,
+    AsyncJurisdictionAdapter,
+    JurisdictionAdapter,
+    SyncAdapterShim,
+)
+from permitting_agent.adapters.index import JurisdictionIndex, NameMatch
+
+ENTRY_POINT_GROUP = "permitting_agent.adapters"
+BUNDLES_ENV = "PERMITTING_ADAPTER_BUNDLES"
+
+# Built-in adapters by jurisdiction_id (normalized: lower, spaces -> underscores)
+_BUILTIN_ADAPTERS: dict[str, str] = {
+    "city_of_sample": "permitting_agent.adapters.sample_jurisdiction:SampleJurisdictionAdapter",
+}
+
+# Extra names per jurisdiction_id: (aliases, two-letter state or None)
+_ALIASES: dict[str, tuple[tuple[str, ...], str | None]] = {
+    "city_of_sample": ((), "CA"),  # its demo boundary (config/boundaries) is in Los Angeles County
 }
 
+# jurisdiction_id -> "module:attr" target (not yet imported), loaded adapter class,
+# or factory returning an adapter (bundle entries). Sync and async adapters are both accepted.
+AnyAdapter = JurisdictionAdapter | AsyncJurisdictionAdapter
+AdapterTarget = str | type[AnyAdapter] | Callable[[], AnyAdapter]
+_REGISTRY: dict[str, AdapterTarget] = {}
+_INSTANCES: dict[str, AnyAdapter] = {}
+_INDEX: JurisdictionIndex | None = None
+_discovered = False
+
 
 def _normalize_jurisdiction_id(name: str) -> str:
     return name.strip().lower().replace(" ", "_").replace("-", "_")
 
 
-def get_adapter(jurisdiction: str) -> JurisdictionAdapter | None:
-    """Return an adapter instance for the given jurisdiction name, or None."""
-    key = _normalize_jurisdiction_id(jurisdiction)
-    cls = _REGISTRY.get(key)
-    if cls is None:
+def _discover() -> dict[str, AdapterTarget]:
+    """Build the manifest once: built-ins, entry points, then bundles. Explicit registrations win."""
+    global _discovered
+    if not _discovered:
+        _discovered = True
+        targets = dict(_BUILTIN_ADAPTERS)
+        for ep in entry_points(group=ENTRY_POINT_GROUP):
+            targets[ep.name] = ep.value
+        for jurisdiction_id, target in targets.items():
+            _REGISTRY.setdefault(_normalize_jurisdiction_id(jurisdiction_id), target)
+        # The flag is already set (register_bundle reads the manifest), so a bundle that fails to
+        # load is skipped here rather than left to raise once and hide the rest of the list.
+        for path in filter(None, os.environ.get(BUNDLES_ENV, "").split(os.pathsep)):
+            from permitting_agent.adapters.bundle import BundleError
+
+            try:
+                register_bundle(path)
+            except (OSError, BundleError) as e:
+                warnings.warn(f"{BUNDLES_ENV}: skipping adapter bundle {path}: {e}", RuntimeWarning, stacklevel=2)
+    return _REGISTRY
+
+
+def _instantiate(key: str) -> AnyAdapter | None:
+    target = _discover().get(key)
+    if target is None:
+        return None
+    if isinstance(target, str):
+        target = EntryPoint(name=key, value=target, group=ENTRY_POINT_GROUP).load()
+        if not (isinstance(target, type) and issubclass(target, (JurisdictionAdapter, AsyncJurisdictionAdapter))):
+            raise TypeError(f"Adapter target for {key!r} is not a JurisdictionAdapter subclass")
+        _REGISTRY[key] = target
+    return target()
+
+
+def _cached_adapter(jurisdiction: str) -> AnyAdapter | None:
+    key = resolve_jurisdiction_id(jurisdiction)
+    if key is None:
         return None
-    return cls()
+    adapter = _INSTANCES.get(key)
+    if adapter is None:
+        adapter = _instantiate(key)
+        if adapter is None:
+            return None
+        _INSTANCES[key] = adapter
+    return adapter
+
+
+def _index() -> JurisdictionIndex:
+    global _INDEX
+    if _INDEX is None:
+        index = JurisdictionIndex()
+        for jurisdiction_id in _discover():
+            aliases, state = _ALIASES.get(jurisdiction_id, ((), None))
+            index.add(jurisdiction_id, aliases, state=state)
+        _INDEX = index
+    return _INDEX
+
+
+def match_jurisdiction(jurisdiction: str, *, fuzzy: bool = True) -> NameMatch:
+    """Resolve a free-text name to a scored ``NameMatch``: certain (id, alias, parsed name), fuzzy
+    (a score below 1.0), ambiguous (tied candidates) or none.
+    """
+    key = _normalize_jurisdiction_id(jurisdiction)
+    if key in _discover():
+        return NameMatch(key, 1.0, "exact")
+    return _index().match(jurisdiction, fuzzy=fuzzy)
+
+
+def resolve_jurisdiction_id(jurisdiction: str, *, fuzzy: bool = False) -> str | None:
+    """Return the registered jurisdiction id for a free-text name, or None if unknown/ambiguous.
+    Fuzzy matches are only accepted with ``fuzzy=True``.
+    """
+    match = match_jurisdiction(jurisdiction, fuzzy=fuzzy)
+    return match.jurisdiction_id
+
+
+def get_adapter(jurisdiction: str) -> JurisdictionAdapter | None:
+    """Return the (cached) adapter instance for the given jurisdiction name, or None.
+    Async adapters are wrapped for sync callers.
+    """
+    adapter = _cached_adapter(jurisdiction)
+    if isinstance(adapter, AsyncJurisdictionAdapter):
+        return AsyncAdapterShim(adapter)
+    return adapter
+
+
+def get_async_adapter(jurisdiction: str) -> AsyncJurisdictionAdapter | None:
+    """Return the adapter through the async contract (sync adapters run in worker threads), or None."""
+    adapter = _cached_adapter(jurisdiction)
+    if adapter is None or isinstance(adapter, AsyncJurisdictionAdapter):
+        return adapter
+    return SyncAdapterShim(adapter)
 
 
 def list_adapters() -> list[str]:
-    """Return list of registered jurisdiction ids."""
-    return list(_REGISTRY.keys())
+    """Return list of registered jurisdiction ids (from the manifest; imports no adapter modules)."""
+    return list(_discover().keys())
+
+
+def register_adapter(jurisdiction_id: str, adapter_class: AdapterTarget) -> None:
+    """Register an adapter class, lazy "module:ClassName" target or factory (for tests or dynamic loading)."""
+    global _INDEX
+    key = _normalize_jurisdiction_id(jurisdiction_id)
+    _REGISTRY[key] = adapter_class
+    _INSTANCES.pop(key, None)
+    _INDEX = None
+
+
+def register_alias(jurisdiction_id: str, *aliases: str, state: str | None = None) -> None:
+    """Add alternate names and/or a state qualifier for a registered jurisdiction id."""
+    global _INDEX
+    key = _normalize_jurisdiction_id(jurisdiction_id)
+    existing, existing_state = _ALIASES.get(key, ((), None))
+    _ALIASES[key] = (existing + aliases, state or existing_state)
+    _INDEX = None
+
 
+def register_bundle(path: Path | str) -> list[str]:
+    """Add every jurisdiction in a compiled adapter bundle to the manifest; returns the ids added."""
+    global _INDEX
+    from permitting_agent.adapters.bundle import AdapterBundle
 
-def register_adapter(jurisdiction_id: str, adapter_class: type[JurisdictionAdapter]) -> None:
-    """Register a new adapter (for tests or dynamic loading)."""
-    _REGISTRY[_normalize_jurisdiction_id(jurisdiction_id)] = adapter_class
+    bundle = AdapterBundle(Path(path))
+    manifest = _discover()
+    added: list[str] = []
+    for jurisdiction_id in bundle.ids():
+        if jurisdiction_id in manifest:
+            continue
+        manifest[jurisdiction_id] = partial(bundle.adapter, jurisdiction_id)
+        name, state, aliases = bundle.metadata(jurisdiction_id)
+        _ALIASES[jurisdiction_id] = ((name, *aliases), state)
+        added.append(jurisdiction_id)
+    _INDEX = None
+    return added
@@ -1,5 +1,8 @@
 """CLI for Permitting + Site Acquisition agent (typer)."""
 
+import asyncio
+import os
+from datetime import datetime, timedelta
 from pathlib import Path
 
 import typer
@@ -9,30 +12,60 @@ from rich.table import Table
 from permitting_agent.intake import IntakeService
 from permitting_agent.intake.service import IntakeService as IntakeServiceType
 from permitting_agent.models import (
+    CaseEventKind,
     IntakeRequest,
     SiteDetails,
     ScopeOfWork,
     ScopeKind,
+    RunStatus,
+    SubmissionBatchReport,
+    SubmissionStatus,
 )
-from permitting_agent.document_review import DocumentReviewService
+from permitting_agent.document_review import DocumentReviewService, unread_pages
 from permitting_agent.portal_research import PortalResearchService
-from permitting_agent.portal_automation import PortalAutomationService
-from permitting_agent.outreach import OutreachService
-from permitting_agent.adapters import get_adapter, list_adapters
+from permitting_agent.portal_automation import (
+    AssetCache,
+    BrowserPool,
+    CaptureOptions,
+    NetworkPolicy,
+    PlaywrightEngine,
+    PortalAutomationService,
+    PortalRunner,
+    RunStore,
+    SessionStore,
+    TimingStore,
+)
+from permitting_agent.portal_automation.engine import credentials_from_env
+from permitting_agent.portal_automation.network import DEFAULT_BLOCK_TYPES
+from permitting_agent.portal_automation.runs import RunStateError
+from permitting_agent.portal_automation.service import case_documents
+from permitting_agent.portal_automation.sessions import SESSION_KEY_ENV
+from permitting_agent.outreach import ContactIndex, OutreachService
+from permitting_agent.adapters import get_adapter, get_async_adapter, list_adapters
+from permitting_agent.serialization import write_model
 
 app = typer.Typer(
     name="permitting",
     help="Permitting + Site Acquisition agent for telecom (small cell + fiber).",
 )
 console = Console()
+cases_app = typer.Typer(help="Query and maintain the case store.")
+app.add_typer(cases_app, name="cases")
+contacts_app = typer.Typer(help="Global contact index: dedup across jurisdictions, re-verify stale contacts.")
+app.add_typer(contacts_app, name="contacts")
+runs_app = typer.Typer(help="Portal runs that wait for approval in the database (web UI / API) instead of at a prompt.")
+app.add_typer(runs_app, name="portal-runs")
 
 
 @app.command()
 def intake(
-    jurisdiction: str = typer.Option(..., "--jurisdiction", "-j", help="Jurisdiction name (e.g. City of Sample)"),
+    jurisdiction: str | None = typer.Option(None, "--jurisdiction", "-j", help="Jurisdiction name (e.g. City of Sample); resolved from --lat/--lon if omitted"),
     address: str = typer.Option(..., "--address", "-a", help="Site address"),
     scope: str = typer.Option("small_cell", "--scope", "-s", help="Scope: small_cell | fiber | both"),
-    docs: list[Path] = typer.Option(default=[], "--docs", "-d", path_type=Path, help="Paths to existing docs"),
+    docs: list[Path] = typer.Option([], "--docs", "-d", path_type=Path, help="Paths to existing docs"),
+    lat: float | None = typer.Option(None, "--lat", help="Site latitude"),
+    lon: float | None = typer.Option(None, "--lon", help="Site longitude"),
+    boundaries: list[Path] = typer.Option([], "--boundaries", path_type=Path, envvar="PERMITTING_BOUNDARIES", help="GeoJSON jurisdiction boundaries"),
     output_dir: Path = typer.Option(Path("output"), "--output-dir", "-o", path_type=Path),
     data_dir: Path = typer.Option(Path("data"), "--data-dir", path_type=Path),
 ) -> None:
@@ -41,28 +74,81 @@ def intake(
         kind = ScopeKind(scope) if scope in ("small_cell", "fiber", "both") else ScopeKind.SMALL_CELL
     except ValueError:
         kind = ScopeKind.SMALL_CELL
-    site = SiteDetails(address=address, jurisdiction=jurisdiction)
+    resolver = None
+    if boundaries and lat is not None and lon is not None:
+        from permitting_agent.geo import JurisdictionResolver
+        resolver = JurisdictionResolver.from_geojson(boundaries)
+    if jurisdiction is None:
+        matches = resolver.resolve(lat, lon) if resolver else []
+        if not matches:
+            console.print("[red]--jurisdiction is required unless --lat/--lon fall inside --boundaries.[/red]")
+            raise typer.Exit(1)
+        jurisdiction = matches[0].name
+    site = SiteDetails(address=address, jurisdiction=jurisdiction, lat=lat, lon=lon)
     request = IntakeRequest(
         jurisdiction=jurisdiction,
         site=site,
         scope=ScopeOfWork(kind=kind),
         existing_doc_paths=docs,
     )
-    service: IntakeServiceType = IntakeService(data_dir=data_dir)
+    service: IntakeServiceType = IntakeService(data_dir=data_dir, resolver=resolver)
     case = service.create_case(request)
     console.print(f"[green]Created case[/green] [bold]{case.id}[/bold]")
     console.print(f"  Jurisdiction: {jurisdiction}")
+    resolved = case.meta.get("resolved_jurisdictions", [])
+    if resolved:
+        console.print(f"  Boundaries: {', '.join(m['name'] for m in resolved)}")
+    if case.meta.get("jurisdiction_mismatch"):
+        console.print("[yellow]  Warning: site coordinates are outside the entered jurisdiction.[/yellow]")
+    for dup in case.meta.get("possible_duplicates", []):
+        distance = f", {dup['distance_m']} m away" if dup["distance_m"] is not None else ""
+        console.print(f"[yellow]  Possible duplicate of case {dup['case_id']} ({dup['reason']}{distance})[/yellow]")
     console.print(f"  Address: {address}")
     console.print(f"  Scope: {kind.value}")
     if docs:
         console.print(f"  Docs: {[str(p) for p in docs]}")
     out_dir = Path(output_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
-    case_path = out_dir / "intake_case.json"
-    case_path.write_text(case.model_dump_json(indent=2))
+    case_path = write_model(out_dir / "intake_case.json", case)
     console.print(f"  Saved: {case_path}")
 
 
+@app.command()
+def intake_bulk(
+    path: Path = typer.Argument(..., path_type=Path, help="CSV, GeoJSON FeatureCollection or GeoJSONSeq file"),
+    data_dir: Path = typer.Option(Path("data"), "--data-dir", path_type=Path),
+    batch_size: int = typer.Option(500, "--batch-size", help="Rows committed per transaction"),
+    boundaries: list[Path] = typer.Option([], "--boundaries", path_type=Path, envvar="PERMITTING_BOUNDARIES", help="GeoJSON jurisdiction boundaries"),
+    import_key: str | None = typer.Option(None, "--import-key", help="Resume key (default: derived from the file)"),
+    errors: Path | None = typer.Option(None, "--errors", path_type=Path, help="Per-row error report CSV"),
+) -> None:
+    """Create cases from a rollout list; re-run the same command to resume an interrupted import."""
+    from permitting_agent.intake import import_cases
+
+    if not path.exists():
+        console.print(f"[red]File not found: {path}[/red]")
+        raise typer.Exit(1)
+    resolver = None
+    if boundaries:
+        from permitting_agent.geo import JurisdictionResolver
+        resolver = JurisdictionResolver.from_geojson(boundaries)
+    service = IntakeService(data_dir=data_dir, resolver=resolver)
+    try:
+        report = import_cases(service, path, batch_size=batch_size, import_key=import_key, error_report=errors)
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(1)
+    console.print(f"[green]Bulk intake complete.[/green] Import key: {report.import_key}")
+    if report.resumed_from_row:
+        console.print(f"  Resumed after row {report.resumed_from_row} ({report.skipped} rows skipped)")
+    console.print(f"  Rows read: {report.rows_read}")
+    console.print(f"  Cases created: {report.created}")
+    if report.possible_duplicates:
+        console.print(f"[yellow]  Possible duplicate sites: {report.possible_duplicates} (see case meta.possible_duplicates)[/yellow]")
+    if report.errors:
+        console.print(f"[yellow]  Rows with errors: {report.errors} (see {report.error_report})[/yellow]")
+
+
 @app.command()
 def document_review(
     case_id: str = typer.Option(..., "--case-id", "-c", help="Intake case ID"),
@@ -99,8 +185,16 @@ def document_review(
         raise typer.Exit(1)
     artifacts, report = review_svc.run_review(case_id, doc_paths, checklist)
     review_svc.save_report(report, output)
+    intake_svc.record_event(
+        case_id,
+        CaseEventKind.REVIEW_COMPLETED,
+        {"report": str(output.with_suffix(".json")), "documents": len(artifacts), "gaps": len(report.gaps)},
+        actor="cli",
+    )
     console.print(f"[green]Document review complete.[/green]")
     console.print(f"  Documents reviewed: {len(artifacts)}")
+    for name, pages in unread_pages(artifacts).items():
+        console.print(f"  [yellow]{name}: {len(pages)} page(s) without a text layer were not machine-read[/yellow]")
     console.print(f"  Gaps: {len(report.gaps)}")
     console.print(f"  Report: {output.with_suffix('.json')} and {output.with_suffix('.md')}")
 
@@ -109,10 +203,28 @@ def document_review(
 def portal_research(
     jurisdiction: str = typer.Option(..., "--jurisdiction", "-j", help="Jurisdiction name"),
     output: Path = typer.Option(Path("output/research"), "--output", "-o", path_type=Path),
+    case_id: str | None = typer.Option(None, "--case-id", "-c", help="Attach the result to this intake case"),
+    data_dir: Path = typer.Option(Path("data"), "--data-dir", path_type=Path),
 ) -> None:
     """Fetch permit requirements from jurisdiction (adapter or uncertain stub). Saves JSON + sources."""
+    intake_svc = IntakeService(data_dir=data_dir) if case_id else None
+    if intake_svc is not None and intake_svc.get_case(case_id) is None:
+        console.print(f"[red]Case not found: {case_id}[/red]")
+        raise typer.Exit(1)
     svc = PortalResearchService(output_dir=output.parent)
     result = svc.research_and_save(jurisdiction, output_path=output)
+    if intake_svc is not None:
+        intake_svc.record_event(
+            case_id,
+            CaseEventKind.RESEARCH_ATTACHED,
+            {
+                "jurisdiction": result.jurisdiction,
+                "portal_url": result.portal_url,
+                "requirements": len(result.requirements),
+                "result": str(output),
+            },
+            actor="cli",
+        )
     console.print(f"[green]Portal research complete.[/green]")
     console.print(f"  Jurisdiction: {result.jurisdiction}")
     console.print(f"  Requirements: {len(result.requirements)}")
@@ -121,42 +233,447 @@ def portal_research(
     console.print(f"  Saved: {output}")
 
 
+@app.command()
+def portal_form(
+    url: str = typer.Argument(..., help="First page of the portal's online application"),
+    data_dir: Path = typer.Option(Path("data"), "--data-dir", path_type=Path, help="Schemas are cached in <data-dir>/form_schemas"),
+    refresh: bool = typer.Option(False, "--refresh", help="Crawl again even if a cached schema exists"),
+    max_pages: int = typer.Option(20, "--max-pages", help="Page budget"),
+    max_depth: int = typer.Option(8, "--max-depth", help="Link hops from the first page"),
+    concurrency: int = typer.Option(4, "--concurrency", help="Pages fetched at once"),
+    output: Path | None = typer.Option(None, "--output", "-o", path_type=Path, help="Also write the schema as JSON"),
+) -> None:
+    """Discover every field of a multi-page application form (wizard steps, Next links, tabs)."""
+    from permitting_agent.portal_crawl import FormSchemaCache, discover_form_schema
+
+    schema = discover_form_schema(
+        url,
+        cache=FormSchemaCache(data_dir / "form_schemas"),
+        refresh=refresh,
+        max_pages=max_pages,
+        max_depth=max_depth,
+        concurrency=concurrency,
+    )
+    if not schema.fields:
+        console.print(f"[yellow]No form fields found from {url}[/yellow]")
+        raise typer.Exit(1)
+    table = Table(title=f"{len(schema.fields)} field(s) on {len(schema.pages)} page(s), discovered {schema.discovered_at:%Y-%m-%d %H:%M}")
+    for column in ("Page", "Section", "Name", "Label", "Type", "Required"):
+        table.add_column(column)
+    for field in schema.fields:
+        page = schema.pages[field.page]
+        table.add_row(page.title or page.url, field.section or "", field.name, field.label, field.type, "yes" if field.required else "")
+    console.print(table)
+    if output:
+        write_model(output, schema)
+        console.print(f"  Saved: {output}")
+
+
 @app.command()
 def portal_automation(
     case_id: str = typer.Option(..., "--case-id", "-c"),
-    approve_each_step: bool = typer.Option(True, "--approve-each-step/--no-approve", help="Require approval before each step"),
+    approve_each_step: bool = typer.Option(True, "--approve-each-step/--no-approve", help="Require approval before each step (submit is always confirmed)"),
     data_dir: Path = typer.Option(Path("data"), "--data-dir", path_type=Path),
+    browser: bool = typer.Option(False, "--browser", help="Drive a real Chromium browser (default: dry run of the steps)"),
+    headed: bool = typer.Option(False, "--headed", help="Show the browser window with --browser"),
+    portal_url_override: str | None = typer.Option(None, "--portal-url", help="Portal URL instead of the adapter's"),
+    reuse_session: bool = typer.Option(True, "--reuse-session/--fresh-login", help=f"Reuse a saved login (needs {SESSION_KEY_ENV})"),
+    block: list[str] = typer.Option(list(DEFAULT_BLOCK_TYPES), "--block", help="Resource types not loaded with --browser (repeatable; e.g. image, font, media, script)"),
+    network_policy: bool = typer.Option(True, "--network-policy/--load-everything", help="Block --block types and analytics/map tiles, cache JS/CSS in <data-dir>/asset_cache"),
+    trace: bool = typer.Option(False, "--trace", help="Keep a Playwright trace (open with `playwright show-trace`)"),
+    screenshots: bool = typer.Option(False, "--screenshots", help="Keep a screenshot after each step"),
+    har: bool = typer.Option(False, "--har", help="Keep a HAR of the run's network traffic"),
 ) -> None:
-    """Run Playwright-based submission flow with human-in-the-loop. Never submits without confirmation."""
+    """Run Playwright-based submission flow with human-in-the-loop. Never submits without confirmation.
+    Step timings are recorded in <data-dir>/portal_timings.db (see `permitting portal-stats`);
+    --trace/--screenshots/--har artifacts go to <data-dir>/portal_artifacts/<run id>/.
+    """
     intake_svc = IntakeService(data_dir=data_dir)
     case = intake_svc.get_case(case_id)
-    portal_url = None
-    if case:
+    portal_url = portal_url_override
+    if case and not portal_url:
         adapter = get_adapter(case.request.jurisdiction)
         if adapter:
             research = adapter.research_portal()
             portal_url = research.portal_url
-    svc = PortalAutomationService(approve_each_step=approve_each_step)
-    if approve_each_step:
-        def approve(step_name: str, step_data: dict) -> bool:
-            typer.echo(f"Step: {step_name}")
-            if step_data.get("danger"):
-                typer.echo("  [DANGER] This step submits the application.")
-            return typer.confirm("Approve this step?", default=False)
-        svc._approval_callback = approve
-    result = svc.run_flow(case_id, case=case, portal_url=portal_url)
+
+    def approve(step_name: str, step_data: dict) -> bool:
+        typer.echo(f"Step: {step_name}")
+        if step_data.get("danger"):
+            typer.echo("  [DANGER] This step submits the application.")
+        approved = typer.confirm("Approve this step?", default=False)
+        if case:
+            kind = CaseEventKind.SUBMISSION_STEP_APPROVED if approved else CaseEventKind.SUBMISSION_STEP_DECLINED
+            intake_svc.record_event(case_id, kind, {"step": step_data["id"], "name": step_name}, actor="cli")
+        return approved
+
+    credentials = credentials_from_env()
+    session_store = None
+    if browser and credentials and reuse_session:
+        if os.environ.get(SESSION_KEY_ENV):
+            session_store = SessionStore(data_dir)
+        else:
+            console.print(f"[yellow]{SESSION_KEY_ENV} not set; logging in without saving the session.[/yellow]")
+    engine = None
+    if browser:
+        policy = NetworkPolicy(block_types=tuple(block), cache=AssetCache(data_dir / "asset_cache")) if network_policy else None
+        engine = PlaywrightEngine(BrowserPool(size=1, headless=not headed), network=policy)
+    timing_store = TimingStore(data_dir / "portal_timings.db")
+    try:
+        svc = PortalAutomationService(
+            approve_each_step=approve_each_step,
+            approval_callback=approve,
+            engine=engine,
+            credentials=credentials,
+            session_store=session_store,
+            timing_store=timing_store,
+            artifacts_dir=data_dir / "portal_artifacts",
+            capture=CaptureOptions(trace=trace, screenshots=screenshots, har=har),
+        )
+        result = svc.run_flow(case_id, case=case, portal_url=portal_url)
+    finally:
+        if engine is not None:
+            engine.close()
+        timing_store.close()
     console.print(f"[green]Flow status:[/green] {result['status']}")
     console.print(f"  Completed steps: {result.get('completed_steps', [])}")
+    for step in result.get("steps", []):
+        console.print(f"  {step['id']}: {step['status']} ({step['elapsed_ms']:.0f} ms){' - ' + step['detail'] if step['detail'] else ''}")
+        if step.get("network"):
+            net = step["network"]
+            console.print(
+                f"    network: {net['requests']} requests, {net['blocked']} blocked, {net['cache_hits']} from cache "
+                f"({net['bytes_saved'] / 1024:.0f} KB, {net['ms_saved']:.0f} ms saved)"
+            )
+    if result.get("error"):
+        console.print(f"[red]{result.get('failed_at')}: {result['error']}[/red]")
+    if result.get("session_reused"):
+        console.print("  Login: reused saved session")
+    if result.get("confirmation"):
+        console.print(f"  Confirmation: {result['confirmation']}")
+    timing = result["timing"]
+    console.print(
+        f"  Time: {timing['total_ms'] / 1000:.1f} s total, browser setup {timing['setup_ms']:.0f} ms, "
+        f"steps {timing['run_ms']:.0f} ms, waiting for approval {timing['approval_ms'] / 1000:.1f} s"
+    )
+    if result.get("artifacts"):
+        console.print(f"  Artifacts: {result['artifacts']}")
+
+
+@app.command()
+def portal_batch(
+    batch: str = typer.Option(..., "--batch", "-b", help="Batch name; rerun with the same name to resume"),
+    case_id: list[str] = typer.Option([], "--case-id", "-c", help="Add this case to the batch (repeatable)"),
+    jurisdiction: str | None = typer.Option(None, "--jurisdiction", "-j", help="Add every case of this jurisdiction"),
+    data_dir: Path = typer.Option(Path("data"), "--data-dir", path_type=Path, help="Batch state lives at <data-dir>/portal_batches.db"),
+    portal_limit: int = typer.Option(2, "--portal-limit", help="Flows at once per portal"),
+    workers: int = typer.Option(8, "--workers", help="Flows at once overall"),
+    approve_each_step: bool = typer.Option(True, "--approve-each-step/--no-approve", help="Require approval before each step (submit is always confirmed)"),
+    browser: bool = typer.Option(False, "--browser", help="Drive a real Chromium browser (default: dry run of the steps)"),
+    headed: bool = typer.Option(False, "--headed", help="Show the browser windows with --browser"),
+    requeue: str | None = typer.Option(None, "--requeue", help="Queue jobs in this state again: aborted, failed, needs_login or unknown"),
+) -> None:
+    """Submit many cases across portals concurrently; every approval goes through one prompt queue."""
+    import threading
+
+    from permitting_agent.portal_automation.batch import ApprovalQueue, BatchScheduler, BatchStore
+
+    intake_svc = IntakeService(data_dir=data_dir)
+    store = BatchStore(data_dir / "portal_batches.db")
+    cases = [c for c in (intake_svc.get_case(i) for i in case_id) if c is not None]
+    if jurisdiction:
+        cursor = None
+        while True:
+            page, cursor = intake_svc.list_cases(jurisdiction=jurisdiction, limit=500, cursor=cursor)
+            cases.extend(page)
+            if cursor is None:
+                break
+    portal_urls: dict[str, str | None] = {}
+    jobs = []
+    for case in cases:
+        name = case.request.jurisdiction
+        if name not in portal_urls:
+            adapter = get_adapter(name)
+            portal_urls[name] = adapter.research_portal().portal_url if adapter else None
+        if portal_urls[name] is None:
+            console.print(f"[yellow]  Skipped {case.id}: no portal known for {name}[/yellow]")
+            continue
+        jobs.append((case.id, portal_urls[name], case_documents(case)))
+    if jobs:
+        console.print(f"Added {store.add(batch, jobs)} case(s) to batch {batch}")
+    if requeue:
+        console.print(f"Requeued {store.requeue(batch, SubmissionStatus(requeue))} {requeue} job(s)")
+
+    engine = PlaywrightEngine(BrowserPool(size=workers, headless=not headed)) if browser else None
+    approvals = ApprovalQueue()
+    scheduler = BatchScheduler(
+        store,
+        approvals,
+        engine=engine,
+        portal_limit=portal_limit,
+        workers=workers,
+        approve_each_step=approve_each_step,
+        credentials=credentials_from_env(),
+        timing_store=TimingStore(data_dir / "portal_timings.db"),
+    )
+    result: list[SubmissionBatchReport] = []
+    runner = threading.Thread(target=lambda: result.append(scheduler.run(batch)), daemon=True)
+    runner.start()
+    try:
+        while runner.is_alive():
+            req = approvals.get(timeout=0.5)
+            if req is None:
+                continue
+            waiting = len(approvals.pending())
+            typer.echo(f"[{req.case_id} @ {req.portal}] {req.step['name']} ({waiting} waiting)")
+            if req.danger:
+                typer.echo("  [DANGER] This step submits the application.")
+                answer = "y" if typer.confirm("Approve this step?", default=False) else "n"
+            else:
+                answer = typer.prompt("Approve? y / n / a = approve all waiting for this step", default="n").strip().lower()
+            if answer == "a":
+                approved_ids = [r.case_id for r in approvals.pending() if r.step["id"] == req.step["id"] and not r.danger]
+                approvals.approve_matching(req.step["id"])
+            else:
+                approved_ids = [req.case_id]
+                approvals.resolve(req.id, answer == "y")
+            kind = CaseEventKind.SUBMISSION_STEP_APPROVED if answer in ("y", "a") else CaseEventKind.SUBMISSION_STEP_DECLINED
+            for cid in approved_ids:
+                intake_svc.record_event(cid, kind, {"step": req.step["id"], "name": req.step["name"], "batch": batch}, actor="cli")
+    except (KeyboardInterrupt, typer.Abort):
+        console.print(f"[yellow]Stopping; rerun with --batch {batch} to resume.[/yellow]")
+        scheduler.stop()
+    runner.join()
+    if engine is not None:
+        engine.close()
+    scheduler.timing_store.close()
+    store.close()
+    if result:
+        report = result[0]
+        console.print(f"[green]Batch {batch}:[/green] {report.jobs} job(s) in {report.elapsed_s:.1f} s")
+        console.print("  " + ", ".join(f"{status}: {n}" for status, n in report.counts.items() if n))
+        console.print(f"  Approvals: {report.approvals}, waiting on a person {report.approval_wait_s:.1f} s in total")
+        if report.counts.get("unknown"):
+            console.print("[yellow]  'unknown' jobs were interrupted mid-submit; check the portal before --requeue unknown.[/yellow]")
+
+
+@app.command()
+def portal_stats(
+    data_dir: Path = typer.Option(Path("data"), "--data-dir", path_type=Path),
+    portal: str | None = typer.Option(None, "--portal", help="Per-step timings for this portal (any URL on it)"),
+    days: float = typer.Option(30.0, "--days", help="Only flows from the last N days"),
+) -> None:
+    """Where portal submission time goes: browser time per portal, or per step for one portal,
+    kept apart from time spent waiting for approvals.
+    """
+    store = TimingStore(data_dir / "portal_timings.db")
+    since = (datetime.now() - timedelta(days=days)).timestamp()
+    if portal is None:
+        rows = store.portal_summary(since=since)
+        table = Table(title=f"Portal timings, last {days:g} days (slowest first)")
+        for column in ("Portal", "Flows", "Failed", "Browser total", "p50 / flow", "p95 / flow", "Setup p50", "Approval wait p50"):
+            table.add_column(column)
+        for row in rows:
+            table.add_row(
+                row["portal"],
+                str(row["flows"]),
+                str(row["failed"]),
+                f"{row['browser_ms'] / 1000:.1f} s",
+                f"{row['p50_ms']:.0f} ms",
+                f"{row['p95_ms']:.0f} ms",
+                f"{row['setup_p50_ms']:.0f} ms",
+                f"{row['approval_p50_ms'] / 1000:.1f} s",
+            )
+    else:
+        portal = SessionStore.portal_key(portal)
+        rows = store.step_summary(portal=portal, since=since)
+        table = Table(title=f"{portal}, last {days:g} days")
+        for column in ("Step", "Count", "Failed", "p50", "p95", "Max", "Approval wait p50"):
+            table.add_column(column)
+        for row in rows:
+            table.add_row(
+                row["step"],
+                str(row["count"]),
+                str(row["failed"]),
+                f"{row['p50_ms']:.0f} ms",
+                f"{row['p95_ms']:.0f} ms",
+                f"{row['max_ms']:.0f} ms",
+                f"{row['approval_p50_ms'] / 1000:.1f} s",
+            )
+    store.close()
+    if not rows:
+        console.print("[yellow]No recorded portal flows in that window.[/yellow]")
+        return
+    console.print(table)
+
+
+@runs_app.command("start")
+def portal_runs_start(
+    case_id: str = typer.Option(..., "--case-id", "-c"),
+    portal_url: str | None = typer.Option(None, "--portal-url", help="Portal URL instead of the adapter's"),
+    approve_each_step: bool = typer.Option(True, "--approve-each-step/--no-approve", help="Wait for approval before each step (submit always waits)"),
+    data_dir: Path = typer.Option(Path("data"), "--data-dir", path_type=Path, help="Runs live at <data-dir>/portal_runs.db"),
+) -> None:
+    """Create a run for a case; a `portal-runs work` process executes it up to the first approval."""
+    case = IntakeService(data_dir=data_dir).get_case(case_id)
+    if case is None:
+        console.print(f"[red]Case not found: {case_id}[/red]")
+        raise typer.Exit(1)
+    if not portal_url:
+        adapter = get_adapter(case.request.jurisdiction)
+        portal_url = adapter.research_portal().portal_url if adapter else None
+    store = RunStore(data_dir / "portal_runs.db")
+    run = PortalRunner(store).start(case_id, portal_url=portal_url, documents=case_documents(case), approve_each_step=approve_each_step)
+    store.close()
+    console.print(f"[green]Run {run.id}[/green] for {case_id}: {run.status.value}")
+
+
+@runs_app.command("list")
+def portal_runs_list(
+    status: str | None = typer.Option(None, "--status", help="e.g. awaiting_approval, unknown"),
+    case_id: str | None = typer.Option(None, "--case-id", "-c"),
+    limit: int = typer.Option(50, "--limit", "-n"),
+    data_dir: Path = typer.Option(Path("data"), "--data-dir", path_type=Path),
+) -> None:
+    """List runs, oldest change first."""
+    store = RunStore(data_dir / "portal_runs.db")
+    runs = store.list(status=RunStatus(status) if status else None, case_id=case_id, limit=limit)
+    store.close()
+    table = Table(title="Portal runs")
+    for column in ("ID", "Case", "Status", "Pending step", "Steps done", "Updated"):
+        table.add_column(column)
+    for run in runs:
+        table.add_row(
+            run.id,
+            run.case_id,
+            run.status.value,
+            run.pending_step or "",
+            str(len(run.completed_steps)),
+            run.updated_at.strftime("%Y-%m-%d %H:%M:%S"),
+        )
+    console.print(table)
+
+
+def _decide_run(run_id: str, step: str, approved: bool, data_dir: Path) -> None:
+    store = RunStore(data_dir / "portal_runs.db")
+    try:
+        run = store.decide(run_id, step, approved, actor="cli")
+    except KeyError:
+        console.print(f"[red]Run not found: {run_id}[/red]")
+        raise typer.Exit(1)
+    except RunStateError as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(1)
+    finally:
+        store.close()
+    intake_svc = IntakeService(data_dir=data_dir)
+    if intake_svc.get_case(run.case_id):
+        kind = CaseEventKind.SUBMISSION_STEP_APPROVED if approved else CaseEventKind.SUBMISSION_STEP_DECLINED
+        intake_svc.record_event(run.case_id, kind, {"step": step, "run": run.id}, actor="cli")
+    console.print(f"[green]Run {run.id}:[/green] {run.status.value}")
+
+
+@runs_app.command("approve")
+def portal_runs_approve(
+    run_id: str = typer.Argument(...),
+    step: str = typer.Option(..., "--step", "-s", help="The run's pending step (guards against approving the wrong one)"),
+    data_dir: Path = typer.Option(Path("data"), "--data-dir", path_type=Path),
+) -> None:
+    """Approve a run's pending step; a worker picks the run up again."""
+    _decide_run(run_id, step, True, data_dir)
+
+
+@runs_app.command("reject")
+def portal_runs_reject(
+    run_id: str = typer.Argument(...),
+    step: str = typer.Option(..., "--step", "-s"),
+    data_dir: Path = typer.Option(Path("data"), "--data-dir", path_type=Path),
+) -> None:
+    """Reject a run's pending step; the run ends as rejected."""
+    _decide_run(run_id, step, False, data_dir)
+
+
+@runs_app.command("retry")
+def portal_runs_retry(
+    run_id: str = typer.Argument(...),
+    data_dir: Path = typer.Option(Path("data"), "--data-dir", path_type=Path),
+) -> None:
+    """Make a failed, needs_login or unknown run ready again (check the portal first for unknown)."""
+    store = RunStore(data_dir / "portal_runs.db")
+    try:
+        run = store.retry(run_id)
+    except (KeyError, RunStateError) as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(1)
+    finally:
+        store.close()
+    console.print(f"[green]Run {run.id}:[/green] {run.status.value}")
+
+
+@runs_app.command("work")
+def portal_runs_work(
+    data_dir: Path = typer.Option(Path("data"), "--data-dir", path_type=Path),
+    browser: bool = typer.Option(False, "--browser", help="Drive a real Chromium browser (default: dry run of the steps)"),
+    headed: bool = typer.Option(False, "--headed", help="Show the browser window with --browser"),
+    once: bool = typer.Option(False, "--once", help="Advance every ready run once, then exit"),
+    poll: float = typer.Option(2.0, "--poll", help="Seconds between checks for newly approved runs"),
+) -> None:
+    """Execute ready runs up to their next approval point. Run as many workers as you like."""
+    store = RunStore(data_dir / "portal_runs.db")
+    credentials = credentials_from_env()
+    session_store = SessionStore(data_dir) if browser and credentials and os.environ.get(SESSION_KEY_ENV) else None
+    engine = None
+    if browser:
+        policy = NetworkPolicy(cache=AssetCache(data_dir / "asset_cache"))
+        engine = PlaywrightEngine(BrowserPool(size=1, headless=not headed), network=policy)
+    timing_store = TimingStore(data_dir / "portal_timings.db")
+    runner = PortalRunner(store, engine=engine, credentials=credentials, session_store=session_store, timing_store=timing_store)
+    try:
+        advanced = runner.work(poll_s=poll, once=once)
+    except KeyboardInterrupt:
+        advanced = None
+    finally:
+        if engine is not None:
+            engine.close()
+        timing_store.close()
+    counts = ", ".join(f"{status}: {n}" for status, n in store.counts().items() if n)
+    store.close()
+    if counts:
+        console.print(f"  Runs: {counts}")
+    if advanced is not None:
+        console.print(f"[green]Advanced {advanced} run(s)[/green]")
 
 
 @app.command()
 def outreach(
     jurisdiction: str = typer.Option(..., "--jurisdiction", "-j"),
     output: Path = typer.Option(Path("output/outreach"), "--output", "-o", path_type=Path),
+    crawl: list[str] = typer.Option([], "--crawl", help="Crawl the city's staff directory from this URL instead of using adapter data (repeatable)"),
+    max_pages: int = typer.Option(500, "--max-pages", help="Page budget for --crawl"),
+    concurrency: int = typer.Option(8, "--concurrency", help="Pages fetched at once for --crawl"),
+    rps: float = typer.Option(0.0, "--rps", help="Request rate cap for --crawl (0 = no cap)"),
+    data_dir: Path | None = typer.Option(None, "--data-dir", path_type=Path, help="Also merge the contacts into <data-dir>/contacts.db"),
 ) -> None:
     """Discover contacts from official sources; save contact list and generate email drafts."""
     svc = OutreachService(output_dir=output.parent)
-    contact_list = svc.discover_and_save(jurisdiction, output_path=output)
+    validators = None
+    if crawl:
+        contact_list, stats = asyncio.run(
+            svc.discover_from_site(jurisdiction, crawl, concurrency=concurrency, max_pages=max_pages, rate_limit_rps=rps or None)
+        )
+        svc.save_contact_list(contact_list, output_path=output)
+        validators = stats.validators
+        console.print(
+            f"  Crawled {stats.fetched} pages in {stats.elapsed_s:.1f}s "
+            f"({stats.robots_skipped} blocked by robots.txt, {stats.failed} failed)"
+        )
+    else:
+        contact_list = svc.discover_and_save(jurisdiction, output_path=output)
+    if data_dir is not None:
+        index = ContactIndex(data_dir / "contacts.db")
+        added, merged = index.add(contact_list, validators=validators)
+        index.close()
+        console.print(f"  Contact index: {added} new, {merged} already known")
     drafts = svc.draft_emails(contact_list)
     console.print(f"[green]Outreach data generated.[/green]")
     console.print(f"  Contacts: {len(contact_list.contacts)}")
@@ -164,6 +681,344 @@ def outreach(
     console.print(f"  Saved: {output} (JSON + .md)")
 
 
+@app.command()
+def outreach_drafts(
+    contacts: list[Path] = typer.Option([], "--contacts", path_type=Path, help="Contact list JSON file or directory of *_contacts.json (repeatable)"),
+    jurisdictions: list[str] = typer.Option([], "--jurisdiction", "-j", help="Discover contacts for this jurisdiction (repeatable)"),
+    templates: Path | None = typer.Option(None, "--templates", path_type=Path, envvar="PERMITTING_OUTREACH_TEMPLATES", help="Template directory (default: config/outreach_templates)"),
+    fmt: str = typer.Option("mbox", "--format", "-f", help="eml (one file per draft) | mbox (one file)"),
+    output: Path | None = typer.Option(None, "--output", "-o", path_type=Path, help="Default: output/outreach/drafts(.mbox)"),
+    sender: str | None = typer.Option(None, "--from", help="From address for the drafts"),
+    var: list[str] = typer.Option([], "--var", help="Extra template variable KEY=VALUE (repeatable)"),
+) -> None:
+    """Render outreach drafts for many jurisdictions and stream them to .eml files or an mbox."""
+    from permitting_agent.outreach import TemplateLibrary, iter_contact_lists, open_writer
+
+    if not contacts and not jurisdictions:
+        console.print("[red]Give --contacts and/or --jurisdiction.[/red]")
+        raise typer.Exit(1)
+    if fmt not in ("eml", "mbox"):
+        console.print(f"[red]Unknown format: {fmt} (use eml or mbox)[/red]")
+        raise typer.Exit(1)
+    variables = {}
+    for item in var:
+        key, sep, value = item.partition("=")
+        if not sep or not key.strip():
+            console.print(f"[red]--var expects KEY=VALUE, got {item!r}[/red]")
+            raise typer.Exit(1)
+        variables[key.strip()] = value
+    output = output or Path("output/outreach") / ("drafts.mbox" if fmt == "mbox" else "drafts")
+    svc = OutreachService(output_dir=output.parent, templates=TemplateLibrary(templates))
+
+    def contact_lists():
+        yield from iter_contact_lists(contacts)
+        for jurisdiction in jurisdictions:
+            yield svc.discover(jurisdiction)
+
+    with open_writer(output, fmt, sender=sender) as writer:
+        report = svc.write_drafts(contact_lists(), writer, variables)
+    console.print(f"[green]Outreach drafts written.[/green]")
+    console.print(f"  Jurisdictions: {report.jurisdictions}")
+    console.print(f"  Drafts: {report.drafts} -> {report.output}")
+    for name, count in sorted(report.templates_used.items()):
+        console.print(f"  Template {name}: {count}")
+    if report.without_contacts:
+        console.print(f"[yellow]  No contacts: {len(report.without_contacts)} jurisdiction(s)[/yellow]")
+    for error in report.errors:
+        console.print(f"[red]  {error}[/red]")
+
+
+@app.command()
+def outreach_send(
+    mbox: list[Path] = typer.Option([], "--mbox", path_type=Path, help="Queue every draft in this mbox (repeatable)"),
+    eml: list[Path] = typer.Option([], "--eml", path_type=Path, help="Queue every .eml file in this directory (repeatable)"),
+    data_dir: Path = typer.Option(Path("data"), "--data-dir", path_type=Path, help="Send queue lives at <data-dir>/outbox.db"),
+    sender: str | None = typer.Option(None, "--from", envvar="OUTREACH_FROM", help="Sender for drafts without a From header"),
+    send: bool = typer.Option(False, "--send", help="Send queued messages (default: only queue and show counts)"),
+    yes: bool = typer.Option(False, "--yes", "-y", help="Skip the confirmation prompt before sending"),
+    smtp_host: str | None = typer.Option(None, "--smtp-host", envvar="SMTP_HOST"),
+    smtp_port: int | None = typer.Option(None, "--smtp-port", envvar="SMTP_PORT"),
+    domain_interval: float = typer.Option(20.0, "--domain-interval", help="Seconds between messages to one recipient domain"),
+    concurrency: int = typer.Option(4, "--concurrency", help="SMTP connections at once"),
+    requeue_failed: bool = typer.Option(False, "--requeue-failed", help="Retry messages that failed permanently"),
+) -> None:
+    """Queue outreach drafts and send them over SMTP, rate-limited per domain; never sends a message twice."""
+    import dataclasses
+    import mailbox
+
+    from permitting_agent.outreach.delivery import DeliveryPolicy, DeliveryQueue, SmtpSettings, parse_message, send_queued
+
+    queue = DeliveryQueue(data_dir / "outbox.db")
+    raw_messages = [m.as_bytes() for path in mbox for m in mailbox.mbox(path, create=False)]
+    raw_messages += [p.read_bytes() for d in eml for p in sorted(Path(d).glob("*.eml"))]
+    to_queue, skipped = [], 0
+    for raw in raw_messages:
+        try:
+            msg_sender, recipients, key = parse_message(raw, default_sender=sender)
+        except ValueError as e:
+            console.print(f"[yellow]  Skipped a message: {e}[/yellow]")
+            skipped += 1
+            continue
+        if not recipients:
+            skipped += 1
+            continue
+        to_queue.append((raw, msg_sender, recipients, key))
+    added = queue.enqueue_many(to_queue)
+    if raw_messages:
+        console.print(f"Queued {added} new message(s) ({len(to_queue) - added} already queued, {skipped} skipped)")
+    if requeue_failed:
+        console.print(f"Requeued {queue.requeue()} failed message(s)")
+    counts = queue.counts()
+    console.print("  " + ", ".join(f"{status}: {n}" for status, n in counts.items()))
+    if not send:
+        queue.close()
+        return
+    if counts["queued"] and not yes and not typer.confirm(f"Send {counts['queued']} message(s) now?", default=False):
+        queue.close()
+        raise typer.Exit(1)
+    settings = SmtpSettings.from_env()
+    settings = dataclasses.replace(settings, host=smtp_host or settings.host, port=smtp_port or settings.port)
+    policy = DeliveryPolicy(domain_interval=domain_interval, concurrency=concurrency)
+    report = send_queued(queue, settings, policy)
+    queue.close()
+    console.print(f"[green]Sent {report.sent}[/green] in {report.elapsed_s:.1f} s")
+    console.print(f"  Retrying later: {report.remaining}, failed: {report.failed}, unknown: {report.unknown}")
+    if report.unknown:
+        console.print("[yellow]  'unknown' messages were interrupted mid-send; check before requeueing.[/yellow]")
+
+
+@app.command()
+def survey(
+    jurisdictions: list[str] = typer.Option(..., "--jurisdiction", "-j", help="Jurisdiction name (repeatable)"),
+    scope: str = typer.Option("small_cell", "--scope", "-s", help="Scope for checklists: small_cell | fiber | both"),
+    output_dir: Path = typer.Option(Path("output/survey"), "--output-dir", "-o", path_type=Path),
+    concurrency: int = typer.Option(8, "--concurrency", help="Jurisdictions surveyed at once"),
+) -> None:
+    """Research, discover contacts and load checklists for many jurisdictions concurrently."""
+    try:
+        kind = ScopeKind(scope)
+    except ValueError:
+        kind = ScopeKind.SMALL_CELL
+    research_svc = PortalResearchService(output_dir=output_dir)
+    outreach_svc = OutreachService(output_dir=output_dir)
+
+    async def _none() -> None:
+        return None
+
+    async def survey_one(jurisdiction: str, semaphore: asyncio.Semaphore):
+        async with semaphore:
+            adapter = get_async_adapter(jurisdiction)
+            checklist = adapter.get_checklist(kind) if adapter else _none()
+            # Research, contacts and checklist for one jurisdiction overlap too
+            return await asyncio.gather(
+                research_svc.research_async(jurisdiction),
+                outreach_svc.discover_async(jurisdiction),
+                checklist,
+            )
+
+    async def run_all():
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        return await asyncio.gather(*(survey_one(j, semaphore) for j in jurisdictions))
+
+    results = asyncio.run(run_all())
+    table = Table(title="Jurisdiction survey")
+    for column in ("Jurisdiction", "Requirements", "Contacts", "Checklist items", "Portal"):
+        table.add_column(column)
+    for jurisdiction, (research, contacts, checklist) in zip(jurisdictions, results):
+        slug = jurisdiction.replace(" ", "_")
+        research_svc.save_result(research, output_dir / f"{slug}_research.json")
+        outreach_svc.save_contact_list(contacts, output_dir / f"{slug}_contacts.json")
+        if checklist is not None:
+            write_model(output_dir / f"{slug}_checklist.json", checklist)
+        table.add_row(
+            jurisdiction,
+            str(len(research.requirements)),
+            str(len(contacts.contacts)),
+            str(len(checklist.items)) if checklist else "-",
+            research.portal_url or "-",
+        )
+    console.print(table)
+    console.print(f"  Saved: {output_dir}")
+
+
+@app.command()
+def build_adapters(
+    src: Path = typer.Option(Path("config/jurisdictions"), "--src", path_type=Path, help="Spec file or directory of YAML/JSON specs"),
+    out: Path = typer.Option(Path("data/adapters.bundle"), "--out", "-o", path_type=Path),
+) -> None:
+    """Validate declarative jurisdiction specs and compile them into one adapter bundle."""
+    from permitting_agent.adapters.bundle import BundleError, compile_bundle
+
+    try:
+        ids = compile_bundle(src, out)
+    except BundleError as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(1)
+    console.print(f"[green]Compiled {len(ids)} jurisdiction(s).[/green]")
+    console.print(f"  Bundle: {out}")
+    console.print(f"  Use with: PERMITTING_ADAPTER_BUNDLES={out}")
+
+
+@cases_app.command("list")
+def cases_list(
+    jurisdiction: str | None = typer.Option(None, "--jurisdiction", "-j"),
+    scope: str | None = typer.Option(None, "--scope", "-s"),
+    status: str | None = typer.Option(None, "--status"),
+    created_from: datetime | None = typer.Option(None, "--from", help="Created on/after (ISO date or datetime)"),
+    created_to: datetime | None = typer.Option(None, "--to", help="Created before (ISO date or datetime)"),
+    limit: int = typer.Option(50, "--limit", "-n"),
+    cursor: str | None = typer.Option(None, "--cursor", help="Continue from a previous page's cursor"),
+    newest_first: bool = typer.Option(False, "--newest-first"),
+    data_dir: Path = typer.Option(Path("data"), "--data-dir", path_type=Path),
+) -> None:
+    """List cases by jurisdiction, scope, status and date range, one page at a time."""
+    service = IntakeService(data_dir=data_dir)
+    try:
+        cases, next_cursor = service.list_cases(
+            jurisdiction=jurisdiction,
+            scope=scope,
+            status=status,
+            created_from=created_from,
+            created_to=created_to,
+            limit=limit,
+            cursor=cursor,
+            descending=newest_first,
+        )
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(1)
+    table = Table(title="Cases")
+    for column in ("ID", "Created", "Jurisdiction", "Scope", "Status", "Address"):
+        table.add_column(column)
+    for case in cases:
+        table.add_row(
+            case.id,
+            case.created_at.strftime("%Y-%m-%d %H:%M"),
+            case.request.jurisdiction,
+            case.request.scope.kind.value,
+            case.status,
+            case.request.site.address,
+        )
+    console.print(table)
+    if next_cursor:
+        console.print(f"  Next page: --cursor {next_cursor}")
+
+
+@cases_app.command("history")
+def cases_history(
+    case_id: str = typer.Argument(..., help="Intake case ID"),
+    data_dir: Path = typer.Option(Path("data"), "--data-dir", path_type=Path),
+) -> None:
+    """Show a case's event log (the audit trail), oldest first."""
+    service = IntakeService(data_dir=data_dir)
+    history = service.case_history(case_id)
+    if not history:
+        console.print(f"[red]No events for case: {case_id}[/red]")
+        raise typer.Exit(1)
+    table = Table(title=f"Case {case_id}")
+    for column in ("Seq", "At", "Event", "Actor", "Details"):
+        table.add_column(column)
+    for event in history:
+        details = ", ".join(f"{k}={v}" for k, v in event.data.items())
+        table.add_row(str(event.seq), event.at.strftime("%Y-%m-%d %H:%M:%S"), event.kind.value, event.actor or "", details)
+    console.print(table)
+
+
+@cases_app.command("compact")
+def cases_compact(
+    data_dir: Path = typer.Option(Path("data"), "--data-dir", path_type=Path),
+    min_events: int = typer.Option(1, "--min-events", help="Only snapshot cases with at least this many new events"),
+) -> None:
+    """Fold accumulated case events into snapshots so reads replay fewer events (events are kept)."""
+    service = IntakeService(data_dir=data_dir)
+    count = service.compact(min_events)
+    console.print(f"[green]Compacted {count} case(s)[/green]")
+
+
+@cases_app.command("migrate")
+def cases_migrate(
+    data_dir: Path = typer.Option(Path("data"), "--data-dir", path_type=Path),
+    src: Path | None = typer.Option(None, "--src", path_type=Path, help="JSON case directory (default: <data-dir>/cases)"),
+) -> None:
+    """Copy legacy one-JSON-file-per-case data into the SQLite case store (safe to re-run)."""
+    from permitting_agent.intake import SqliteCaseStore, migrate_json_cases
+
+    src_dir = src or data_dir / "cases"
+    if not src_dir.is_dir():
+        console.print(f"[red]No case directory: {src_dir}[/red]")
+        raise typer.Exit(1)
+    store = SqliteCaseStore(data_dir / "cases.db")
+    migrated, errors = migrate_json_cases(src_dir, store)
+    console.print(f"[green]Migrated {migrated} case(s)[/green] into {store.path} ({len(store)} total).")
+    for error in errors:
+        console.print(f"[yellow]  Skipped {error}[/yellow]")
+    store.close()
+
+
+@cases_app.command("reindex-sites")
+def cases_reindex_sites(
+    data_dir: Path = typer.Option(Path("data"), "--data-dir", path_type=Path),
+) -> None:
+    """Rebuild the site dedup index from every stored case (after a migration, an import from elsewhere,
+    or an upgrade that changed how address keys are built)."""
+    service = IntakeService(data_dir=data_dir)
+    count = service.site_index.rebuild(service.store.iter_cases())
+    console.print(f"[green]Indexed {count} site(s)[/green] into {service.site_index.path}")
+
+
+@contacts_app.command("import")
+def contacts_import(
+    paths: list[Path] = typer.Argument(..., help="Contact list JSON files or directories of *_contacts.json"),
+    data_dir: Path = typer.Option(Path("data"), "--data-dir", path_type=Path),
+) -> None:
+    """Merge saved contact lists into the contact index (deduped by email and phone)."""
+    from permitting_agent.outreach import iter_contact_lists
+
+    index = ContactIndex(data_dir / "contacts.db")
+    added, merged = index.add_many(iter_contact_lists(paths))
+    counts = index.counts()
+    index.close()
+    console.print(f"[green]Imported:[/green] {added} new, {merged} merged into existing contacts")
+    console.print(f"  Index: {counts['active']} active contacts from {counts['sources']} source pages")
+
+
+@contacts_app.command("refresh")
+def contacts_refresh(
+    data_dir: Path = typer.Option(Path("data"), "--data-dir", path_type=Path),
+    max_age_days: float = typer.Option(30.0, "--max-age-days", help="Re-verify contacts not verified for this long"),
+    concurrency: int = typer.Option(8, "--concurrency", help="Source pages checked at once"),
+    rps: float = typer.Option(0.0, "--rps", help="Request rate cap (0 = no cap)"),
+) -> None:
+    """Re-verify stale contacts with one conditional GET per source page (no recrawl)."""
+    from permitting_agent.outreach import ContactCrawler
+
+    index = ContactIndex(data_dir / "contacts.db")
+    crawler = ContactCrawler(concurrency=concurrency, rate_limit_rps=rps or None)
+    report = asyncio.run(index.refresh(timedelta(days=max_age_days), crawler))
+    index.close()
+    console.print(f"[green]Checked {report.sources_checked} source page(s) in {report.elapsed_s:.1f}s[/green]")
+    console.print(
+        f"  Unchanged (304): {report.not_modified}  Changed: {report.changed}  Gone: {report.gone}  Failed: {report.failed}"
+    )
+    console.print(f"  Contacts verified: {report.verified}  Removed: {report.removed}")
+    if report.unverifiable:
+        console.print(f"[yellow]  {report.unverifiable} stale contact(s) have no source URL to re-check.[/yellow]")
+
+
+@contacts_app.command("export")
+def contacts_export(
+    jurisdiction: str = typer.Option(..., "--jurisdiction", "-j"),
+    output: Path = typer.Option(..., "--output", "-o", path_type=Path),
+    data_dir: Path = typer.Option(Path("data"), "--data-dir", path_type=Path),
+) -> None:
+    """Write a jurisdiction's current contacts from the index as a contact list (JSON + Markdown)."""
+    index = ContactIndex(data_dir / "contacts.db")
+    contact_list = index.contact_list(jurisdiction)
+    index.close()
+    OutreachService(output_dir=output.parent).save_contact_list(contact_list, output_path=output)
+    console.print(f"[green]Exported {len(contact_list.contacts)} contact(s)[/green] to {output}")
+
+
 @app.command()
 def adapters() -> None:
     """List registered jurisdiction adapters."""
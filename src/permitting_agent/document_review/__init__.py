@@ -1,5 +1,5 @@
 """Document review: ingest PDF/Word, extract fields, compare to checklist, output What's Needed."""
 
-from permitting_agent.document_review.service import DocumentReviewService
+from permitting_agent.document_review.service import DocumentReviewService, unread_pages
 
-__all__ = ["DocumentReviewService"]
+__all__ = ["DocumentReviewService", "unread_pages"]
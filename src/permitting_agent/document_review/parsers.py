@@ -1,12 +1,40 @@
-"""Document parsers: PDF and Word (stubs with one working path for sample PDF)."""
+"""Document parsers: PDF and Word (stubs with one working path for sample PDF).
 
+Fillable PDFs can be read from their AcroForm instead of their page text: ``read_form_fields``
+walks the form's field tree (exact names, types, options, current values, page of each widget)
+without extracting any text, which is both exact and much faster than ``extract_text``.
+
+Before extracting a page's text, ``classify_page`` scans its content stream for text objects and
+image draws (no operator parsing). Scanned sheets and vector drawings have no text objects, so
+``extract_text`` could only walk their content for nothing; they are skipped and reported as
+not machine-read in ``DocumentArtifact.pages``.
+"""
+
+import re
 from pathlib import Path
+from typing import Any
 
 from pydantic import BaseModel
 
-from permitting_agent.models import DocumentArtifact, ExtractedField, Citation
+from permitting_agent.models import DocumentArtifact, ExtractedField, Citation, FormField, PageInfo
 from permitting_agent.models.document import Confidence
 
+PARSE_MODES = ("text", "form", "auto")
+
+# AcroForm field flags (PDF 32000-1, 12.7.3.1 and 12.7.4)
+_READ_ONLY = 1 << 0
+_REQUIRED = 1 << 1
+_RADIO = 1 << 15
+_PUSHBUTTON = 1 << 16
+_INHERITABLE = ("/FT", "/Ff", "/V", "/Opt")
+
+# Content stream tokens for the page pre-check: text objects, XObject draws, inline images
+_BT = re.compile(rb"(?<![^\s\]>)])BT(?![^\s/\[(<])")
+_DO = re.compile(rb"/([^\s/\[\]()<>{}%]+)\s*Do(?![^\s/\[(<])")
+_INLINE_IMAGE = re.compile(rb"(?<![^\s])BI\s.*?\sID\s.*?\sEI(?![^\s])", re.DOTALL)
+_MAX_FORM_DEPTH = 4
+_EXTRACTED_KINDS = ("text", "mixed")
+
 
 class ParseResult(BaseModel):
     """Result of parsing a single document."""
@@ -17,16 +45,43 @@ class ParseResult(BaseModel):
     error: str | None = None
 
 
-def parse_pdf(path: Path) -> ParseResult:
-    """Extract text and key fields from a PDF. Stub: sample PDF returns mock fields."""
+def parse_pdf(path: Path, mode: str = "text") -> ParseResult:
+    """Extract text and key fields from a PDF. Stub: sample PDF returns mock fields.
+
+    ``mode``: "text" extracts page text and applies keyword heuristics; "form" reads only the
+    AcroForm fields (a flat PDF yields none); "auto" reads the form and falls back to text
+    heuristics only when the PDF has no fillable fields.
+    """
+    if mode not in PARSE_MODES:
+        raise ValueError(f"unknown parse mode {mode!r}; expected one of {', '.join(PARSE_MODES)}")
+    reader = None
+    if mode != "text":
+        try:
+            from pypdf import PdfReader
+
+            reader = PdfReader(str(path))
+            form_fields = _read_form_fields(reader)
+        except Exception as e:
+            if mode == "form":
+                return ParseResult(path=path, success=False, error=str(e))
+            form_fields = []  # unreadable form: the text path may still get something
+        if form_fields or mode == "form":
+            artifact = DocumentArtifact(
+                path=path,
+                kind="pdf",
+                form_fields=form_fields,
+                extracted_fields=_extract_fields_from_form(path, form_fields),
+            )
+            return ParseResult(path=path, success=True, artifact=artifact)
     try:
         # Stub: for MVP we use pypdf for text; key-field extraction is heuristic/sample
-        text = _read_pdf_text(path)
+        text, pages = _read_pdf_pages(path, reader)
         fields = _extract_fields_from_text(path, text) if text else []
         artifact = DocumentArtifact(
             path=path,
             kind="pdf",
             extracted_fields=fields,
+            pages=pages,
             raw_text_preview=(text[:2000] + "..." if text and len(text) > 2000 else text),
         )
         return ParseResult(path=path, success=True, artifact=artifact)
@@ -50,20 +105,210 @@ def parse_docx(path: Path) -> ParseResult:
         return ParseResult(path=path, success=False, error=str(e))
 
 
-def _read_pdf_text(path: Path) -> str:
-    """Read raw text from PDF using pypdf."""
+def _read_pdf_text(path: Path, reader: Any = None) -> str:
+    """Read raw text from PDF using pypdf (reusing ``reader`` if the PDF is already open)."""
+    return _read_pdf_pages(path, reader)[0]
+
+
+def _read_pdf_pages(path: Path, reader: Any = None) -> tuple[str, list[PageInfo]]:
+    """Text of the pages that have any, and every page's classification. Pages without text
+    objects are not extracted.
+    """
+    parts: list[str] = []
+    pages: list[PageInfo] = []
     try:
         from pypdf import PdfReader
 
-        reader = PdfReader(str(path))
-        parts = []
-        for page in reader.pages:
-            t = page.extract_text()
-            if t:
-                parts.append(t)
-        return "\n\n".join(parts) or ""
+        reader = reader or PdfReader(str(path))
+        forms: dict[int, tuple[int, int]] = {}
+        for number, page in enumerate(reader.pages, 1):
+            try:
+                info = classify_page(page, number, forms)
+            except Exception:  # unreadable content stream: let extract_text have a go
+                info = PageInfo(number=number, kind="text")
+            pages.append(info)
+            if info.kind in _EXTRACTED_KINDS:
+                info.extracted = True
+                t = page.extract_text()
+                if t:
+                    parts.append(t)
     except Exception:
-        return ""
+        pass
+    return "\n\n".join(parts), pages
+
+
+def classify_page(page: Any, number: int = 1, forms: dict[int, tuple[int, int]] | None = None) -> PageInfo:
+    """Classify a pypdf page as text, mixed, image (images, no text objects) or graphics (neither)
+    from its content stream, including the Form XObjects it draws. ``forms`` caches the counts of
+    Form XObjects shared between pages (title blocks of a drawing set).
+    """
+    text_ops, images = _scan_content(_page_content(page), _resolve(page.get("/Resources")), {} if forms is None else forms, 0)
+    if text_ops:
+        kind = "mixed" if images else "text"
+    else:
+        kind = "image" if images else "graphics"
+    return PageInfo(number=number, kind=kind, images=images, text_ops=text_ops)
+
+
+def _page_content(page: Any) -> bytes:
+    contents = _resolve(page.get("/Contents"))
+    if contents is None:
+        return b""
+    streams = contents if isinstance(contents, list) else [contents]
+    return b"\n".join(stream.get_object().get_data() for stream in streams)
+
+
+def _scan_content(data: bytes, resources: Any, forms: dict[int, tuple[int, int]], depth: int) -> tuple[int, int]:
+    """(text objects, images drawn) in one content stream and the Form XObjects it draws."""
+    data, images = _INLINE_IMAGE.subn(b" ", data)
+    text_ops = len(_BT.findall(data))
+    xobjects = _resolve(resources.get("/XObject")) if resources is not None else None
+    if xobjects is None:
+        return text_ops, images
+    for name in _DO.findall(data):
+        key = "/" + name.decode("latin-1")
+        if key not in xobjects:
+            continue
+        ref = xobjects.raw_get(key)
+        xobject = ref.get_object()
+        subtype = xobject.get("/Subtype")
+        if subtype == "/Image":
+            images += 1
+        elif subtype == "/Form":
+            if depth >= _MAX_FORM_DEPTH:  # too deep to look into: assume it may hold text
+                text_ops += 1
+                continue
+            idnum = getattr(ref, "idnum", None)
+            counts = forms.get(idnum) if idnum is not None else None
+            if counts is None:
+                inner = _resolve(xobject.get("/Resources"))
+                counts = _scan_content(xobject.get_data(), inner if inner is not None else resources, forms, depth + 1)
+                if idnum is not None:
+                    forms[idnum] = counts
+            text_ops += counts[0]
+            images += counts[1]
+    return text_ops, images
+
+
+def read_form_fields(path: Path) -> list[FormField]:
+    """AcroForm fields of a PDF in form order, read from the field tree (no page text is extracted).
+    Empty for flat PDFs and XFA-only forms; push buttons are left out.
+    """
+    from pypdf import PdfReader
+
+    return _read_form_fields(PdfReader(str(path)))
+
+
+def _read_form_fields(reader: Any) -> list[FormField]:
+    acro_form = reader.trailer["/Root"].get("/AcroForm")
+    if acro_form is None:
+        return []
+    acro_form = acro_form.get_object()
+    widget_pages: dict[int, int] = {}
+    for number, page in enumerate(reader.pages, 1):
+        annots = page.get("/Annots")
+        for annot in annots.get_object() if annots is not None else ():
+            if hasattr(annot, "idnum"):
+                widget_pages.setdefault(annot.idnum, number)
+    fields: list[FormField] = []
+    seen: set[int] = set()
+    for ref in acro_form.get("/Fields") or ():
+        _walk_form_field(ref, "", {}, widget_pages, seen, fields)
+    return fields
+
+
+def _walk_form_field(
+    ref: Any, prefix: str, inherited: dict[str, Any], widget_pages: dict[int, int], seen: set[int], out: list[FormField]
+) -> None:
+    """Depth-first over one field node: kids with their own /T are fields, other kids are its widgets."""
+    if hasattr(ref, "idnum"):
+        if ref.idnum in seen:  # malformed trees can loop
+            return
+        seen.add(ref.idnum)
+    node = ref.get_object()
+    partial = node.get("/T")
+    name = prefix if partial is None else (f"{prefix}.{partial}" if prefix else str(partial))
+    inherited = {**inherited, **{k: node[k] for k in _INHERITABLE if k in node}}
+    kids = list(node["/Kids"]) if "/Kids" in node else []
+    named = [kid for kid in kids if "/T" in kid.get_object()]
+    if named:
+        for kid in named:
+            _walk_form_field(kid, name, inherited, widget_pages, seen, out)
+        return
+    field = _form_field(name, node, inherited, kids or [ref], widget_pages)
+    if field is not None:
+        out.append(field)
+
+
+def _form_field(
+    name: str, node: Any, props: dict[str, Any], widgets: list[Any], widget_pages: dict[int, int]
+) -> FormField | None:
+    flags = int(props.get("/Ff", 0))
+    ft = props.get("/FT")
+    if ft == "/Btn":
+        if flags & _PUSHBUTTON:
+            return None
+        kind = "radio" if flags & _RADIO else "checkbox"
+    else:
+        kind = {"/Tx": "text", "/Ch": "choice", "/Sig": "signature"}.get(ft)
+        if kind is None:  # a node without a field type is not a field
+            return None
+    options: list[str] = []
+    if kind == "choice":
+        for item in props.get("/Opt") or ():
+            item = item.get_object()
+            options.append(str(item[0] if isinstance(item, list) else item))  # [export value, display text]
+    elif kind in ("checkbox", "radio"):
+        for widget in widgets:  # on-states are the names of the normal appearances
+            appearance = _resolve(widget.get_object().get("/AP"))
+            states = _resolve(appearance.get("/N")) if hasattr(appearance, "get") else None
+            for state in states.keys() if hasattr(states, "keys") else ():
+                if state != "/Off" and state[1:] not in options:
+                    options.append(state[1:])
+    pages = [widget_pages[w.idnum] for w in widgets if hasattr(w, "idnum") and w.idnum in widget_pages]
+    leaf = name.rsplit(".", 1)[-1]
+    return FormField(
+        name=name,
+        label=str(node.get("/TU") or leaf.replace("_", " ").title()),
+        type=kind,
+        value=_form_value(props.get("/V")),
+        options=options,
+        required=bool(flags & _REQUIRED),
+        read_only=bool(flags & _READ_ONLY),
+        page=min(pages) if pages else None,
+    )
+
+
+def _resolve(obj: Any) -> Any:
+    return obj.get_object() if obj is not None else None
+
+
+def _form_value(value: Any) -> str | None:
+    """/V as text: names lose their slash ("/Off" means unset), multi-select lists are joined."""
+    if value is None:
+        return None
+    value = value.get_object()
+    if isinstance(value, list):
+        return ", ".join(str(v) for v in value) or None
+    text = str(value)
+    if text.startswith("/"):
+        text = text[1:]
+        return None if text == "Off" else text
+    return text or None
+
+
+def _extract_fields_from_form(path: Path, form_fields: list[FormField]) -> list[ExtractedField]:
+    """Filled-in form fields as extracted fields: the value is read, not inferred."""
+    return [
+        ExtractedField(
+            name=f.name,
+            value=f.value,
+            confidence=Confidence.CERTAIN,
+            citations=[Citation(page=f.page, section_heading=f.label, source_file=path.name)],
+        )
+        for f in form_fields
+        if f.value
+    ]
 
 
 def _read_docx_text(path: Path) -> str:
@@ -112,11 +357,11 @@ def _extract_fields_from_text(path: Path, text: str) -> list[ExtractedField]:
     return fields
 
 
-def parse_document(path: Path) -> ParseResult:
-    """Dispatch to PDF or Word parser by extension."""
+def parse_document(path: Path, mode: str = "text") -> ParseResult:
+    """Dispatch to PDF or Word parser by extension; ``mode`` applies to PDFs (see ``parse_pdf``)."""
     suf = path.suffix.lower()
     if suf == ".pdf":
-        return parse_pdf(path)
+        return parse_pdf(path, mode)
     if suf in (".docx", ".doc"):
         return parse_docx(path)
     return ParseResult(path=path, success=False, error=f"Unsupported format: {suf}")
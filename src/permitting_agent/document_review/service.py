@@ -12,6 +12,7 @@ from permitting_agent.models import (
     DocumentArtifact,
 )
 from permitting_agent.document_review.parsers import parse_document
+from permitting_agent.serialization import write_model
 
 
 class DocumentReviewService:
@@ -65,11 +66,17 @@ class DocumentReviewService:
                     )
                 )
 
+        summary = f"Found {len(artifacts)} document(s). {len(gaps)} checklist item(s) missing or uncertain."
+        unread = unread_pages(artifacts)
+        if unread:
+            listing = "; ".join(f"{name} p. {_page_ranges(numbers)}" for name, numbers in unread.items())
+            count = sum(len(numbers) for numbers in unread.values())
+            summary += f" {count} page(s) have no text layer (scans or drawings) and were not machine-read: {listing}."
         report = WhatsNeededReport(
             case_id=case_id,
             documents_reviewed=[str(a.path) for a in artifacts],
             gaps=gaps,
-            summary=f"Found {len(artifacts)} document(s). {len(gaps)} checklist item(s) missing or uncertain.",
+            summary=summary,
             citations=[c for a in artifacts for ef in a.extracted_fields for c in ef.citations],
         )
         return artifacts, report
@@ -79,8 +86,7 @@ class DocumentReviewService:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        json_path = output_path.with_suffix(".json")
-        json_path.write_text(report.model_dump_json(indent=2))
+        write_model(output_path.with_suffix(".json"), report)
 
         md_path = output_path.with_suffix(".md")
         md_path.write_text(self._report_to_markdown(report))
@@ -104,3 +110,27 @@ class DocumentReviewService:
         if report.summary:
             lines.extend(["", "## Summary", "", report.summary])
         return "\n".join(lines)
+
+
+def unread_pages(artifacts: list[DocumentArtifact]) -> dict[str, list[int]]:
+    """File name -> numbers of the pages whose text was never extracted (image-only or drawing pages)."""
+    unread: dict[str, list[int]] = {}
+    for artifact in artifacts:
+        numbers = [p.number for p in artifact.pages if not p.extracted]
+        if numbers:
+            unread.setdefault(artifact.path.name, []).extend(numbers)
+    return unread
+
+
+def _page_ranges(numbers: list[int]) -> str:
+    """[2, 3, 4, 7] -> "2-4, 7"."""
+    ranges: list[str] = []
+    start = prev = numbers[0]
+    for n in numbers[1:] + [None]:
+        if n is not None and n == prev + 1:
+            prev = n
+            continue
+        ranges.append(str(start) if start == prev else f"{start}-{prev}")
+        if n is not None:
+            start = prev = n
+    return ", ".join(ranges)
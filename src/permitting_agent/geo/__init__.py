@@ -0,0 +1,6 @@
+"""Geospatial helpers: jurisdiction boundary resolution and geohash bucketing of site coordinates."""
+
+from permitting_agent.geo.boundaries import JurisdictionResolver
+from permitting_agent.geo import geohash
+
+__all__ = ["JurisdictionResolver", "geohash"]
@@ -0,0 +1,182 @@
+"""Spatial jurisdiction resolution: which municipal/county boundaries contain a site.
+
+Boundary polygons are loaded from local GeoJSON (Polygon/MultiPolygon features with
+``jurisdiction_id``, ``name``, ``level`` and optional ``state`` properties) into a uniform
+grid. Each grid cell stores, per jurisdiction, whether the cell center is inside and the
+few boundary edges that touch the cell. A point query is then one dict lookup plus a
+crossing count against a handful of edges, instead of a ray cast over the whole polygon.
+"""
+
+import math
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any, Iterable
+
+from permitting_agent.models import JurisdictionMatch
+from permitting_agent.serialization import read_json
+
+DEFAULT_TARGET_CELLS = 1 << 16
+LEVEL_ORDER = {"municipal": 0, "county": 1, "state": 2}
+
+Edge = tuple[float, float, float, float]  # ax, ay, bx, by  (x = lon, y = lat)
+# (feature index, cell center inside?, boundary edges touching the cell)
+CellEntry = tuple[int, bool, tuple[Edge, ...]]
+
+
+class JurisdictionResolver:
+    """Grid-indexed point-in-polygon lookup over jurisdiction boundaries."""
+
+    def __init__(self, features: list[dict[str, Any]], cell_size: float | None = None):
+        self._matches: list[JurisdictionMatch] = []
+        rings_by_feature: list[list[list[tuple[float, float]]]] = []
+        for feature in features:
+            props = feature.get("properties") or {}
+            rings = _rings(feature.get("geometry") or {})
+            jurisdiction_id = props.get("jurisdiction_id") or feature.get("id")
+            if not rings or not jurisdiction_id:
+                continue
+            self._matches.append(
+                JurisdictionMatch(
+                    jurisdiction_id=str(jurisdiction_id),
+                    name=props.get("name") or str(jurisdiction_id),
+                    level=props.get("level") or "municipal",
+                    state=props.get("state"),
+                )
+            )
+            rings_by_feature.append(rings)
+
+        xs = [x for rings in rings_by_feature for ring in rings for x, _ in ring]
+        ys = [y for rings in rings_by_feature for ring in rings for _, y in ring]
+        if not xs:
+            self.min_x = self.min_y = 0.0
+            self.cell_size = cell_size or 1.0
+            self._grid: dict[tuple[int, int], list[CellEntry]] = {}
+            return
+        self.min_x, self.min_y = min(xs), min(ys)
+        if cell_size is None:
+            area = max((max(xs) - self.min_x) * (max(ys) - self.min_y), 1e-12)
+            cell_size = math.sqrt(area / DEFAULT_TARGET_CELLS)
+        self.cell_size = cell_size
+        self._grid = {}
+        for index, rings in enumerate(rings_by_feature):
+            self._index_feature(index, rings)
+        # Most specific jurisdiction first within each cell
+        for entries in self._grid.values():
+            entries.sort(key=lambda e: LEVEL_ORDER.get(self._matches[e[0]].level, len(LEVEL_ORDER)))
+
+    @classmethod
+    def from_geojson(cls, paths: Path | str | Iterable[Path | str], cell_size: float | None = None) -> "JurisdictionResolver":
+        """Load one or more GeoJSON FeatureCollection files."""
+        if isinstance(paths, (str, Path)):
+            paths = [paths]
+        features: list[dict[str, Any]] = []
+        for path in paths:
+            data = read_json(path)
+            features.extend(data.get("features", []) if data.get("type") == "FeatureCollection" else [data])
+        return cls(features, cell_size=cell_size)
+
+    def __len__(self) -> int:
+        return len(self._matches)
+
+    def resolve(self, lat: float, lon: float) -> list[JurisdictionMatch]:
+        """Jurisdictions containing (lat, lon), most specific (municipal) first."""
+        cs = self.cell_size
+        cx = math.floor((lon - self.min_x) / cs)
+        cy = math.floor((lat - self.min_y) / cs)
+        entries = self._grid.get((cx, cy))
+        if not entries:
+            return []
+        center_x = self.min_x + (cx + 0.5) * cs
+        center_y = self.min_y + (cy + 0.5) * cs
+        out = []
+        for index, inside, edges in entries:
+            if edges:
+                for ax, ay, bx, by in edges:
+                    if _crosses(center_x, center_y, lon, lat, ax, ay, bx, by):
+                        inside = not inside
+            if inside:
+                out.append(self._matches[index])
+        return out
+
+    def resolve_many(self, points: Iterable[tuple[float, float]]) -> list[list[JurisdictionMatch]]:
+        """Resolve a batch of (lat, lon) points."""
+        resolve = self.resolve
+        return [resolve(lat, lon) for lat, lon in points]
+
+    def _index_feature(self, index: int, rings: list[list[tuple[float, float]]]) -> None:
+        cs, min_x, min_y = self.cell_size, self.min_x, self.min_y
+        edges_by_cell: dict[tuple[int, int], list[Edge]] = {}
+        edges_by_row: dict[int, list[Edge]] = {}
+        col_lo = row_lo = math.inf
+        col_hi = row_hi = -math.inf
+        for ring in rings:
+            for (ax, ay), (bx, by) in zip(ring, ring[1:] + ring[:1]):
+                if ax == bx and ay == by:
+                    continue
+                edge = (ax, ay, bx, by)
+                c0 = math.floor((min(ax, bx) - min_x) / cs)
+                c1 = math.floor((max(ax, bx) - min_x) / cs)
+                r0 = math.floor((min(ay, by) - min_y) / cs)
+                r1 = math.floor((max(ay, by) - min_y) / cs)
+                col_lo, col_hi = min(col_lo, c0), max(col_hi, c1)
+                row_lo, row_hi = min(row_lo, r0), max(row_hi, r1)
+                for r in range(r0, r1 + 1):
+                    edges_by_row.setdefault(r, []).append(edge)
+                    for c in _edge_columns(edge, r, c0, c1, cs, min_x, min_y):
+                        edges_by_cell.setdefault((c, r), []).append(edge)
+        # Scanline through each row's cell centers gives the inside/outside state of every center
+        for r in range(int(row_lo), int(row_hi) + 1):
+            yc = min_y + (r + 0.5) * cs
+            crossings = sorted(
+                ax + (yc - ay) * (bx - ax) / (by - ay)
+                for ax, ay, bx, by in edges_by_row.get(r, ())
+                if (ay > yc) != (by > yc)
+            )
+            for c in range(int(col_lo), int(col_hi) + 1):
+                xc = min_x + (c + 0.5) * cs
+                center_inside = bisect_left(crossings, xc) % 2 == 1
+                edges = edges_by_cell.get((c, r))
+                if edges or center_inside:
+                    self._grid.setdefault((c, r), []).append((index, center_inside, tuple(edges or ())))
+
+
+def _edge_columns(edge: Edge, row: int, c0: int, c1: int, cs: float, min_x: float, min_y: float) -> range:
+    """Columns of the cells in ``row`` that the edge passes through (clipped to the row's y band)."""
+    ax, ay, bx, by = edge
+    if c0 == c1 or ay == by:
+        return range(c0, c1 + 1)
+    y_lo = max(min(ay, by), min_y + row * cs)
+    y_hi = min(max(ay, by), min_y + (row + 1) * cs)
+    x_lo = ax + (y_lo - ay) * (bx - ax) / (by - ay)
+    x_hi = ax + (y_hi - ay) * (bx - ax) / (by - ay)
+    # Small tolerance so rounding never drops a cell the edge really touches (extra cells are harmless)
+    lo = math.floor((min(x_lo, x_hi) - min_x) / cs - 1e-9)
+    hi = math.floor((max(x_lo, x_hi) - min_x) / cs + 1e-9)
+    return range(max(lo, c0), min(hi, c1) + 1)
+
+
+def _crosses(px: float, py: float, qx: float, qy: float, ax: float, ay: float, bx: float, by: float) -> bool:
+    """Whether segment p->q crosses edge a->b (half-open at vertices so shared vertices count once)."""
+    d1 = (qx - px) * (ay - py) - (qy - py) * (ax - px)
+    d2 = (qx - px) * (by - py) - (qy - py) * (bx - px)
+    if (d1 > 0) == (d2 > 0):
+        return False
+    d3 = (bx - ax) * (py - ay) - (by - ay) * (px - ax)
+    d4 = (bx - ax) * (qy - ay) - (by - ay) * (qx - ax)
+    return (d3 > 0) != (d4 > 0)
+
+
+def _rings(geometry: dict[str, Any]) -> list[list[tuple[float, float]]]:
+    """All rings (outer and holes) of a Polygon/MultiPolygon as (lon, lat) tuples, closing point dropped."""
+    kind = geometry.get("type")
+    coords = geometry.get("coordinates") or []
+    polygons = [coords] if kind == "Polygon" else coords if kind == "MultiPolygon" else []
+    rings = []
+    for polygon in polygons:
+        for ring in polygon:
+            points = [(float(p[0]), float(p[1])) for p in ring]
+            if len(points) > 1 and points[0] == points[-1]:
+                points.pop()
+            if len(points) >= 3:
+                rings.append(points)
+    return rings
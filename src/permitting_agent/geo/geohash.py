@@ -0,0 +1,120 @@
+"""Geohash encoding, cell neighbors and great-circle distance, for bucketing nearby sites."""
+
+import math
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+_DECODE = {c: i for i, c in enumerate(_BASE32)}
+EARTH_RADIUS_M = 6_371_008.8
+_M_PER_DEG_LAT = 111_320.0
+# Neighbor search must cover the radius even where cells narrow toward the poles
+_DESIGN_LATITUDE = 60.0
+
+
+def encode(lat: float, lon: float, precision: int = 8) -> str:
+    """Geohash of (lat, lon) with ``precision`` characters."""
+    lat_i, lon_i = _cell(lat, lon, precision)
+    return _hash(lat_i, lon_i, precision)
+
+
+def _bits(precision: int) -> tuple[int, int]:
+    """(lat bits, lon bits); longitude gets the extra bit when the total is odd."""
+    total = 5 * precision
+    return total // 2, (total + 1) // 2
+
+
+def _cell(lat: float, lon: float, precision: int) -> tuple[int, int]:
+    """Integer (row, column) of the cell containing (lat, lon)."""
+    lat_bits, lon_bits = _bits(precision)
+    lat_i = min(max(int((lat + 90.0) / 180.0 * (1 << lat_bits)), 0), (1 << lat_bits) - 1)
+    lon_i = min(max(int((lon + 180.0) / 360.0 * (1 << lon_bits)), 0), (1 << lon_bits) - 1)
+    return lat_i, lon_i
+
+
+def _spread(x: int) -> int:
+    """Insert a zero bit between each of the low 32 bits of x (Morton interleave)."""
+    x &= 0xFFFFFFFF
+    x = (x | x << 16) & 0x0000FFFF0000FFFF
+    x = (x | x << 8) & 0x00FF00FF00FF00FF
+    x = (x | x << 4) & 0x0F0F0F0F0F0F0F0F
+    x = (x | x << 2) & 0x3333333333333333
+    return (x | x << 1) & 0x5555555555555555
+
+
+def _hash(lat_i: int, lon_i: int, precision: int) -> str:
+    # Bits alternate lon, lat, lon, ... from the most significant end
+    if precision % 2:
+        value = _spread(lon_i) | _spread(lat_i) << 1
+    else:
+        value = _spread(lat_i) | _spread(lon_i) << 1
+    return "".join(_BASE32[value >> shift & 31] for shift in range(5 * (precision - 1), -1, -5))
+
+
+def bounds(geohash: str) -> tuple[float, float, float, float]:
+    """(lat_lo, lat_hi, lon_lo, lon_hi) of a geohash cell."""
+    lat_lo, lat_hi, lon_lo, lon_hi = -90.0, 90.0, -180.0, 180.0
+    even = True
+    for char in geohash:
+        value = _DECODE[char]
+        for shift in range(4, -1, -1):
+            bit = value >> shift & 1
+            if even:
+                mid = (lon_lo + lon_hi) / 2
+                lon_lo, lon_hi = (mid, lon_hi) if bit else (lon_lo, mid)
+            else:
+                mid = (lat_lo + lat_hi) / 2
+                lat_lo, lat_hi = (mid, lat_hi) if bit else (lat_lo, mid)
+            even = not even
+    return lat_lo, lat_hi, lon_lo, lon_hi
+
+
+def neighbors(geohash: str) -> list[str]:
+    """The cell itself and its 8 surrounding cells (fewer at the poles)."""
+    precision = len(geohash)
+    lat_lo, lat_hi, lon_lo, lon_hi = bounds(geohash)
+    lat_i, lon_i = _cell((lat_lo + lat_hi) / 2, (lon_lo + lon_hi) / 2, precision)
+    return neighbor_cells(lat_i, lon_i, precision)
+
+
+def neighborhood(lat: float, lon: float, precision: int) -> list[str]:
+    """Geohashes of the cell containing (lat, lon) and its neighbors, without decoding."""
+    lat_i, lon_i = _cell(lat, lon, precision)
+    return neighbor_cells(lat_i, lon_i, precision)
+
+
+def neighbor_cells(lat_i: int, lon_i: int, precision: int) -> list[str]:
+    lat_bits, lon_bits = _bits(precision)
+    cells = []
+    for dy in (-1, 0, 1):
+        row = lat_i + dy
+        if not 0 <= row < 1 << lat_bits:
+            continue
+        for dx in (-1, 0, 1):
+            cell = _hash(row, (lon_i + dx) % (1 << lon_bits), precision)
+            if cell not in cells:
+                cells.append(cell)
+    return cells
+
+
+def cell_size_m(precision: int, lat: float = 0.0) -> tuple[float, float]:
+    """Approximate (height, width) in meters of a cell at ``precision`` and latitude ``lat``."""
+    lon_bits = (5 * precision + 1) // 2
+    lat_bits = 5 * precision // 2
+    height = 180 / 2**lat_bits * _M_PER_DEG_LAT
+    width = 360 / 2**lon_bits * _M_PER_DEG_LAT * math.cos(math.radians(lat))
+    return height, width
+
+
+def precision_for_radius(radius_m: float) -> int:
+    """Finest precision whose 3x3 neighborhood still covers ``radius_m`` around any point (to ~60° latitude)."""
+    for precision in range(12, 0, -1):
+        if min(cell_size_m(precision, _DESIGN_LATITUDE)) >= radius_m:
+            return precision
+    return 1
+
+
+def haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance in meters."""
+    p1, p2 = math.radians(lat1), math.radians(lat2)
+    dp, dl = p2 - p1, math.radians(lon2 - lon1)
+    a = math.sin(dp / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dl / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(a))
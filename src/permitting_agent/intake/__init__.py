@@ -1,5 +1,20 @@
 """Intake module: create and persist cases from jurisdiction, site, scope, docs."""
 
 from permitting_agent.intake.service import IntakeService
+from permitting_agent.intake.events import apply_event, replay
+from permitting_agent.intake.store import CaseStore, JsonCaseStore, SqliteCaseStore, migrate_json_cases
+from permitting_agent.intake.bulk import import_cases
+from permitting_agent.intake.dedup import SiteIndex, normalize_address
 
-__all__ = ["IntakeService"]
+__all__ = [
+    "CaseStore",
+    "IntakeService",
+    "JsonCaseStore",
+    "SiteIndex",
+    "SqliteCaseStore",
+    "apply_event",
+    "import_cases",
+    "migrate_json_cases",
+    "normalize_address",
+    "replay",
+]
@@ -0,0 +1,298 @@
+"""Bulk intake: stream CSV / GeoJSON rows into cases, committed in batched transactions.
+
+Rows are read one at a time (a GeoJSON FeatureCollection is decoded feature by feature), so
+memory stays bounded by the batch size rather than the file size. Case ids are derived from
+the import key and row number, and a checkpoint is written after every committed batch, so
+re-running an interrupted import skips finished rows and never duplicates a case.
+"""
+
+import csv
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from pydantic import ValidationError
+
+from permitting_agent.intake.service import IntakeService
+from permitting_agent.models import BulkIntakeReport, IntakeCase, IntakeRequest, ScopeKind, ScopeOfWork, SiteDetails
+from permitting_agent.serialization import dumps, loads, read_json, write_json
+
+DEFAULT_BATCH_SIZE = 500
+CSV_SUFFIXES = {".csv"}
+GEOJSON_SEQ_SUFFIXES = {".geojsons", ".geojsonl", ".geojsonseq", ".ndjson", ".jsonl"}
+GEOJSON_SUFFIXES = {".geojson", ".json"}
+_READ_CHUNK = 1 << 16
+
+# Spreadsheet column spellings -> SiteDetails / request field
+COLUMN_ALIASES = {
+    "latitude": "lat",
+    "longitude": "lon",
+    "lng": "lon",
+    "zip": "zip_code",
+    "postal_code": "zip_code",
+    "parcel": "parcel_id",
+    "apn": "parcel_id",
+    "site_address": "address",
+    "city": "jurisdiction",
+    "docs": "existing_docs",
+}
+SITE_FIELDS = {"address", "parcel_id", "lat", "lon", "jurisdiction", "county", "state", "zip_code"}
+REQUEST_FIELDS = {"scope", "description", "existing_docs"}
+
+Row = dict[str, Any]
+
+
+def import_cases(
+    service: IntakeService,
+    path: Path,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    import_key: str | None = None,
+    error_report: Path | None = None,
+) -> BulkIntakeReport:
+    """Stream rows from ``path`` into cases. Re-running with the same file (or ``import_key``)
+    resumes after the last committed batch. Rows that fail validation go to a CSV error report.
+    """
+    path = Path(path)
+    import_key = import_key or default_import_key(path)
+    imports_dir = service.data_dir / "imports"
+    imports_dir.mkdir(parents=True, exist_ok=True)
+    checkpoint_path = imports_dir / f"{import_key}.json"
+    error_report = Path(error_report or imports_dir / f"{import_key}.errors.csv")
+    checkpoint = read_json(checkpoint_path) if checkpoint_path.exists() else {}
+    rows_done = int(checkpoint.get("rows_done", 0))
+    report = BulkIntakeReport(source=path, import_key=import_key, resumed_from_row=rows_done, error_report=error_report)
+    if checkpoint.get("complete"):
+        report.skipped = rows_done
+        return report
+
+    resolve = _jurisdiction_resolver(service)
+    new_report = not error_report.exists() or rows_done == 0
+    error_report.parent.mkdir(parents=True, exist_ok=True)
+    with open(error_report, "w" if new_report else "a", newline="", encoding="utf-8") as errors_file:
+        errors_out = csv.writer(errors_file)
+        if new_report:
+            errors_out.writerow(["row", "error", "data"])
+        batch: list[IntakeCase] = []
+        batch_errors: list[list[str]] = []
+        last_row = rows_done
+
+        def commit() -> None:
+            report.created += service.save_cases(batch) if batch else 0
+            errors_out.writerows(batch_errors)
+            errors_file.flush()
+            report.errors += len(batch_errors)
+            _write_checkpoint(checkpoint_path, path, last_row, complete=False)
+            batch.clear()
+            batch_errors.clear()
+
+        for row_number, fields in iter_rows(path):
+            if row_number <= rows_done:
+                report.skipped += 1
+                continue
+            report.rows_read += 1
+            last_row = row_number
+            try:
+                request = row_to_request(fields, resolve)
+            except (ValueError, ValidationError) as e:
+                batch_errors.append([str(row_number), _error_message(e), dumps(fields, pretty=False).decode()])
+            else:
+                case = service.build_case(request, case_id=row_case_id(import_key, row_number), pending=batch)
+                report.possible_duplicates += bool(case.meta.get("possible_duplicates"))
+                batch.append(case)
+            if len(batch) + len(batch_errors) >= batch_size:
+                commit()
+        commit()
+    _write_checkpoint(checkpoint_path, path, last_row, complete=True)
+    return report
+
+
+def default_import_key(path: Path) -> str:
+    """Identifies one version of one file: path, size and mtime."""
+    stat = Path(path).stat()
+    raw = f"{Path(path).resolve()}:{stat.st_size}:{stat.st_mtime_ns}"
+    return hashlib.sha1(raw.encode()).hexdigest()[:16]
+
+
+def row_case_id(import_key: str, row_number: int) -> str:
+    return hashlib.sha1(f"{import_key}:{row_number}".encode()).hexdigest()[:12]
+
+
+def iter_rows(path: Path) -> Iterator[tuple[int, Row]]:
+    """(1-based row number, fields) for a CSV, GeoJSON FeatureCollection or GeoJSONSeq file."""
+    suffix = Path(path).suffix.lower()
+    if suffix in CSV_SUFFIXES:
+        return iter_csv_rows(path)
+    if suffix in GEOJSON_SEQ_SUFFIXES:
+        return iter_geojson_rows(path, sequence=True)
+    if suffix in GEOJSON_SUFFIXES:
+        return iter_geojson_rows(path, sequence=False)
+    raise ValueError(f"Unsupported bulk intake file type: {path} (use .csv, .geojson or .geojsons)")
+
+
+def iter_csv_rows(path: Path) -> Iterator[tuple[int, Row]]:
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        for row_number, row in enumerate(csv.DictReader(f), start=1):
+            yield row_number, {_column(k): v for k, v in row.items() if k}
+
+
+def iter_geojson_rows(path: Path, sequence: bool) -> Iterator[tuple[int, Row]]:
+    with open(path, encoding="utf-8") as f:
+        features = _iter_feature_lines(f) if sequence else _iter_feature_collection(f)
+        for row_number, feature in enumerate(features, start=1):
+            yield row_number, _feature_fields(feature)
+
+
+def row_to_request(fields: Row, resolve: Callable[[float, float], str | None] | None = None) -> IntakeRequest:
+    """Validate one row. Jurisdiction may be omitted when coordinates resolve to one."""
+    if "_error" in fields:
+        raise ValueError(fields["_error"])
+    values = {k: v.strip() if isinstance(v, str) else v for k, v in fields.items()}
+    values = {k: v for k, v in values.items() if v not in (None, "")}
+    if "address" not in values:
+        raise ValueError("address is required")
+    scope = values.pop("scope", ScopeKind.SMALL_CELL.value)
+    try:
+        kind = ScopeKind(str(scope).lower())
+    except ValueError:
+        raise ValueError(f"unknown scope {scope!r} (use small_cell, fiber or both)") from None
+    site = {k: values[k] for k in SITE_FIELDS if k in values}
+    if "jurisdiction" not in site and resolve is not None and "lat" in site and "lon" in site:
+        resolved = resolve(float(site["lat"]), float(site["lon"]))
+        if resolved:
+            site["jurisdiction"] = resolved
+    if "jurisdiction" not in site:
+        raise ValueError("jurisdiction is required (or coordinates inside the configured boundaries)")
+    site["extra"] = {k: v for k, v in values.items() if k not in SITE_FIELDS and k not in REQUEST_FIELDS}
+    docs = values.get("existing_docs") or ""
+    return IntakeRequest(
+        jurisdiction=site["jurisdiction"],
+        site=SiteDetails(**site),
+        scope=ScopeOfWork(kind=kind, description=values.get("description")),
+        existing_doc_paths=[Path(p.strip()) for p in str(docs).split(";") if p.strip()],
+    )
+
+
+def _jurisdiction_resolver(service: IntakeService) -> Callable[[float, float], str | None] | None:
+    if service.resolver is None:
+        return None
+
+    def resolve(lat: float, lon: float) -> str | None:
+        matches = service.resolver.resolve(lat, lon)
+        return matches[0].name if matches else None
+
+    return resolve
+
+
+def _write_checkpoint(checkpoint_path: Path, source: Path, rows_done: int, complete: bool) -> None:
+    write_json(checkpoint_path, {"source": str(source), "rows_done": rows_done, "complete": complete}, pretty=False)
+
+
+def _error_message(e: Exception) -> str:
+    if isinstance(e, ValidationError):
+        return "; ".join(f"{'.'.join(str(p) for p in err['loc'])}: {err['msg']}" for err in e.errors())
+    return str(e)
+
+
+def _column(name: str) -> str:
+    key = name.strip().lower().replace(" ", "_")
+    return COLUMN_ALIASES.get(key, key)
+
+
+def _feature_fields(feature: Any) -> Row:
+    if not isinstance(feature, dict):
+        return {"_error": "feature is not a JSON object"}
+    if "_error" in feature:
+        return feature
+    fields = {_column(k): v for k, v in (feature.get("properties") or {}).items()}
+    geometry = feature.get("geometry") or {}
+    if geometry.get("type") == "Point" and len(geometry.get("coordinates") or []) >= 2:
+        lon, lat = geometry["coordinates"][:2]
+        fields.setdefault("lat", lat)
+        fields.setdefault("lon", lon)
+    return fields
+
+
+def _iter_feature_lines(f) -> Iterator[Any]:
+    """GeoJSONSeq / newline-delimited features (RFC 8142 record separators allowed)."""
+    for line in f:
+        line = line.strip().lstrip("\x1e").strip()
+        if not line:
+            continue
+        try:
+            yield loads(line)
+        except ValueError as e:
+            yield {"_error": f"invalid JSON: {e}"}
+
+
+class _JsonStream:
+    """Just enough of an incremental JSON reader to walk a FeatureCollection's top-level object."""
+
+    _decoder = json.JSONDecoder()
+
+    def __init__(self, f):
+        self.f = f
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        chunk = self.f.read(_READ_CHUNK)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buf) or not self._fill():
+                return self.buf[self.pos : self.pos + 1]
+
+    def take(self, expected: str) -> str:
+        char = self.peek()
+        if char not in expected or not char:
+            raise ValueError(f"invalid GeoJSON: expected one of {expected!r}, got {char or 'end of file'!r}")
+        self.pos += 1
+        return char
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A value ending exactly at the buffer end (e.g. a number) may continue in the next chunk
+            if end == len(self.buf) and not self.eof and self._fill():
+                continue
+            self.pos = end
+            return value
+
+
+def _iter_feature_collection(f) -> Iterator[Any]:
+    stream = _JsonStream(f)
+    stream.take("{")
+    if stream.peek() == "}":
+        return
+    while True:
+        key = stream.value()
+        stream.take(":")
+        if key == "features":
+            stream.take("[")
+            if stream.peek() == "]":
+                stream.take("]")
+            else:
+                while True:
+                    yield stream.value()
+                    if stream.take(",]") == "]":
+                        break
+        else:
+            stream.value()
+        if stream.take(",}") == "}":
+            return
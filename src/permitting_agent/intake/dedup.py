@@ -0,0 +1,152 @@
+"""Site deduplication: flag new cases whose site matches an existing one.
+
+Sites are indexed by geohash cell (at a precision chosen from the match radius) and by a
+normalized address key. Checking a new site is two indexed lookups: the 3x3 geohash
+neighborhood, confirmed with a haversine distance, and an exact address-key match. Address keys
+are scoped by the registered jurisdiction id when the name resolves to one ("Sample City" and
+"City of Sample" are one scope); ``permitting cases reindex-sites`` rebuilds keys written before.
+"""
+
+import re
+from pathlib import Path
+from typing import Iterable
+
+from permitting_agent.adapters import resolve_jurisdiction_id
+from permitting_agent.geo.geohash import encode, haversine_m, neighborhood, precision_for_radius
+from permitting_agent.models import DuplicateSite, IntakeCase, SiteDetails
+from permitting_agent.sqlite import ConnectionPool
+
+DEFAULT_RADIUS_M = 25.0
+MAX_MATCHES = 10
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sites (
+    case_id TEXT PRIMARY KEY,
+    geohash TEXT,
+    address_key TEXT,
+    lat REAL,
+    lon REAL
+);
+CREATE INDEX IF NOT EXISTS sites_by_geohash ON sites (geohash);
+CREATE INDEX IF NOT EXISTS sites_by_address ON sites (address_key);
+"""
+
+_ABBREVIATIONS = {
+    "street": "st", "str": "st", "avenue": "ave", "av": "ave", "road": "rd", "drive": "dr",
+    "boulevard": "blvd", "lane": "ln", "court": "ct", "place": "pl", "terrace": "ter",
+    "highway": "hwy", "parkway": "pkwy", "circle": "cir", "square": "sq", "trail": "trl",
+    "way": "way", "north": "n", "south": "s", "east": "e", "west": "w", "northeast": "ne",
+    "northwest": "nw", "southeast": "se", "southwest": "sw", "suite": "ste", "apartment": "apt",
+    "unit": "unit", "number": "#", "no": "#",
+}
+_NON_WORD = re.compile(r"[^\w#]+")
+
+
+def normalize_address(address: str) -> str:
+    """Canonical form for comparing addresses: case, punctuation and common suffix spellings ignored."""
+    tokens = _NON_WORD.sub(" ", address.lower().replace("#", " # ")).split()
+    return " ".join(_ABBREVIATIONS.get(t, t) for t in tokens)
+
+
+def address_key(site: SiteDetails) -> str | None:
+    """Jurisdiction-scoped normalized address, or None for an empty address. The scope is the
+    registered jurisdiction id, else the normalized jurisdiction name.
+    """
+    address = normalize_address(site.address)
+    if not address:
+        return None
+    scope = resolve_jurisdiction_id(site.jurisdiction, fuzzy=False) or normalize_address(site.jurisdiction)
+    return f"{scope}|{address}"
+
+
+class SiteIndex:
+    """SQLite-backed index of case sites for near-duplicate detection."""
+
+    def __init__(self, path: Path, radius_m: float = DEFAULT_RADIUS_M):
+        self.path = Path(path)
+        self.radius_m = radius_m
+        self.precision = precision_for_radius(radius_m)
+        self._pool = ConnectionPool(self.path, _SCHEMA)
+
+    def find(
+        self,
+        site: SiteDetails,
+        exclude: str | None = None,
+        pending: Iterable[tuple[str, SiteDetails]] = (),
+    ) -> list[DuplicateSite]:
+        """Existing cases within ``radius_m`` of the site or with the same address key,
+        nearest first, at most MAX_MATCHES. Read-only: ``pending`` sites (cases built but not
+        saved yet, e.g. earlier rows of an import batch) are compared in memory.
+        """
+        conn = self._pool.conn()
+        found: dict[str, DuplicateSite] = {}
+        key = address_key(site)
+        pending = [(case_id, other) for case_id, other in pending if case_id != exclude]
+        if site.lat is not None and site.lon is not None:
+            cells = neighborhood(site.lat, site.lon, self.precision)
+            rows = conn.execute(
+                f"SELECT case_id, lat, lon FROM sites WHERE geohash IN ({','.join('?' * len(cells))})", cells
+            ).fetchall()
+            rows += [
+                (case_id, other.lat, other.lon)
+                for case_id, other in pending
+                if other.lat is not None and other.lon is not None
+            ]
+            for case_id, lat, lon in rows:
+                distance = haversine_m(site.lat, site.lon, lat, lon)
+                if distance <= self.radius_m and case_id != exclude:
+                    found[case_id] = DuplicateSite(case_id=case_id, reason="location", distance_m=round(distance, 1))
+        if key is not None:
+            rows = conn.execute("SELECT case_id FROM sites WHERE address_key = ?", (key,))
+            same_address = [case_id for (case_id,) in rows]
+            same_address += [case_id for case_id, other in pending if address_key(other) == key]
+            for case_id in same_address:
+                if case_id == exclude:
+                    continue
+                if case_id in found:
+                    found[case_id].reason = "location_and_address"
+                else:
+                    found[case_id] = DuplicateSite(case_id=case_id, reason="address")
+        matches = sorted(found.values(), key=lambda d: (d.distance_m is None, d.distance_m or 0.0, d.case_id))
+        return matches[:MAX_MATCHES]
+
+    def add(self, case_id: str, site: SiteDetails) -> None:
+        self.add_many([(case_id, site)])
+
+    def add_many(self, sites: Iterable[tuple[str, SiteDetails]]) -> int:
+        rows = [(case_id, *self._keys(site)) for case_id, site in sites]
+        conn = self._pool.conn()
+        with conn:
+            conn.executemany("INSERT OR REPLACE INTO sites VALUES (?, ?, ?, ?, ?)", rows)
+        return len(rows)
+
+    def check_and_add(self, case_id: str, site: SiteDetails) -> list[DuplicateSite]:
+        """find() then add(); the case never matches itself (e.g. when a resumed import rebuilds it)."""
+        duplicates = self.find(site, exclude=case_id)
+        self.add(case_id, site)
+        return duplicates
+
+    def rebuild(self, cases: Iterable[IntakeCase], batch_size: int = 1000) -> int:
+        """Replace the index contents with the sites of ``cases`` (e.g. after a migration)."""
+        conn = self._pool.conn()
+        with conn:
+            conn.execute("DELETE FROM sites")
+        count = 0
+        batch: list[tuple[str, SiteDetails]] = []
+        for case in cases:
+            batch.append((case.id, case.request.site))
+            if len(batch) >= batch_size:
+                count += self.add_many(batch)
+                batch = []
+        return count + self.add_many(batch)
+
+    def __len__(self) -> int:
+        return self._pool.conn().execute("SELECT COUNT(*) FROM sites").fetchone()[0]
+
+    def close(self) -> None:
+        self._pool.close()
+
+    def _keys(self, site: SiteDetails) -> tuple[str | None, str | None, float | None, float | None]:
+        has_point = site.lat is not None and site.lon is not None
+        geohash = encode(site.lat, site.lon, self.precision) if has_point else None
+        return geohash, address_key(site), site.lat, site.lon
@@ -0,0 +1,53 @@
+"""Case events: constructors for the common events and the replay that folds them into a case.
+
+Writers only ever append events, so concurrent workers never overwrite each other's changes;
+the current case is its last snapshot with the newer events replayed on top, in append order.
+"""
+
+from typing import Any, Iterable
+
+from permitting_agent.models import CaseEvent, CaseEventKind, IntakeCase
+
+
+def created(case: IntakeCase, actor: str | None = None) -> CaseEvent:
+    return CaseEvent(case_id=case.id, kind=CaseEventKind.INTAKE_CREATED, at=case.created_at, actor=actor, case=case)
+
+
+def status_changed(case_id: str, status: str, actor: str | None = None) -> CaseEvent:
+    return CaseEvent(case_id=case_id, kind=CaseEventKind.STATUS_CHANGED, actor=actor, data={"status": status})
+
+
+def meta_updated(case_id: str, meta: dict[str, Any], actor: str | None = None) -> CaseEvent:
+    """Set (not merge) the given top-level meta keys."""
+    return CaseEvent(case_id=case_id, kind=CaseEventKind.META_UPDATED, actor=actor, data={"meta": meta})
+
+
+def apply_event(case: IntakeCase | None, event: CaseEvent) -> IntakeCase | None:
+    """Case after ``event``. Mutates and returns ``case`` (or the created case for intake_created)."""
+    if event.kind == CaseEventKind.INTAKE_CREATED:
+        return event.case.model_copy(deep=True) if event.case is not None else case
+    if case is None:
+        return None
+    data = event.data
+    if event.kind == CaseEventKind.STATUS_CHANGED:
+        case.status = data["status"]
+    elif event.kind == CaseEventKind.META_UPDATED:
+        case.meta.update(data.get("meta") or {})
+    elif event.kind == CaseEventKind.REVIEW_COMPLETED:
+        case.meta["review"] = data
+    elif event.kind == CaseEventKind.RESEARCH_ATTACHED:
+        case.meta.setdefault("research", {})[data.get("jurisdiction") or "default"] = data
+    elif event.kind == CaseEventKind.SUBMISSION_STEP_APPROVED:
+        case.meta.setdefault("approved_steps", []).append(data.get("step"))
+    elif event.kind == CaseEventKind.SUBMISSION_STEP_DECLINED:
+        case.meta["declined_step"] = data.get("step")
+    if event.at > case.updated_at:
+        case.updated_at = event.at
+    return case
+
+
+def replay(case: IntakeCase | None, events: Iterable[CaseEvent]) -> IntakeCase | None:
+    """Fold ``events`` (in seq order) onto a snapshot, or onto nothing to rebuild from scratch."""
+    for event in events:
+        case = apply_event(case, event)
+    return case
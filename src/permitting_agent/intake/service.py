@@ -1,48 +1,174 @@
-"""Intake service: create case, persist to JSON, resolve jurisdiction adapter."""
+"""Intake service: create case, persist to the case store, resolve jurisdiction adapter."""
 
-import json
 import uuid
+from datetime import datetime
 from pathlib import Path
+from typing import Any
 
-from permitting_agent.models import IntakeRequest, IntakeCase
-from permitting_agent.adapters import get_adapter
+from permitting_agent.models import CaseEvent, CaseEventKind, IntakeRequest, IntakeCase, JurisdictionMatch, SiteDetails
+from permitting_agent.adapters import get_adapter, match_jurisdiction, resolve_jurisdiction_id
+from permitting_agent.geo import JurisdictionResolver
+from permitting_agent.intake import events
+from permitting_agent.intake.dedup import SiteIndex
+from permitting_agent.intake.store import CaseStore, JsonCaseStore, SqliteCaseStore, decode_cursor, encode_cursor
 
 
 class IntakeService:
-    """Create intake cases and persist to data dir."""
+    """Create intake cases and persist to the case store (default: SQLite at ``<data_dir>/cases.db``)."""
 
-    def __init__(self, data_dir: Path | None = None):
+    def __init__(
+        self,
+        data_dir: Path | None = None,
+        resolver: JurisdictionResolver | None = None,
+        store: CaseStore | None = None,
+        site_index: SiteIndex | None = None,
+    ):
+        self.resolver = resolver
         self.data_dir = Path(data_dir or "data")
         self.data_dir.mkdir(parents=True, exist_ok=True)
-        self.cases_dir = self.data_dir / "cases"
-        self.cases_dir.mkdir(parents=True, exist_ok=True)
+        self.store = store if store is not None else SqliteCaseStore(self.data_dir / "cases.db")
+        self.site_index = site_index if site_index is not None else SiteIndex(self.data_dir / "sites.db")
+        # Not-yet-migrated data/cases/<id>.json files stay readable through get_case
+        legacy_dir = self.data_dir / "cases"
+        self._legacy = (
+            JsonCaseStore(legacy_dir)
+            if legacy_dir.is_dir() and not isinstance(self.store, JsonCaseStore)
+            else None
+        )
 
     def create_case(self, request: IntakeRequest) -> IntakeCase:
         """Create a new case with generated id and timestamps."""
-        case_id = str(uuid.uuid4())[:8]
-        case = IntakeCase(id=case_id, request=request)
-        self._save_case(case)
+        case = self.build_case(request)
+        self.store.append([events.created(case)])
+        self.site_index.add(case.id, case.request.site)
         return case
 
+    def build_case(
+        self, request: IntakeRequest, case_id: str | None = None, pending: list[IntakeCase] | None = None
+    ) -> IntakeCase:
+        """Build (but don't save) a case; boundary matches and possible duplicates are attached as in create_case.
+        Nothing is written: ``pending`` cases (built, not yet saved) are also checked for duplicates.
+        """
+        case = IntakeCase(id=case_id or str(uuid.uuid4())[:8], request=request)
+        self._attach_jurisdiction_match(case)
+        self._attach_resolved_jurisdictions(case)
+        self._flag_duplicates(case, pending or [])
+        return case
+
+    def save_cases(self, cases: list[IntakeCase]) -> int:
+        """Record a batch of new cases (one intake_created event each) in one transaction, then index their sites."""
+        saved = len(self.store.append(events.created(case) for case in cases))
+        self.site_index.add_many((case.id, case.request.site) for case in cases)
+        return saved
+
+    def record_event(
+        self, case_id: str, kind: CaseEventKind, data: dict[str, Any] | None = None, actor: str | None = None
+    ) -> CaseEvent:
+        """Append one event to a case's log (KeyError for an unknown case)."""
+        event = CaseEvent(case_id=case_id, kind=kind, data=data or {}, actor=actor)
+        return self._append(event)
+
+    def set_status(self, case_id: str, status: str, actor: str | None = None) -> CaseEvent:
+        return self._append(events.status_changed(case_id, status, actor=actor))
+
+    def _append(self, event: CaseEvent) -> CaseEvent:
+        """Append to an existing case; a not-yet-migrated legacy JSON case is imported on this first
+        write (an intake_created event from its snapshot, in the same transaction).
+        """
+        try:
+            return self.store.append([event])[0]
+        except KeyError:
+            legacy = self._legacy.get(event.case_id) if self._legacy is not None else None
+            if legacy is None:
+                raise
+        appended = self.store.append([events.created(legacy), event])
+        self.site_index.add(legacy.id, legacy.request.site)
+        return appended[-1]
+
+    def case_history(self, case_id: str) -> list[CaseEvent]:
+        """Every event recorded for a case, oldest first."""
+        return self.store.events(case_id)
+
+    def compact(self, min_events: int | None = None) -> int:
+        """Fold accumulated events into case snapshots; returns the number of cases compacted."""
+        return self.store.compact() if min_events is None else self.store.compact(min_events)
+
     def get_case(self, case_id: str) -> IntakeCase | None:
         """Load case by id."""
-        path = self.cases_dir / f"{case_id}.json"
-        if not path.exists():
-            return None
-        raw = json.loads(path.read_text())
-        # Paths in existing_doc_paths stored as strings
-        req = raw["request"]
-        if "existing_doc_paths" in req:
-            req["existing_doc_paths"] = [Path(p) for p in req["existing_doc_paths"]]
-        return IntakeCase.model_validate(raw)
-
-    def _save_case(self, case: IntakeCase) -> None:
-        path = self.cases_dir / f"{case.id}.json"
-        # Serialize Paths as strings
-        payload = case.model_dump(mode="json")
-        payload["request"]["existing_doc_paths"] = [str(p) for p in case.request.existing_doc_paths]
-        path.write_text(json.dumps(payload, indent=2))
+        case = self.store.get(case_id)
+        if case is None and self._legacy is not None:
+            case = self._legacy.get(case_id)
+        return case
+
+    def list_cases(
+        self,
+        jurisdiction: str | None = None,
+        scope: str | None = None,
+        status: str | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+        limit: int = 100,
+        cursor: str | None = None,
+        descending: bool = False,
+    ) -> tuple[list[IntakeCase], str | None]:
+        """Query cases by indexed fields, oldest first (newest first if ``descending``).
+        Returns (page, next cursor or None when there are no more cases).
+        """
+        page = self.store.query(
+            jurisdiction=jurisdiction,
+            scope=scope,
+            status=status,
+            created_from=created_from,
+            created_to=created_to,
+            limit=limit + 1,
+            after=decode_cursor(cursor) if cursor else None,
+            descending=descending,
+        )
+        if len(page) <= limit:
+            return page, None
+        page = page[:limit]
+        return page, encode_cursor(page[-1])
 
     def resolve_adapter(self, jurisdiction: str):
         """Return jurisdiction adapter for name, or None."""
         return get_adapter(jurisdiction)
+
+    def resolve_site(self, site: SiteDetails) -> list[JurisdictionMatch]:
+        """Jurisdictions whose boundaries contain the site (most specific first); [] without coordinates."""
+        if self.resolver is None or site.lat is None or site.lon is None:
+            return []
+        return self.resolver.resolve(site.lat, site.lon)
+
+    def resolve_site_adapter(self, site: SiteDetails):
+        """Adapter for the most specific jurisdiction containing the site; falls back to the entered name."""
+        for match in self.resolve_site(site):
+            adapter = get_adapter(match.jurisdiction_id)
+            if adapter is not None:
+                return adapter
+        return get_adapter(site.jurisdiction)
+
+    def _attach_jurisdiction_match(self, case: IntakeCase) -> None:
+        """Record a fuzzy suggestion or the ambiguous candidates for an entered name that didn't resolve outright."""
+        match = match_jurisdiction(case.request.jurisdiction)
+        if match.method == "fuzzy" and match.jurisdiction_id is not None:
+            case.meta["jurisdiction_suggestion"] = {"jurisdiction_id": match.jurisdiction_id, "score": match.score}
+        elif match.ambiguous:
+            case.meta["jurisdiction_candidates"] = list(match.candidates)
+
+    def _attach_resolved_jurisdictions(self, case: IntakeCase) -> None:
+        """Record boundary matches in case.meta and flag an entered jurisdiction that doesn't contain the site."""
+        matches = self.resolve_site(case.request.site)
+        if not matches:
+            return
+        case.meta["resolved_jurisdictions"] = [m.model_dump() for m in matches]
+        entered = resolve_jurisdiction_id(case.request.jurisdiction)
+        resolved_ids = {m.jurisdiction_id for m in matches}
+        if entered not in resolved_ids and case.request.jurisdiction not in {m.name for m in matches}:
+            case.meta["jurisdiction_mismatch"] = True
+
+    def _flag_duplicates(self, case: IntakeCase, pending: list[IntakeCase]) -> None:
+        """Record existing (or pending) cases at the same location/address in case.meta."""
+        others = [(p.id, p.request.site) for p in pending]
+        duplicates = self.site_index.find(case.request.site, exclude=case.id, pending=others)
+        if duplicates:
+            case.meta["possible_duplicates"] = [d.model_dump() for d in duplicates]
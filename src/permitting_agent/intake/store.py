@@ -0,0 +1,473 @@
+"""Pluggable case storage: SQLite (default, indexed) or the legacy one-JSON-file-per-case directory.
+
+Changes to a case are appended as events (see ``intake.events``) rather than rewriting the case;
+the SQLite store keeps a snapshot per case and replays the events appended since on read, and
+``compact`` periodically folds those events into a new snapshot. Events are never deleted, so the
+event table doubles as the audit trail.
+"""
+
+import base64
+import sqlite3
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from pydantic import ValidationError
+
+from permitting_agent.intake.events import apply_event, replay
+from permitting_agent.models import CaseEvent, CaseEventKind, IntakeCase
+from permitting_agent.serialization import (
+    dump_json,
+    dumps,
+    load_json,
+    load_json_lines,
+    loads,
+    read_model,
+    write_model,
+)
+from permitting_agent.sqlite import ConnectionPool
+
+DEFAULT_QUERY_LIMIT = 100
+MIGRATION_BATCH_SIZE = 500
+# Snapshot a case once this many events have piled up on top of its last snapshot
+COMPACT_AFTER_EVENTS = 32
+# Rows replayed per query: two bound parameters each, within SQLite's 999-variable limit before 3.32
+_REPLAY_BATCH = 400
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cases (
+    id TEXT PRIMARY KEY,
+    jurisdiction TEXT NOT NULL COLLATE NOCASE,
+    scope TEXT NOT NULL,
+    status TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    data TEXT NOT NULL,
+    snapshot_seq INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS case_events (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    case_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    at TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS case_events_by_case ON case_events (case_id, seq);
+CREATE INDEX IF NOT EXISTS cases_by_jurisdiction ON cases (jurisdiction, created_at, id);
+CREATE INDEX IF NOT EXISTS cases_by_jurisdiction_scope ON cases (jurisdiction, scope, created_at, id);
+CREATE INDEX IF NOT EXISTS cases_by_scope ON cases (scope, created_at, id);
+CREATE INDEX IF NOT EXISTS cases_by_status ON cases (status, created_at, id);
+CREATE INDEX IF NOT EXISTS cases_by_created ON cases (created_at, id);
+"""
+
+
+class CaseStore(ABC):
+    """Persistence for intake cases. ``save_many`` and ``append`` are atomic: all or nothing."""
+
+    @abstractmethod
+    def get(self, case_id: str) -> IntakeCase | None:
+        ...
+
+    @abstractmethod
+    def save_many(self, cases: Iterable[IntakeCase]) -> int:
+        """Insert or replace cases in one transaction without recording events (migration, restore);
+        the saved case supersedes earlier events. Returns the number written.
+        """
+        ...
+
+    @abstractmethod
+    def append(self, events: Iterable[CaseEvent]) -> list[CaseEvent]:
+        """Append events in one transaction and return them with ``seq`` assigned.
+        intake_created events create (or replace) their case; any other event for an unknown case
+        raises KeyError and nothing is appended.
+        """
+        ...
+
+    @abstractmethod
+    def events(self, case_id: str, after_seq: int = 0) -> list[CaseEvent]:
+        """A case's events with seq > ``after_seq``, oldest first."""
+        ...
+
+    @abstractmethod
+    def query(
+        self,
+        *,
+        jurisdiction: str | None = None,
+        scope: str | None = None,
+        status: str | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+        limit: int = DEFAULT_QUERY_LIMIT,
+        after: tuple[datetime, str] | None = None,
+        descending: bool = False,
+    ) -> list[IntakeCase]:
+        """Cases matching all given filters, oldest first (newest first if ``descending``).
+        ``created_to`` is exclusive. ``after`` is a keyset cursor: the (created_at, id) of the last
+        case of the previous page; only cases strictly past it in the sort order are returned.
+        """
+        ...
+
+    @abstractmethod
+    def iter_cases(self) -> Iterator[IntakeCase]:
+        ...
+
+    @abstractmethod
+    def __len__(self) -> int:
+        ...
+
+    def save(self, case: IntakeCase) -> None:
+        self.save_many([case])
+
+    def compact(self, min_events: int = COMPACT_AFTER_EVENTS) -> int:
+        """Fold pending events into snapshots for cases with at least ``min_events`` of them.
+        Returns the number of cases compacted.
+        """
+        return 0
+
+    def close(self) -> None:
+        pass
+
+
+class JsonCaseStore(CaseStore):
+    """Legacy layout: ``<cases_dir>/<id>.json``. Queries scan every file; use for small data dirs only.
+    Events go to ``<id>.events.jsonl`` and are applied to the case file immediately (one at a time,
+    so a batch is not atomic here).
+    """
+
+    def __init__(self, cases_dir: Path):
+        self.cases_dir = Path(cases_dir)
+        self.cases_dir.mkdir(parents=True, exist_ok=True)
+
+    def get(self, case_id: str) -> IntakeCase | None:
+        path = self.cases_dir / f"{case_id}.json"
+        if not path.exists():
+            return None
+        return read_model(path, IntakeCase)
+
+    def save_many(self, cases: Iterable[IntakeCase]) -> int:
+        count = 0
+        for case in cases:
+            write_model(self.cases_dir / f"{case.id}.json", case)
+            count += 1
+        return count
+
+    def append(self, events: Iterable[CaseEvent]) -> list[CaseEvent]:
+        appended = []
+        for event in events:
+            case = apply_event(self.get(event.case_id), event)
+            if case is None:
+                raise KeyError(event.case_id)
+            log = self._events_path(event.case_id)
+            seq = sum(1 for _ in open(log, "rb")) + 1 if log.exists() else 1
+            event = event.model_copy(update={"seq": seq})
+            with open(log, "ab") as f:
+                f.write(dump_json(event, pretty=False) + b"\n")
+            write_model(self.cases_dir / f"{case.id}.json", case)
+            appended.append(event)
+        return appended
+
+    def events(self, case_id: str, after_seq: int = 0) -> list[CaseEvent]:
+        log = self._events_path(case_id)
+        if not log.exists():
+            return []
+        return [e for e in load_json_lines(CaseEvent, log.read_bytes()) if e.seq > after_seq]
+
+    def _events_path(self, case_id: str) -> Path:
+        return self.cases_dir / f"{case_id}.events.jsonl"
+
+    def query(
+        self,
+        *,
+        jurisdiction: str | None = None,
+        scope: str | None = None,
+        status: str | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+        limit: int = DEFAULT_QUERY_LIMIT,
+        after: tuple[datetime, str] | None = None,
+        descending: bool = False,
+    ) -> list[IntakeCase]:
+        lo = _ts(created_from) if created_from else None
+        hi = _ts(created_to) if created_to else None
+        matches = []
+        for case in self.iter_cases():
+            created = _ts(case.created_at)
+            if jurisdiction is not None and case.request.jurisdiction.lower() != jurisdiction.lower():
+                continue
+            if scope is not None and case.request.scope.kind.value != scope:
+                continue
+            if status is not None and case.status != status:
+                continue
+            if (lo is not None and created < lo) or (hi is not None and created >= hi):
+                continue
+            if after is not None:
+                key, cursor = (created, case.id), (_ts(after[0]), after[1])
+                if (key <= cursor) if not descending else (key >= cursor):
+                    continue
+            matches.append(case)
+        matches.sort(key=lambda c: (_ts(c.created_at), c.id), reverse=descending)
+        return matches[:limit]
+
+    def iter_cases(self) -> Iterator[IntakeCase]:
+        for path in sorted(self.cases_dir.glob("*.json")):
+            yield read_model(path, IntakeCase)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.cases_dir.glob("*.json"))
+
+
+class SqliteCaseStore(CaseStore):
+    """SQLite store in WAL mode: one writer and many concurrent readers, one connection per thread.
+    Jurisdiction (case-insensitive), scope, status and created_at are indexed columns; the case
+    snapshot is kept as JSON alongside them, with ``snapshot_seq`` the last event folded into it.
+    Appending an event is one small insert plus an update of the indexed columns, never a rewrite
+    of the case document.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._pool = ConnectionPool(self.path, _SCHEMA)
+        self._upgrade()
+
+    def _conn(self) -> sqlite3.Connection:
+        return self._pool.conn()
+
+    def _upgrade(self) -> None:
+        conn = self._conn()
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(cases)")}
+        if "snapshot_seq" not in columns:
+            with conn:
+                conn.execute("ALTER TABLE cases ADD COLUMN snapshot_seq INTEGER NOT NULL DEFAULT 0")
+
+    def get(self, case_id: str) -> IntakeCase | None:
+        conn = self._conn()
+        row = conn.execute("SELECT data, snapshot_seq FROM cases WHERE id = ?", (case_id,)).fetchone()
+        if row is None:
+            return None
+        data, snapshot_seq = row
+        pending = self.events(case_id, after_seq=snapshot_seq)
+        case = replay(load_json(IntakeCase, data), pending)
+        if len(pending) >= COMPACT_AFTER_EVENTS:
+            self._write_snapshot(case, snapshot_seq, pending[-1].seq)
+        return case
+
+    def save_many(self, cases: Iterable[IntakeCase]) -> int:
+        rows = [(*_row(case), case.id) for case in cases]
+        conn = self._conn()
+        with conn:
+            conn.executemany(
+                "INSERT INTO cases (id, jurisdiction, scope, status, created_at, updated_at, data, snapshot_seq)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, (SELECT COALESCE(MAX(seq), 0) FROM case_events WHERE case_id = ?))"
+                " ON CONFLICT(id) DO UPDATE SET jurisdiction = excluded.jurisdiction, scope = excluded.scope,"
+                " status = excluded.status, created_at = excluded.created_at,"
+                " updated_at = excluded.updated_at, data = excluded.data, snapshot_seq = excluded.snapshot_seq",
+                rows,
+            )
+        return len(rows)
+
+    def append(self, events: Iterable[CaseEvent]) -> list[CaseEvent]:
+        appended = []
+        conn = self._conn()
+        with conn:
+            for event in events:
+                cur = conn.execute(
+                    "INSERT INTO case_events (case_id, kind, at, data) VALUES (?, ?, ?, ?)",
+                    (event.case_id, event.kind.value, _ts(event.at), dump_json(event, pretty=False, exclude={"seq"})),
+                )
+                seq = cur.lastrowid
+                if event.kind == CaseEventKind.INTAKE_CREATED:
+                    if event.case is None or event.case.id != event.case_id:
+                        raise ValueError(f"intake_created event for {event.case_id} must carry that case")
+                    self._upsert_snapshot(conn, event.case, seq)
+                else:
+                    status = event.data.get("status") if event.kind == CaseEventKind.STATUS_CHANGED else None
+                    cur = conn.execute(
+                        "UPDATE cases SET updated_at = MAX(updated_at, ?), status = COALESCE(?, status) WHERE id = ?",
+                        (_ts(event.at), status, event.case_id),
+                    )
+                    if cur.rowcount == 0:
+                        raise KeyError(event.case_id)
+                appended.append(event.model_copy(update={"seq": seq}))
+        return appended
+
+    def events(self, case_id: str, after_seq: int = 0) -> list[CaseEvent]:
+        rows = self._conn().execute(
+            "SELECT seq, data FROM case_events WHERE case_id = ? AND seq > ? ORDER BY seq", (case_id, after_seq)
+        )
+        return [_event(seq, data) for seq, data in rows]
+
+    def compact(self, min_events: int = COMPACT_AFTER_EVENTS) -> int:
+        conn = self._conn()
+        rows = conn.execute(
+            "SELECT c.id, c.data, c.snapshot_seq FROM cases c"
+            " JOIN case_events e ON e.case_id = c.id AND e.seq > c.snapshot_seq"
+            " GROUP BY c.id HAVING COUNT(*) >= ?",
+            (max(min_events, 1),),
+        ).fetchall()
+        compacted = 0
+        for case_id, data, snapshot_seq in rows:
+            pending = self.events(case_id, after_seq=snapshot_seq)
+            if pending:
+                case = replay(load_json(IntakeCase, data), pending)
+                compacted += self._write_snapshot(case, snapshot_seq, pending[-1].seq)
+        return compacted
+
+    def query(
+        self,
+        *,
+        jurisdiction: str | None = None,
+        scope: str | None = None,
+        status: str | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+        limit: int = DEFAULT_QUERY_LIMIT,
+        after: tuple[datetime, str] | None = None,
+        descending: bool = False,
+    ) -> list[IntakeCase]:
+        clauses, params = _filters(jurisdiction, scope, status, created_from, created_to)
+        if after is not None:
+            clauses.append(f"(created_at, id) {'<' if descending else '>'} (?, ?)")
+            params.extend((_ts(after[0]), after[1]))
+        sql = "SELECT id, data, snapshot_seq FROM cases"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        direction = "DESC" if descending else "ASC"
+        sql += f" ORDER BY created_at {direction}, id {direction} LIMIT ?"
+        conn = self._conn()
+        return self._replay_rows(conn, conn.execute(sql, (*params, limit)).fetchall())
+
+    def iter_cases(self) -> Iterator[IntakeCase]:
+        conn = self._conn()
+        cur = conn.execute("SELECT id, data, snapshot_seq FROM cases ORDER BY created_at, id")
+        while rows := cur.fetchmany(_REPLAY_BATCH):
+            yield from self._replay_rows(conn, rows)
+
+    def __len__(self) -> int:
+        return self._conn().execute("SELECT COUNT(*) FROM cases").fetchone()[0]
+
+    def close(self) -> None:
+        self._pool.close()
+
+    def _replay_rows(self, conn: sqlite3.Connection, rows: list[tuple]) -> list[IntakeCase]:
+        """Snapshots -> current cases, fetching the pending events of up to ``_REPLAY_BATCH`` rows per query."""
+        cases = [load_json(IntakeCase, data) for _, data, _ in rows]
+        by_id = {case.id: case for case in cases}
+        for start in range(0, len(rows), _REPLAY_BATCH):
+            batch = rows[start : start + _REPLAY_BATCH]
+            snapshots = ", ".join("(?, ?)" for _ in batch)
+            pending = conn.execute(
+                f"WITH snap(id, seq) AS (VALUES {snapshots})"
+                " SELECT e.case_id, e.seq, e.data FROM snap JOIN case_events e ON e.case_id = snap.id AND e.seq > snap.seq"
+                " ORDER BY e.seq",
+                [v for case_id, _, snapshot_seq in batch for v in (case_id, snapshot_seq)],
+            ).fetchall()
+            for case_id, seq, data in pending:
+                apply_event(by_id[case_id], _event(seq, data))
+        return cases
+
+    def _upsert_snapshot(self, conn: sqlite3.Connection, case: IntakeCase, snapshot_seq: int) -> None:
+        conn.execute(
+            "INSERT INTO cases (id, jurisdiction, scope, status, created_at, updated_at, data, snapshot_seq)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+            " ON CONFLICT(id) DO UPDATE SET jurisdiction = excluded.jurisdiction, scope = excluded.scope,"
+            " status = excluded.status, created_at = excluded.created_at,"
+            " updated_at = excluded.updated_at, data = excluded.data, snapshot_seq = excluded.snapshot_seq",
+            (*_row(case), snapshot_seq),
+        )
+
+    def _write_snapshot(self, case: IntakeCase, from_seq: int, to_seq: int) -> bool:
+        """Store ``case`` (replayed up to ``to_seq``) unless another writer moved the snapshot meanwhile."""
+        conn = self._conn()
+        with conn:
+            cur = conn.execute(
+                "UPDATE cases SET data = ?, snapshot_seq = ? WHERE id = ? AND snapshot_seq = ?",
+                (dump_json(case, pretty=False), to_seq, case.id, from_seq),
+            )
+        return cur.rowcount == 1
+
+
+def encode_cursor(case: IntakeCase) -> str:
+    """Opaque keyset cursor pointing just past ``case``."""
+    raw = dumps([_ts(case.created_at), case.id], pretty=False)
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """Inverse of encode_cursor; raises ValueError for a malformed cursor."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, case_id = loads(raw)
+        return datetime.fromisoformat(created_at), str(case_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"invalid cursor: {cursor!r}") from e
+
+
+def migrate_json_cases(
+    cases_dir: Path, store: CaseStore, batch_size: int = MIGRATION_BATCH_SIZE
+) -> tuple[int, list[str]]:
+    """Copy every ``<id>.json`` case into ``store`` in batched transactions.
+    Returns (cases migrated, errors for files that could not be read). Safe to re-run.
+    """
+    migrated = 0
+    errors: list[str] = []
+    batch: list[IntakeCase] = []
+    for path in sorted(Path(cases_dir).glob("*.json")):
+        try:
+            batch.append(read_model(path, IntakeCase))
+        except (OSError, ValidationError) as e:
+            errors.append(f"{path}: {e}")
+            continue
+        if len(batch) >= batch_size:
+            migrated += store.save_many(batch)
+            batch = []
+    if batch:
+        migrated += store.save_many(batch)
+    return migrated, errors
+
+
+def _ts(dt: datetime) -> str:
+    """Fixed-width naive-UTC ISO timestamp so string order is time order."""
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt.isoformat(timespec="microseconds")
+
+
+def _row(case: IntakeCase) -> tuple:
+    return (
+        case.id,
+        case.request.jurisdiction,
+        case.request.scope.kind.value,
+        case.status,
+        _ts(case.created_at),
+        _ts(case.updated_at),
+        dump_json(case, pretty=False),
+    )
+
+
+def _event(seq: int, data: bytes | str) -> CaseEvent:
+    event = load_json(CaseEvent, data)
+    event.seq = seq
+    return event
+
+
+def _filters(
+    jurisdiction: str | None,
+    scope: str | None,
+    status: str | None,
+    created_from: datetime | None,
+    created_to: datetime | None,
+) -> tuple[list[str], list]:
+    clauses: list[str] = []
+    params: list = []
+    for column, value in (("jurisdiction", jurisdiction), ("scope", scope), ("status", status)):
+        if value is not None:
+            clauses.append(f"{column} = ?")
+            params.append(value)
+    if created_from is not None:
+        clauses.append("created_at >= ?")
+        params.append(_ts(created_from))
+    if created_to is not None:
+        clauses.append("created_at < ?")
+        params.append(_ts(created_to))
+    return clauses, params
@@ -1,6 +1,10 @@
-"""Core Pydantic models for intake, documents, jurisdiction, outreach, and workflow."""
+"""Core Pydantic models for intake, documents, jurisdiction, outreach, submission, and workflow."""
 
 from permitting_agent.models.intake import (
+    BulkIntakeReport,
+    CaseEvent,
+    CaseEventKind,
+    DuplicateSite,
     IntakeRequest,
     IntakeCase,
     ScopeKind,
@@ -14,22 +18,43 @@ from permitting_agent.models.document import (
     Confidence,
     DocumentArtifact,
     ExtractedField,
+    FormField,
     GapItem,
+    PageInfo,
     WhatsNeededReport,
 )
 from permitting_agent.models.jurisdiction import (
     Certainty,
+    JurisdictionMatch,
     PermitRequirement,
     PortalResearchResult,
     ResearchSource,
 )
 from permitting_agent.models.outreach import (
     Contact,
+    ContactRefreshReport,
+    DeliveryReport,
+    DeliveryStatus,
+    OutreachBatchReport,
     OutreachDraft,
     ContactList,
 )
+from permitting_agent.models.submission import (
+    PortalFormField,
+    PortalFormPage,
+    PortalFormSchema,
+    PortalRun,
+    RunStatus,
+    StepDecision,
+    SubmissionBatchReport,
+    SubmissionStatus,
+)
 
 __all__ = [
+    "BulkIntakeReport",
+    "CaseEvent",
+    "CaseEventKind",
+    "DuplicateSite",
     "IntakeRequest",
     "IntakeCase",
     "ScopeKind",
@@ -41,13 +66,28 @@ __all__ = [
     "Confidence",
     "DocumentArtifact",
     "ExtractedField",
+    "FormField",
     "GapItem",
+    "PageInfo",
     "WhatsNeededReport",
     "Certainty",
+    "JurisdictionMatch",
     "PermitRequirement",
     "PortalResearchResult",
     "ResearchSource",
     "Contact",
+    "ContactRefreshReport",
+    "DeliveryReport",
+    "DeliveryStatus",
+    "OutreachBatchReport",
     "OutreachDraft",
     "ContactList",
+    "PortalFormField",
+    "PortalFormPage",
+    "PortalFormSchema",
+    "PortalRun",
+    "RunStatus",
+    "StepDecision",
+    "SubmissionBatchReport",
+    "SubmissionStatus",
 ]
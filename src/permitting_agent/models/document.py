@@ -33,12 +33,37 @@ class ExtractedField(BaseModel):
     citations: list[Citation] = Field(default_factory=list)
 
 
+class FormField(BaseModel):
+    """A fillable (AcroForm) field of a PDF, read from the form definition rather than page text."""
+
+    name: str  # fully qualified field name, e.g. "applicant.name"
+    label: str
+    type: str = "text"  # text | checkbox | radio | choice | signature
+    value: str | None = None
+    options: list[str] = Field(default_factory=list)  # choice items; on-states of checkboxes/radios
+    required: bool = False
+    read_only: bool = False
+    page: int | None = None  # 1-based page of the field's first widget
+
+
+class PageInfo(BaseModel):
+    """How one PDF page was classified before text extraction, and whether its text was read."""
+
+    number: int  # 1-based
+    kind: str  # text | mixed | image (scanned: images, no text operators) | graphics (no text, no images)
+    images: int = 0  # image XObjects and inline images drawn
+    text_ops: int = 0  # text objects (BT ... ET) in the content stream
+    extracted: bool = False  # False: never machine-read (needs OCR or a person)
+
+
 class DocumentArtifact(BaseModel):
     """Result of ingesting one document (PDF/Word)."""
 
     path: Path
     kind: str = "pdf"  # pdf | docx
     extracted_fields: list[ExtractedField] = Field(default_factory=list)
+    form_fields: list[FormField] = Field(default_factory=list)  # fillable PDFs only
+    pages: list[PageInfo] = Field(default_factory=list)  # PDFs read for text
     raw_text_preview: str | None = None
     ingested_at: datetime = Field(default_factory=datetime.utcnow)
 
@@ -52,6 +52,53 @@ class IntakeCase(BaseModel):
 
     id: str
     request: IntakeRequest
+    status: str = "open"
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     meta: dict[str, Any] = Field(default_factory=dict)
+
+
+class DuplicateSite(BaseModel):
+    """An existing case whose site looks like the same location (near-identical coordinates or address)."""
+
+    case_id: str
+    reason: str  # "location" | "address" | "location_and_address"
+    distance_m: float | None = None
+
+
+class BulkIntakeReport(BaseModel):
+    """Outcome of a bulk intake import (one run; resumed runs report only their own rows)."""
+
+    source: Path
+    import_key: str
+    rows_read: int = 0
+    created: int = 0
+    skipped: int = 0
+    errors: int = 0
+    possible_duplicates: int = 0
+    error_report: Path | None = None
+    resumed_from_row: int = 0
+
+
+class CaseEventKind(str, Enum):
+    """What happened to a case. Unknown kinds still advance ``updated_at`` when replayed."""
+
+    INTAKE_CREATED = "intake_created"
+    STATUS_CHANGED = "status_changed"
+    META_UPDATED = "meta_updated"
+    REVIEW_COMPLETED = "review_completed"
+    RESEARCH_ATTACHED = "research_attached"
+    SUBMISSION_STEP_APPROVED = "submission_step_approved"
+    SUBMISSION_STEP_DECLINED = "submission_step_declined"
+
+
+class CaseEvent(BaseModel):
+    """One append-only entry in a case's history; the current case is the replay of its events."""
+
+    case_id: str
+    kind: CaseEventKind
+    at: datetime = Field(default_factory=datetime.utcnow)
+    seq: int | None = None  # assigned by the store on append
+    actor: str | None = None
+    case: IntakeCase | None = None  # full case, intake_created only
+    data: dict[str, Any] = Field(default_factory=dict)
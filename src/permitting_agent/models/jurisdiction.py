@@ -43,3 +43,12 @@ class PortalResearchResult(BaseModel):
     application_steps: list[str] = Field(default_factory=list)
     sources: list[ResearchSource] = Field(default_factory=list)
     raw_notes: str | None = None
+
+
+class JurisdictionMatch(BaseModel):
+    """A jurisdiction whose boundary contains a site (from spatial resolution)."""
+
+    jurisdiction_id: str
+    name: str
+    level: str = "municipal"  # municipal | county | state | other
+    state: str | None = None
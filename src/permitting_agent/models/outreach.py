@@ -1,6 +1,8 @@
 """Outreach models: contacts, email drafts, contact list with source URLs."""
 
 from datetime import datetime
+from enum import Enum
+from pathlib import Path
 
 from pydantic import BaseModel, Field
 
@@ -15,6 +17,7 @@ class Contact(BaseModel):
     department: str | None = None
     source_url: str | None = None
     discovered_at: datetime = Field(default_factory=datetime.utcnow)
+    last_verified: datetime | None = None  # last time source_url still listed this contact
     notes: str | None = None
 
 
@@ -26,6 +29,7 @@ class OutreachDraft(BaseModel):
     body: str
     contact_ids: list[str] = Field(default_factory=list)
     template_used: str | None = None
+    jurisdiction: str | None = None
 
 
 class ContactList(BaseModel):
@@ -35,3 +39,50 @@ class ContactList(BaseModel):
     generated_at: datetime = Field(default_factory=datetime.utcnow)
     contacts: list[Contact] = Field(default_factory=list)
     source_urls: list[str] = Field(default_factory=list)
+
+
+class OutreachBatchReport(BaseModel):
+    """Outcome of a bulk draft run written to .eml files or an mbox."""
+
+    output: Path
+    format: str  # "eml" | "mbox"
+    jurisdictions: int = 0
+    drafts: int = 0
+    without_contacts: list[str] = Field(default_factory=list)
+    errors: list[str] = Field(default_factory=list)
+    templates_used: dict[str, int] = Field(default_factory=dict)
+
+
+class DeliveryStatus(str, Enum):
+    """Send-queue state of one outreach message."""
+
+    QUEUED = "queued"
+    SENDING = "sending"
+    SENT = "sent"
+    FAILED = "failed"
+    UNKNOWN = "unknown"  # interrupted mid-send; not retried automatically (it may have been delivered)
+
+
+class DeliveryReport(BaseModel):
+    """Outcome of one run of the outreach send queue."""
+
+    sent: int = 0
+    retried: int = 0
+    failed: int = 0
+    unknown: int = 0
+    remaining: int = 0
+    elapsed_s: float = 0.0
+
+
+class ContactRefreshReport(BaseModel):
+    """Outcome of re-verifying stale contacts in the contact index against their source pages."""
+
+    sources_checked: int = 0
+    not_modified: int = 0  # 304: every contact on the page confirmed without a download
+    changed: int = 0  # page re-downloaded and re-extracted
+    gone: int = 0  # 404/410: the page is gone
+    failed: int = 0  # network/server errors, robots.txt; contacts stay stale for the next run
+    verified: int = 0
+    removed: int = 0  # contacts no longer listed on their source page
+    unverifiable: int = 0  # stale contacts with no source_url
+    elapsed_s: float = 0.0
@@ -0,0 +1,105 @@
+"""Portal submission models: batch job states, batch run reports, persisted approval-driven runs,
+discovered application form schemas."""
+
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+
+class SubmissionStatus(str, Enum):
+    """State of one case's portal submission in a batch."""
+
+    QUEUED = "queued"  # waiting for a worker (resumed jobs keep their completed steps)
+    RUNNING = "running"
+    SUBMITTING = "submitting"  # final submit approved and in flight
+    COMPLETED = "completed"
+    ABORTED = "aborted"  # a step was declined
+    FAILED = "failed"
+    NEEDS_LOGIN = "needs_login"
+    UNKNOWN = "unknown"  # interrupted during submit; not retried automatically (it may have gone through)
+
+
+class SubmissionBatchReport(BaseModel):
+    """Outcome of one run of a portal submission batch (resumed runs count every job in the batch)."""
+
+    batch: str
+    jobs: int = 0
+    counts: dict[str, int] = Field(default_factory=dict)  # SubmissionStatus value -> jobs
+    resumed: int = 0  # jobs picked up with steps already completed by an earlier run
+    approvals: int = 0
+    approval_wait_s: float = 0.0  # total time flows spent waiting for a person
+    max_parallel: int = 0
+    elapsed_s: float = 0.0
+
+
+class RunStatus(str, Enum):
+    """State of a persisted, approval-driven portal run (see ``portal_automation.runs``)."""
+
+    READY = "ready"  # a worker may run it (just created, or its pending step was approved)
+    AWAITING_APPROVAL = "awaiting_approval"  # suspended: no process or browser holds it
+    RUNNING = "running"  # leased by a worker
+    SUBMITTING = "submitting"  # final submit in flight
+    COMPLETED = "completed"
+    REJECTED = "rejected"
+    FAILED = "failed"
+    NEEDS_LOGIN = "needs_login"
+    UNKNOWN = "unknown"  # worker lost during submit; never resubmitted automatically
+
+
+class StepDecision(BaseModel):
+    """A person's answer to one pending step."""
+
+    step: str
+    approved: bool
+    actor: str | None = None
+    at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class PortalRun(BaseModel):
+    """One case's portal submission as a resumable state machine."""
+
+    id: str
+    case_id: str
+    portal_url: str | None = None
+    documents: dict[str, Path] = Field(default_factory=dict)
+    approve_each_step: bool = True
+    status: RunStatus = RunStatus.READY
+    pending_step: str | None = None  # step waiting for (or holding) approval
+    awaiting_since: datetime | None = None  # when the run last suspended for approval
+    completed_steps: list[str] = Field(default_factory=list)
+    steps: list[dict[str, Any]] = Field(default_factory=list)  # latest StepResult of each executed step
+    decisions: list[StepDecision] = Field(default_factory=list)
+    confirmation: str | None = None
+    error: str | None = None
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class PortalFormPage(BaseModel):
+    """One page of a portal's application wizard."""
+
+    url: str
+    title: str | None = None
+
+
+class PortalFormField(BaseModel):
+    """One input of a portal's application form."""
+
+    name: str
+    label: str
+    type: str = "text"  # text | email | tel | number | url | textarea | select
+    required: bool = False
+    page: int = 0  # index into PortalFormSchema.pages
+    section: str | None = None  # tab panel or fieldset on that page
+
+
+class PortalFormSchema(BaseModel):
+    """Every field of a (multi-page) application form, in wizard order."""
+
+    portal_url: str
+    pages: list[PortalFormPage] = Field(default_factory=list)
+    fields: list[PortalFormField] = Field(default_factory=list)
+    discovered_at: datetime = Field(default_factory=datetime.utcnow)
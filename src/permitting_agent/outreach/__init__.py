@@ -1,5 +1,26 @@
 """Outreach: discover contacts from official sources, draft emails, contact list with source URLs."""
 
-from permitting_agent.outreach.service import OutreachService
+from permitting_agent.outreach.service import OutreachService, iter_contact_lists
+from permitting_agent.outreach.templates import TemplateError, TemplateLibrary
+from permitting_agent.outreach.mailbox import EmlWriter, MboxWriter, open_writer
+from permitting_agent.outreach.contact_index import ContactIndex
+from permitting_agent.outreach.discovery import ContactCrawler, CrawlStats, extract_contacts
+from permitting_agent.outreach.delivery import DeliveryPolicy, DeliveryQueue, SmtpSettings, send_queued
 
-__all__ = ["OutreachService"]
+__all__ = [
+    "ContactCrawler",
+    "ContactIndex",
+    "CrawlStats",
+    "DeliveryPolicy",
+    "DeliveryQueue",
+    "EmlWriter",
+    "MboxWriter",
+    "OutreachService",
+    "SmtpSettings",
+    "TemplateError",
+    "TemplateLibrary",
+    "extract_contacts",
+    "iter_contact_lists",
+    "open_writer",
+    "send_queued",
+]
@@ -0,0 +1,373 @@
+"""Global contact index: one row per person across jurisdictions, with freshness tracking.
+
+Contacts from every jurisdiction's contact list are merged in SQLite (``<data-dir>/contacts.db``)
+by normalized email and phone, so a county ROW engineer listed by five cities is one contact
+with five jurisdiction roles. Merge rules:
+
+- The normalized email is the identity: the same email is the same contact everywhere.
+- A sighting without email joins a contact without email that has that phone (a department desk
+  line). It joins an emailed contact only if that is the one contact with the phone and has the
+  same origin: listed on the same source page, for the same role.
+- An emailed sighting whose phone matches a phone-only contact of the same origin takes that
+  contact over; a planner listing the ROW desk's number doesn't become the ROW desk.
+- A sighting fills empty fields. A sighting from the contact's own ``source_url`` (re-reading the
+  page it came from) overwrites name, phone and department: the page is the authority.
+
+Every contact has ``last_verified``: when its source page last listed it. ``refresh`` re-checks
+only stale contacts, and only once per source page, with a conditional GET (ETag /
+Last-Modified): a 304 confirms every contact on the page without a download, a changed page is
+re-extracted, and contacts the page no longer lists are marked removed.
+"""
+
+import re
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterable
+
+from permitting_agent.models import Contact, ContactList, ContactRefreshReport
+from permitting_agent.outreach.discovery import ContactCrawler, Revalidation
+from permitting_agent.sqlite import ConnectionPool
+
+DEFAULT_MAX_AGE = timedelta(days=30)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS contacts (
+    id INTEGER PRIMARY KEY,
+    email_key TEXT UNIQUE,
+    phone_key TEXT,
+    name TEXT,
+    email TEXT,
+    phone TEXT,
+    department TEXT,
+    source_url TEXT,
+    first_seen REAL NOT NULL,
+    last_verified REAL,
+    removed_at REAL
+);
+CREATE INDEX IF NOT EXISTS contacts_by_phone ON contacts (phone_key);
+CREATE INDEX IF NOT EXISTS contacts_by_source ON contacts (source_url);
+CREATE INDEX IF NOT EXISTS contacts_by_verified ON contacts (last_verified);
+CREATE TABLE IF NOT EXISTS contact_roles (
+    contact_id INTEGER NOT NULL,
+    jurisdiction TEXT NOT NULL,
+    role TEXT NOT NULL,
+    PRIMARY KEY (contact_id, jurisdiction, role)
+);
+CREATE INDEX IF NOT EXISTS contact_roles_by_jurisdiction ON contact_roles (jurisdiction);
+CREATE TABLE IF NOT EXISTS sources (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    checked_at REAL,
+    status TEXT
+);
+"""
+
+_COLUMNS = "id, email_key, phone_key, name, email, phone, department, source_url, first_seen, last_verified"
+_EXTENSION = re.compile(r"(?:ext\.?|extension|x|#)\s*(\d{1,6})\s*$", re.IGNORECASE)
+
+
+def normalize_email(email: str | None) -> str | None:
+    """Lowercased address without ``mailto:``, brackets or whitespace; None if it isn't one."""
+    if not email:
+        return None
+    value = email.strip().strip("<>").strip()
+    if value[:7].lower() == "mailto:":
+        value = value[7:].split("?", 1)[0]
+    value = value.lower()
+    return value if "@" in value and "." in value.rpartition("@")[2] else None
+
+
+def normalize_phone(phone: str | None) -> str | None:
+    """Digits only, US country code dropped, extension kept as ``x<n>`` (``2105551234x12``);
+    None for fewer than 7 digits.
+    """
+    if not phone:
+        return None
+    ext = _EXTENSION.search(phone)
+    main = phone[: ext.start()] if ext else phone
+    digits = "".join(ch for ch in main if ch.isdigit())
+    if len(digits) == 11 and digits[0] == "1":
+        digits = digits[1:]
+    if len(digits) < 7:
+        return None
+    return f"{digits}x{ext.group(1)}" if ext else digits
+
+
+@dataclass
+class _Row:
+    id: int
+    email_key: str | None
+    phone_key: str | None
+    name: str | None
+    email: str | None
+    phone: str | None
+    department: str | None
+    source_url: str | None
+    first_seen: float
+    last_verified: float | None
+
+
+class ContactIndex:
+    """SQLite-backed contact index shared by all jurisdictions."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._pool = ConnectionPool(self.path, _SCHEMA)
+
+    def add(
+        self,
+        contact_list: ContactList,
+        now: datetime | None = None,
+        validators: dict[str, tuple[str | None, str | None]] | None = None,
+    ) -> tuple[int, int]:
+        """Merge a jurisdiction's contacts into the index; returns (added, merged) counts.
+        Contacts are recorded as verified at ``now`` (their source page just listed them).
+        ``validators`` (a crawl's ``CrawlStats.validators``) let the next refresh send conditional GETs.
+        """
+        ts = _ts(now)
+        conn = self._pool.conn()
+        added = merged = 0
+        with conn:
+            for url, (etag, modified) in (validators or {}).items():
+                self._record_source(conn, url, etag, modified, ts, "crawled")
+            for contact in contact_list.contacts:
+                contact_id, created = self._merge(conn, contact, ts)
+                conn.execute(
+                    "INSERT OR IGNORE INTO contact_roles (contact_id, jurisdiction, role) VALUES (?, ?, ?)",
+                    (contact_id, contact_list.jurisdiction, contact.role),
+                )
+                added += created
+                merged += not created
+        return added, merged
+
+    def add_many(self, contact_lists: Iterable[ContactList], now: datetime | None = None) -> tuple[int, int]:
+        """``add`` for many contact lists; returns total (added, merged)."""
+        added = merged = 0
+        for contact_list in contact_lists:
+            a, m = self.add(contact_list, now)
+            added, merged = added + a, merged + m
+        return added, merged
+
+    def contact_list(self, jurisdiction: str, include_removed: bool = False) -> ContactList:
+        """The jurisdiction's current contacts (one per role they hold there), with ``last_verified``."""
+        removed = "" if include_removed else "AND c.removed_at IS NULL"
+        rows = self._pool.conn().execute(
+            f"SELECT r.role, {', '.join('c.' + col for col in _COLUMNS.split(', '))} "
+            f"FROM contact_roles r JOIN contacts c ON c.id = r.contact_id "
+            f"WHERE r.jurisdiction = ? {removed} ORDER BY r.role, c.id",
+            (jurisdiction,),
+        ).fetchall()
+        contacts = [_to_contact(_Row(*row[1:]), row[0]) for row in rows]
+        return ContactList(
+            jurisdiction=jurisdiction,
+            contacts=contacts,
+            source_urls=list(dict.fromkeys(c.source_url for c in contacts if c.source_url)),
+        )
+
+    def jurisdictions(self) -> list[str]:
+        return [r[0] for r in self._pool.conn().execute("SELECT DISTINCT jurisdiction FROM contact_roles ORDER BY 1")]
+
+    def roles(self, email: str | None = None, phone: str | None = None) -> list[tuple[str, str]]:
+        """(jurisdiction, role) pairs of the contact with this email (or phone)."""
+        row = self._find(self._pool.conn(), normalize_email(email), normalize_phone(phone))
+        if row is None:
+            return []
+        return [
+            tuple(r)
+            for r in self._pool.conn().execute(
+                "SELECT jurisdiction, role FROM contact_roles WHERE contact_id = ? ORDER BY 1, 2", (row.id,)
+            )
+        ]
+
+    def counts(self, max_age: timedelta = DEFAULT_MAX_AGE, now: datetime | None = None) -> dict[str, int]:
+        """Active, stale (not verified within ``max_age``) and removed contacts, and source pages."""
+        cutoff = _ts(now) - max_age.total_seconds()
+        active, stale, removed, sources = self._pool.conn().execute(
+            "SELECT SUM(removed_at IS NULL), "
+            "SUM(removed_at IS NULL AND (last_verified IS NULL OR last_verified < ?)), "
+            "SUM(removed_at IS NOT NULL), COUNT(DISTINCT source_url) FROM contacts",
+            (cutoff,),
+        ).fetchone()
+        return {"active": active or 0, "stale": stale or 0, "removed": removed or 0, "sources": sources or 0}
+
+    def stale_sources(
+        self, max_age: timedelta = DEFAULT_MAX_AGE, now: datetime | None = None
+    ) -> dict[str, tuple[str | None, str | None]]:
+        """Source pages with at least one stale active contact -> their stored (ETag, Last-Modified)."""
+        cutoff = _ts(now) - max_age.total_seconds()
+        rows = self._pool.conn().execute(
+            "SELECT DISTINCT c.source_url, s.etag, s.last_modified FROM contacts c "
+            "LEFT JOIN sources s ON s.url = c.source_url "
+            "WHERE c.removed_at IS NULL AND c.source_url IS NOT NULL "
+            "AND (c.last_verified IS NULL OR c.last_verified < ?)",
+            (cutoff,),
+        )
+        return {url: (etag, modified) for url, etag, modified in rows}
+
+    async def refresh(
+        self,
+        max_age: timedelta = DEFAULT_MAX_AGE,
+        crawler: ContactCrawler | None = None,
+        now: datetime | None = None,
+    ) -> ContactRefreshReport:
+        """Re-verify stale contacts: one conditional GET per stale source page, not a recrawl."""
+        started = time.perf_counter()
+        cutoff = _ts(now) - max_age.total_seconds()
+        report = ContactRefreshReport()
+        report.unverifiable = self._pool.conn().execute(
+            "SELECT COUNT(*) FROM contacts WHERE removed_at IS NULL AND source_url IS NULL "
+            "AND (last_verified IS NULL OR last_verified < ?)",
+            (cutoff,),
+        ).fetchone()[0]
+        validators = self.stale_sources(max_age, now)
+        if validators:
+            results = await (crawler or ContactCrawler()).revalidate(validators)
+            for result in results:
+                self._apply(result, _ts(now), report)
+        report.sources_checked = len(validators)
+        report.elapsed_s = round(time.perf_counter() - started, 3)
+        return report
+
+    def close(self) -> None:
+        self._pool.close()
+
+    def _apply(self, result: Revalidation, ts: float, report: ContactRefreshReport) -> None:
+        conn = self._pool.conn()
+        with conn:
+            if result.status in ("failed", "blocked"):
+                report.failed += 1
+                return
+            self._record_source(conn, result.url, result.etag, result.last_modified, ts, result.status)
+            if result.status == "not_modified":
+                report.not_modified += 1
+                report.verified += conn.execute(
+                    "UPDATE contacts SET last_verified = ? WHERE source_url = ? AND removed_at IS NULL", (ts, result.url)
+                ).rowcount
+                return
+            if result.status == "gone":
+                report.gone += 1
+                report.removed += conn.execute(
+                    "UPDATE contacts SET removed_at = ? WHERE source_url = ? AND removed_at IS NULL", (ts, result.url)
+                ).rowcount
+                return
+            report.changed += 1
+            before = {
+                r[0]
+                for r in conn.execute("SELECT id FROM contacts WHERE source_url = ? AND removed_at IS NULL", (result.url,))
+            }
+            jurisdictions = [
+                r[0]
+                for r in conn.execute(
+                    "SELECT DISTINCT r.jurisdiction FROM contact_roles r JOIN contacts c ON c.id = r.contact_id "
+                    "WHERE c.source_url = ?",
+                    (result.url,),
+                )
+            ]
+            seen: set[int] = set()
+            for contact in result.page.contacts if result.page else []:
+                contact_id, _ = self._merge(conn, contact, ts)
+                seen.add(contact_id)
+                for jurisdiction in jurisdictions:  # new people on a known page belong where the page does
+                    conn.execute(
+                        "INSERT OR IGNORE INTO contact_roles (contact_id, jurisdiction, role) VALUES (?, ?, ?)",
+                        (contact_id, jurisdiction, contact.role),
+                    )
+            report.verified += len(seen & before)
+            gone = before - seen
+            if gone:
+                conn.executemany("UPDATE contacts SET removed_at = ? WHERE id = ?", [(ts, i) for i in gone])
+                report.removed += len(gone)
+
+    def _record_source(self, conn, url: str, etag: str | None, modified: str | None, ts: float, status: str) -> None:
+        conn.execute(
+            "INSERT INTO sources (url, etag, last_modified, checked_at, status) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT (url) DO UPDATE SET etag = excluded.etag, last_modified = excluded.last_modified, "
+            "checked_at = excluded.checked_at, status = excluded.status",
+            (url, etag, modified, ts, status),
+        )
+
+    def _merge(self, conn, contact: Contact, ts: float) -> tuple[int, bool]:
+        """Insert or merge one sighting; returns (contact id, created)."""
+        email_key, phone_key = normalize_email(contact.email), normalize_phone(contact.phone)
+        row = self._find(conn, email_key, phone_key, contact)
+        if row is None:
+            cur = conn.execute(
+                "INSERT INTO contacts (email_key, phone_key, name, email, phone, department, source_url, "
+                "first_seen, last_verified) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (email_key, phone_key, contact.name, email_key, contact.phone, contact.department, contact.source_url, ts, ts),
+            )
+            return cur.lastrowid, True
+        authoritative = contact.source_url is not None and contact.source_url == row.source_url
+        updates = {"last_verified": ts, "removed_at": None}
+        for field, value in (("name", contact.name), ("phone", contact.phone), ("department", contact.department)):
+            if value and (authoritative or not getattr(row, field)):
+                updates[field] = value
+        if "phone" in updates:
+            updates["phone_key"] = normalize_phone(updates["phone"])
+        if email_key and not row.email_key:
+            updates["email_key"] = updates["email"] = email_key
+        if contact.source_url and not row.source_url:
+            updates["source_url"] = contact.source_url
+        conn.execute(
+            f"UPDATE contacts SET {', '.join(f'{k} = ?' for k in updates)} WHERE id = ?",
+            (*updates.values(), row.id),
+        )
+        return row.id, False
+
+    def _find(
+        self, conn, email_key: str | None, phone_key: str | None, contact: Contact | None = None
+    ) -> _Row | None:
+        """The contact a sighting merges into, or, without ``contact``, the one a lookup by email/phone means."""
+        if email_key:
+            row = conn.execute(f"SELECT {_COLUMNS} FROM contacts WHERE email_key = ?", (email_key,)).fetchone()
+            if row:
+                return _Row(*row)
+            if phone_key:  # an emailed sighting takes over a phone-only contact of the same origin
+                rows = conn.execute(
+                    f"SELECT {_COLUMNS} FROM contacts WHERE phone_key = ? AND email_key IS NULL ORDER BY id", (phone_key,)
+                )
+                return next((r for r in (_Row(*r) for r in rows) if self._same_origin(conn, r, contact)), None)
+            return None
+        if phone_key:
+            rows = [
+                _Row(*r)
+                for r in conn.execute(
+                    f"SELECT {_COLUMNS} FROM contacts WHERE phone_key = ? ORDER BY email_key IS NOT NULL, id LIMIT 2",
+                    (phone_key,),
+                )
+            ]
+            if rows and rows[0].email_key is None:
+                return rows[0]
+            if len(rows) == 1 and self._same_origin(conn, rows[0], contact):
+                return rows[0]
+        return None
+
+    def _same_origin(self, conn, row: _Row, contact: Contact | None) -> bool:
+        """Listed on the same source page (or both unknown) and holding the sighting's role somewhere."""
+        if contact is None:
+            return True
+        if row.source_url != contact.source_url:
+            return False
+        return conn.execute(
+            "SELECT 1 FROM contact_roles WHERE contact_id = ? AND role = ? LIMIT 1", (row.id, contact.role)
+        ).fetchone() is not None
+
+
+def _ts(now: datetime | None) -> float:
+    return (now or datetime.utcnow()).timestamp()
+
+
+def _to_contact(row: _Row, role: str) -> Contact:
+    return Contact(
+        name=row.name,
+        role=role,
+        email=row.email,
+        phone=row.phone,
+        department=row.department,
+        source_url=row.source_url,
+        discovered_at=datetime.fromtimestamp(row.first_seen),
+        last_verified=datetime.fromtimestamp(row.last_verified) if row.last_verified else None,
+    )
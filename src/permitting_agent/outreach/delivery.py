@@ -0,0 +1,455 @@
+"""Outreach delivery: a send queue persisted in SQLite, drained over SMTP with per-domain rate limits.
+
+Every message is queued under an idempotency key (a draft's Message-ID), so enqueueing the same
+drafts again is a no-op. Delivery is at most once: a row is marked ``sending`` before it is
+handed to the SMTP server, and a run that finds rows still ``sending`` (the previous process died
+mid-send) marks them ``unknown`` for a person to check rather than sending them again.
+
+Failures the server reports as temporary (4xx, dropped connections before DATA) are retried with
+exponential backoff; permanent ones (5xx) fail the message. Messages to one recipient domain are
+spaced ``domain_interval`` seconds apart so a city mail server sees a trickle, while different
+domains are sent concurrently over a small pool of SMTP connections.
+"""
+
+import asyncio
+import os
+import random
+import re
+import smtplib
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from email import message_from_bytes
+from email.utils import getaddresses, parseaddr
+from pathlib import Path
+from typing import Iterable
+
+from permitting_agent.models import DeliveryReport, DeliveryStatus, OutreachDraft
+from permitting_agent.outreach.mailbox import MESSAGE_ID_DOMAIN, draft_bytes, draft_key
+from permitting_agent.sqlite import ConnectionPool
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY,
+    idempotency_key TEXT NOT NULL UNIQUE,
+    domain TEXT NOT NULL,
+    sender TEXT NOT NULL,
+    recipients TEXT NOT NULL,
+    message BLOB NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    created_at REAL NOT NULL,
+    sent_at REAL,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS outbox_by_status ON outbox (status, domain, next_attempt_at);
+CREATE INDEX IF NOT EXISTS outbox_sent_by_domain ON outbox (domain, sent_at);
+"""
+
+_IDLE_CHECK_SECONDS = 10.0  # NOOP a pooled connection idle longer than this before reusing it
+_MAX_WAIT_SECONDS = 5.0  # longest scheduler sleep, so messages queued by another process are noticed
+
+
+@dataclass(frozen=True)
+class SmtpSettings:
+    """SMTP relay to send through (usually the organisation's own mail server, not the cities' MX)."""
+
+    host: str = "localhost"
+    port: int = 25
+    username: str | None = None
+    password: str | None = None
+    starttls: bool = False
+    ssl: bool = False
+    timeout: float = 30.0
+
+    @classmethod
+    def from_env(cls) -> "SmtpSettings":
+        """``SMTP_HOST``, ``SMTP_PORT``, ``SMTP_USER``, ``SMTP_PASSWORD``, ``SMTP_STARTTLS``, ``SMTP_SSL``."""
+
+        def flag(name: str) -> bool:
+            return os.environ.get(name, "").lower() in ("1", "true", "yes")
+
+        ssl = flag("SMTP_SSL")
+        return cls(
+            host=os.environ.get("SMTP_HOST", "localhost"),
+            port=int(os.environ.get("SMTP_PORT") or (465 if ssl else 25)),
+            username=os.environ.get("SMTP_USER") or None,
+            password=os.environ.get("SMTP_PASSWORD") or None,
+            starttls=flag("SMTP_STARTTLS"),
+            ssl=ssl,
+        )
+
+
+@dataclass(frozen=True)
+class DeliveryPolicy:
+    """Pacing and retry rules. Defaults send 1000 inquiries to ~250 cities in a few minutes while
+    never giving one city's server more than one message per ``domain_interval`` seconds.
+    """
+
+    domain_interval: float = 20.0
+    concurrency: int = 4
+    max_attempts: int = 5
+    backoff_base: float = 60.0
+    backoff_max: float = 3600.0
+
+
+class DeliveryError(Exception):
+    """A send that did not succeed; ``outcome`` is the queue status it leads to."""
+
+    def __init__(self, outcome: str, message: str):
+        super().__init__(message)
+        self.outcome = outcome  # "retry" | "failed" | "unknown"
+
+
+@dataclass(frozen=True)
+class QueuedMessage:
+    id: int
+    domain: str
+    sender: str
+    recipients: list[str]
+    message: bytes
+    attempts: int
+
+
+class DeliveryQueue:
+    """The persisted outbox. Run one sender per queue file at a time."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._pool = ConnectionPool(self.path, _SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        return self._pool.conn()
+
+    def enqueue(self, message: bytes, sender: str, recipients: list[str], key: str) -> bool:
+        """Queue one message; False if ``key`` was queued before (whatever its status)."""
+        return self.enqueue_many([(message, sender, recipients, key)]) == 1
+
+    def enqueue_many(self, messages: Iterable[tuple[bytes, str, list[str], str]]) -> int:
+        """Queue (message, sender, recipients, key) tuples in one transaction; returns how many were new."""
+        now = time.time()
+        rows = []
+        for message, sender, recipients, key in messages:
+            if not recipients:
+                raise ValueError(f"message {key} has no recipients")
+            rows.append((key, recipient_domain(recipients[0]), sender, "\n".join(recipients), message, now, now))
+        conn = self._conn()
+        with conn:
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO outbox (idempotency_key, domain, sender, recipients, message, status,"
+                f" next_attempt_at, created_at) VALUES (?, ?, ?, ?, ?, '{DeliveryStatus.QUEUED.value}', ?, ?)",
+                rows,
+            )
+            return conn.total_changes - before
+
+    def enqueue_drafts(self, drafts: Iterable[OutreachDraft], sender: str) -> int:
+        """Queue drafts addressed to their email contact ids (drafts without any are skipped)."""
+        return self.enqueue_many(
+            (draft_bytes(draft, sender), sender, recipients, draft_key(draft))
+            for draft in drafts
+            if (recipients := [c for c in draft.contact_ids if "@" in c])
+        )
+
+    def counts(self) -> dict[str, int]:
+        rows = self._conn().execute("SELECT status, COUNT(*) FROM outbox GROUP BY status")
+        return {status.value: 0 for status in DeliveryStatus} | dict(rows.fetchall())
+
+    def recover(self) -> int:
+        """Mark messages left ``sending`` by a dead process as ``unknown`` (never resent automatically)."""
+        conn = self._conn()
+        with conn:
+            cur = conn.execute(
+                "UPDATE outbox SET status = ?, last_error = 'interrupted while sending' WHERE status = ?",
+                (DeliveryStatus.UNKNOWN.value, DeliveryStatus.SENDING.value),
+            )
+        return cur.rowcount
+
+    def requeue(self, status: DeliveryStatus = DeliveryStatus.FAILED) -> int:
+        """Put failed (or, after checking they did not arrive, unknown) messages back in the queue."""
+        conn = self._conn()
+        with conn:
+            cur = conn.execute(
+                "UPDATE outbox SET status = ?, attempts = 0, next_attempt_at = ? WHERE status = ?",
+                (DeliveryStatus.QUEUED.value, time.time(), status.value),
+            )
+        return cur.rowcount
+
+    def pending_by_domain(self) -> dict[str, float]:
+        """Earliest next_attempt_at of the queued messages of each domain."""
+        rows = self._conn().execute(
+            "SELECT domain, MIN(next_attempt_at) FROM outbox WHERE status = ? GROUP BY domain",
+            (DeliveryStatus.QUEUED.value,),
+        )
+        return dict(rows.fetchall())
+
+    def last_sent_by_domain(self) -> dict[str, float]:
+        rows = self._conn().execute("SELECT domain, MAX(sent_at) FROM outbox WHERE sent_at IS NOT NULL GROUP BY domain")
+        return dict(rows.fetchall())
+
+    def claim(self, domain: str, now: float) -> QueuedMessage | None:
+        """Mark the domain's next due message ``sending`` and return it (None if nothing is due)."""
+        conn = self._conn()
+        with conn:
+            row = conn.execute(
+                "SELECT id, sender, recipients, message, attempts FROM outbox"
+                " WHERE status = ? AND domain = ? AND next_attempt_at <= ? ORDER BY next_attempt_at, id LIMIT 1",
+                (DeliveryStatus.QUEUED.value, domain, now),
+            ).fetchone()
+            if row is None:
+                return None
+            cur = conn.execute(
+                "UPDATE outbox SET status = ?, attempts = attempts + 1 WHERE id = ? AND status = ?",
+                (DeliveryStatus.SENDING.value, row[0], DeliveryStatus.QUEUED.value),
+            )
+            if cur.rowcount == 0:
+                return None
+        return QueuedMessage(row[0], domain, row[1], row[2].split("\n"), row[3], row[4] + 1)
+
+    def mark_sent(self, message_id: int, response: str | None = None) -> None:
+        self._finish(message_id, DeliveryStatus.SENT, response, sent_at=time.time())
+
+    def mark_failed(self, message_id: int, error: str) -> None:
+        self._finish(message_id, DeliveryStatus.FAILED, error)
+
+    def mark_unknown(self, message_id: int, error: str) -> None:
+        self._finish(message_id, DeliveryStatus.UNKNOWN, error)
+
+    def mark_retry(self, message_id: int, error: str, next_attempt_at: float) -> None:
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "UPDATE outbox SET status = ?, last_error = ?, next_attempt_at = ? WHERE id = ?",
+                (DeliveryStatus.QUEUED.value, error, next_attempt_at, message_id),
+            )
+
+    def _finish(self, message_id: int, status: DeliveryStatus, note: str | None, sent_at: float | None = None) -> None:
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "UPDATE outbox SET status = ?, last_error = ?, sent_at = COALESCE(?, sent_at) WHERE id = ?",
+                (status.value, note, sent_at, message_id),
+            )
+
+    def close(self) -> None:
+        self._pool.close()
+
+
+class SmtpTransport:
+    """Blocking SMTP sends over a small pool of reused connections (call from worker threads)."""
+
+    def __init__(self, settings: SmtpSettings):
+        self.settings = settings
+        self._idle: list[tuple[smtplib.SMTP, float]] = []
+        self._lock = threading.Lock()
+
+    def send(self, sender: str, recipients: list[str], message: bytes) -> str:
+        """Send one message; returns the server's reply. Raises DeliveryError classified by stage:
+        anything before DATA is safe to retry, a broken connection during DATA is ``unknown``.
+        """
+        conn = self._acquire()
+        stage = "envelope"
+        try:
+            code, reply = conn.mail(sender)
+            if code != 250:
+                raise _reply_error(code, reply, "MAIL FROM")
+            refused = []
+            for recipient in recipients:
+                code, reply = conn.rcpt(recipient)
+                if code not in (250, 251):
+                    refused.append((recipient, code, reply))
+            if len(refused) == len(recipients):
+                _, code, reply = refused[0]
+                raise _reply_error(code, reply, "RCPT TO")
+            stage = "data"
+            code, reply = conn.data(_crlf(message))
+            if code != 250:
+                raise _reply_error(code, reply, "DATA")
+        except DeliveryError:
+            self._reset(conn)
+            raise
+        except (smtplib.SMTPException, OSError) as e:
+            _close(conn)
+            outcome = "unknown" if stage == "data" else "retry"
+            raise DeliveryError(outcome, f"{type(e).__name__} during {stage}: {e}") from e
+        self._release(conn)
+        note = _decode(reply)
+        if refused:
+            note += "; refused: " + ", ".join(f"{r} ({c})" for r, c, _ in refused)
+        return note
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn, _ in idle:
+            try:
+                conn.quit()
+            except (smtplib.SMTPException, OSError):
+                _close(conn)
+
+    def _acquire(self) -> smtplib.SMTP:
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                conn, idle_since = self._idle.pop()
+            if time.monotonic() - idle_since < _IDLE_CHECK_SECONDS:
+                return conn
+            try:
+                if conn.noop()[0] == 250:
+                    return conn
+            except (smtplib.SMTPException, OSError):
+                pass
+            _close(conn)
+        try:
+            return self._connect()
+        except (smtplib.SMTPException, OSError) as e:
+            raise DeliveryError("retry", f"cannot connect to {self.settings.host}:{self.settings.port}: {e}") from e
+
+    def _connect(self) -> smtplib.SMTP:
+        s = self.settings
+        cls = smtplib.SMTP_SSL if s.ssl else smtplib.SMTP
+        conn = cls(s.host, s.port, timeout=s.timeout)
+        conn.ehlo()
+        if s.starttls and not s.ssl:
+            conn.starttls()
+            conn.ehlo()
+        if s.username:
+            conn.login(s.username, s.password or "")
+        return conn
+
+    def _release(self, conn: smtplib.SMTP) -> None:
+        with self._lock:
+            self._idle.append((conn, time.monotonic()))
+
+    def _reset(self, conn: smtplib.SMTP) -> None:
+        try:
+            conn.rset()
+        except (smtplib.SMTPException, OSError):
+            _close(conn)
+            return
+        self._release(conn)
+
+
+class DeliveryWorker:
+    """Drain a DeliveryQueue: at most one message in flight per domain, ``concurrency`` overall."""
+
+    def __init__(self, queue: DeliveryQueue, transport: SmtpTransport, policy: DeliveryPolicy | None = None):
+        self.queue = queue
+        self.transport = transport
+        self.policy = policy or DeliveryPolicy()
+
+    async def run(self, until_idle: bool = True) -> DeliveryReport:
+        """Send until nothing is left to do soon: waits out per-domain spacing (and short retry
+        backoffs), but messages that cannot go out within ``max(domain_interval, 5 s)`` stay queued
+        for the next run.
+        With ``until_idle=False``, keep polling the queue forever.
+        """
+        policy = self.policy
+        report = DeliveryReport(unknown=self.queue.recover())
+        started = time.monotonic()
+        next_allowed = {d: t + policy.domain_interval for d, t in self.queue.last_sent_by_domain().items()}
+        in_flight: dict[asyncio.Task, str] = {}
+        while True:
+            now = time.time()
+            pending = self.queue.pending_by_domain()
+            ready_at = {
+                d: max(due, next_allowed.get(d, 0.0)) for d, due in pending.items() if d not in in_flight.values()
+            }
+            for domain in sorted((d for d, t in ready_at.items() if t <= now), key=ready_at.get):
+                if len(in_flight) >= max(1, policy.concurrency):
+                    break
+                message = self.queue.claim(domain, now)
+                if message is None:
+                    continue
+                next_allowed[domain] = now + policy.domain_interval
+                in_flight[asyncio.create_task(self._deliver(message, report))] = domain
+            waits = [t - now for d, t in ready_at.items() if t > now and d not in in_flight.values()]
+            if until_idle and not in_flight and min(waits, default=0.0) > max(policy.domain_interval, _MAX_WAIT_SECONDS):
+                break
+            if until_idle and not in_flight and not pending:
+                break
+            timeout = min([_MAX_WAIT_SECONDS, *waits])
+            if in_flight:
+                done, _ = await asyncio.wait(in_flight, timeout=max(timeout, 0.0), return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    del in_flight[task]
+                    task.result()
+            else:
+                await asyncio.sleep(max(timeout, 0.01))
+        report.remaining = self.queue.counts()[DeliveryStatus.QUEUED.value]
+        report.elapsed_s = round(time.monotonic() - started, 3)
+        return report
+
+    async def _deliver(self, message: QueuedMessage, report: DeliveryReport) -> None:
+        try:
+            reply = await asyncio.to_thread(self.transport.send, message.sender, message.recipients, message.message)
+        except DeliveryError as e:
+            if e.outcome == "retry" and message.attempts < self.policy.max_attempts:
+                self.queue.mark_retry(message.id, str(e), time.time() + self._backoff(message.attempts))
+                report.retried += 1
+            elif e.outcome == "unknown":
+                self.queue.mark_unknown(message.id, str(e))
+                report.unknown += 1
+            else:
+                self.queue.mark_failed(message.id, str(e))
+                report.failed += 1
+            return
+        self.queue.mark_sent(message.id, reply)
+        report.sent += 1
+
+    def _backoff(self, attempts: int) -> float:
+        delay = min(self.policy.backoff_max, self.policy.backoff_base * 2 ** (attempts - 1))
+        return delay * random.uniform(0.8, 1.2)
+
+
+def send_queued(
+    queue: DeliveryQueue, settings: SmtpSettings, policy: DeliveryPolicy | None = None
+) -> DeliveryReport:
+    """Sync entry point: drain the queue once over a fresh SMTP connection pool."""
+    transport = SmtpTransport(settings)
+    try:
+        return asyncio.run(DeliveryWorker(queue, transport, policy).run())
+    finally:
+        transport.close()
+
+
+def parse_message(raw: bytes, default_sender: str | None = None) -> tuple[str, list[str], str]:
+    """(sender, recipients, idempotency key) from an RFC 5322 message, e.g. one read from an mbox.
+    The key is the Message-ID, so drafts written twice are queued once.
+    """
+    msg = message_from_bytes(raw)
+    sender = parseaddr(msg.get("From", ""))[1] or default_sender
+    if not sender:
+        raise ValueError("message has no From address (pass a default sender)")
+    recipients = [addr for _, addr in getaddresses(msg.get_all("To", []) + msg.get_all("Cc", [])) if addr]
+    message_id = (msg.get("Message-ID") or "").strip().strip("<>")
+    if not message_id:
+        raise ValueError("message has no Message-ID")
+    return sender, recipients, message_id.removesuffix(f"@{MESSAGE_ID_DOMAIN}")
+
+
+def recipient_domain(address: str) -> str:
+    return address.rpartition("@")[2].strip().lower()
+
+
+def _reply_error(code: int, reply: bytes | str, command: str) -> DeliveryError:
+    outcome = "retry" if 400 <= code < 500 else "failed"
+    return DeliveryError(outcome, f"{command} {code} {_decode(reply)}")
+
+
+def _decode(reply: bytes | str) -> str:
+    return reply.decode(errors="replace") if isinstance(reply, bytes) else str(reply)
+
+
+def _crlf(message: bytes) -> bytes:
+    return re.sub(rb"(?<!\r)\n", b"\r\n", message)
+
+
+def _close(conn: smtplib.SMTP) -> None:
+    try:
+        conn.close()
+    except OSError:
+        pass
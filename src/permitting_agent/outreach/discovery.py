@@ -0,0 +1,480 @@
+"""Contact discovery: crawl a jurisdiction's staff directory pages and extract planning, engineering,
+ROW and clerk contacts (email, phone, name) with the page they were found on.
+
+Extraction is one pass of a single compiled pattern over the raw HTML: emails, phones, role
+keywords, person-name cells, links and block boundaries are alternatives of one regex, so a page
+is scanned once no matter how many extractors there are. Pages are fetched concurrently on one
+``httpx.AsyncClient``, staying on the start host, respecting robots.txt and following only links
+that look like directory, department or contact pages.
+"""
+
+import asyncio
+import re
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from html import unescape
+from urllib.parse import urljoin, urlparse
+
+import httpx
+from robotexclusionrulesparser import RobotExclusionRulesParser
+
+from permitting_agent.models import Contact, ContactList
+from permitting_agent.portal_research.crawler import DEFAULT_USER_AGENT, can_fetch
+
+DEFAULT_CONCURRENCY = 8
+DEFAULT_MAX_PAGES = 500
+DEFAULT_MAX_DEPTH = 3
+DEFAULT_TIMEOUT = 15.0
+MAX_RETRIES = 2
+
+# Role -> keywords that mark a department, heading or job title as belonging to that role
+ROLE_KEYWORDS: dict[str, tuple[str, ...]] = {
+    "planning": ("planning", "zoning", "land use", "community development"),
+    "engineering": ("engineering", "engineer", "public works", "traffic"),
+    "row": ("right-of-way", "right of way", "encroachment"),
+    "clerk": ("clerk",),
+}
+# Links worth following from a directory page (matched against URL path and anchor text)
+FOLLOW_KEYWORDS = (
+    "staff", "directory", "contact", "department", "dept", "division", "office", "employee",
+    "planning", "zoning", "engineering", "public works", "right-of-way", "clerk", "permit",
+)
+SKIP_SUFFIXES = (".pdf", ".doc", ".docx", ".xls", ".xlsx", ".zip", ".jpg", ".jpeg", ".png", ".gif", ".svg", ".css", ".js")
+# Capitalized words that are job titles or place words, not people
+_NOT_NAME_WORDS = frozenset(
+    "city county town village department division office staff director manager supervisor "
+    "planner engineer clerk inspector assistant deputy senior permits permit services home email phone".split()
+)
+
+
+def _keyword_pattern(words) -> str:
+    """Alternation of keywords where spaces and hyphens match any run of either."""
+    return "|".join(r"[\s-]+".join(map(re.escape, re.split(r"[\s-]+", w))) for w in words)
+
+
+def _normalize_keyword(text: str) -> str:
+    return " ".join(re.split(r"[\s-]+", text.lower()))
+
+
+_KEYWORD_ROLE = {_normalize_keyword(w): role for role, words in ROLE_KEYWORDS.items() for w in words}
+# One group for every role keyword (the role is looked up from the matched text); the lookahead
+# rejects positions that can't start a keyword before the alternation is tried. Uppercase "ROW"
+# only: "row" is an ordinary word.
+_ROLE = rf"\b(?=[{''.join(sorted({w[0] for w in _KEYWORD_ROLE} | {w[0].upper() for w in _KEYWORD_ROLE}))}R])(?:{_keyword_pattern(_KEYWORD_ROLE)}|(?-i:ROW))\b"
+# Lookbehind/lookahead guards so emails and phones are only tried where one can start
+_EMAIL = r"(?<![\w.%+-])[\w.%+-]+@[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)*\.[A-Za-z]{2,}"
+_PHONE = r"(?<![\w+(])(?=[+(\d])(?:\+?1[\s.-]?)?\(?[2-9]\d{2}\)?[\s.-]?\d{3}[\s.-]\d{4}(?!\w)"
+_NAME = r"(?-i:[A-Z][a-z'’-]+(?:\s+[A-Z]\.)?(?:\s+[A-Z][A-Za-z'’-]+){1,2})"
+
+# One pattern, one pass: the first alternative that matches at a position wins, so links and
+# name cells consume their markup before the email/phone/keyword alternatives see it.
+CONTACT_PATTERN = re.compile(
+    "|".join(
+        [
+            r"(?P<link><a\s[^>]*?href\s*=\s*[\"'](?P<href>[^\"'<>]*)[\"'][^>]*>(?P<anchor>[^<]{0,200}))",
+            r"(?P<boundary></(?:tr|li|p|dd|div|article|section|table|ul|h[1-6])>|<(?:h[1-6]|hr)\b)",
+            rf"<(?:td|th|strong|b|dt|h[3-6]|span)\b[^>]*>\s*(?P<name>{_NAME})\s*<",
+            rf"(?P<email>{_EMAIL})",
+            rf"(?P<phone>{_PHONE})",
+            rf"(?P<role>{_ROLE})",
+            r"(?P<skip><(?:script|style)\b.*?</(?:script|style)>)",
+        ]
+    ),
+    re.IGNORECASE | re.DOTALL,
+)
+_ROLE_ONLY = re.compile(_ROLE, re.IGNORECASE)
+_EMAIL_ONLY = re.compile(_EMAIL)
+_PHONE_ONLY = re.compile(_PHONE)
+_FOLLOW = re.compile(_keyword_pattern(FOLLOW_KEYWORDS).replace(r"[\s-]+", r"[\s_-]*"), re.IGNORECASE)
+
+
+@dataclass
+class PageExtract:
+    """Contacts and follow-able links found on one page."""
+
+    url: str
+    contacts: list[Contact] = field(default_factory=list)
+    links: list[tuple[str, str]] = field(default_factory=list)  # (absolute url, anchor text)
+    unmatched: int = 0  # emails/phones found with no planning/engineering/ROW/clerk role
+
+
+@dataclass
+class _Record:
+    name: str | None = None
+    emails: list[str] = field(default_factory=list)
+    phones: list[str] = field(default_factory=list)
+    role: str | None = None  # a job title or department named in this block itself
+    department: str | None = None
+
+    def has_contact(self) -> bool:
+        return bool(self.emails or self.phones)
+
+
+def extract_contacts(html: str, url: str) -> PageExtract:
+    """Contacts and links on one HTML page, in a single scan.
+
+    A contact is the emails/phones (and a person-name cell, if any) between two block boundaries
+    (table row, list item, paragraph, div). A role keyword in the contact's own block (a job title)
+    is its role; otherwise it takes the section role, set by the most recent heading, or block
+    without contact details, naming one in the current h1/h2 section.
+    """
+    out = PageExtract(url=url)
+    role: str | None = None
+    department: str | None = None
+    in_heading = False
+    record = _Record()
+
+    def close() -> None:
+        nonlocal record, role, department
+        if not record.has_contact():
+            if record.role is not None:  # a department label block: it heads the blocks after it
+                role, department = record.role, record.department
+                record.role = record.department = None
+            return  # a name-only block (e.g. a card's name div) carries over to the next block
+        row_role, row_department = (record.role, record.department) if record.role else (role, department)
+        if row_role is None:
+            out.unmatched += len(record.emails) or 1
+        else:
+            for email in record.emails or [None]:
+                out.contacts.append(
+                    Contact(
+                        name=record.name,
+                        role=row_role,
+                        email=email,
+                        phone=record.phones[0] if record.phones else None,
+                        department=row_department,
+                        source_url=url,
+                    )
+                )
+        record = _Record()
+
+    def found_role(keyword_role: str, text: str) -> None:
+        nonlocal role, department
+        if in_heading:
+            role, department = keyword_role, text
+        elif record.role is None:
+            record.role, record.department = keyword_role, text
+
+    for m in CONTACT_PATTERN.finditer(html):
+        kind = m.lastgroup
+        if kind == "link":
+            href = unescape(m["href"].strip())
+            scheme = href[:7].lower()
+            if scheme == "mailto:":
+                email = href[7:].split("?", 1)[0].strip().lower()
+                if _EMAIL_ONLY.fullmatch(email) and email not in record.emails:
+                    record.emails.append(email)
+            elif href[:4].lower() == "tel:":
+                record.phones.append(_display_phone(m["anchor"], href[4:]))
+            else:
+                out.links.append((urljoin(url, href), unescape(m["anchor"]).strip()))
+                email = _EMAIL_ONLY.search(m["anchor"])
+                if email and email[0].lower() not in record.emails:
+                    record.emails.append(email[0].lower())
+        elif kind == "boundary":
+            close()
+            tag = m["boundary"][:3].lower()
+            in_heading = tag.startswith("<h") and tag != "<hr"
+            if tag in ("<h1", "<h2"):
+                role = department = None  # a new top-level section; its heading sets the role again
+        elif kind == "name":
+            text = unescape(m["name"])
+            keyword = _ROLE_ONLY.search(text)
+            if keyword:
+                found_role(_role_of(keyword), text.strip())
+            elif record.name is None and not _NOT_NAME_WORDS.intersection(w.lower() for w in text.split()):
+                record.name = " ".join(text.split())
+        elif kind == "email":
+            email = m["email"].lower()
+            if email not in record.emails:
+                record.emails.append(email)
+        elif kind == "phone":
+            if not record.phones:
+                record.phones.append(" ".join(m["phone"].split()))
+        elif kind == "skip":
+            continue
+        elif kind == "role":
+            found_role(_role_of(m), _department_text(html, m.start(), m.end()))
+    close()
+    return out
+
+
+def _role_of(match: re.Match) -> str:
+    return _KEYWORD_ROLE.get(_normalize_keyword(match[0]), "row")  # only "ROW" isn't in the table
+
+
+def _department_text(html: str, start: int, end: int) -> str:
+    """The text run around a role keyword (e.g. 'Planning & Zoning'), bounded by tags."""
+    left = html.rfind(">", max(0, start - 80), start)
+    right = html.find("<", end, end + 80)
+    text = unescape(html[left + 1 if left != -1 else start : right if right != -1 else end])
+    return " ".join(text.split())[:120]
+
+
+def _display_phone(anchor: str, tel: str) -> str:
+    shown = _PHONE_ONLY.search(anchor)
+    return " ".join(shown[0].split()) if shown else unescape(tel).strip()
+
+
+def merge_contacts(contacts: list[Contact]) -> list[Contact]:
+    """One contact per email (or phone, for contacts without email); later sightings fill gaps."""
+    merged: dict[str, Contact] = {}
+    for c in contacts:
+        key = (c.email or "").lower() or "tel:" + "".join(ch for ch in c.phone or "" if ch.isdigit())
+        seen = merged.get(key)
+        if seen is None:
+            merged[key] = c
+            continue
+        updates = {f: getattr(c, f) for f in ("name", "phone", "department") if getattr(seen, f) is None and getattr(c, f)}
+        if updates:
+            merged[key] = seen.model_copy(update=updates)
+    return list(merged.values())
+
+
+@dataclass
+class Revalidation:
+    """Result of a conditional re-fetch of one source page."""
+
+    url: str
+    status: str  # "not_modified" | "changed" | "gone" | "failed" | "blocked"
+    page: PageExtract | None = None
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+@dataclass
+class CrawlStats:
+    """Counters for one discovery crawl."""
+
+    fetched: int = 0
+    failed: int = 0
+    robots_skipped: int = 0
+    throttled: int = 0
+    unmatched: int = 0
+    elapsed_s: float = 0.0
+    pages_with_contacts: list[str] = field(default_factory=list)
+    # (ETag, Last-Modified) of pages with contacts, so the first re-verification can be conditional
+    validators: dict[str, tuple[str | None, str | None]] = field(default_factory=dict)
+
+
+class ContactCrawler:
+    """Concurrent crawl of one jurisdiction site's directory pages.
+
+    Starts at ``start_urls``, stays on their hosts, skips URLs robots.txt disallows and follows
+    only links whose URL or anchor text looks like a directory/department/contact page, up to
+    ``max_depth`` hops and ``max_pages`` fetches. ``rate_limit_rps`` (if set) caps the request
+    rate across all workers; 429 responses are retried after their Retry-After.
+    """
+
+    def __init__(
+        self,
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        max_pages: int = DEFAULT_MAX_PAGES,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+        rate_limit_rps: float | None = None,
+        user_agent: str = DEFAULT_USER_AGENT,
+        client: httpx.AsyncClient | None = None,
+    ):
+        self.concurrency = max(1, concurrency)
+        self.max_pages = max_pages
+        self.max_depth = max_depth
+        self.rate_limit_rps = rate_limit_rps
+        self.user_agent = user_agent
+        self._client = client
+        self.stats = CrawlStats()
+        self._robots: dict[str, asyncio.Task] = {}
+        self._next_slot = 0.0
+
+    async def crawl(self, jurisdiction: str, start_urls: list[str]) -> ContactList:
+        """Crawl from ``start_urls`` and return the merged contacts with the pages they came from."""
+        self.stats = CrawlStats()
+        self._robots = {}  # tasks belong to this run's event loop
+        started = time.perf_counter()
+        client = self._client or self._open_client()
+        hosts = {urlparse(u).netloc for u in start_urls}
+        queue: asyncio.Queue[tuple[str, int]] = asyncio.Queue()
+        seen: set[str] = set()
+        contacts: list[Contact] = []
+
+        def schedule(url: str, depth: int) -> None:
+            url = url.split("#", 1)[0]
+            if url in seen or len(seen) >= self.max_pages:
+                return
+            seen.add(url)
+            queue.put_nowait((url, depth))
+
+        for url in start_urls:
+            schedule(url, 0)
+
+        async def worker() -> None:
+            while True:
+                url, depth = await queue.get()
+                try:
+                    try:
+                        page = await self._visit(client, url)
+                    except Exception:  # one unparseable page must not stall the crawl
+                        self.stats.failed += 1
+                        continue
+                    if page is None:
+                        continue
+                    contacts.extend(page.contacts)
+                    if page.contacts:
+                        self.stats.pages_with_contacts.append(url)
+                    if depth < self.max_depth:
+                        for link, anchor in page.links:
+                            if _should_follow(link, anchor, hosts):
+                                schedule(link, depth + 1)
+                finally:
+                    queue.task_done()
+
+        workers = [asyncio.create_task(worker()) for _ in range(self.concurrency)]
+        try:
+            await queue.join()
+        finally:
+            for w in workers:
+                w.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            if self._client is None:
+                await client.aclose()
+        self.stats.elapsed_s = round(time.perf_counter() - started, 3)
+        return ContactList(
+            jurisdiction=jurisdiction,
+            generated_at=datetime.utcnow(),
+            contacts=merge_contacts(contacts),
+            source_urls=list(dict.fromkeys(self.stats.pages_with_contacts)),
+        )
+
+    async def revalidate(self, validators: dict[str, tuple[str | None, str | None]]) -> list["Revalidation"]:
+        """Conditional GET of each URL with its stored (ETag, Last-Modified) validators, at most
+        ``concurrency`` at once. Unchanged pages cost a 304 and are not parsed; changed pages are
+        re-extracted.
+        """
+        self.stats = CrawlStats()
+        self._robots = {}  # tasks belong to this run's event loop
+        started = time.perf_counter()
+        client = self._client or self._open_client()
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def one(url: str, etag: str | None, last_modified: str | None) -> Revalidation:
+            async with semaphore:
+                if not await self._allowed(client, url):
+                    self.stats.robots_skipped += 1
+                    return Revalidation(url, "blocked")
+                headers = {}
+                if etag:
+                    headers["If-None-Match"] = etag
+                if last_modified:
+                    headers["If-Modified-Since"] = last_modified
+                r = await self._get(client, url, headers)
+            if r is None or r.status_code >= 500 or r.status_code == 429:
+                self.stats.failed += 1
+                return Revalidation(url, "failed", etag=etag, last_modified=last_modified)
+            new_etag, new_modified = r.headers.get("ETag", etag), r.headers.get("Last-Modified", last_modified)
+            if r.status_code == 304:
+                return Revalidation(url, "not_modified", etag=new_etag, last_modified=new_modified)
+            if r.status_code in (404, 410):
+                return Revalidation(url, "gone")
+            if r.status_code != 200 or "html" not in r.headers.get("Content-Type", "text/html"):
+                self.stats.failed += 1
+                return Revalidation(url, "failed", etag=etag, last_modified=last_modified)
+            self.stats.fetched += 1
+            page = extract_contacts(r.text, url)
+            return Revalidation(url, "changed", page, new_etag, new_modified)
+
+        try:
+            return list(await asyncio.gather(*(one(url, *v) for url, v in validators.items())))
+        finally:
+            if self._client is None:
+                await client.aclose()
+            self.stats.elapsed_s = round(time.perf_counter() - started, 3)
+
+    def _open_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            headers={"User-Agent": self.user_agent},
+            timeout=DEFAULT_TIMEOUT,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=self.concurrency, max_keepalive_connections=self.concurrency),
+        )
+
+    async def _visit(self, client: httpx.AsyncClient, url: str) -> PageExtract | None:
+        if not await self._allowed(client, url):
+            self.stats.robots_skipped += 1
+            return None
+        r = await self._get(client, url)
+        if r is None or r.status_code != 200 or "html" not in r.headers.get("Content-Type", "text/html"):
+            self.stats.failed += 1
+            return None
+        self.stats.fetched += 1
+        page = extract_contacts(r.text, url)
+        self.stats.unmatched += page.unmatched
+        if page.contacts and ("ETag" in r.headers or "Last-Modified" in r.headers):
+            self.stats.validators[url] = (r.headers.get("ETag"), r.headers.get("Last-Modified"))
+        return page
+
+    async def _allowed(self, client: httpx.AsyncClient, url: str) -> bool:
+        parts = urlparse(url)
+        origin = f"{parts.scheme}://{parts.netloc}"
+        task = self._robots.get(origin)
+        if task is None:
+            # One robots.txt fetch per origin; concurrent workers await the same task
+            task = self._robots[origin] = asyncio.ensure_future(self._load_robots(client, origin))
+        return can_fetch(await task, url, self.user_agent)
+
+    async def _load_robots(self, client: httpx.AsyncClient, origin: str) -> RobotExclusionRulesParser:
+        parser = RobotExclusionRulesParser()
+        parser.user_agent = self.user_agent
+        text = await self._fetch(client, origin + "/robots.txt", html_only=False)
+        if text:
+            parser.parse(text)
+        return parser
+
+    async def _fetch(self, client: httpx.AsyncClient, url: str, html_only: bool = True) -> str | None:
+        r = await self._get(client, url)
+        if r is None or r.status_code != 200:
+            return None
+        if html_only and "html" not in r.headers.get("Content-Type", "text/html"):
+            return None
+        return r.text
+
+    async def _get(self, client: httpx.AsyncClient, url: str, headers: dict[str, str] | None = None) -> httpx.Response | None:
+        """GET with 429 retries (after Retry-After); None on a network error."""
+        for attempt in range(MAX_RETRIES + 1):
+            await self._throttle()
+            try:
+                r = await client.get(url, headers=headers)
+            except httpx.HTTPError:
+                return None
+            if r.status_code == 429 and attempt < MAX_RETRIES:
+                self.stats.throttled += 1
+                await asyncio.sleep(_retry_after(r.headers.get("Retry-After")))
+                continue
+            return r
+        return None
+
+    async def _throttle(self) -> None:
+        if not self.rate_limit_rps:
+            return
+        now = time.monotonic()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + 1.0 / self.rate_limit_rps
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+def _should_follow(url: str, anchor: str, hosts: set[str]) -> bool:
+    parts = urlparse(url)
+    if parts.scheme not in ("http", "https") or parts.netloc not in hosts:
+        return False
+    if parts.path.lower().endswith(SKIP_SUFFIXES):
+        return False
+    return bool(_FOLLOW.search(parts.path) or _FOLLOW.search(anchor))
+
+
+def _retry_after(value: str | None) -> float:
+    try:
+        return min(max(float(value), 0.0), 30.0)
+    except (TypeError, ValueError):
+        return 1.0
+
@@ -0,0 +1,158 @@
+"""Streaming draft writers: one .eml file per draft, or every draft appended to one mbox file.
+
+Each draft is converted and written as it arrives, so a bulk run holds one draft at a time.
+"""
+
+import base64
+import hashlib
+import quopri
+import re
+import time
+from abc import ABC, abstractmethod
+from email.utils import formatdate
+from pathlib import Path
+
+from permitting_agent.models import OutreachDraft
+
+FORMATS = ("eml", "mbox")
+DEFAULT_SENDER = "MAILER-DAEMON"
+MESSAGE_ID_DOMAIN = "permitting-agent.local"
+MAX_LINE_BYTES = 998  # RFC 5322 line limit; longer body lines are sent quoted-printable
+_ENCODED_WORD_BYTES = 45  # 60 base64 chars per encoded word keeps folded header lines short
+_FROM_LINE = re.compile(r"^(>*From )", re.MULTILINE)
+
+
+def draft_bytes(draft: OutreachDraft, sender: str | None = None, mbox: bool = False) -> bytes:
+    """RFC 5322 bytes for an unsent plain-text draft; recipients are the contact ids that are email
+    addresses. Built directly rather than through ``email.message`` (whose header parsing dominated
+    bulk runs); ``mbox=True`` escapes body lines starting with "From ". The Message-ID is derived
+    from the content (see draft_key), so re-rendering the same draft gives the same id.
+    """
+    headers = [f"Message-ID: <{draft_key(draft)}@{MESSAGE_ID_DOMAIN}>"]
+    if sender:
+        headers.append(f"From: {sender}")
+    recipients = [c for c in draft.contact_ids if "@" in c]
+    if recipients:
+        headers.append(f"To: {', '.join(recipients)}")
+    headers.append(f"Subject: {_encode_header(draft.subject)}")
+    headers.append(f"Date: {formatdate(localtime=False)}")
+    headers.append(f"X-Permitting-Role: {_encode_header(draft.to_role)}")
+    if draft.jurisdiction:
+        headers.append(f"X-Permitting-Jurisdiction: {_encode_header(draft.jurisdiction)}")
+    if draft.template_used:
+        headers.append(f"X-Permitting-Template: {_encode_header(draft.template_used)}")
+    headers.append("X-Unsent: 1")  # opens as an editable draft in most mail clients
+    headers.append("MIME-Version: 1.0")
+    headers.append('Content-Type: text/plain; charset="utf-8"')
+    body = draft.body.replace("\r\n", "\n").replace("\r", "\n")
+    if not body.endswith("\n"):
+        body += "\n"
+    if max(map(len, body.encode().split(b"\n"))) > MAX_LINE_BYTES:
+        headers.append("Content-Transfer-Encoding: quoted-printable")
+        body = quopri.encodestring(body.encode()).decode("ascii")
+    else:
+        headers.append("Content-Transfer-Encoding: 8bit")
+    if mbox:
+        body = _FROM_LINE.sub(r">\1", body)
+    return ("\n".join(headers) + "\n\n" + body).encode()
+
+
+def draft_key(draft: OutreachDraft) -> str:
+    """Stable identity of a draft's content: jurisdiction, role, recipients, subject and body."""
+    parts = [draft.jurisdiction or "", draft.to_role, ",".join(sorted(draft.contact_ids)), draft.subject, draft.body]
+    return hashlib.sha1("\x1f".join(parts).encode()).hexdigest()[:24]
+
+
+class DraftWriter(ABC):
+    """Write drafts one at a time; use as a context manager or call close()."""
+
+    format: str
+
+    def __init__(self, output: Path, sender: str | None = None):
+        self.output = Path(output)
+        self.sender = sender
+        self.count = 0
+
+    @abstractmethod
+    def write(self, draft: OutreachDraft) -> None:
+        ...
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "DraftWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class EmlWriter(DraftWriter):
+    """``<out_dir>/<jurisdiction>_<role>.eml`` per draft; a numeric suffix separates repeats within a run
+    and files from an earlier run are overwritten.
+    """
+
+    format = "eml"
+
+    def __init__(self, out_dir: Path, sender: str | None = None):
+        super().__init__(out_dir, sender)
+        self.out_dir = self.output
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        self._seen: dict[str, int] = {}
+
+    def write(self, draft: OutreachDraft) -> None:
+        stem = _filename(f"{draft.jurisdiction or 'draft'}_{draft.to_role}")
+        n = self._seen[stem] = self._seen.get(stem, 0) + 1
+        path = self.out_dir / (f"{stem}.eml" if n == 1 else f"{stem}_{n}.eml")
+        path.write_bytes(draft_bytes(draft, self.sender))
+        self.count += 1
+
+
+class MboxWriter(DraftWriter):
+    """Append drafts to one mbox file (``From `` separator lines, body ``From`` lines escaped)."""
+
+    format = "mbox"
+
+    def __init__(self, path: Path, sender: str | None = None, append: bool = False):
+        super().__init__(path, sender)
+        self.path = self.output
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "ab" if append else "wb")
+
+    def write(self, draft: OutreachDraft) -> None:
+        envelope = f"From {self.sender or DEFAULT_SENDER} {time.asctime(time.gmtime())}\n"
+        self._file.write(envelope.encode())
+        self._file.write(draft_bytes(draft, self.sender, mbox=True))
+        self._file.write(b"\n")
+        self.count += 1
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def open_writer(output: Path, fmt: str, sender: str | None = None) -> DraftWriter:
+    """EmlWriter for a directory or MboxWriter for a file, by ``fmt`` ("eml" | "mbox")."""
+    if fmt == "eml":
+        return EmlWriter(output, sender)
+    if fmt == "mbox":
+        return MboxWriter(output, sender)
+    raise ValueError(f"Unknown draft format {fmt!r} (use {' or '.join(FORMATS)})")
+
+
+def _encode_header(value: str) -> str:
+    """ASCII as is; otherwise RFC 2047 base64 encoded words, split on character boundaries."""
+    if value.isascii():
+        return value.replace("\r", " ").replace("\n", " ")
+    words, chunk = [], b""
+    for char in value:
+        encoded = char.encode()
+        if len(chunk) + len(encoded) > _ENCODED_WORD_BYTES:
+            words.append(chunk)
+            chunk = b""
+        chunk += encoded
+    words.append(chunk)
+    return "\n ".join(f"=?utf-8?b?{base64.b64encode(w).decode()}?=" for w in words)
+
+
+def _filename(text: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", text).strip("_") or "draft"
@@ -1,58 +1,131 @@
 """Outreach service: use adapter to discover contacts, generate email drafts and contact list."""
 
-import json
+import asyncio
+from datetime import date
 from pathlib import Path
+from typing import Any, Iterable, Iterator
 
-from permitting_agent.models import ContactList, Contact, OutreachDraft
-from permitting_agent.adapters import get_adapter
+from permitting_agent.models import ContactList, Contact, OutreachBatchReport, OutreachDraft
+from permitting_agent.adapters import get_adapter, get_async_adapter
+from permitting_agent.outreach.discovery import ContactCrawler, CrawlStats
+from permitting_agent.outreach.mailbox import DraftWriter
+from permitting_agent.outreach.templates import TemplateError, TemplateLibrary
+from permitting_agent.serialization import read_model, write_model
+
+DEFAULT_CONCURRENCY = 8
+DRAFT_ROLES = ("planning", "engineering", "row", "clerk")
 
 
 class OutreachService:
     """Discover contacts and produce outreach drafts and contact list."""
 
-    def __init__(self, output_dir: Path | None = None):
+    def __init__(self, output_dir: Path | None = None, templates: TemplateLibrary | None = None):
         self.output_dir = Path(output_dir or "output")
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.templates = templates if templates is not None else TemplateLibrary()
 
-    def discover_and_save(self, jurisdiction: str, output_path: Path | None = None) -> ContactList:
-        """Discover contacts via adapter; save contact list JSON + Markdown."""
+    def discover(self, jurisdiction: str) -> ContactList:
+        """Discover contacts via adapter (empty list when no adapter)."""
         adapter = get_adapter(jurisdiction)
         if adapter is None:
-            contact_list = ContactList(jurisdiction=jurisdiction, contacts=[], source_urls=[])
-        else:
-            contact_list = adapter.discover_contacts()
+            return ContactList(jurisdiction=jurisdiction, contacts=[], source_urls=[])
+        return adapter.discover_contacts()
+
+    async def discover_async(self, jurisdiction: str) -> ContactList:
+        """Async discovery: awaits async adapters directly; sync adapters run in a worker thread."""
+        adapter = get_async_adapter(jurisdiction)
+        if adapter is None:
+            return ContactList(jurisdiction=jurisdiction, contacts=[], source_urls=[])
+        return await adapter.discover_contacts()
+
+    async def discover_many(self, jurisdictions: list[str], concurrency: int = DEFAULT_CONCURRENCY) -> list[ContactList]:
+        """Discover contacts for many jurisdictions concurrently (at most ``concurrency`` at once), in input order."""
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def one(jurisdiction: str) -> ContactList:
+            async with semaphore:
+                return await self.discover_async(jurisdiction)
+
+        return list(await asyncio.gather(*(one(j) for j in jurisdictions)))
+
+    async def discover_from_site(
+        self, jurisdiction: str, start_urls: list[str], **options: Any
+    ) -> tuple[ContactList, CrawlStats]:
+        """Crawl the jurisdiction's own directory pages from ``start_urls`` for contacts instead of
+        using adapter data; ``options`` are ``ContactCrawler`` arguments (concurrency, max_pages, ...).
+        """
+        crawler = ContactCrawler(**options)
+        contact_list = await crawler.crawl(jurisdiction, start_urls)
+        return contact_list, crawler.stats
 
+    def discover_and_save(self, jurisdiction: str, output_path: Path | None = None) -> ContactList:
+        """Discover contacts via adapter; save contact list JSON + Markdown."""
+        return self.save_contact_list(self.discover(jurisdiction), output_path)
+
+    def save_contact_list(self, contact_list: ContactList, output_path: Path | None = None) -> ContactList:
+        """Save contact list JSON + Markdown (default path under output_dir)."""
+        jurisdiction = contact_list.jurisdiction
         out = output_path or (self.output_dir / "outreach" / f"{jurisdiction.replace(' ', '_')}_contacts.json")
         out = Path(out)
         out.parent.mkdir(parents=True, exist_ok=True)
-        out.write_text(contact_list.model_dump_json(indent=2))
+        write_model(out, contact_list)
 
         md_path = out.with_suffix(".md")
         md_path.write_text(self._contact_list_to_markdown(contact_list))
 
         return contact_list
 
-    def draft_emails(self, contact_list: ContactList) -> list[OutreachDraft]:
+    def draft_emails(self, contact_list: ContactList, variables: dict[str, Any] | None = None) -> list[OutreachDraft]:
         """Generate outreach email drafts for planning/engineering/ROW/clerk."""
-        drafts: list[OutreachDraft] = []
+        return list(self.iter_drafts(contact_list, variables))
+
+    def iter_drafts(self, contact_list: ContactList, variables: dict[str, Any] | None = None) -> Iterator[OutreachDraft]:
+        """One draft per role with contacts, rendered from the jurisdiction's (or default) template.
+        ``variables`` fill extra template placeholders and override the built-in ones.
+        """
         by_role: dict[str, list[Contact]] = {}
         for c in contact_list.contacts:
             by_role.setdefault(c.role, []).append(c)
 
-        for role in ("planning", "engineering", "row", "clerk"):
+        for role in DRAFT_ROLES:
             contacts = by_role.get(role, [])
             if not contacts:
                 continue
-            drafts.append(
-                OutreachDraft(
-                    to_role=role,
-                    subject=f"Permit inquiry – {contact_list.jurisdiction}",
-                    body=_default_body(role, contact_list.jurisdiction),
-                    contact_ids=[c.email or c.name or str(i) for i, c in enumerate(contacts)],
-                    template_used="default",
-                )
+            template = self.templates.get(contact_list.jurisdiction, role)
+            subject, body = template.render(_template_variables(contact_list.jurisdiction, role, contacts, variables))
+            yield OutreachDraft(
+                to_role=role,
+                subject=subject,
+                body=body,
+                contact_ids=[c.email or c.name or str(i) for i, c in enumerate(contacts)],
+                template_used=template.name,
+                jurisdiction=contact_list.jurisdiction,
             )
-        return drafts
+
+    def write_drafts(
+        self,
+        contact_lists: Iterable[ContactList],
+        writer: DraftWriter,
+        variables: dict[str, Any] | None = None,
+    ) -> OutreachBatchReport:
+        """Render and stream drafts for many jurisdictions straight to ``writer`` (one draft in memory
+        at a time). A template error skips that jurisdiction and is reported, not raised.
+        """
+        report = OutreachBatchReport(output=writer.output, format=writer.format)
+        for contact_list in contact_lists:
+            report.jurisdictions += 1
+            try:
+                drafts = list(self.iter_drafts(contact_list, variables))
+            except TemplateError as e:
+                report.errors.append(f"{contact_list.jurisdiction}: {e}")
+                continue
+            if not drafts:
+                report.without_contacts.append(contact_list.jurisdiction)
+            for draft in drafts:
+                writer.write(draft)
+                report.drafts += 1
+                report.templates_used[draft.template_used] = report.templates_used.get(draft.template_used, 0) + 1
+        return report
 
     def _contact_list_to_markdown(self, cl: ContactList) -> str:
         lines = [
@@ -77,10 +150,28 @@ class OutreachService:
         return "\n".join(lines)
 
 
-def _default_body(role: str, jurisdiction: str) -> str:
-    return f"""Hello,
-
-We are preparing a permit application for telecom infrastructure (small cell / fiber) within {jurisdiction}.
-Could you please advise on the current application process, required documents, and any key contacts in your {role} department?
-
-Thank you."""
+def iter_contact_lists(paths: Iterable[Path]) -> Iterator[ContactList]:
+    """Contact lists from JSON files, or from every ``*_contacts.json`` in a directory, read one at a time."""
+    for path in paths:
+        path = Path(path)
+        files = sorted(path.glob("*_contacts.json")) if path.is_dir() else [path]
+        for file in files:
+            yield read_model(file, ContactList)
+
+
+def _template_variables(
+    jurisdiction: str, role: str, contacts: list[Contact], extra: dict[str, Any] | None
+) -> dict[str, Any]:
+    names = [c.name for c in contacts if c.name]
+    department = next((c.department for c in contacts if c.department), None)
+    variables = {
+        "jurisdiction": jurisdiction,
+        "role": role,
+        "department": department or f"{role} department",
+        "contact_name": names[0] if names else f"{department or role} team",
+        "contact_names": ", ".join(names),
+        "date": date.today().isoformat(),
+    }
+    if extra:
+        variables.update(extra)
+    return variables
@@ -0,0 +1,129 @@
+"""Outreach email templates: per-jurisdiction and per-role files, compiled once and cached.
+
+Templates are ``string.Template`` text files with a ``Subject:`` first line, a blank line, then
+the body::
+
+    Subject: Permit inquiry - $jurisdiction
+
+    Hello $contact_name,
+    ...
+
+For a jurisdiction id ``J`` and contact role ``R`` the first existing file wins:
+``<dir>/J/R.txt``, ``<dir>/J/default.txt``, ``<dir>/R.txt``, ``<dir>/default.txt``, then the
+built-in template. The directory is scanned once; compiled templates are cached by file mtime,
+so ``reload()`` after editing only recompiles what changed.
+"""
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from string import Template
+from typing import Any
+
+from permitting_agent.adapters import resolve_jurisdiction_id
+
+TEMPLATES_ENV = "PERMITTING_OUTREACH_TEMPLATES"
+DEFAULT_TEMPLATE_DIR = Path("config/outreach_templates")
+TEMPLATE_SUFFIX = ".txt"
+DEFAULT_NAME = "default"
+BUILTIN_NAME = "builtin"
+
+BUILTIN_SUBJECT = "Permit inquiry – $jurisdiction"
+BUILTIN_BODY = """Hello,
+
+We are preparing a permit application for telecom infrastructure (small cell / fiber) within $jurisdiction.
+Could you please advise on the current application process, required documents, and any key contacts in your $role department?
+
+Thank you."""
+
+
+class TemplateError(ValueError):
+    """A template file that cannot be parsed, or a render missing one of its placeholders."""
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    name: str  # e.g. "city_of_sample/planning", or "builtin"
+    subject: Template
+    body: Template
+
+    def render(self, variables: dict[str, Any]) -> tuple[str, str]:
+        """(subject, body); raises TemplateError naming the first missing placeholder."""
+        try:
+            return self.subject.substitute(variables), self.body.substitute(variables)
+        except KeyError as e:
+            raise TemplateError(f"template {self.name!r}: no value for ${e.args[0]}") from None
+
+
+def compile_template(name: str, text: str) -> CompiledTemplate:
+    """Parse ``Subject: ...`` + blank line + body and check both parts for bad ``$`` placeholders."""
+    head, sep, body = text.replace("\r\n", "\n").partition("\n\n")
+    if not sep or not head.lower().startswith("subject:"):
+        raise TemplateError(f"template {name!r}: expected 'Subject: ...', a blank line, then the body")
+    compiled = CompiledTemplate(name, Template(head[len("subject:") :].strip()), Template(body.strip("\n")))
+    for part in (compiled.subject, compiled.body):
+        if not part.is_valid():
+            raise TemplateError(f"template {name!r}: invalid placeholder in {part.template[:60]!r}")
+    return compiled
+
+
+BUILTIN_TEMPLATE = CompiledTemplate(BUILTIN_NAME, Template(BUILTIN_SUBJECT), Template(BUILTIN_BODY))
+
+
+class TemplateLibrary:
+    """Template lookup over one directory (missing directory: built-in template only)."""
+
+    def __init__(self, template_dir: Path | None = None):
+        self.template_dir = Path(template_dir or os.environ.get(TEMPLATES_ENV) or DEFAULT_TEMPLATE_DIR)
+        self._files: set[str] = set()
+        self._dirs: set[str] = set()
+        self._compiled: dict[str, tuple[int, CompiledTemplate]] = {}
+        self._resolved: dict[tuple[str, str], CompiledTemplate] = {}
+        self.reload()
+
+    def reload(self) -> None:
+        """Rescan the directory; templates whose file changed are recompiled on next use."""
+        files: set[str] = set()
+        if self.template_dir.is_dir():
+            for path in self.template_dir.rglob(f"*{TEMPLATE_SUFFIX}"):
+                files.add(path.relative_to(self.template_dir).with_suffix("").as_posix())
+        self._files = files
+        self._dirs = {name.rpartition("/")[0] for name in files if "/" in name}
+        self._resolved.clear()
+
+    def names(self) -> list[str]:
+        return sorted(self._files)
+
+    def get(self, jurisdiction: str, role: str) -> CompiledTemplate:
+        """Most specific template for the jurisdiction (name or id) and role."""
+        jurisdiction_id = template_key(jurisdiction) if self._dirs else ""
+        if jurisdiction_id not in self._dirs:
+            jurisdiction_id = ""  # shared role/default templates; the cache stays small across thousands of runs
+        key = (jurisdiction_id, role)
+        template = self._resolved.get(key)
+        if template is None:
+            template = self._resolved[key] = self._lookup(jurisdiction_id, role)
+        return template
+
+    def _lookup(self, jurisdiction_id: str, role: str) -> CompiledTemplate:
+        candidates = (f"{jurisdiction_id}/{role}", f"{jurisdiction_id}/{DEFAULT_NAME}") if jurisdiction_id else ()
+        for name in (*candidates, role, DEFAULT_NAME):
+            if name in self._files:
+                return self._load(name)
+        return BUILTIN_TEMPLATE
+
+    def _load(self, name: str) -> CompiledTemplate:
+        path = self.template_dir / f"{name}{TEMPLATE_SUFFIX}"
+        mtime = path.stat().st_mtime_ns
+        cached = self._compiled.get(name)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        compiled = compile_template(name, path.read_text(encoding="utf-8"))
+        self._compiled[name] = (mtime, compiled)
+        return compiled
+
+
+def template_key(jurisdiction: str) -> str:
+    """Directory name for a jurisdiction's templates: its registered id, else its normalized name."""
+    registered = resolve_jurisdiction_id(jurisdiction, fuzzy=False)
+    return registered or jurisdiction.strip().lower().replace(" ", "_").replace("-", "_")
@@ -1,5 +1,25 @@
 """Portal automation: Playwright-based submission with human-in-the-loop (approve each step)."""
 
+from permitting_agent.portal_automation.batch import ApprovalQueue, BatchScheduler, BatchStore
+from permitting_agent.portal_automation.engine import BrowserPool, PlaywrightEngine
+from permitting_agent.portal_automation.network import AssetCache, NetworkPolicy
+from permitting_agent.portal_automation.runs import PortalRunner, RunStore
 from permitting_agent.portal_automation.service import PortalAutomationService
+from permitting_agent.portal_automation.sessions import SessionStore
+from permitting_agent.portal_automation.tracing import CaptureOptions, TimingStore
 
-__all__ = ["PortalAutomationService"]
+__all__ = [
+    "ApprovalQueue",
+    "AssetCache",
+    "BatchScheduler",
+    "BatchStore",
+    "BrowserPool",
+    "CaptureOptions",
+    "NetworkPolicy",
+    "PlaywrightEngine",
+    "PortalAutomationService",
+    "PortalRunner",
+    "RunStore",
+    "SessionStore",
+    "TimingStore",
+]
@@ -0,0 +1,413 @@
+"""Batch portal submissions: many cases across many portals, one approval queue, resumable.
+
+``BatchStore`` persists every job (case, portal URL, documents) of a named batch in SQLite together
+with the steps it has completed, updated as each step finishes. ``BatchScheduler`` runs queued jobs
+on worker threads, at most ``portal_limit`` per portal at a time, each through
+``PortalAutomationService``. Every approval a flow needs goes into one ``ApprovalQueue`` that a
+person works through (the CLI prompts; several requests for the same step can be approved at
+once). Flows wait on the person, not on each other, so with enough workers the rate at which
+approvals are answered is what bounds the batch.
+
+An interrupted batch resumes where it stopped: jobs left ``running`` go back to the queue with
+their completed steps, which are redone in a fresh browser context without asking again. Like the
+outreach send queue, submission is at most once: a job is marked ``submitting`` before its final
+submit runs, and one still in that state after a crash becomes ``unknown`` for a person to check
+on the portal instead of being submitted again.
+"""
+
+import queue
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable
+
+from permitting_agent.models import SubmissionBatchReport, SubmissionStatus
+from permitting_agent.portal_automation.engine import PlaywrightEngine
+from permitting_agent.portal_automation.service import PortalAutomationService
+from permitting_agent.portal_automation.sessions import SessionStore
+from permitting_agent.portal_automation.tracing import TimingStore
+from permitting_agent.serialization import dumps, loads
+from permitting_agent.sqlite import ConnectionPool
+
+DEFAULT_PORTAL_LIMIT = 2
+DEFAULT_WORKERS = 8
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    batch TEXT NOT NULL,
+    case_id TEXT NOT NULL,
+    portal TEXT NOT NULL,
+    portal_url TEXT NOT NULL,
+    documents TEXT NOT NULL,
+    status TEXT NOT NULL,
+    completed_steps TEXT NOT NULL DEFAULT '[]',
+    confirmation TEXT,
+    error TEXT,
+    updated_at REAL NOT NULL,
+    UNIQUE (batch, case_id)
+);
+CREATE INDEX IF NOT EXISTS jobs_by_status ON jobs (batch, status);
+"""
+
+_FINAL = {
+    "completed": SubmissionStatus.COMPLETED,
+    "aborted": SubmissionStatus.ABORTED,
+    "failed": SubmissionStatus.FAILED,
+    "needs_login": SubmissionStatus.NEEDS_LOGIN,
+}
+
+
+@dataclass
+class BatchJob:
+    """One case's submission in a batch."""
+
+    id: int
+    batch: str
+    case_id: str
+    portal: str
+    portal_url: str
+    documents: dict[str, Path]
+    status: SubmissionStatus
+    completed_steps: list[str] = field(default_factory=list)
+    confirmation: str | None = None
+    error: str | None = None
+
+
+class BatchStore:
+    """Persisted batch jobs. Run one scheduler per batch at a time."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._pool = ConnectionPool(self.path, _SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        return self._pool.conn()
+
+    def add(self, batch: str, jobs: Iterable[tuple[str, str, dict[str, Path]]]) -> int:
+        """Queue (case_id, portal_url, documents) jobs; cases already in the batch are left alone.
+        Returns how many were new.
+        """
+        now = time.time()
+        rows = [
+            (
+                batch,
+                case_id,
+                SessionStore.portal_key(portal_url),
+                portal_url,
+                dumps(documents, pretty=False).decode(),
+                SubmissionStatus.QUEUED.value,
+                now,
+            )
+            for case_id, portal_url, documents in jobs
+        ]
+        conn = self._conn()
+        with conn:
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO jobs (batch, case_id, portal, portal_url, documents, status, updated_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            return conn.total_changes - before
+
+    def jobs(self, batch: str, status: SubmissionStatus | None = None) -> list[BatchJob]:
+        sql = (
+            "SELECT id, batch, case_id, portal, portal_url, documents, status, completed_steps, confirmation, error"
+            " FROM jobs WHERE batch = ?"
+        )
+        args: tuple = (batch,)
+        if status is not None:
+            sql += " AND status = ?"
+            args += (status.value,)
+        return [
+            BatchJob(
+                row[0],
+                row[1],
+                row[2],
+                row[3],
+                row[4],
+                {k: Path(v) for k, v in loads(row[5]).items()},
+                SubmissionStatus(row[6]),
+                loads(row[7]),
+                row[8],
+                row[9],
+            )
+            for row in self._conn().execute(sql + " ORDER BY id", args)
+        ]
+
+    def counts(self, batch: str) -> dict[str, int]:
+        rows = self._conn().execute("SELECT status, COUNT(*) FROM jobs WHERE batch = ? GROUP BY status", (batch,))
+        return {status.value: 0 for status in SubmissionStatus} | dict(rows.fetchall())
+
+    def recover(self, batch: str) -> int:
+        """After a crash: ``running`` jobs go back to the queue (keeping their completed steps),
+        ``submitting`` ones become ``unknown``. Returns how many jobs were touched.
+        """
+        conn = self._conn()
+        with conn:
+            requeued = conn.execute(
+                "UPDATE jobs SET status = ? WHERE batch = ? AND status = ?",
+                (SubmissionStatus.QUEUED.value, batch, SubmissionStatus.RUNNING.value),
+            ).rowcount
+            unknown = conn.execute(
+                "UPDATE jobs SET status = ?, error = 'interrupted while submitting' WHERE batch = ? AND status = ?",
+                (SubmissionStatus.UNKNOWN.value, batch, SubmissionStatus.SUBMITTING.value),
+            ).rowcount
+        return requeued + unknown
+
+    def requeue(self, batch: str, status: SubmissionStatus) -> int:
+        """Queue aborted/failed/needs_login jobs again (or unknown ones, once checked on the portal)."""
+        conn = self._conn()
+        with conn:
+            cur = conn.execute(
+                "UPDATE jobs SET status = ?, error = NULL, updated_at = ? WHERE batch = ? AND status = ?",
+                (SubmissionStatus.QUEUED.value, time.time(), batch, status.value),
+            )
+        return cur.rowcount
+
+    def set_status(self, job_id: int, status: SubmissionStatus, **fields: Any) -> None:
+        """Update a job's status plus any of ``completed_steps``, ``confirmation``, ``error``."""
+        columns = ["status = ?", "updated_at = ?"]
+        args: list[Any] = [status.value, time.time()]
+        for name in ("completed_steps", "confirmation", "error"):
+            if name in fields:
+                columns.append(f"{name} = ?")
+                value = fields[name]
+                args.append(dumps(value, pretty=False).decode() if name == "completed_steps" else value)
+        conn = self._conn()
+        with conn:
+            conn.execute(f"UPDATE jobs SET {', '.join(columns)} WHERE id = ?", (*args, job_id))
+
+    def close(self) -> None:
+        self._pool.close()
+
+
+@dataclass
+class ApprovalRequest:
+    """One step of one job waiting for a person."""
+
+    id: int
+    case_id: str
+    portal: str
+    step: dict[str, Any]
+    requested_at: float
+    approved: bool | None = None
+    _done: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    @property
+    def danger(self) -> bool:
+        return bool(self.step.get("danger"))
+
+
+class ApprovalQueue:
+    """Approval requests from every running flow, in the order they were raised.
+
+    Worker threads block in ``request`` until a person answers with ``resolve`` (or
+    ``approve_matching`` for all waiting requests of a step). ``close`` declines whatever is
+    still waiting so workers can stop.
+    """
+
+    def __init__(self):
+        self._queue: queue.Queue[ApprovalRequest] = queue.Queue()
+        self._pending: dict[int, ApprovalRequest] = {}
+        self._lock = threading.Lock()
+        self._next_id = 1
+        self._closed = False
+        self.answered = 0
+        self.wait_s = 0.0
+
+    def request(self, case_id: str, portal: str, step: dict[str, Any]) -> bool:
+        """Raise a request and wait for the answer (called from worker threads)."""
+        with self._lock:
+            if self._closed:
+                return False
+            req = ApprovalRequest(self._next_id, case_id, portal, step, time.time())
+            self._next_id += 1
+            self._pending[req.id] = req
+        self._queue.put(req)
+        req._done.wait()
+        return bool(req.approved)
+
+    def get(self, timeout: float | None = None) -> ApprovalRequest | None:
+        """The oldest request still waiting, or None after ``timeout`` seconds."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                req = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                return None
+            if req.approved is None:
+                return req
+
+    def pending(self) -> list[ApprovalRequest]:
+        with self._lock:
+            return sorted(self._pending.values(), key=lambda r: r.id)
+
+    def resolve(self, request_id: int, approved: bool) -> bool:
+        """Answer one request; False if it was already answered."""
+        with self._lock:
+            req = self._pending.pop(request_id, None)
+            if req is None:
+                return False
+            req.approved = approved
+            self.answered += 1
+            self.wait_s += time.time() - req.requested_at
+        req._done.set()
+        return True
+
+    def approve_matching(self, step_id: str) -> int:
+        """Approve every waiting request for ``step_id``; a final submit is never approved in bulk."""
+        ids = [r.id for r in self.pending() if r.step["id"] == step_id and not r.danger]
+        return sum(self.resolve(i, True) for i in ids)
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+        for req in self.pending():
+            self.resolve(req.id, False)
+
+
+class BatchScheduler:
+    """Run a batch's queued jobs concurrently, at most ``portal_limit`` per portal."""
+
+    def __init__(
+        self,
+        store: BatchStore,
+        approvals: ApprovalQueue,
+        engine: PlaywrightEngine | None = None,
+        portal_limit: int = DEFAULT_PORTAL_LIMIT,
+        workers: int = DEFAULT_WORKERS,
+        approve_each_step: bool = True,
+        credentials: tuple[str, str] | None = None,
+        session_store: SessionStore | None = None,
+        timing_store: TimingStore | None = None,
+    ):
+        self.store = store
+        self.approvals = approvals
+        self.engine = engine
+        self.portal_limit = max(1, portal_limit)
+        self.workers = max(1, workers)
+        self.approve_each_step = approve_each_step
+        self.credentials = credentials
+        self.session_store = session_store
+        self.timing_store = timing_store
+        self._cond = threading.Condition()
+        self._queued: list[BatchJob] = []
+        self._active: dict[str, int] = {}
+        self._stopping = False
+        self._max_parallel = 0
+
+    def run(self, batch: str) -> SubmissionBatchReport:
+        """Run every queued job of ``batch`` (blocking) and report the batch's state afterwards."""
+        started = time.perf_counter()
+        self.store.recover(batch)
+        self._queued = self.store.jobs(batch, SubmissionStatus.QUEUED)
+        resumed = sum(1 for job in self._queued if job.completed_steps)
+        self._stopping = False
+        threads = [
+            threading.Thread(target=self._worker, name=f"portal-batch-{i}", daemon=True)
+            for i in range(min(self.workers, len(self._queued)))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        counts = self.store.counts(batch)
+        return SubmissionBatchReport(
+            batch=batch,
+            jobs=sum(counts.values()),
+            counts=counts,
+            resumed=resumed,
+            approvals=self.approvals.answered,
+            approval_wait_s=round(self.approvals.wait_s, 3),
+            max_parallel=self._max_parallel,
+            elapsed_s=round(time.perf_counter() - started, 3),
+        )
+
+    def stop(self) -> None:
+        """Start no more jobs and decline waiting approvals; interrupted jobs stay resumable."""
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        self.approvals.close()
+
+    def _next_job(self) -> BatchJob | None:
+        """The oldest queued job whose portal has a free slot (waits for one); None when done."""
+        with self._cond:
+            while True:
+                if self._stopping or not self._queued:
+                    return None
+                for i, job in enumerate(self._queued):
+                    if self._active.get(job.portal, 0) < self.portal_limit:
+                        self._active[job.portal] = self._active.get(job.portal, 0) + 1
+                        self._max_parallel = max(self._max_parallel, sum(self._active.values()))
+                        return self._queued.pop(i)
+                self._cond.wait()
+
+    def _worker(self) -> None:
+        while (job := self._next_job()) is not None:
+            try:
+                self._run_job(job)
+            finally:
+                with self._cond:
+                    self._active[job.portal] -= 1
+                    self._cond.notify_all()
+
+    def _run_job(self, job: BatchJob) -> None:
+        completed = list(job.completed_steps)
+        submitting = False
+        self.store.set_status(job.id, SubmissionStatus.RUNNING)
+
+        def approve(name: str, step: dict[str, Any]) -> bool:
+            return self.approvals.request(job.case_id, job.portal, step)
+
+        def progress(step: dict[str, Any], result: dict[str, Any] | None) -> None:
+            nonlocal submitting
+            if result is None:
+                if step.get("danger"):
+                    submitting = True
+                    self.store.set_status(job.id, SubmissionStatus.SUBMITTING)
+            elif step["id"] not in completed:
+                completed.append(step["id"])
+                status = SubmissionStatus.SUBMITTING if step.get("danger") else SubmissionStatus.RUNNING
+                self.store.set_status(job.id, status, completed_steps=completed)
+
+        svc = PortalAutomationService(
+            approve_each_step=self.approve_each_step,
+            approval_callback=approve,
+            engine=self.engine,
+            credentials=self.credentials,
+            session_store=self.session_store,
+            timing_store=self.timing_store,
+        )
+        try:
+            outcome = svc.run_flow(
+                job.case_id,
+                portal_url=job.portal_url,
+                documents=job.documents,
+                resume_after=job.completed_steps,
+                progress=progress,
+            )
+        except Exception as e:
+            # the browser itself failed (not a step): resumable, unless the submit may have gone out
+            status = SubmissionStatus.UNKNOWN if submitting else SubmissionStatus.QUEUED
+            self.store.set_status(job.id, status, completed_steps=completed, error=str(e))
+            return
+        if outcome["status"] == "aborted" and self._stopping:
+            # declined by stop(), not by a person: resume later from the same step
+            self.store.set_status(job.id, SubmissionStatus.QUEUED, completed_steps=completed)
+            return
+        status = _FINAL[outcome["status"]]
+        if status is SubmissionStatus.FAILED and submitting:
+            status = SubmissionStatus.UNKNOWN  # the submit click happened; whether it went through is unclear
+        self.store.set_status(
+            job.id,
+            status,
+            completed_steps=completed,
+            confirmation=outcome.get("confirmation"),
+            error=outcome.get("error"),
+        )
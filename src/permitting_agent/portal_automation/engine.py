@@ -0,0 +1,360 @@
+"""Playwright execution engine: one warm Chromium process, an isolated browser context per flow.
+
+``BrowserPool`` launches the browser once and keeps a few contexts pre-created. A flow borrows a
+context, uses it, and the context is closed when the flow ends (cookies, storage and uploads
+never leak between cases); a replacement is warmed in the background so the next flow doesn't
+wait for one. ``PlaywrightEngine`` runs the pool on its own event-loop thread and exposes a
+blocking, step-at-a-time API, so ``PortalAutomationService`` can ask for approval (e.g. a
+terminal prompt) in the caller's thread between steps while the browser stays warm.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, AsyncIterator
+
+from permitting_agent.portal_automation.network import NetworkPolicy, NetworkStats
+from permitting_agent.portal_automation.tracing import CaptureOptions
+
+DEFAULT_POOL_SIZE = 4
+DEFAULT_WARM_CONTEXTS = 1
+DEFAULT_STEP_TIMEOUT_MS = 30_000
+
+# Selectors used by the default step list; they match common permit-portal markup by field name.
+DEFAULT_SELECTORS = {
+    "username": "input[name=username], input[type=email]",
+    "password": "input[type=password]",
+    "login_submit": "form:has(input[type=password]) [type=submit]",
+    "application": "input[type=file][name*=application]",
+    "site_plan": "input[type=file][name*=site]",
+    "fee": "input[type=checkbox][name*=fee]",
+    "submit": "form [type=submit]",
+    "confirmation": "#confirmation, .confirmation",
+}
+
+
+class EngineError(RuntimeError):
+    """A step could not be executed in the browser."""
+
+
+class LoginRequired(EngineError):
+    """The portal asks for a login and no credentials were supplied."""
+
+
+@dataclass
+class PoolStats:
+    """Counters for one BrowserPool."""
+
+    launches: int = 0
+    launch_s: float = 0.0
+    contexts_created: int = 0
+    warm_hits: int = 0  # flows that got a pre-created context
+    in_use: int = 0
+
+
+class BrowserPool:
+    """One Chromium process and a bounded set of isolated contexts (at most ``size`` in use)."""
+
+    def __init__(
+        self,
+        size: int = DEFAULT_POOL_SIZE,
+        warm: int = DEFAULT_WARM_CONTEXTS,
+        headless: bool = True,
+        launch_options: dict[str, Any] | None = None,
+        context_options: dict[str, Any] | None = None,
+    ):
+        self.size = max(1, size)
+        self.warm = max(0, min(warm, self.size))
+        self.headless = headless
+        self.launch_options = launch_options or {}
+        self.context_options = context_options or {}
+        self.stats = PoolStats()
+        self._playwright = None
+        self._browser = None
+        self._idle: list[Any] = []
+        self._semaphore: asyncio.Semaphore | None = None
+        self._warming: set[asyncio.Task] = set()
+
+    async def start(self) -> "BrowserPool":
+        if self._browser is not None:
+            return self
+        from playwright.async_api import async_playwright
+
+        started = time.perf_counter()
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(headless=self.headless, **self.launch_options)
+        self.stats.launches += 1
+        self.stats.launch_s = round(time.perf_counter() - started, 3)
+        self._semaphore = asyncio.Semaphore(self.size)
+        for _ in range(self.warm):
+            self._idle.append(await self._new_context())
+        return self
+
+    async def close(self) -> None:
+        for task in list(self._warming):
+            task.cancel()
+        await asyncio.gather(*self._warming, return_exceptions=True)
+        for ctx in self._idle:
+            await ctx.close()
+        self._idle.clear()
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    async def __aenter__(self) -> "BrowserPool":
+        return await self.start()
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    async def acquire(self, **options: Any) -> Any:
+        """A fresh, isolated browser context (waits while ``size`` are in use). ``options``
+        (e.g. ``storage_state``) force a new context instead of a pre-warmed one.
+        """
+        if self._browser is None:
+            await self.start()
+        await self._semaphore.acquire()
+        try:
+            if self._idle and not options:
+                ctx = self._idle.pop()
+                self.stats.warm_hits += 1
+            else:
+                ctx = await self._new_context(**options)
+        except BaseException:
+            self._semaphore.release()
+            raise
+        self.stats.in_use += 1
+        return ctx
+
+    async def release(self, ctx: Any) -> None:
+        """Close a borrowed context and warm a replacement in the background."""
+        self.stats.in_use -= 1
+        try:
+            await ctx.close()
+        finally:
+            self._semaphore.release()
+        if self._browser is not None and len(self._idle) + len(self._warming) < self.warm:
+            task = asyncio.ensure_future(self._rewarm())
+            self._warming.add(task)
+            task.add_done_callback(self._warming.discard)
+
+    @asynccontextmanager
+    async def context(self, **options: Any) -> AsyncIterator[Any]:
+        """``acquire``/``release`` as an async context manager."""
+        ctx = await self.acquire(**options)
+        try:
+            yield ctx
+        finally:
+            await self.release(ctx)
+
+    async def _new_context(self, **options: Any) -> Any:
+        ctx = await self._browser.new_context(**{**self.context_options, **options})
+        ctx.set_default_timeout(DEFAULT_STEP_TIMEOUT_MS)
+        self.stats.contexts_created += 1
+        return ctx
+
+    async def _rewarm(self) -> None:
+        if self._browser is not None:
+            self._idle.append(await self._new_context())
+
+
+@dataclass
+class StepResult:
+    """What one executed step did."""
+
+    id: str
+    status: str  # "done" | "skipped"
+    elapsed_ms: float = 0.0
+    url: str | None = None
+    detail: str | None = None
+    network: dict[str, Any] | None = None  # NetworkStats.since for this step, with a policy
+
+
+@dataclass
+class FlowSession:
+    """Browser state for one flow: the borrowed context and its page."""
+
+    context: Any
+    page: Any
+    documents: dict[str, Path] = field(default_factory=dict)
+    credentials: tuple[str, str] | None = None
+    restored: bool = False  # context started from a saved storage state
+    network: NetworkStats | None = None
+    artifacts_dir: Path | None = None  # where CaptureOptions artifacts of this flow go
+    capture: CaptureOptions | None = None
+
+
+async def run_step(session: FlowSession, step: dict[str, Any]) -> StepResult:
+    """Execute one step dict (``action`` plus its arguments) on the session's page."""
+    page = session.page
+    action = step.get("action")
+    before = session.network.snapshot() if session.network is not None else None
+    started = time.perf_counter()
+    detail = None
+    status = "done"
+    if action == "navigate":
+        response = await page.goto(step["url"], wait_until="domcontentloaded")
+        if response is not None and response.status >= 400:
+            raise EngineError(f"{step['url']} returned HTTP {response.status}")
+    elif action == "login":
+        if await page.locator(DEFAULT_SELECTORS["password"]).count() == 0:
+            status, detail = "skipped", "saved session accepted" if session.restored else "no login form"
+        elif session.credentials is None:
+            raise LoginRequired("portal requires a login; set PORTAL_USER and PORTAL_PASSWORD")
+        else:
+            user, password = session.credentials
+            await page.locator(DEFAULT_SELECTORS["username"]).first.fill(user)
+            await page.locator(DEFAULT_SELECTORS["password"]).first.fill(password)
+            async with page.expect_navigation(wait_until="domcontentloaded"):
+                await page.locator(DEFAULT_SELECTORS["login_submit"]).first.click()
+            if await page.locator(DEFAULT_SELECTORS["password"]).count():
+                raise EngineError("login was rejected")
+    elif action == "upload":
+        path = session.documents.get(step["document"])
+        if path is None:
+            status, detail = "skipped", f"no {step['document']} document on the case"
+        else:
+            await page.locator(step["selector"]).first.set_input_files(str(path))
+            detail = Path(path).name
+    elif action == "check":
+        target = page.locator(step["selector"])
+        if await target.count() == 0:
+            status, detail = "skipped", "not on this portal"
+        else:
+            await target.first.check()
+    elif action == "submit":
+        async with page.expect_navigation(wait_until="domcontentloaded"):
+            await page.locator(step["selector"]).first.click()
+        confirmation = page.locator(DEFAULT_SELECTORS["confirmation"])
+        if await confirmation.count():
+            detail = (await confirmation.first.inner_text()).strip()
+    elif action is None:
+        status, detail = "skipped", "no browser action"
+    else:
+        raise EngineError(f"unknown step action: {action}")
+    elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+    network = session.network.since(before) if before is not None else None
+    if session.capture is not None and session.capture.screenshots:
+        await page.screenshot(path=str(session.artifacts_dir / f"{step['id']}.png"))
+    return StepResult(step["id"], status, elapsed_ms, page.url, detail, network)
+
+
+class PlaywrightEngine:
+    """Blocking facade over a BrowserPool running on a private event-loop thread.
+
+    ``open_session`` borrows a context, ``run_step`` executes one step in it and
+    ``close_session`` gives it back; the browser process survives across sessions until ``close``.
+    With a ``network`` policy every session's requests are filtered and cached by it. A session
+    opened with ``capture`` writes its trace, screenshots and HAR into ``artifacts_dir``.
+    """
+
+    def __init__(self, pool: BrowserPool | None = None, network: NetworkPolicy | None = None):
+        self.pool = pool or BrowserPool()
+        self.network = network
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="playwright-engine", daemon=True)
+        self._thread.start()
+        self._started = False
+
+    def _call(self, coro, timeout: float | None = None):
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result(timeout)
+
+    def start(self) -> "PlaywrightEngine":
+        if not self._started:
+            self._call(self.pool.start())
+            self._started = True
+        return self
+
+    def open_session(
+        self,
+        documents: dict[str, Path] | None = None,
+        credentials: tuple[str, str] | None = None,
+        artifacts_dir: Path | None = None,
+        capture: CaptureOptions | None = None,
+        **context_options: Any,
+    ) -> FlowSession:
+        self.start()
+        restored = "storage_state" in context_options
+        if capture is not None and capture.enabled:
+            artifacts_dir.mkdir(parents=True, exist_ok=True)
+            if capture.har:
+                context_options["record_har_path"] = str(artifacts_dir / "network.har")
+        else:
+            capture = None
+
+        async def open_() -> FlowSession:
+            ctx = await self.pool.acquire(**context_options)
+            try:
+                stats = await self.network.install(ctx) if self.network is not None else None
+                if capture is not None and capture.trace:
+                    await ctx.tracing.start(screenshots=True, snapshots=True)
+                page = await ctx.new_page()
+            except BaseException:
+                await self.pool.release(ctx)
+                raise
+            return FlowSession(ctx, page, dict(documents or {}), credentials, restored, stats, artifacts_dir, capture)
+
+        return self._call(open_())
+
+    def run_step(self, session: FlowSession, step: dict[str, Any]) -> StepResult:
+        return self._call(run_step(session, step))
+
+    def storage_state(self, session: FlowSession) -> dict[str, Any]:
+        """Cookies and localStorage of the session's context, for ``SessionStore.save``."""
+        return self._call(session.context.storage_state())
+
+    def close_session(self, session: FlowSession) -> None:
+        """Give the context back (writing its trace and HAR first, if captured)."""
+        if session.context is None:
+            return
+
+        async def close_() -> None:
+            try:
+                if session.capture is not None and session.capture.trace:
+                    await session.context.tracing.stop(path=str(session.artifacts_dir / "trace.zip"))
+            finally:
+                await self.pool.release(session.context)
+
+        self._call(close_())
+        session.context = session.page = None
+
+    def close(self) -> None:
+        if self._loop.is_closed():
+            return
+        if self._started:
+            self._call(self.pool.close())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=10)
+        self._loop.close()
+
+    def __enter__(self) -> "PlaywrightEngine":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def credentials_from_env() -> tuple[str, str] | None:
+    """(PORTAL_USER, PORTAL_PASSWORD) when both are set; credentials are only used if supplied."""
+    user, password = os.environ.get("PORTAL_USER"), os.environ.get("PORTAL_PASSWORD")
+    return (user, password) if user and password else None
+
+
+def chromium_available() -> bool:
+    """True if Playwright and its Chromium build are installed (``playwright install chromium``)."""
+    try:
+        from playwright.sync_api import sync_playwright
+    except ImportError:
+        return False
+    try:
+        with sync_playwright() as p:
+            return Path(p.chromium.executable_path).exists()
+    except Exception:
+        return False
@@ -0,0 +1,186 @@
+"""Network policy for portal automation: block what form filling never needs, cache static assets.
+
+Municipal portals load images, fonts, analytics and map tiles on every page. ``NetworkPolicy``
+routes every request of a browser context: blocked resource types and URL patterns are aborted
+before they leave the browser, and GET scripts and stylesheets are answered from an on-disk
+``AssetCache`` that survives across runs (Playwright turns its own HTTP cache off once a context
+has routes). ``NetworkStats`` counts what was blocked and served from cache; the engine reports
+the difference per step.
+"""
+
+import hashlib
+import re
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from permitting_agent.serialization import dumps, loads, write_bytes_atomic
+
+DEFAULT_BLOCK_TYPES = ("image", "font", "media")
+# Analytics, tag managers and map tile servers; matched as substrings of the URL.
+DEFAULT_BLOCK_PATTERNS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "connect.facebook.net",
+    "hotjar.com",
+    "js-agent.newrelic.com",
+    "cdn.segment.com",
+    "/analytics/",
+    "tile.openstreetmap.org",
+    "arcgisonline.com",
+    "maps.googleapis.com",
+    "/tiles/",
+)
+DEFAULT_CACHE_TYPES = ("script", "stylesheet")
+DEFAULT_CACHE_MAX_AGE_S = 7 * 24 * 3600
+# Response headers replayed from the cache (the body is stored decoded, so no encoding/length).
+_REPLAY_HEADERS = ("content-type", "cache-control", "etag", "last-modified")
+
+
+@dataclass
+class NetworkStats:
+    """Running counters for one browser context."""
+
+    requests: int = 0
+    blocked: int = 0
+    blocked_by_type: dict[str, int] = field(default_factory=dict)
+    cache_hits: int = 0
+    cache_bytes: int = 0  # bytes served from the asset cache instead of the network
+    cache_ms: float = 0.0  # what those responses took to fetch when they were cached
+    fetched: int = 0  # cacheable assets fetched from the network (and stored)
+    fetched_bytes: int = 0
+
+    def snapshot(self) -> "NetworkStats":
+        return NetworkStats(**{**asdict(self), "blocked_by_type": dict(self.blocked_by_type)})
+
+    def since(self, before: "NetworkStats") -> dict[str, Any]:
+        """What happened after ``before`` was taken, as a plain dict for step results."""
+        return {
+            "requests": self.requests - before.requests,
+            "blocked": self.blocked - before.blocked,
+            "blocked_by_type": {
+                kind: n - before.blocked_by_type.get(kind, 0)
+                for kind, n in self.blocked_by_type.items()
+                if n != before.blocked_by_type.get(kind, 0)
+            },
+            "cache_hits": self.cache_hits - before.cache_hits,
+            "bytes_saved": self.cache_bytes - before.cache_bytes,
+            "ms_saved": round(self.cache_ms - before.cache_ms, 1),
+            "fetched_bytes": self.fetched_bytes - before.fetched_bytes,
+        }
+
+
+def sum_network(steps: list[dict[str, Any]]) -> dict[str, Any]:
+    """Add up per-step ``NetworkStats.since`` dicts into flow totals."""
+    total: dict[str, Any] = {"blocked_by_type": {}}
+    for step in steps:
+        for key, value in step.items():
+            if key == "blocked_by_type":
+                for kind, n in value.items():
+                    total[key][kind] = total[key].get(kind, 0) + n
+            else:
+                total[key] = total.get(key, 0) + value
+    if "ms_saved" in total:
+        total["ms_saved"] = round(total["ms_saved"], 1)
+    return total
+
+
+class AssetCache:
+    """Static responses on disk, keyed by URL: ``<sha>.body`` plus ``<sha>.json`` metadata."""
+
+    def __init__(self, cache_dir: Path, max_age_s: float = DEFAULT_CACHE_MAX_AGE_S):
+        self.dir = Path(cache_dir)
+        self.max_age_s = max_age_s
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        digest = hashlib.sha256(url.encode()).hexdigest()[:32]
+        return self.dir / f"{digest}.json", self.dir / f"{digest}.body"
+
+    def get(self, url: str, now: float | None = None) -> tuple[dict[str, Any], bytes] | None:
+        meta_path, body_path = self._paths(url)
+        try:
+            meta = loads(meta_path.read_bytes())
+            body = body_path.read_bytes()
+        except (FileNotFoundError, ValueError):
+            return None
+        if meta["url"] != url or meta["stored_at"] + self.max_age_s <= (time.time() if now is None else now):
+            return None
+        return meta, body
+
+    def put(self, url: str, status: int, headers: dict[str, str], body: bytes, fetch_ms: float) -> bool:
+        """Store a response unless it is an error or marked no-store/private. True if stored."""
+        cache_control = headers.get("cache-control", "").lower()
+        if status != 200 or "no-store" in cache_control or "private" in cache_control:
+            return False
+        self.dir.mkdir(parents=True, exist_ok=True)
+        meta_path, body_path = self._paths(url)
+        write_bytes_atomic(body_path, body)
+        meta = {
+            "url": url,
+            "status": status,
+            "headers": {k: v for k, v in headers.items() if k in _REPLAY_HEADERS},
+            "fetch_ms": round(fetch_ms, 1),
+            "stored_at": time.time(),
+        }
+        write_bytes_atomic(meta_path, dumps(meta, pretty=False))
+        return True
+
+
+@dataclass
+class NetworkPolicy:
+    """What to block and what to cache; ``install`` applies it to a browser context."""
+
+    block_types: tuple[str, ...] = DEFAULT_BLOCK_TYPES
+    block_patterns: tuple[str, ...] = DEFAULT_BLOCK_PATTERNS
+    cache_types: tuple[str, ...] = DEFAULT_CACHE_TYPES
+    cache: AssetCache | None = None
+
+    def __post_init__(self) -> None:
+        self._blocked_url = (
+            re.compile("|".join(re.escape(p) for p in self.block_patterns), re.IGNORECASE)
+            if self.block_patterns
+            else None
+        )
+
+    def blocks(self, resource_type: str, url: str) -> bool:
+        return resource_type in self.block_types or bool(self._blocked_url and self._blocked_url.search(url))
+
+    async def install(self, context: Any) -> NetworkStats:
+        """Route every request of ``context`` through the policy; returns its live counters."""
+        stats = NetworkStats()
+
+        async def handle(route, request) -> None:
+            stats.requests += 1
+            kind = request.resource_type
+            if self.blocks(kind, request.url):
+                stats.blocked += 1
+                stats.blocked_by_type[kind] = stats.blocked_by_type.get(kind, 0) + 1
+                await route.abort("blockedbyclient")
+                return
+            if self.cache is None or kind not in self.cache_types or request.method != "GET":
+                await route.continue_()
+                return
+            cached = self.cache.get(request.url)
+            if cached is not None:
+                meta, body = cached
+                stats.cache_hits += 1
+                stats.cache_bytes += len(body)
+                stats.cache_ms += meta["fetch_ms"]
+                await route.fulfill(status=meta["status"], headers=meta["headers"], body=body)
+                return
+            started = time.perf_counter()
+            try:
+                response = await route.fetch()
+                body = await response.body()
+            except Exception:  # e.g. a reset connection: let the browser load it itself, uncached
+                await route.continue_()
+                return
+            stats.fetched += 1
+            stats.fetched_bytes += len(body)
+            self.cache.put(request.url, response.status, response.headers, body, (time.perf_counter() - started) * 1000)
+            await route.fulfill(response=response, body=body)
+
+        await context.route("**/*", handle)
+        return stats
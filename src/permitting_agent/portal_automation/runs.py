@@ -0,0 +1,369 @@
+"""Approval-driven portal runs as a persisted state machine (for the web UI and worker processes).
+
+``PortalAutomationService.run_flow`` asks for approval through a blocking callback, which would
+hold a web worker (and a browser) for as long as a person takes to answer. Here a run lives in
+SQLite instead: a worker executes it up to the next step that needs approval, records that step
+as pending and lets go of everything (status ``awaiting_approval``). An API call records the
+decision; any worker process then claims the run and carries on. While a run waits, no process,
+thread or browser context is tied to it.
+
+A browser page cannot be parked in a database, so a resumed run starts a fresh context and redoes
+its completed steps (approved before, so without asking) before the newly approved one; with
+saved logins (``SessionStore``) that replay is a few page loads. As in the batch scheduler, a run
+is marked ``submitting`` before its final submit, and one whose worker vanished in that state
+becomes ``unknown`` rather than being submitted again.
+
+    ready --worker--> running --next step needs approval--> awaiting_approval
+      ^                  |                                     |        |
+      +---- approve -----+-------------------------------------+     reject --> rejected
+                         +--> submitting --> completed | failed | needs_login | unknown
+"""
+
+import secrets
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from permitting_agent.models import PortalRun, RunStatus, StepDecision
+from permitting_agent.portal_automation.engine import PlaywrightEngine
+from permitting_agent.portal_automation.service import PortalAutomationService, default_steps
+from permitting_agent.portal_automation.sessions import SessionStore
+from permitting_agent.portal_automation.tracing import TimingStore
+from permitting_agent.serialization import dump_json, load_json
+from permitting_agent.sqlite import ConnectionPool
+
+DEFAULT_LEASE_S = 600.0  # a worker that holds a run longer than this without progress is presumed dead
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id TEXT PRIMARY KEY,
+    case_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    pending_step TEXT,
+    lease_token TEXT,
+    lease_until REAL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_by_status ON runs (status, updated_at);
+CREATE INDEX IF NOT EXISTS runs_by_case ON runs (case_id, created_at);
+"""
+
+_RETRYABLE = (RunStatus.FAILED, RunStatus.NEEDS_LOGIN, RunStatus.UNKNOWN)
+_OUTCOMES = {
+    "completed": RunStatus.COMPLETED,
+    "failed": RunStatus.FAILED,
+    "needs_login": RunStatus.NEEDS_LOGIN,
+}
+
+
+class RunStateError(ValueError):
+    """The run is not in a state that allows this (e.g. approving a step that isn't pending)."""
+
+
+class RunStore:
+    """Persisted PortalRuns. Safe to share between processes: every transition is a conditional update."""
+
+    def __init__(self, path: Path, lease_s: float = DEFAULT_LEASE_S):
+        self.path = Path(path)
+        self.lease_s = lease_s
+        self._pool = ConnectionPool(self.path, _SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        return self._pool.conn()
+
+    def create(self, run: PortalRun) -> PortalRun:
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "INSERT INTO runs (id, case_id, status, pending_step, created_at, updated_at, data)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    run.id,
+                    run.case_id,
+                    run.status.value,
+                    run.pending_step,
+                    run.created_at.isoformat(),
+                    run.updated_at.isoformat(),
+                    dump_json(run, pretty=False),
+                ),
+            )
+        return run
+
+    def get(self, run_id: str) -> PortalRun | None:
+        row = self._conn().execute("SELECT data FROM runs WHERE id = ?", (run_id,)).fetchone()
+        return load_json(PortalRun, row[0]) if row else None
+
+    def list(self, status: RunStatus | None = None, case_id: str | None = None, limit: int = 100) -> list[PortalRun]:
+        """Runs, oldest change first (so ``awaiting_approval`` lists read as a work queue)."""
+        where, args = [], []
+        if status is not None:
+            where.append("status = ?")
+            args.append(status.value)
+        if case_id is not None:
+            where.append("case_id = ?")
+            args.append(case_id)
+        sql = "SELECT data FROM runs" + (" WHERE " + " AND ".join(where) if where else "")
+        rows = self._conn().execute(sql + " ORDER BY updated_at, id LIMIT ?", (*args, limit))
+        return [load_json(PortalRun, row[0]) for row in rows]
+
+    def counts(self) -> dict[str, int]:
+        rows = self._conn().execute("SELECT status, COUNT(*) FROM runs GROUP BY status")
+        return {status.value: 0 for status in RunStatus} | dict(rows.fetchall())
+
+    def decide(self, run_id: str, step: str, approved: bool, actor: str | None = None) -> PortalRun:
+        """Approve (-> ``ready``) or reject (-> ``rejected``) the run's pending step."""
+        run = self._require(run_id)
+        if run.status is not RunStatus.AWAITING_APPROVAL or run.pending_step != step:
+            raise RunStateError(f"run {run_id} is {run.status.value}, not waiting for approval of {step!r}")
+        run.decisions.append(StepDecision(step=step, approved=approved, actor=actor))
+        run.status = RunStatus.READY if approved else RunStatus.REJECTED
+        if not self._update(run, "status = ? AND pending_step = ?", (RunStatus.AWAITING_APPROVAL.value, step)):
+            raise RunStateError(f"run {run_id} was decided concurrently")
+        return run
+
+    def retry(self, run_id: str) -> PortalRun:
+        """Make a failed, needs_login or unknown (checked on the portal) run ready again."""
+        run = self._require(run_id)
+        if run.status not in _RETRYABLE:
+            raise RunStateError(f"run {run_id} is {run.status.value}; only failed, needs_login or unknown runs can be retried")
+        previous = run.status
+        # an approval is spent once its step was attempted: a retried run asks again
+        run.status, run.error, run.pending_step = RunStatus.READY, None, None
+        if not self._update(run, "status = ?", (previous.value,)):
+            raise RunStateError(f"run {run_id} changed concurrently")
+        return run
+
+    def claim(self, run_id: str | None = None) -> tuple[PortalRun, str] | None:
+        """Lease a ``ready`` run (that one, or the oldest) to the caller: (run, lease token) or None."""
+        conn = self._conn()
+        for _ in range(5):
+            if run_id is None:
+                row = conn.execute(
+                    "SELECT id FROM runs WHERE status = ? ORDER BY updated_at, id LIMIT 1", (RunStatus.READY.value,)
+                ).fetchone()
+                if row is None:
+                    return None
+                candidate = row[0]
+            else:
+                candidate = run_id
+            run = self.get(candidate)
+            if run is None or run.status is not RunStatus.READY:
+                if run_id is not None:
+                    return None
+                continue
+            token = secrets.token_hex(8)
+            run.status = RunStatus.RUNNING
+            if self._update(run, "status = ?", (RunStatus.READY.value,), lease_token=token):
+                return run, token
+        return None
+
+    def save(self, run: PortalRun, token: str) -> None:
+        """Write back a leased run (renewing the lease while it is still running)."""
+        leased = run.status in (RunStatus.RUNNING, RunStatus.SUBMITTING)
+        if not self._update(run, "lease_token = ?", (token,), lease_token=token if leased else None):
+            raise RunStateError(f"lost the lease on run {run.id}")
+
+    def recover(self, now: float | None = None) -> int:
+        """Runs whose worker's lease expired: ``running`` -> ``ready``, ``submitting`` -> ``unknown``."""
+        now = time.time() if now is None else now
+        touched = 0
+        rows = self._conn().execute(
+            "SELECT id, lease_token FROM runs WHERE status IN (?, ?) AND lease_until < ?",
+            (RunStatus.RUNNING.value, RunStatus.SUBMITTING.value, now),
+        ).fetchall()
+        for run_id, token in rows:
+            run = self.get(run_id)
+            if run.status is RunStatus.SUBMITTING:
+                run.status, run.error = RunStatus.UNKNOWN, "worker lost while submitting"
+                run.pending_step = None  # its approval was used; retrying must not submit without a new one
+            else:
+                run.status = RunStatus.READY
+            touched += self._update(run, "lease_token = ?", (token,))
+        return touched
+
+    def close(self) -> None:
+        self._pool.close()
+
+    def _require(self, run_id: str) -> PortalRun:
+        run = self.get(run_id)
+        if run is None:
+            raise KeyError(run_id)
+        return run
+
+    def _update(self, run: PortalRun, condition: str, args: tuple, lease_token: str | None = None) -> bool:
+        run.updated_at = datetime.utcnow()
+        lease_until = time.time() + self.lease_s if lease_token else None
+        conn = self._conn()
+        with conn:
+            cur = conn.execute(
+                "UPDATE runs SET status = ?, pending_step = ?, lease_token = ?, lease_until = ?, updated_at = ?, data = ?"
+                f" WHERE id = ? AND {condition}",
+                (
+                    run.status.value,
+                    run.pending_step,
+                    lease_token,
+                    lease_until,
+                    run.updated_at.isoformat(),
+                    dump_json(run, pretty=False),
+                    run.id,
+                    *args,
+                ),
+            )
+        return cur.rowcount == 1
+
+
+class PortalRunner:
+    """Executes ``ready`` runs up to their next approval point. Any number of processes may run one."""
+
+    def __init__(
+        self,
+        store: RunStore,
+        engine: PlaywrightEngine | None = None,
+        credentials: tuple[str, str] | None = None,
+        session_store: SessionStore | None = None,
+        timing_store: TimingStore | None = None,
+    ):
+        self.store = store
+        self.engine = engine
+        self.credentials = credentials
+        self.session_store = session_store
+        self.timing_store = timing_store
+
+    def start(
+        self,
+        case_id: str,
+        portal_url: str | None = None,
+        documents: dict[str, Path] | None = None,
+        approve_each_step: bool = True,
+    ) -> PortalRun:
+        """Create a run; it is ``ready`` until a worker reaches its first approval point."""
+        run = PortalRun(
+            id=uuid.uuid4().hex[:12],
+            case_id=case_id,
+            portal_url=portal_url,
+            documents=documents or {},
+            approve_each_step=approve_each_step,
+        )
+        return self.store.create(run)
+
+    def advance(self, run_id: str | None = None) -> PortalRun | None:
+        """Claim a ready run (that one, or the oldest) and execute it until it has to wait or ends.
+        Returns the run as saved, or None if there was nothing to claim.
+        """
+        claimed = self.store.claim(run_id)
+        if claimed is None:
+            return None
+        run, token = claimed
+        steps = default_steps(run.portal_url)
+        upcoming = next((s for s in steps if s["id"] not in run.completed_steps), None)
+        if upcoming is not None and self._needs_approval(run, upcoming) and not self._approved(run, upcoming["id"]):
+            # nothing approved to do yet: suspend without opening a browser
+            run.status, run.pending_step = RunStatus.AWAITING_APPROVAL, upcoming["id"]
+            run.awaiting_since = datetime.utcnow()
+            self.store.save(run, token)
+            return run
+
+        suspended_at: list[str] = []
+        submitting = False
+
+        def gate(name: str, step: dict[str, Any]) -> bool:
+            if not suspended_at and step["id"] == run.pending_step and self._approved(run, step["id"]):
+                return True
+            suspended_at.append(step["id"])
+            return False
+
+        def progress(step: dict[str, Any], result: dict[str, Any] | None) -> None:
+            nonlocal submitting
+            if result is None:
+                if step.get("danger"):
+                    submitting = True
+                    run.status = RunStatus.SUBMITTING
+                    self.store.save(run, token)
+                return
+            if step["id"] not in run.completed_steps:
+                run.completed_steps.append(step["id"])
+            run.steps = [s for s in run.steps if s["id"] != step["id"]] + [result]
+            self.store.save(run, token)
+
+        svc = PortalAutomationService(
+            approve_each_step=run.approve_each_step,
+            approval_callback=gate,
+            engine=self.engine,
+            credentials=self.credentials,
+            session_store=self.session_store,
+        )
+        try:
+            outcome = svc.run_flow(
+                run.case_id,
+                portal_url=run.portal_url,
+                documents=run.documents,
+                resume_after=list(run.completed_steps),
+                progress=progress,
+                run_id=run.id,
+                approval_waits=self._approval_waits(run),
+            )
+        except Exception as e:  # the browser itself failed, not a step
+            run.status = RunStatus.UNKNOWN if submitting else RunStatus.FAILED
+            run.error, run.pending_step = str(e), None
+            self.store.save(run, token)
+            return run
+        self._record_timing(run, steps, outcome, suspended=bool(suspended_at))
+        if outcome["status"] == "aborted":
+            run.status, run.pending_step = RunStatus.AWAITING_APPROVAL, suspended_at[0]
+            run.awaiting_since = datetime.utcnow()
+        else:
+            run.status = _OUTCOMES[outcome["status"]]
+            if run.status is RunStatus.FAILED and submitting:
+                run.status = RunStatus.UNKNOWN
+            run.pending_step = None
+            run.confirmation = outcome.get("confirmation")
+            run.error = outcome.get("error")
+        self.store.save(run, token)
+        return run
+
+    def work(self, poll_s: float = 2.0, stop: threading.Event | None = None, once: bool = False) -> int:
+        """Worker loop: recover abandoned runs, advance every ready one, sleep, repeat. Returns runs advanced."""
+        stop = stop or threading.Event()
+        advanced = 0
+        while not stop.is_set():
+            self.store.recover()
+            while not stop.is_set() and self.advance() is not None:
+                advanced += 1
+            if once:
+                break
+            stop.wait(poll_s)
+        return advanced
+
+    def _record_timing(self, run: PortalRun, steps: list[dict[str, Any]], outcome: dict[str, Any], suspended: bool) -> None:
+        """Add this segment to the run's one flow in the timing store. A suspension isn't a decline:
+        its span is dropped (the step is timed, with its real approval wait, when it runs).
+        """
+        if self.timing_store is None or self.engine is None:  # dry runs say nothing about the portal
+            return
+        if suspended:
+            outcome = {**outcome, "status": RunStatus.AWAITING_APPROVAL.value, "timings": outcome["timings"][:-1]}
+        portal = SessionStore.portal_key(steps[0]["url"])
+        self.timing_store.record(run.id, portal, run.case_id, outcome, accumulate=True)
+
+    @staticmethod
+    def _approval_waits(run: PortalRun) -> dict[str, float]:
+        """The pending step's approval wait: from the suspension to the decision."""
+        decision = next((d for d in reversed(run.decisions) if d.step == run.pending_step), None)
+        if decision is None or run.awaiting_since is None:
+            return {}
+        return {run.pending_step: round(max(0.0, (decision.at - run.awaiting_since).total_seconds() * 1000), 1)}
+
+    @staticmethod
+    def _needs_approval(run: PortalRun, step: dict[str, Any]) -> bool:
+        return run.approve_each_step or bool(step.get("danger"))
+
+    @staticmethod
+    def _approved(run: PortalRun, step_id: str) -> bool:
+        decision = next((d for d in reversed(run.decisions) if d.step == step_id), None)
+        return run.pending_step == step_id and decision is not None and decision.approved
@@ -1,54 +1,264 @@
 """Portal automation: Playwright flow with approve-each-step; never submit without confirmation."""
 
+import time
+import uuid
+from dataclasses import asdict
 from pathlib import Path
 from typing import Callable, Any
 
 from permitting_agent.models import IntakeCase
-from permitting_agent.adapters import get_adapter
+from permitting_agent.portal_automation.engine import (
+    DEFAULT_SELECTORS,
+    LoginRequired,
+    PlaywrightEngine,
+)
+from permitting_agent.portal_automation.network import sum_network
+from permitting_agent.portal_automation.sessions import SessionStore
+from permitting_agent.portal_automation.tracing import CaptureOptions, TimingStore
 
 
 # Step approval callback: (step_name, step_data) -> True to proceed, False to abort
 ApprovalCallback = Callable[[str, dict[str, Any]], bool]
+# Progress hook: (step_data, None) once a step is approved and about to run, (step_data, result) after it ran
+ProgressHook = Callable[[dict[str, Any], dict[str, Any] | None], None]
+
+DEFAULT_PORTAL_URL = "https://example.gov/permits"
+
+
+def default_steps(portal_url: str | None = None) -> list[dict[str, Any]]:
+    """The standard submission flow. ``danger`` steps are always sent for approval."""
+    return [
+        {"id": "navigate", "name": "Navigate to portal", "action": "navigate", "url": portal_url or DEFAULT_PORTAL_URL},
+        {"id": "login", "name": "Login (if required)", "action": "login", "note": "Only if user supplied credentials"},
+        {
+            "id": "upload_application",
+            "name": "Upload application form",
+            "action": "upload",
+            "document": "application",
+            "selector": DEFAULT_SELECTORS["application"],
+            "note": "User must confirm",
+        },
+        {
+            "id": "upload_site_plan",
+            "name": "Upload site plan",
+            "action": "upload",
+            "document": "site_plan",
+            "selector": DEFAULT_SELECTORS["site_plan"],
+            "note": "User must confirm",
+        },
+        {
+            "id": "pay_fee",
+            "name": "Pay fee",
+            "action": "check",
+            "selector": DEFAULT_SELECTORS["fee"],
+            "note": "User must confirm; only acknowledges the fee, never enters payment details",
+        },
+        {
+            "id": "submit",
+            "name": "Submit application",
+            "action": "submit",
+            "selector": DEFAULT_SELECTORS["submit"],
+            "danger": "Final submit; requires explicit approval",
+        },
+    ]
 
 
 class PortalAutomationService:
-    """Run Playwright-based submission flow with human-in-the-loop. Never submits without approval."""
+    """Run Playwright-based submission flow with human-in-the-loop. Never submits without approval.
+
+    Without an ``engine`` the flow is a dry run: approvals are asked, nothing is opened. With a
+    ``PlaywrightEngine`` each approved step runs in an isolated context of its warm browser.
+    With a ``session_store`` a login is saved after it succeeds and later flows for the same
+    portal and username start from it, so the ``login`` step is usually skipped. A
+    ``timing_store`` records each flow's step spans; ``capture`` keeps a trace, screenshots
+    and/or a HAR per flow under ``artifacts_dir/<run id>``.
+    """
 
     def __init__(
         self,
         approve_each_step: bool = True,
         approval_callback: ApprovalCallback | None = None,
+        engine: PlaywrightEngine | None = None,
+        credentials: tuple[str, str] | None = None,
+        session_store: SessionStore | None = None,
+        timing_store: TimingStore | None = None,
+        artifacts_dir: Path | None = None,
+        capture: CaptureOptions | None = None,
     ):
+        if engine is not None and approval_callback is None:
+            raise ValueError("a browser run needs an approval_callback: nothing is submitted without approval")
         self.approve_each_step = approve_each_step
         self._approval_callback = approval_callback or _default_approval_callback
+        self.engine = engine
+        self.credentials = credentials
+        self.session_store = session_store
+        self.timing_store = timing_store
+        self.artifacts_dir = artifacts_dir
+        self.capture = capture
 
     def run_flow(
         self,
         case_id: str,
         case: IntakeCase | None = None,
         portal_url: str | None = None,
+        documents: dict[str, Path] | None = None,
+        resume_after: list[str] | None = None,
+        progress: ProgressHook | None = None,
+        run_id: str | None = None,
+        approval_waits: dict[str, float] | None = None,
     ) -> dict[str, Any]:
-        """Execute submission flow steps; after each step call approval_callback. Never submit without confirm."""
-        # Stub: no real Playwright run in MVP; we only demonstrate the hook points
-        steps: list[dict[str, Any]] = [
-            {"id": "navigate", "name": "Navigate to portal", "url": portal_url or "https://example.gov/permits"},
-            {"id": "login", "name": "Login (if required)", "note": "Only if user supplied credentials"},
-            {"id": "upload_application", "name": "Upload application form", "note": "User must confirm"},
-            {"id": "upload_site_plan", "name": "Upload site plan", "note": "User must confirm"},
-            {"id": "pay_fee", "name": "Pay fee", "note": "User must confirm"},
-            {"id": "submit", "name": "Submit application", "danger": "Final submit; requires explicit approval"},
-        ]
+        """Execute submission flow steps; before each step call approval_callback (before ``submit``
+        always, even when approve_each_step is off). Never submit without confirm.
+
+        ``resume_after`` lists steps an interrupted run already completed: they were approved then,
+        so they are redone in the fresh browser context without asking again (a submit is never
+        redone). ``progress`` is told about each step before and after it runs. ``run_id`` names the
+        flow (default: a new id); ``approval_waits`` gives the approval wait in ms of steps approved
+        outside the callback (e.g. a persisted run's decision), recorded instead of the callback's time.
+
+        The outcome's ``timings`` has one span per step reached (``approval_ms`` waiting for the
+        callback, ``run_ms`` in the browser) and ``timing`` the flow's totals, including context
+        setup; with a ``timing_store``, browser runs are also recorded under the portal's host.
+        """
+        started = time.perf_counter()
+        run_id = run_id or uuid.uuid4().hex[:12]
+        approval_waits = approval_waits or {}
+        steps = default_steps(portal_url)
+        replay = set(resume_after or ())
         completed: list[str] = []
+        results: list[dict[str, Any]] = []
+        spans: list[dict[str, Any]] = []
+        session = None
+        artifacts_dir = None
+        setup_ms = 0.0
+        if self.engine is not None:
+            docs = documents if documents is not None else case_documents(case)
+            saved = self._saved_state(steps[0]["url"])
+            options: dict[str, Any] = {"storage_state": saved} if saved else {}
+            if self.capture is not None and self.capture.enabled and self.artifacts_dir is not None:
+                artifacts_dir = self.artifacts_dir / run_id
+                options.update(artifacts_dir=artifacts_dir, capture=self.capture)
+            session = self.engine.open_session(docs, self.credentials, **options)
+            setup_ms = _ms_since(started)
+        try:
+            outcome = self._run_steps(steps, replay, session, progress, completed, results, spans, approval_waits)
+        finally:
+            if session is not None:
+                self.engine.close_session(session)
+        outcome.update(completed_steps=completed, steps=results, run_id=run_id, timings=spans)
+        outcome["timing"] = {
+            "setup_ms": setup_ms,
+            "run_ms": round(sum(s["run_ms"] for s in spans), 1),
+            "approval_ms": round(sum(s["approval_ms"] for s in spans), 1),
+            # a wait recorded from outside happened before this call started
+            "total_ms": round(_ms_since(started) + sum(approval_waits.get(s["step"], 0.0) for s in spans), 1),
+        }
+        if artifacts_dir is not None:
+            outcome["artifacts"] = str(artifacts_dir)
+        if outcome["status"] == "completed":
+            if session is not None:
+                outcome["session_reused"] = session.restored and any(
+                    r["id"] == "login" and r["status"] == "skipped" for r in results
+                )
+            if any(r["network"] for r in results):
+                outcome["network"] = sum_network([r["network"] for r in results if r["network"]])
+            if results and results[-1]["id"] == "submit" and results[-1]["detail"]:
+                outcome["confirmation"] = results[-1]["detail"]
+        if self.timing_store is not None and session is not None:  # dry runs say nothing about the portal
+            self.timing_store.record(run_id, SessionStore.portal_key(steps[0]["url"]), case_id, outcome)
+        return outcome
+
+    def _run_steps(
+        self,
+        steps: list[dict[str, Any]],
+        replay: set[str],
+        session: Any,
+        progress: ProgressHook | None,
+        completed: list[str],
+        results: list[dict[str, Any]],
+        spans: list[dict[str, Any]],
+        approval_waits: dict[str, float],
+    ) -> dict[str, Any]:
+        """The step loop of ``run_flow``; returns the outcome's status fields."""
         for step in steps:
-            if self.approve_each_step:
+            if step["id"] in replay and step.get("danger"):
+                completed.append(step["id"])
+                continue
+            span = {
+                "step": step["id"],
+                "action": step.get("action"),
+                "status": "done",
+                "replayed": step["id"] in replay,
+                "approval_ms": 0.0,
+                "run_ms": 0.0,
+            }
+            spans.append(span)
+            if step["id"] not in replay and (self.approve_each_step or step.get("danger")):
+                asked = time.perf_counter()
                 ok = self._approval_callback(step["name"], step)
+                span["approval_ms"] = approval_waits.get(step["id"], _ms_since(asked))
                 if not ok:
-                    return {"status": "aborted", "completed_steps": completed, "aborted_at": step["id"]}
+                    span["status"] = "declined"
+                    return {"status": "aborted", "aborted_at": step["id"]}
+            if progress is not None:
+                progress(step, None)
+            if session is not None:
+                ran = time.perf_counter()
+                try:
+                    result = self.engine.run_step(session, step)
+                except LoginRequired as e:
+                    span.update(status="needs_login", run_ms=_ms_since(ran))
+                    return {"status": "needs_login", "failed_at": step["id"], "error": str(e)}
+                except Exception as e:
+                    span.update(status="failed", run_ms=_ms_since(ran))
+                    if step["id"] == "login":
+                        self._forget_state(steps[0]["url"])
+                    return {"status": "failed", "failed_at": step["id"], "error": str(e)}
+                span.update(status=result.status, run_ms=_ms_since(ran))
+                results.append(asdict(result))
+                if step["id"] == "login" and result.status == "done":
+                    self._save_state(steps[0]["url"], session)
             completed.append(step["id"])
-            # Stub: real implementation would run Playwright here
-        return {"status": "completed", "completed_steps": completed}
+            if progress is not None:
+                progress(step, results[-1] if session is not None else {"id": step["id"], "status": "done"})
+        return {"status": "completed"}
+
+    def _saved_state(self, portal_url: str) -> dict[str, Any] | None:
+        if self.session_store is None or self.credentials is None:
+            return None
+        return self.session_store.load(portal_url, self.credentials[0])
+
+    def _save_state(self, portal_url: str, session: Any) -> None:
+        if self.session_store is not None and self.credentials is not None:
+            self.session_store.save(portal_url, self.credentials[0], self.engine.storage_state(session))
+
+    def _forget_state(self, portal_url: str) -> None:
+        if self.session_store is not None and self.credentials is not None:
+            self.session_store.invalidate(portal_url, self.credentials[0])
+
+
+def case_documents(case: IntakeCase | None) -> dict[str, Path]:
+    """Pick the application form and site plan from the case's documents by file name."""
+    if case is None:
+        return {}
+    paths = [Path(p) for p in case.request.existing_doc_paths]
+    docs: dict[str, Path] = {}
+    for path in paths:
+        name = path.name.lower()
+        if "site" in name or "plan" in name:
+            docs.setdefault("site_plan", path)
+        elif "app" in name or "form" in name:
+            docs.setdefault("application", path)
+    rest = [p for p in paths if p not in docs.values()]
+    if "application" not in docs and rest:
+        docs["application"] = rest[0]
+    return docs
 
 
 def _default_approval_callback(step_name: str, step_data: dict[str, Any]) -> bool:
     """Default: no interactive prompt in library; CLI will inject prompt. Return True to proceed in tests."""
     return True
+
+
+def _ms_since(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 1)
@@ -0,0 +1,92 @@
+"""Saved portal logins: encrypted Playwright storage state per portal and credential.
+
+Logging in to a municipal portal can take several seconds and portals rate-limit logins, so after
+a successful login the browser context's storage state (cookies, localStorage) is saved and
+handed to the next flow for the same portal and username. Files are Fernet-encrypted with the
+key in ``PERMITTING_SESSION_KEY``; nothing is stored without a key. A saved state is used until
+its earliest persistent cookie expires (at most ``max_age``); whether the portal still accepts it
+shows up for free on the flow's first navigation, and a refused state just means a normal login.
+"""
+
+import hashlib
+import os
+import time
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+from permitting_agent.serialization import dumps, loads, write_bytes_atomic
+
+SESSION_KEY_ENV = "PERMITTING_SESSION_KEY"
+DEFAULT_MAX_AGE_S = 12 * 3600
+
+
+def state_expiry(storage_state: dict[str, Any], saved_at: float, max_age_s: float) -> float:
+    """When a storage state stops being worth trying: its earliest persistent cookie expiry, capped."""
+    expiries = [c["expires"] for c in storage_state.get("cookies", []) if c.get("expires", -1) > 0]
+    return min([saved_at + max_age_s, *expiries])
+
+
+class SessionStore:
+    """Encrypted storage states under ``<data_dir>/portal_sessions``, one file per (portal, username)."""
+
+    def __init__(self, data_dir: Path, key: str | bytes | None = None, max_age_s: float = DEFAULT_MAX_AGE_S):
+        key = key or os.environ.get(SESSION_KEY_ENV)
+        if not key:
+            raise ValueError(f"saved portal sessions need an encryption key in {SESSION_KEY_ENV}")
+        self._fernet = _fernet_module().Fernet(key)
+        self.dir = Path(data_dir) / "portal_sessions"
+        self.max_age_s = max_age_s
+
+    @staticmethod
+    def portal_key(portal_url: str) -> str:
+        """Sessions are shared by every page of a portal: scheme and host."""
+        parts = urlsplit(portal_url)
+        return f"{parts.scheme}://{parts.netloc}".lower()
+
+    def path(self, portal_url: str, username: str) -> Path:
+        digest = hashlib.sha256(f"{self.portal_key(portal_url)}\n{username.lower()}".encode()).hexdigest()
+        return self.dir / f"{digest[:32]}.session"
+
+    def load(self, portal_url: str, username: str, now: float | None = None) -> dict[str, Any] | None:
+        """The saved storage state, or None if there is none, it expired or it can't be decrypted."""
+        path = self.path(portal_url, username)
+        try:
+            token = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        try:
+            record = loads(self._fernet.decrypt(token, ttl=int(self.max_age_s)))
+        except _fernet_module().InvalidToken:
+            # expired past max_age, or written with another key
+            path.unlink(missing_ok=True)
+            return None
+        if record["expires_at"] <= (time.time() if now is None else now):
+            path.unlink(missing_ok=True)
+            return None
+        return record["storage_state"]
+
+    def save(self, portal_url: str, username: str, storage_state: dict[str, Any], now: float | None = None) -> Path:
+        saved_at = time.time() if now is None else now
+        record = {
+            "portal": self.portal_key(portal_url),
+            "saved_at": saved_at,
+            "expires_at": state_expiry(storage_state, saved_at, self.max_age_s),
+            "storage_state": storage_state,
+        }
+        self.dir.mkdir(parents=True, exist_ok=True)
+        path = self.path(portal_url, username)
+        write_bytes_atomic(path, self._fernet.encrypt(dumps(record, pretty=False)))
+        os.chmod(path, 0o600)
+        return path
+
+    def invalidate(self, portal_url: str, username: str) -> None:
+        self.path(portal_url, username).unlink(missing_ok=True)
+
+
+def _fernet_module():
+    try:
+        from cryptography import fernet
+    except ImportError as e:
+        raise RuntimeError("saved portal sessions need cryptography: pip install 'permitting-agent[sessions]'") from e
+    return fernet
@@ -0,0 +1,197 @@
+"""Per-step timing spans and debug artifacts for portal flows.
+
+``run_flow`` times every step twice over: how long a person took to approve it (``approval_ms``)
+and how long the browser took to do it (``run_ms``), plus the context setup before the first
+step. A ``TimingStore`` keeps those spans per portal so slow portals can be told apart from slow
+reviewers: ``portal_summary`` ranks portals by the browser time they cost, ``step_summary``
+shows which step (navigation, upload, fee, submit) is slow on one portal.
+
+``CaptureOptions`` turns on Playwright artifacts for a run (a trace, a screenshot after each
+step, a HAR of the traffic); they are written under ``<artifacts dir>/<run id>/``.
+"""
+
+import math
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable
+
+from permitting_agent.sqlite import ConnectionPool
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS flows (
+    run_id TEXT PRIMARY KEY,
+    portal TEXT NOT NULL,
+    case_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    setup_ms REAL NOT NULL,
+    run_ms REAL NOT NULL,
+    approval_ms REAL NOT NULL,
+    total_ms REAL NOT NULL,
+    artifacts TEXT,
+    at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS flows_by_portal ON flows (portal, at);
+CREATE TABLE IF NOT EXISTS spans (
+    run_id TEXT NOT NULL,
+    portal TEXT NOT NULL,
+    step TEXT NOT NULL,
+    action TEXT,
+    status TEXT NOT NULL,
+    replayed INTEGER NOT NULL,
+    approval_ms REAL NOT NULL,
+    run_ms REAL NOT NULL,
+    at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS spans_by_portal ON spans (portal, step, at);
+"""
+
+_FAILED = ("failed", "needs_login")
+
+
+@dataclass
+class CaptureOptions:
+    """Which Playwright artifacts to keep for a flow (browser runs only)."""
+
+    trace: bool = False  # trace.zip: open with `playwright show-trace`
+    screenshots: bool = False  # <step>.png after each executed step
+    har: bool = False  # network.har
+
+    @property
+    def enabled(self) -> bool:
+        return self.trace or self.screenshots or self.har
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile (``q`` in 0..100) of unsorted values; 0.0 for none."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class TimingStore:
+    """Step spans and flow totals of every recorded flow, queryable by portal."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._pool = ConnectionPool(self.path, _SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        return self._pool.conn()
+
+    def record(
+        self,
+        run_id: str,
+        portal: str,
+        case_id: str,
+        outcome: dict[str, Any],
+        at: float | None = None,
+        accumulate: bool = False,
+    ) -> None:
+        """Store one flow's ``timing`` totals and ``timings`` spans (from ``run_flow``'s outcome).
+        With ``accumulate`` the outcome is one more segment of a resumed run: its totals are added
+        to the run's flow row and its spans appended, and the latest status wins.
+        """
+        at = time.time() if at is None else at
+        totals = outcome["timing"]
+        conn = self._conn()
+        with conn:
+            if accumulate:
+                previous = conn.execute(
+                    "SELECT setup_ms, run_ms, approval_ms, total_ms FROM flows WHERE run_id = ?", (run_id,)
+                ).fetchone()
+                if previous is not None:
+                    keys = ("setup_ms", "run_ms", "approval_ms", "total_ms")
+                    totals = {k: round(totals[k] + v, 1) for k, v in zip(keys, previous)}
+            conn.execute(
+                "INSERT OR REPLACE INTO flows VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    run_id,
+                    portal,
+                    case_id,
+                    outcome["status"],
+                    totals["setup_ms"],
+                    totals["run_ms"],
+                    totals["approval_ms"],
+                    totals["total_ms"],
+                    outcome.get("artifacts"),
+                    at,
+                ),
+            )
+            conn.executemany(
+                "INSERT INTO spans VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (run_id, portal, s["step"], s["action"], s["status"], s["replayed"], s["approval_ms"], s["run_ms"], at)
+                    for s in outcome["timings"]
+                ],
+            )
+
+    def portal_summary(self, since: float | None = None) -> list[dict[str, Any]]:
+        """Per portal: flows, failures, browser time (total, p50, p95 per flow), setup and approval wait.
+        Portals costing the most browser time come first.
+        """
+        rows = self._conn().execute(
+            "SELECT portal, status, setup_ms, run_ms, approval_ms FROM flows WHERE at >= ?", (since or 0.0,)
+        )
+        by_portal: dict[str, list[tuple]] = {}
+        for portal, *row in rows:
+            by_portal.setdefault(portal, []).append(tuple(row))
+        summary = []
+        for portal, flows in by_portal.items():
+            browser = [setup + run for _, setup, run, _ in flows]
+            summary.append(
+                {
+                    "portal": portal,
+                    "flows": len(flows),
+                    "failed": sum(1 for status, *_ in flows if status in _FAILED),
+                    "browser_ms": round(sum(browser), 1),
+                    "p50_ms": percentile(browser, 50),
+                    "p95_ms": percentile(browser, 95),
+                    "setup_p50_ms": percentile([f[1] for f in flows], 50),
+                    "approval_p50_ms": percentile([f[3] for f in flows], 50),
+                }
+            )
+        return sorted(summary, key=lambda s: s["browser_ms"], reverse=True)
+
+    def step_summary(self, portal: str | None = None, since: float | None = None) -> list[dict[str, Any]]:
+        """Per (portal, step): count, p50/p95/max run time and median approval wait. Replayed steps of
+        resumed runs are left out so each approval is counted once.
+        """
+        sql = "SELECT portal, step, run_ms, approval_ms, status FROM spans WHERE replayed = 0 AND at >= ?"
+        args: list[Any] = [since or 0.0]
+        if portal is not None:
+            sql += " AND portal = ?"
+            args.append(portal)
+        groups: dict[tuple[str, str], list[tuple]] = {}
+        for portal_key, step, *row in self._conn().execute(sql + " ORDER BY rowid", args):
+            groups.setdefault((portal_key, step), []).append(tuple(row))
+        return [
+            {
+                "portal": portal_key,
+                "step": step,
+                "count": len(spans),
+                "failed": sum(1 for *_, status in spans if status == "failed"),
+                "p50_ms": percentile([s[0] for s in spans], 50),
+                "p95_ms": percentile([s[0] for s in spans], 95),
+                "max_ms": max(s[0] for s in spans),
+                "approval_p50_ms": percentile([s[1] for s in spans], 50),
+            }
+            for (portal_key, step), spans in groups.items()
+        ]
+
+    def flows(self, portal: str | None = None, limit: int = 20) -> list[dict[str, Any]]:
+        """Most recent flows (with their artifact directory, if captured)."""
+        sql = "SELECT run_id, portal, case_id, status, run_ms, approval_ms, artifacts, at FROM flows"
+        args: Iterable[Any] = ()
+        if portal is not None:
+            sql += " WHERE portal = ?"
+            args = (portal,)
+        rows = self._conn().execute(sql + " ORDER BY at DESC LIMIT ?", (*args, limit))
+        keys = ("run_id", "portal", "case_id", "status", "run_ms", "approval_ms", "artifacts", "at")
+        return [dict(zip(keys, row)) for row in rows]
+
+    def close(self) -> None:
+        self._pool.close()
@@ -1,13 +1,46 @@
-"""Crawl a portal URL and extract form fields (inputs, labels, required) from HTML."""
+"""Crawl a portal URL and extract form fields (inputs, labels, required) from HTML.
 
-from urllib.parse import urlparse
+``crawl_form_fields`` reads the forms on one page. Permit portals usually spread the application
+over a wizard of several pages, so ``FormDiscovery`` starts at the application URL and follows,
+concurrently, the same-origin links that lead to further steps: ``rel=next`` and Next/Continue
+links, step navigation, GET forms whose button says Next/Continue, and tabs that load their panel
+from another URL. It never submits a POST form. The fields of every page are merged into one
+``PortalFormSchema`` in wizard order, each field knowing its page and tab/fieldset section.
+``FormSchemaCache`` keeps the schema per portal URL so later runs skip the crawl.
+"""
+
+import asyncio
+import hashlib
+import re
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import urljoin, urlparse
 
 import httpx
 from bs4 import BeautifulSoup
+from robotexclusionrulesparser import RobotExclusionRulesParser
+
+from permitting_agent.models import PortalFormField, PortalFormPage, PortalFormSchema
+from permitting_agent.portal_research.crawler import can_fetch
+from permitting_agent.serialization import read_model, write_model
 
 # Default user agent; respect robots.txt via caller
 DEFAULT_USER_AGENT = "PermittingAgent/1.0 (compliance; +https://github.com/permitting-agent)"
 DEFAULT_TIMEOUT = 15.0
+DEFAULT_CONCURRENCY = 4
+DEFAULT_MAX_PAGES = 20
+DEFAULT_MAX_DEPTH = 8
+DEFAULT_SCHEMA_MAX_AGE_S = 7 * 24 * 3600
+
+FIELD_TYPES = ("text", "email", "tel", "number", "url", "textarea", "select")
+_SKIP_INPUT_TYPES = ("hidden", "submit", "button", "image")
+# Link or button text that moves to the next wizard step / text that must never be followed
+_NEXT = re.compile(r"\b(next|continue|proceed|step\s*\d+|page\s*\d+)\b", re.I)
+_STOP = re.compile(r"\b(log\s*out|sign\s*out|cancel|delete|withdraw|submit|pay)\b", re.I)
+_STEP_CLASS = re.compile(r"\b(wizard|steps?|stepper|progress)\b", re.I)
+_SKIP_SUFFIXES = (".pdf", ".doc", ".docx", ".xls", ".xlsx", ".zip", ".jpg", ".jpeg", ".png", ".gif", ".svg", ".css", ".js")
 
 
 def crawl_form_fields(
@@ -18,10 +51,9 @@ def crawl_form_fields(
 ) -> list[dict]:
     """
     Fetch URL, parse HTML, and return a list of form fields found on the page.
-    Each item: {"name": str, "label": str, "type": str, "required": bool}.
+    Each item: {"name": str, "label": str, "type": str, "required": bool, "section": str | None}.
     Returns [] on fetch or parse failure.
     """
-    fields: list[dict] = []
     try:
         use_client = client or httpx.Client()
         try:
@@ -39,36 +71,305 @@ def crawl_form_fields(
                 use_client.close()
     except Exception:
         return []
+    return extract_form_fields(soup)
 
-    seen_names: set[str] = set()
-    for form in soup.find_all("form"):
-        for tag in form.find_all(["input", "select", "textarea"]):
+
+def extract_form_fields(soup: BeautifulSoup, seen_names: set[str] | None = None) -> list[dict]:
+    """Visible fields of the page's forms (and of tab panels loaded outside a form), in document order.
+    Names already in ``seen_names`` are skipped; new ones are added to it.
+    """
+    seen_names = set() if seen_names is None else seen_names
+    # Label and tab texts are looked up once per page, not searched for once per field
+    labels: dict[str, str] = {}
+    for label_el in soup.find_all("label"):
+        target, text = label_el.get("for"), label_el.get_text(strip=True)
+        if target and text and target not in labels:
+            labels[target] = text[:200]
+    tabs = {t["id"]: t.get_text(strip=True) for t in soup.find_all(attrs={"role": "tab"}) if t.get("id")}
+
+    containers = soup.find_all(
+        lambda t: t.name == "form" or (t.get("role") == "tabpanel" and t.find_parent("form") is None)
+    )
+    fields: list[dict] = []
+    for container in containers:
+        for tag in container.find_all(["input", "select", "textarea"]):
             name = tag.get("name") or tag.get("id")
             if not name or name in seen_names:
                 continue
-            if tag.name == "input" and (tag.get("type") or "text").lower() in ("hidden", "submit", "button", "image"):
+            if tag.name == "input" and (tag.get("type") or "text").lower() in _SKIP_INPUT_TYPES:
                 continue
             seen_names.add(name)
-            label = _get_label(soup, tag)
+            label = _get_label(labels, tag)
             type_ = (tag.get("type") or "text").lower() if tag.name == "input" else tag.name
             required = tag.has_attr("required") or (tag.get("aria-required") == "true")
             fields.append({
                 "name": name,
                 "label": label or name.replace("_", " ").replace("-", " ").title(),
-                "type": type_ if type_ in ("text", "email", "tel", "number", "url", "textarea", "select") else "text",
+                "type": type_ if type_ in FIELD_TYPES else "text",
                 "required": required,
+                "section": _get_section(tabs, tag),
             })
     return fields
 
 
-def _get_label(soup: BeautifulSoup, tag) -> str | None:
+def wizard_links(soup: BeautifulSoup, page_url: str) -> list[tuple[str, str | None]]:
+    """Same-origin URLs that lead to further steps of the form on this page, in document order, as
+    (url, tab text) pairs; the tab text is set for tabs that load their panel from another URL.
+    """
+    origin = urlparse(page_url).netloc
+    found: dict[str, str | None] = {}
+
+    def add(href: str | None, tab: str | None = None) -> None:
+        if not href or href.startswith(("#", "javascript:", "mailto:", "tel:")):
+            return
+        try:
+            url = urljoin(page_url, href.strip()).split("#", 1)[0]
+            parts = urlparse(url)
+        except ValueError:  # e.g. "http://[bad/x": not a link anyone can follow
+            return
+        if parts.scheme in ("http", "https") and parts.netloc == origin and not parts.path.lower().endswith(_SKIP_SUFFIXES):
+            found.setdefault(url, tab)
+
+    # one pass over the candidates, in document order
+    for tag in soup.find_all(lambda t: t.name in ("a", "link", "form") or t.get("role") == "tab"):
+        if tag.name == "form":
+            button = tag.find(["button", "input"], attrs={"type": "submit"}) or tag.find("button")
+            label = (button.get_text(strip=True) or button.get("value", "")) if button else ""
+            if (tag.get("method") or "get").lower() == "get" and _NEXT.search(label) and not _STOP.search(label):
+                add(tag.get("action") or page_url)
+            continue
+        text = " ".join(filter(None, (tag.get_text(" ", strip=True), tag.get("aria-label"), tag.get("title"))))
+        if _STOP.search(text):
+            continue
+        if tag.get("role") == "tab":
+            add(tag.get("href") or tag.get("data-url") or tag.get("data-href") or tag.get("hx-get"), text or None)
+        elif (
+            "next" in (tag.get("rel") or ())
+            or _NEXT.search(text)
+            or _STEP_CLASS.search(" ".join(tag.get("class") or ()))
+            or tag.find_parent(class_=_STEP_CLASS) is not None
+        ):
+            add(tag.get("href"))
+    return list(found.items())
+
+
+@dataclass
+class DiscoveryStats:
+    """Counters for one form discovery crawl."""
+
+    fetched: int = 0
+    failed: int = 0
+    robots_skipped: int = 0
+    budget_skipped: int = 0  # links not followed because max_pages or max_depth was reached
+    elapsed_s: float = 0.0
+
+
+class FormDiscovery:
+    """Concurrent crawl of an application wizard, from its first page.
+
+    Follows only ``wizard_links`` on the start URL's origin, at most ``max_depth`` hops and
+    ``max_pages`` fetches, ``concurrency`` pages at a time, skipping what robots.txt disallows.
+    Pages are ordered by the path that reached them (link order at each hop), so a step list or a
+    chain of Next links both come out in wizard order.
+    """
+
+    def __init__(
+        self,
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        max_pages: int = DEFAULT_MAX_PAGES,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+        user_agent: str = DEFAULT_USER_AGENT,
+        client: httpx.AsyncClient | None = None,
+    ):
+        self.concurrency = max(1, concurrency)
+        self.max_pages = max(1, max_pages)
+        self.max_depth = max_depth
+        self.user_agent = user_agent
+        self._client = client
+        self.stats = DiscoveryStats()
+
+    async def discover(self, url: str) -> PortalFormSchema:
+        """Crawl the wizard starting at ``url`` and merge its fields into one schema."""
+        self.stats = DiscoveryStats()
+        started = time.perf_counter()
+        client = self._client or httpx.AsyncClient(
+            headers={"User-Agent": self.user_agent},
+            timeout=DEFAULT_TIMEOUT,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=self.concurrency, max_keepalive_connections=self.concurrency),
+        )
+        queue: asyncio.Queue[tuple[str, tuple[int, ...], str | None]] = asyncio.Queue()
+        seen: set[str] = set()
+        pages: list[tuple[tuple[int, ...], str, str | None, str | None, BeautifulSoup]] = []
+
+        def schedule(link: str, path: tuple[int, ...], tab: str | None = None) -> None:
+            if link in seen:
+                return
+            if len(seen) >= self.max_pages or len(path) > self.max_depth:
+                self.stats.budget_skipped += 1
+                return
+            seen.add(link)
+            queue.put_nowait((link, path, tab))
+
+        async def worker(robots: RobotExclusionRulesParser) -> None:
+            while True:
+                link, path, tab = await queue.get()
+                try:
+                    if not can_fetch(robots, link, self.user_agent):
+                        self.stats.robots_skipped += 1
+                        continue
+                    try:
+                        soup = await self._fetch(client, link)
+                        if soup is None:
+                            continue
+                        links = wizard_links(soup, link)
+                    except Exception:  # one unparseable page must not stall the crawl
+                        self.stats.failed += 1
+                        continue
+                    pages.append((path, link, _page_title(soup), tab, soup))
+                    for i, (nxt, nxt_tab) in enumerate(links):
+                        schedule(nxt, path + (i,), nxt_tab)
+                finally:
+                    queue.task_done()
+
+        try:
+            robots = await self._robots(client, url)
+            schedule(url.split("#", 1)[0], ())
+            workers = [asyncio.create_task(worker(robots)) for _ in range(self.concurrency)]
+            try:
+                await queue.join()
+            finally:
+                for w in workers:
+                    w.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+        finally:
+            if self._client is None:
+                await client.aclose()
+
+        self.stats.elapsed_s = round(time.perf_counter() - started, 3)
+        return _merge(url, pages)
+
+    async def _fetch(self, client: httpx.AsyncClient, url: str) -> BeautifulSoup | None:
+        try:
+            r = await client.get(url)
+        except httpx.HTTPError:
+            self.stats.failed += 1
+            return None
+        if r.status_code != 200 or "html" not in r.headers.get("Content-Type", "text/html"):
+            self.stats.failed += 1
+            return None
+        self.stats.fetched += 1
+        return BeautifulSoup(r.text, "html.parser")
+
+    async def _robots(self, client: httpx.AsyncClient, url: str) -> RobotExclusionRulesParser:
+        parser = RobotExclusionRulesParser()
+        parser.user_agent = self.user_agent
+        try:
+            r = await client.get(urljoin(url, "/robots.txt"))
+            if r.status_code == 200:
+                parser.parse(r.text)
+        except httpx.HTTPError:
+            pass
+        return parser
+
+
+def _merge(url: str, pages: list[tuple[tuple[int, ...], str, str | None, str | None, BeautifulSoup]]) -> PortalFormSchema:
+    """One schema from the fetched pages: wizard order, first occurrence of a field name wins, a
+    tab loaded from another URL adds its fields to the page it belongs to.
+    """
+    schema = PortalFormSchema(portal_url=url)
+    fields: list[PortalFormField] = []
+    seen_names: set[str] = set()
+    page_of: dict[tuple[int, ...], int] = {}
+    for path, link, title, tab, soup in sorted(pages, key=lambda p: p[0]):
+        found = extract_form_fields(soup, seen_names)
+        parent = page_of.get(path[:-1]) if tab and path else None
+        if parent is not None:
+            page_of[path] = parent
+            fields.extend(PortalFormField(**{**f, "page": parent, "section": f["section"] or tab}) for f in found)
+            continue
+        if not found and schema.pages:
+            continue  # a step without fields (a summary, a help page) is not a page of the form
+        schema.pages.append(PortalFormPage(url=link, title=title))
+        page_of[path] = len(schema.pages) - 1
+        fields.extend(PortalFormField(page=page_of[path], **f) for f in found)
+    schema.fields = sorted(fields, key=lambda f: f.page)
+    return schema
+
+
+class FormSchemaCache:
+    """Discovered schemas on disk, one JSON file per portal URL, trusted for ``max_age_s``."""
+
+    def __init__(self, cache_dir: Path, max_age_s: float = DEFAULT_SCHEMA_MAX_AGE_S):
+        self.cache_dir = Path(cache_dir)
+        self.max_age_s = max_age_s
+
+    def path(self, url: str) -> Path:
+        return self.cache_dir / f"{hashlib.sha256(url.encode()).hexdigest()[:32]}.json"
+
+    def get(self, url: str, now: datetime | None = None) -> PortalFormSchema | None:
+        path = self.path(url)
+        if not path.exists():
+            return None
+        try:
+            schema = read_model(path, PortalFormSchema)
+        except ValueError:
+            return None
+        age = ((now or datetime.utcnow()) - schema.discovered_at).total_seconds()
+        return schema if age <= self.max_age_s and schema.portal_url == url else None
+
+    def put(self, schema: PortalFormSchema) -> Path:
+        return write_model(self.path(schema.portal_url), schema)
+
+    def invalidate(self, url: str) -> None:
+        self.path(url).unlink(missing_ok=True)
+
+
+def discover_form_schema(
+    url: str,
+    *,
+    cache: FormSchemaCache | None = None,
+    refresh: bool = False,
+    **options,
+) -> PortalFormSchema:
+    """Blocking ``FormDiscovery.discover`` behind ``cache`` (``refresh`` re-crawls). A schema
+    without fields is returned but not cached, so a portal that was down is tried again next time.
+    """
+    if cache is not None and not refresh:
+        cached = cache.get(url)
+        if cached is not None:
+            return cached
+    schema = asyncio.run(FormDiscovery(**options).discover(url))
+    if cache is not None and schema.fields:
+        cache.put(schema)
+    return schema
+
+
+def _get_label(labels: dict[str, str], tag) -> str | None:
     """Get associated label text for an input/select/textarea."""
     id_ = tag.get("id")
-    if id_:
-        label_el = soup.find("label", attrs={"for": id_})
-        if label_el and label_el.get_text(strip=True):
-            return label_el.get_text(strip=True)[:200]
+    if id_ and id_ in labels:
+        return labels[id_]
     parent = tag.parent
     if parent and parent.name == "label" and parent.get_text(strip=True):
         return parent.get_text(strip=True)[:200]
+    return (tag.get("aria-label") or "").strip()[:200] or None
+
+
+def _get_section(tabs: dict[str, str], tag) -> str | None:
+    """The tab panel (by its tab's text) or fieldset legend the field sits in."""
+    panel = tag.find_parent(attrs={"role": "tabpanel"})
+    if panel is not None:
+        return tabs.get(panel.get("aria-labelledby", "")) or panel.get("aria-label") or panel.get("id")
+    fieldset = tag.find_parent("fieldset")
+    if fieldset is not None and fieldset.legend is not None:
+        return fieldset.legend.get_text(strip=True)[:200] or None
+    return None
+
+
+def _page_title(soup: BeautifulSoup) -> str | None:
+    for tag in (soup.find(attrs={"aria-current": "step"}), soup.find("h1"), soup.find("h2"), soup.title):
+        if tag is not None and tag.get_text(strip=True):
+            return tag.get_text(" ", strip=True)[:200]
     return None
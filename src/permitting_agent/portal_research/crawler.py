@@ -9,6 +9,7 @@ import httpx
 from robotexclusionrulesparser import RobotExclusionRulesParser
 
 from permitting_agent.models import ResearchSource
+from permitting_agent.serialization import write_json_lines
 
 
 DEFAULT_RATE_LIMIT_RPS = 1.0
@@ -70,8 +71,4 @@ def fetch_page(
 
 def save_sources(sources: list[ResearchSource], path: Path) -> None:
     """Write list of ResearchSource to JSON for audit."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(
-        "\n".join(s.model_dump_json() for s in sources),
-        encoding="utf-8",
-    )
+    write_json_lines(path, sources)
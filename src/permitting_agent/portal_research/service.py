@@ -1,10 +1,12 @@
 """Portal research service: use adapter or crawl; respect robots.txt and rate limit; save sources."""
 
+import asyncio
 import json
 from pathlib import Path
 
 from permitting_agent.models import PortalResearchResult, ResearchSource
-from permitting_agent.adapters import get_adapter
+from permitting_agent.adapters import get_adapter, get_async_adapter
+from permitting_agent.serialization import write_json_lines, write_model
 from permitting_agent.portal_research.crawler import (
     get_robots_parser,
     can_fetch,
@@ -12,6 +14,8 @@ from permitting_agent.portal_research.crawler import (
     DEFAULT_RATE_LIMIT_RPS,
 )
 
+DEFAULT_CONCURRENCY = 8
+
 
 class PortalResearchService:
     """Run portal research via jurisdiction adapter; optionally crawl; save JSON + sources."""
@@ -32,23 +36,43 @@ class PortalResearchService:
             result = adapter.research_portal()
             # If adapter returned live URLs we could verify with crawler (optional)
             return result
+        return _uncertain_result(jurisdiction)
+
+    async def research_async(self, jurisdiction: str) -> PortalResearchResult:
+        """Async research: awaits async adapters directly; sync adapters run in a worker thread."""
+        adapter = get_async_adapter(jurisdiction)
+        if adapter is not None:
+            return await adapter.research_portal()
+        return _uncertain_result(jurisdiction)
+
+    async def research_many(
+        self, jurisdictions: list[str], concurrency: int = DEFAULT_CONCURRENCY
+    ) -> list[PortalResearchResult]:
+        """Research many jurisdictions concurrently (at most ``concurrency`` at once), in input order."""
+        semaphore = asyncio.Semaphore(max(1, concurrency))
 
-        # No adapter: return uncertain result (never guess legal requirements)
-        return PortalResearchResult(
-            jurisdiction=jurisdiction,
-            requirements=[],
-            raw_notes="No jurisdiction adapter found. Requirements not researched; mark as uncertain.",
-        )
+        async def one(jurisdiction: str) -> PortalResearchResult:
+            async with semaphore:
+                return await self.research_async(jurisdiction)
+
+        return list(await asyncio.gather(*(one(j) for j in jurisdictions)))
 
     def research_and_save(self, jurisdiction: str, output_path: Path | None = None) -> PortalResearchResult:
         """Run research and save JSON + sources to output dir."""
-        result = self.research(jurisdiction)
+        return self.save_result(self.research(jurisdiction), output_path, jurisdiction=jurisdiction)
+
+    def save_result(
+        self, result: PortalResearchResult, output_path: Path | None = None, jurisdiction: str | None = None
+    ) -> PortalResearchResult:
+        """Save a research result as JSON + sources audit. The default path under output_dir is named
+        after ``jurisdiction`` (the name the caller asked for), else the result's jurisdiction.
+        """
+        jurisdiction = jurisdiction or result.jurisdiction
         out = output_path or (self.output_dir / "portal_research" / f"{jurisdiction.replace(' ', '_')}.json")
         out = Path(out)
-        out.parent.mkdir(parents=True, exist_ok=True)
 
         # JSON
-        out.write_text(result.model_dump_json(indent=2))
+        write_model(out, result)
 
         # Sources audit
         sources_path = out.with_suffix(".sources.jsonl")
@@ -56,6 +80,15 @@ class PortalResearchService:
         for r in result.requirements:
             sources.extend(r.sources)
         if sources:
-            sources_path.write_text("\n".join(s.model_dump_json() for s in sources))
+            write_json_lines(sources_path, sources)
 
         return result
+
+
+def _uncertain_result(jurisdiction: str) -> PortalResearchResult:
+    # No adapter: return uncertain result (never guess legal requirements)
+    return PortalResearchResult(
+        jurisdiction=jurisdiction,
+        requirements=[],
+        raw_notes="No jurisdiction adapter found. Requirements not researched; mark as uncertain.",
+    )
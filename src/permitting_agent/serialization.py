@@ -0,0 +1,101 @@
+"""JSON serialization for models and persisted artifacts, in one place.
+
+Models go straight to/from JSON bytes through pydantic-core (no intermediate dicts, ``Path``
+and ``datetime`` fields handled natively). Human-facing artifacts (reports, research results,
+contact lists) are indented by default; set ``PERMITTING_COMPACT_JSON=1`` in production to
+write them compact. Internal storage (case store rows, bundles, checkpoints) is always compact.
+"""
+
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterable, TypeVar
+
+import pydantic_core
+from pydantic import BaseModel, TypeAdapter
+
+COMPACT_ENV = "PERMITTING_COMPACT_JSON"
+PRETTY_INDENT = 2
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def compact_mode() -> bool:
+    """Whether artifacts are written without indentation (``PERMITTING_COMPACT_JSON``)."""
+    return os.environ.get(COMPACT_ENV, "").lower() in ("1", "true", "yes")
+
+
+def _indent(pretty: bool | None) -> int | None:
+    if pretty is None:
+        pretty = not compact_mode()
+    return PRETTY_INDENT if pretty else None
+
+
+def dump_json(model: BaseModel, pretty: bool | None = None, **kwargs: Any) -> bytes:
+    """Model -> JSON bytes. ``pretty=None`` follows compact mode; kwargs as for model_dump_json."""
+    return type(model).__pydantic_serializer__.to_json(model, indent=_indent(pretty), **kwargs)
+
+
+def load_json(model_type: type[M], data: bytes | str) -> M:
+    """JSON bytes/str -> validated model, without an intermediate json.loads."""
+    return model_type.model_validate_json(data)
+
+
+def dumps(value: Any, pretty: bool | None = None) -> bytes:
+    """Any JSON-able value (dicts/lists, may contain models, datetimes, Paths) -> JSON bytes."""
+    return pydantic_core.to_json(value, indent=_indent(pretty))
+
+
+def loads(data: bytes | str) -> Any:
+    """JSON bytes/str -> plain Python values."""
+    return pydantic_core.from_json(data)
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model_type: type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(list[model_type])
+
+
+def load_json_list(model_type: type[M], data: bytes | str) -> list[M]:
+    """JSON array -> list of validated models in one pass."""
+    return _list_adapter(model_type).validate_json(data)
+
+
+def dump_json_lines(models: Iterable[BaseModel]) -> bytes:
+    """One compact JSON document per line."""
+    return b"\n".join(dump_json(m, pretty=False) for m in models)
+
+
+def load_json_lines(model_type: type[M], data: bytes | str) -> list[M]:
+    lines = data.splitlines() if isinstance(data, bytes) else data.encode().splitlines()
+    return [model_type.model_validate_json(line) for line in lines if line.strip()]
+
+
+def write_bytes_atomic(path: Path, data: bytes) -> Path:
+    """Write via a temp file + rename so readers never see a partial file."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+    return path
+
+
+def write_model(path: Path, model: BaseModel, pretty: bool | None = None, **kwargs: Any) -> Path:
+    return write_bytes_atomic(path, dump_json(model, pretty=pretty, **kwargs))
+
+
+def read_model(path: Path, model_type: type[M]) -> M:
+    return model_type.model_validate_json(Path(path).read_bytes())
+
+
+def write_json(path: Path, value: Any, pretty: bool | None = None) -> Path:
+    return write_bytes_atomic(path, dumps(value, pretty=pretty))
+
+
+def read_json(path: Path) -> Any:
+    return loads(Path(path).read_bytes())
+
+
+def write_json_lines(path: Path, models: Iterable[BaseModel]) -> Path:
+    return write_bytes_atomic(path, dump_json_lines(models))
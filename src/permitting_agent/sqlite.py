@@ -0,0 +1,40 @@
+"""Shared SQLite plumbing for the local stores (cases, site index, ...)."""
+
+import sqlite3
+import threading
+from pathlib import Path
+
+
+class ConnectionPool:
+    """One connection per thread to a WAL-mode database file: one writer, many concurrent readers.
+    ``schema`` (CREATE ... IF NOT EXISTS statements) is applied when the pool is created.
+    """
+
+    def __init__(self, path: Path, schema: str = ""):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        conn = self.conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        if schema:
+            conn.executescript(schema)
+
+    def conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # check_same_thread=False only so close() can run from any thread; each thread uses its own
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def close(self) -> None:
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
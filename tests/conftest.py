@@ -7,6 +7,7 @@ import pytest
 
 from permitting_agent.models import IntakeRequest, SiteDetails, ScopeOfWork, ScopeKind
 from permitting_agent.intake import IntakeService
+from tests.mock_portal import MockPortal, MockPortalConfig
 
 
 @pytest.fixture
@@ -80,3 +81,19 @@ def sample_case(intake_service: IntakeService) -> tuple[str, IntakeRequest]:
     )
     case = intake_service.create_case(request)
     return case.id, request
+
+
+@pytest.fixture
+def mock_portal():
+    """Running local mock jurisdiction site (default config); stopped after the test."""
+    with MockPortal(MockPortalConfig()) as portal:
+        yield portal
+
+
+@pytest.fixture
+def upload_documents(tmp_path: Path) -> dict[str, Path]:
+    """An application form and a site plan to upload in portal automation tests."""
+    docs = {"application": tmp_path / "application.pdf", "site_plan": tmp_path / "site_plan.pdf"}
+    for path in docs.values():
+        path.write_bytes(b"%PDF-1.4\n" + b"0" * 2048)
+    return docs
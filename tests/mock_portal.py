@@ -0,0 +1,488 @@
+"""Local mock municipal portal: synthetic jurisdiction site served over HTTP for tests and benchmarks.
+
+The site is a tree of pages rooted at ``/`` (page 0). Every page links to its children,
+the application form at ``/apply``, a disallowed ``/private/`` page, a slow endpoint and
+a large PDF, so crawlers see the same mix of content they hit on real city sites.
+With ``directory_pages`` set, ``/directory/`` lists that many department staff pages
+(tables and contact cards with mailto/tel links) for contact discovery. Directory pages carry
+an ETag and answer conditional GETs with 304 until ``remove_staff`` edits them.
+``/portal/apply`` is an online permit application (optional login, file uploads, fee
+acknowledgement, submit) that records what browser automation submits in ``submissions``;
+with ``portal_assets`` its pages also pull in images, map tiles, a font, analytics and theme
+CSS/JS, counted per path in ``asset_requests``. With ``wizard_pages`` set, ``/wizard/0`` starts a
+multi-page application: each step has its own fields, a Next link or a GET Continue form, and
+(optionally) a step list linking every step; the first step has an inline tab panel and a tab
+loaded from ``/wizard/0/contact``.
+"""
+
+import math
+import secrets
+import threading
+import time
+from dataclasses import dataclass, field
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+
+@dataclass(frozen=True)
+class MockPortalConfig:
+    """Shape of the synthetic site. Defaults give a small, fast site suitable for unit tests."""
+
+    page_count: int = 25
+    link_depth: int = 3
+    robots_disallow: tuple[str, ...] = ("/private/",)
+    slow_paths: tuple[str, ...] = ("/slow/",)
+    slow_delay: float = 0.2
+    throttle_every: int = 0  # every Nth request gets 429; 0 disables
+    retry_after: int = 1
+    pdf_bytes: int = 256 * 1024
+    form_field_count: int = 20
+    jurisdiction_name: str = "City of Sample"
+    extra_pages: dict[str, str] = field(default_factory=dict)  # path -> HTML body
+    directory_pages: int = 0  # staff directory pages under /directory/; 0 disables
+    staff_per_page: int = 8
+    portal_login: tuple[str, str] | None = None  # (username, password) required by /portal/apply
+    login_delay: float = 0.0  # seconds POST /portal/login takes (real portals take several)
+    portal_assets: int = 0  # images/tiles per /portal page, plus a script, stylesheet, font and analytics tag
+    asset_bytes: int = 64 * 1024
+    asset_delay: float = 0.0  # seconds per /static/, /tiles/ or /analytics/ response
+    wizard_pages: int = 0  # steps of the /wizard/ application; 0 disables
+    wizard_fields: int = 3  # fields per wizard step
+    wizard_step_nav: bool = True  # every step links all steps (otherwise only Next/Continue)
+    wizard_delay: float = 0.0  # seconds per /wizard/ response
+
+
+class MockPortal:
+    """Threaded HTTP server for a synthetic jurisdiction site. Use as a context manager."""
+
+    def __init__(self, config: MockPortalConfig | None = None):
+        self.config = config or MockPortalConfig()
+        self.fanout = _fanout(self.config.page_count, self.config.link_depth)
+        self.request_count = 0
+        self.throttled_count = 0
+        self.not_modified_count = 0
+        self.removed_staff: set[tuple[int, int]] = set()
+        self.directory_versions: dict[int, int] = {}
+        self.submissions: list[dict] = []  # one per POST /portal/apply: form fields and uploaded file names
+        self.logins = 0
+        self.asset_requests: dict[str, int] = {}  # /static/, /tiles/, /analytics/ path -> times served
+        self._sessions: set[str] = set()
+        self._lock = threading.Lock()
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        if self._server is None:
+            raise RuntimeError("MockPortal is not running")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockPortal":
+        portal = self
+
+        class Handler(_PortalHandler):
+            pass
+
+        Handler.portal = portal
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def __enter__(self) -> "MockPortal":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def page_url(self, index: int) -> str:
+        return f"{self.url}{_page_path(index)}"
+
+    def children(self, index: int) -> list[int]:
+        """Child page indexes of page ``index`` (heap layout with fixed fanout)."""
+        first = index * self.fanout + 1
+        return [i for i in range(first, first + self.fanout) if i < self.config.page_count]
+
+    def directory_contacts(self) -> list[tuple[str, str, str, str]]:
+        """(role, name, email, phone) of every staff member the directory lists; role is '' for
+        departments outreach doesn't target."""
+        return [
+            (_DEPARTMENTS[page % len(_DEPARTMENTS)][1], *_staff(page, k))
+            for page in range(self.config.directory_pages)
+            for k in range(self.config.staff_per_page)
+            if (page, k) not in self.removed_staff
+        ]
+
+    def remove_staff(self, page: int, k: int) -> None:
+        """Drop staff member ``k`` from directory page ``page`` (which gets a new ETag)."""
+        with self._lock:
+            self.removed_staff.add((page, k))
+            self.directory_versions[page] = self.directory_versions.get(page, 0) + 1
+
+    def _next_request_throttled(self) -> bool:
+        with self._lock:
+            self.request_count += 1
+            every = self.config.throttle_every
+            throttled = every > 0 and self.request_count % every == 0
+            if throttled:
+                self.throttled_count += 1
+            return throttled
+
+
+class _PortalHandler(BaseHTTPRequestHandler):
+    portal: MockPortal
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # headers and body are separate writes; avoid delayed-ACK stalls
+
+    def log_message(self, format, *args) -> None:  # noqa: A002 - silence default stderr logging
+        pass
+
+    def do_GET(self) -> None:
+        portal = self.portal
+        cfg = portal.config
+        path = self.path.split("?", 1)[0]
+        if portal._next_request_throttled():
+            self._send(429, b"Too Many Requests", "text/plain", {"Retry-After": str(cfg.retry_after)})
+            return
+        if any(path.startswith(p) for p in cfg.slow_paths):
+            time.sleep(cfg.slow_delay)
+        if path == "/robots.txt":
+            lines = ["User-agent: *"] + [f"Disallow: {p}" for p in cfg.robots_disallow]
+            self._send(200, ("\n".join(lines) + "\n").encode(), "text/plain")
+        elif path in cfg.extra_pages:
+            self._send(200, cfg.extra_pages[path].encode(), "text/html; charset=utf-8")
+        elif path in ("/", "/index.html"):
+            self._send(200, _render_page(portal, 0), "text/html; charset=utf-8")
+        elif path.startswith("/pages/"):
+            try:
+                index = int(path[len("/pages/"):])
+            except ValueError:
+                index = -1
+            if 0 <= index < cfg.page_count:
+                self._send(200, _render_page(portal, index), "text/html; charset=utf-8")
+            else:
+                self._send(404, b"Not Found", "text/plain")
+        elif path.startswith("/directory/") and cfg.directory_pages:
+            page = path[len("/directory/"):].strip("/")
+            if not page:
+                self._send(200, _render_directory_index(cfg), "text/html; charset=utf-8")
+            elif page.isdigit() and int(page) < cfg.directory_pages:
+                index = int(page)
+                etag = f'"dir-{index}-{portal.directory_versions.get(index, 0)}"'
+                headers = {"ETag": etag, "Last-Modified": "Mon, 05 Oct 2026 12:00:00 GMT"}
+                if self.headers.get("If-None-Match") == etag:
+                    with portal._lock:
+                        portal.not_modified_count += 1
+                    self._send(304, b"", "text/html; charset=utf-8", headers)
+                else:
+                    body = _render_directory_page(cfg, index, portal.removed_staff)
+                    self._send(200, body, "text/html; charset=utf-8", headers)
+            else:
+                self._send(404, b"Not Found", "text/plain")
+        elif path == "/apply":
+            self._send(200, _render_form(cfg), "text/html; charset=utf-8")
+        elif path.startswith("/wizard/") and cfg.wizard_pages:
+            time.sleep(cfg.wizard_delay)
+            step = path[len("/wizard/"):]
+            if step == "0/contact":
+                self._send(200, _WIZARD_CONTACT_TAB.encode(), "text/html; charset=utf-8")
+            elif step.isdigit() and int(step) < cfg.wizard_pages:
+                self._send(200, _render_wizard_step(cfg, int(step)), "text/html; charset=utf-8")
+            else:
+                self._send(404, b"Not Found", "text/plain")
+        elif path == "/portal/login":
+            self._send(200, _with_assets(_PORTAL_LOGIN, cfg.portal_assets), "text/html; charset=utf-8")
+        elif path == "/portal/apply":
+            if cfg.portal_login and not self._logged_in():
+                self._redirect("/portal/login")
+            else:
+                self._send(200, _with_assets(_PORTAL_APPLY, cfg.portal_assets), "text/html; charset=utf-8")
+        elif path.startswith(("/static/", "/tiles/", "/analytics/")):
+            with portal._lock:
+                portal.asset_requests[path] = portal.asset_requests.get(path, 0) + 1
+            time.sleep(cfg.asset_delay)
+            content_type = _ASSET_TYPES.get(path.rsplit(".", 1)[-1], "application/octet-stream")
+            headers = {"Cache-Control": "public, max-age=86400"}
+            self._send(200, _asset_body(path, cfg.asset_bytes), content_type, headers)
+        elif path == "/docs/plans.pdf":
+            self._send(200, _pdf_body(cfg.pdf_bytes), "application/pdf")
+        elif path.startswith("/slow/") or path.startswith("/private/"):
+            body = f"<html><body><h1>{path}</h1></body></html>".encode()
+            self._send(200, body, "text/html; charset=utf-8")
+        else:
+            self._send(404, b"Not Found", "text/plain")
+
+    def do_POST(self) -> None:
+        portal = self.portal
+        cfg = portal.config
+        path = self.path.split("?", 1)[0]
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if path == "/portal/login":
+            form = {k: v[0] for k, v in parse_qs(body.decode()).items()}
+            if cfg.portal_login and (form.get("username"), form.get("password")) != cfg.portal_login:
+                self._send(401, b"<html><body><p class='error'>Invalid login</p></body></html>", "text/html")
+                return
+            time.sleep(cfg.login_delay)
+            token = secrets.token_hex(8)
+            with portal._lock:
+                portal._sessions.add(token)
+                portal.logins += 1
+            self._redirect("/portal/apply", {"Set-Cookie": f"portal_session={token}; Path=/portal; HttpOnly"})
+        elif path == "/portal/apply":
+            if cfg.portal_login and not self._logged_in():
+                self._send(403, b"Login required", "text/plain")
+                return
+            submission = _parse_multipart(self.headers.get("Content-Type", ""), body)
+            with portal._lock:
+                portal.submissions.append(submission)
+                number = f"SUB-{len(portal.submissions):04d}"
+            page = f"<html><body><h1>Application received</h1><p id='confirmation'>Confirmation number: {number}</p></body></html>"
+            self._send(200, page.encode(), "text/html; charset=utf-8")
+        else:
+            self._send(404, b"Not Found", "text/plain")
+
+    def _logged_in(self) -> bool:
+        cookies = dict(
+            part.strip().split("=", 1) for part in self.headers.get("Cookie", "").split(";") if "=" in part
+        )
+        return cookies.get("portal_session") in self.portal._sessions
+
+    def _redirect(self, location: str, headers: dict[str, str] | None = None) -> None:
+        self._send(303, b"", "text/plain", {"Location": location, **(headers or {})})
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: dict[str, str] | None = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def _fanout(page_count: int, depth: int) -> int:
+    """Smallest fanout so that a heap-ordered tree of page_count pages is at most depth levels deep."""
+    if page_count <= 1 or depth <= 0:
+        return max(page_count - 1, 1)
+    return max(2, math.ceil(page_count ** (1.0 / depth)))
+
+
+def _page_path(index: int) -> str:
+    return "/" if index == 0 else f"/pages/{index}"
+
+
+def _render_page(portal: MockPortal, index: int) -> bytes:
+    cfg = portal.config
+    links = [f'<li><a href="{_page_path(i)}">Permits page {i}</a></li>' for i in portal.children(index)]
+    links += [
+        '<li><a href="/apply">Apply online</a></li>',
+        f'<li><a href="/slow/{index}">Fee schedule</a></li>',
+        f'<li><a href="/private/{index}">Staff only</a></li>',
+        '<li><a href="/docs/plans.pdf">Standard plans (PDF)</a></li>',
+    ]
+    if cfg.directory_pages:
+        links.append('<li><a href="/directory/">Staff directory</a></li>')
+    body = (
+        f"<html><head><title>{cfg.jurisdiction_name} - Page {index}</title></head><body>"
+        f"<h1>{cfg.jurisdiction_name} permits</h1>"
+        "<p>Small cell permit fee: $250. Submit applications in PDF format.</p>"
+        f"<ul>{''.join(links)}</ul></body></html>"
+    )
+    return body.encode()
+
+
+_DEPARTMENTS = (
+    ("Planning &amp; Zoning", "planning"),
+    ("Engineering / Public Works", "engineering"),
+    ("Right-of-Way Permits", "row"),
+    ("Office of the City Clerk", "clerk"),
+    ("Parks and Recreation", ""),
+)
+_FIRST = ("Jane", "Omar", "Priya", "Luis", "Mei", "Tom", "Ana", "Sam")
+_LAST = ("Park", "Okafor", "Shah", "Garcia", "Chen", "Becker", "Silva", "Nguyen")
+
+
+def _staff(page: int, k: int) -> tuple[str, str, str]:
+    name = f"{_FIRST[(page + k) % len(_FIRST)]} {_LAST[(page * 3 + k) % len(_LAST)]}"
+    email = f"staff{page}.{k}@sample.example.gov"
+    phone = f"(555) {page % 1000:03d}-{k:04d}"
+    return name, email, phone
+
+
+def _render_directory_index(cfg: MockPortalConfig) -> bytes:
+    links = "".join(
+        f'<li><a href="/directory/{i}">{_DEPARTMENTS[i % len(_DEPARTMENTS)][0]} staff ({i})</a></li>'
+        for i in range(cfg.directory_pages)
+    )
+    return (
+        f"<html><head><title>{cfg.jurisdiction_name} - Staff directory</title></head><body>"
+        f"<h1>Staff directory</h1><ul>{links}</ul>"
+        '<p>General questions: <a href="mailto:info@sample.example.gov">info@sample.example.gov</a></p>'
+        "</body></html>"
+    ).encode()
+
+
+def _render_directory_page(cfg: MockPortalConfig, page: int, removed: set[tuple[int, int]]) -> bytes:
+    department = _DEPARTMENTS[page % len(_DEPARTMENTS)][0]
+    rows, cards = [], []
+    for k in range(cfg.staff_per_page):
+        if (page, k) in removed:
+            continue
+        name, email, phone = _staff(page, k)
+        if k % 2 == 0:  # table rows: plain-text email and phone
+            rows.append(f"<tr><td>{name}</td><td>Staff {k}</td><td>{email}</td><td>{phone}</td></tr>")
+        else:  # contact cards: mailto / tel links, fields in nested divs
+            tel = "+1" + "".join(ch for ch in phone if ch.isdigit())
+            cards.append(
+                f'<div class="card"><div><strong>{name}</strong></div>'
+                f'<div><a href="mailto:{email}">Email</a> | <a href="tel:{tel}">{phone}</a></div></div>'
+            )
+    nav = f'<a href="/directory/{page + 1}">Next department</a>' if page + 1 < cfg.directory_pages else ""
+    return (
+        f"<html><head><title>{department}</title></head><body>"
+        '<nav><a href="/">Home</a> <a href="/directory/">Staff directory</a></nav>'
+        f"<h2>{department}</h2><table>{''.join(rows)}</table>{''.join(cards)}{nav}"
+        "</body></html>"
+    ).encode()
+
+
+_PORTAL_LOGIN = """<html><head><title>Permit portal - Sign in</title></head><body>
+<form method="post" action="/portal/login">
+<label for="username">Username</label><input id="username" name="username" type="text">
+<label for="password">Password</label><input id="password" name="password" type="password">
+<button type="submit">Sign in</button>
+</form></body></html>"""
+
+_PORTAL_APPLY = """<html><head><title>Permit portal - New application</title></head><body>
+<h1>Small cell / fiber permit application</h1>
+<form method="post" action="/portal/apply" enctype="multipart/form-data">
+<label for="site_address">Site address</label><input id="site_address" name="site_address" type="text">
+<label for="application_pdf">Application form (PDF)</label><input id="application_pdf" name="application_pdf" type="file">
+<label for="site_plan">Site plan (PDF)</label><input id="site_plan" name="site_plan" type="file">
+<label><input id="fee_acknowledged" name="fee_acknowledged" type="checkbox" value="yes">
+I understand the permit fee will be invoiced</label>
+<button id="submit" type="submit">Submit application</button>
+</form></body></html>"""
+
+
+_ASSET_TYPES = {
+    "js": "application/javascript",
+    "css": "text/css",
+    "png": "image/png",
+    "woff2": "font/woff2",
+}
+
+
+def _with_assets(page: str, images: int) -> bytes:
+    """A portal page with the static weight real portals carry: theme CSS/JS, a font, analytics, images, map tiles."""
+    if not images:
+        return page.encode()
+    head = (
+        '<link rel="stylesheet" href="/static/portal.css">'
+        '<script src="/static/portal.js"></script>'
+        '<script async src="/analytics/collect.js"></script>'
+    )
+    body = "".join(f'<img src="/static/img/banner{i}.png" alt="">' for i in range(images // 2))
+    body += "".join(f'<img src="/tiles/12/{655 + i}/1583.png" alt="">' for i in range(images - images // 2))
+    return page.replace("</head>", head + "</head>").replace("</body>", body + "</body>").encode()
+
+
+def _asset_body(path: str, size: int) -> bytes:
+    if path.endswith(".css"):
+        rule = "@font-face{font-family:Portal;src:url(/static/fonts/portal.woff2)}body{font-family:Portal}\n"
+        return (rule + "/*" + "x" * max(0, size - len(rule) - 4) + "*/").encode()
+    if path.endswith(".js"):
+        return ("var portal=1;//" + "x" * max(0, size - 15)).encode()
+    return b"\x89PNG" + b"\0" * max(0, size - 4)
+
+
+def _parse_multipart(content_type: str, body: bytes) -> dict:
+    """Form fields and uploaded file names (with sizes) of a multipart/form-data POST."""
+    message = BytesParser(policy=HTTP).parsebytes(f"Content-Type: {content_type}\r\n\r\n".encode() + body)
+    fields: dict = {}
+    for part in message.iter_parts():
+        name = part.get_param("name", header="content-disposition")
+        filename = part.get_filename()
+        payload = part.get_payload(decode=True) or b""
+        if filename is not None:
+            fields[name] = {"filename": filename, "size": len(payload)} if filename else None
+        else:
+            fields[name] = payload.decode(errors="replace")
+    return fields
+
+
+def _render_form(cfg: MockPortalConfig) -> bytes:
+    rows = []
+    kinds = ("text", "email", "tel", "number")
+    for i in range(cfg.form_field_count):
+        kind = kinds[i % len(kinds)]
+        required = " required" if i % 3 == 0 else ""
+        rows.append(
+            f'<label for="field_{i}">Field {i}</label>'
+            f'<input id="field_{i}" name="field_{i}" type="{kind}"{required}>'
+        )
+    rows.append('<input type="hidden" name="csrf" value="x">')
+    rows.append('<input type="submit" value="Submit">')
+    return f"<html><body><form method='post' action='/apply'>{''.join(rows)}</form></body></html>".encode()
+
+
+_WIZARD_CONTACT_TAB = (
+    '<div role="tabpanel" aria-label="Contact">'
+    '<label for="contact_email">Contact email</label><input id="contact_email" name="contact_email" type="email" required>'
+    '<label for="contact_phone">Contact phone</label><input id="contact_phone" name="contact_phone" type="tel">'
+    "</div>"
+)
+
+
+def _render_wizard_step(cfg: MockPortalConfig, step: int) -> bytes:
+    """Step ``step`` of the wizard: its fields, then navigation to the next step."""
+    nav = ""
+    if cfg.wizard_step_nav:
+        items = "".join(f'<li><a href="/wizard/{i}">Step {i + 1}</a></li>' for i in range(cfg.wizard_pages))
+        nav = f'<ol class="wizard-steps">{items}</ol>'
+    rows = [
+        f'<label for="s{step}_f{i}">Step {step + 1} field {i}</label>'
+        f'<input id="s{step}_f{i}" name="s{step}_f{i}" type="text"{" required" if i == 0 else ""}>'
+        for i in range(cfg.wizard_fields)
+    ]
+    tabs = ""
+    if step == 0:
+        tabs = (
+            '<div role="tablist"><button role="tab" id="tab-site" aria-controls="panel-site">Site</button>'
+            '<a role="tab" href="/wizard/0/contact">Contact</a></div>'
+            '<div role="tabpanel" id="panel-site" aria-labelledby="tab-site">'
+            '<label for="site_address">Site address</label><input id="site_address" name="site_address" required>'
+            "</div>"
+        )
+    if step + 1 < cfg.wizard_pages and step % 2 == 0:
+        forward = f'<a href="/wizard/{step + 1}" rel="next" class="btn">Next</a>'
+    elif step + 1 < cfg.wizard_pages:
+        forward = f'<form method="get" action="/wizard/{step + 1}"><button type="submit">Continue</button></form>'
+    else:
+        forward = '<form method="post" action="/wizard/done"><button type="submit">Submit application</button></form>'
+    return (
+        f"<html><head><title>Permit application</title></head><body>{nav}"
+        f'<h1 aria-current="step">Step {step + 1} of {cfg.wizard_pages}</h1>{tabs}'
+        f"<form method='post' action='/wizard/{step}'>{''.join(rows)}</form>{forward}"
+        '<a href="/wizard/cancel">Cancel application</a> <a href="/logout">Log out</a></body></html>'
+    ).encode()
+
+
+def _pdf_body(size: int) -> bytes:
+    head = b"%PDF-1.4\n%mock\n"
+    tail = b"\n%%EOF\n"
+    pad = max(size - len(head) - len(tail), 0)
+    return head + b"0" * pad + tail
@@ -0,0 +1,236 @@
+"""Build fillable (AcroForm) and flat permit-application PDFs, and drawing sets, with pypdf, for tests
+and benchmarks.
+
+Each ``write_pdf`` page carries real text (so text extraction has work to do) and, for fillable forms, widget
+annotations for its fields. Field specs are dicts::
+
+    {"name": "applicant_name", "type": "text", "label": "Applicant name", "value": "Acme",
+     "required": True, "options": [...], "page": 0}
+
+``type`` is text, checkbox, radio, choice or signature; ``name`` may be dotted ("site.address")
+to build a field hierarchy.
+
+``write_plan_set`` writes one sheet per letter of a layout string: ``t`` text, ``i`` scanned
+(a page-size image over a heavy vector overlay, no text), ``m`` mixed (scan plus a text title
+block drawn from a shared Form XObject), ``g`` vector drawing only.
+"""
+
+from pathlib import Path
+from typing import Any
+
+from pypdf import PdfWriter
+from pypdf.generic import (
+    ArrayObject,
+    BooleanObject,
+    DecodedStreamObject,
+    DictionaryObject,
+    FloatObject,
+    NameObject,
+    NumberObject,
+    TextStringObject,
+)
+
+_FT = {"text": "/Tx", "checkbox": "/Btn", "radio": "/Btn", "choice": "/Ch", "signature": "/Sig"}
+_REQUIRED = 1 << 1
+_RADIO = 1 << 15
+_COMBO = 1 << 17
+
+
+def sample_fields(count: int = 12, pages: int = 1) -> list[dict[str, Any]]:
+    """A permit application's worth of fields spread over ``pages``; the first few are the usual ones."""
+    base = [
+        {"name": "applicant.name", "label": "Applicant / company name", "required": True, "value": "Acme Telecom"},
+        {"name": "applicant.email", "label": "Contact email"},
+        {"name": "site.address", "label": "Site address", "required": True, "value": "123 Main St"},
+        {"name": "scope", "type": "choice", "options": ["Small cell", "Fiber", "Both"], "value": "Small cell"},
+        {"name": "fee_acknowledged", "type": "checkbox", "value": "Yes"},
+        {"name": "pole_owner", "type": "radio", "options": ["City", "Utility"]},
+        {"name": "signature", "type": "signature"},
+    ]
+    fields = [dict(f) for f in base[:count]]
+    fields += [{"name": f"extra_{i}", "label": f"Extra field {i}"} for i in range(len(fields), count)]
+    for i, f in enumerate(fields):
+        f["page"] = i * pages // max(count, 1)
+    return fields
+
+
+def write_pdf(
+    path: Path, fields: list[dict[str, Any]] | None = None, pages: int = 1, lines_per_page: int = 40
+) -> Path:
+    """Write a PDF of ``pages`` text pages; with ``fields`` it is a fillable form, without it a flat one."""
+    writer = PdfWriter()
+    font = _font(writer)
+    for n in range(pages):
+        _page(writer, _text_ops(n, lines_per_page), {"/Font": DictionaryObject({NameObject("/F1"): font})})
+    if fields:
+        _add_form(writer, fields)
+    return _write(writer, path)
+
+
+def write_plan_set(path: Path, layout: str = "tiimg", path_ops: int = 5000, lines_per_page: int = 40) -> Path:
+    """Write a drawing set, one sheet per letter of ``layout`` (see the module docstring); scanned
+    and vector sheets carry ``path_ops`` line segments.
+    """
+    writer = PdfWriter()
+    font = _font(writer)
+    scan = DecodedStreamObject()
+    scan.set_data(bytes(range(256)) * 16)
+    scan.update(
+        {
+            NameObject("/Type"): NameObject("/XObject"),
+            NameObject("/Subtype"): NameObject("/Image"),
+            NameObject("/Width"): NumberObject(64),
+            NameObject("/Height"): NumberObject(64),
+            NameObject("/ColorSpace"): NameObject("/DeviceGray"),
+            NameObject("/BitsPerComponent"): NumberObject(8),
+        }
+    )
+    scan_ref = writer._add_object(scan)
+    title = DecodedStreamObject()
+    title.set_data(b"BT /F1 10 Tf 450 40 Td (Sheet title block: site plan) Tj ET")
+    title.update(
+        {
+            NameObject("/Type"): NameObject("/XObject"),
+            NameObject("/Subtype"): NameObject("/Form"),
+            NameObject("/BBox"): ArrayObject(FloatObject(v) for v in (0, 0, 612, 792)),
+            NameObject("/Resources"): DictionaryObject(
+                {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+            ),
+        }
+    )
+    title_ref = writer._add_object(title)
+    vectors = "".join(f"{i % 600} {i % 780} m {(i * 7) % 600} {(i * 13) % 780} l S\n" for i in range(path_ops))
+    scanned = "q 612 0 0 792 0 0 cm /Im0 Do Q\n" + vectors
+    for n, sheet in enumerate(layout):
+        xobjects = DictionaryObject({NameObject("/Im0"): scan_ref, NameObject("/Title"): title_ref})
+        resources = {"/XObject": xobjects, "/Font": DictionaryObject({NameObject("/F1"): font})}
+        ops = {
+            "t": _text_ops(n, lines_per_page),
+            "i": scanned,
+            "m": scanned + "q /Title Do Q\n",
+            "g": vectors,
+        }[sheet]
+        _page(writer, ops, resources)
+    return _write(writer, path)
+
+
+def _font(writer: PdfWriter) -> Any:
+    return writer._add_object(
+        DictionaryObject(
+            {
+                NameObject("/Type"): NameObject("/Font"),
+                NameObject("/Subtype"): NameObject("/Type1"),
+                NameObject("/BaseFont"): NameObject("/Helvetica"),
+            }
+        )
+    )
+
+
+def _text_ops(n: int, lines: int) -> str:
+    text = [f"Permit application, page {n + 1}. Site plan and fee schedule ($250) on file."]
+    text += [f"Line {i}: the applicant certifies the information in section {i} is accurate." for i in range(lines)]
+    return "".join(f"BT /F1 9 Tf 36 {760 - 18 * i} Td ({line}) Tj ET\n" for i, line in enumerate(text))
+
+
+def _page(writer: PdfWriter, ops: str, resources: dict[str, Any]) -> Any:
+    page = writer.add_blank_page(612, 792)
+    page[NameObject("/Resources")] = DictionaryObject({NameObject(k): v for k, v in resources.items()})
+    content = DecodedStreamObject()
+    content.set_data(ops.encode("latin-1"))
+    page[NameObject("/Contents")] = writer._add_object(content)
+    return page
+
+
+def _write(writer: PdfWriter, path: Path) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as f:
+        writer.write(f)
+    return path
+
+
+def _add_form(writer: PdfWriter, fields: list[dict[str, Any]]) -> None:
+    roots = ArrayObject()
+    parents: dict[str, Any] = {}
+    for i, spec in enumerate(fields):
+        kind = spec.get("type", "text")
+        *path, leaf = spec["name"].split(".")
+        parent = _parent(writer, parents, roots, path)
+        page = writer.pages[spec.get("page", 0)]
+        field = DictionaryObject(
+            {
+                NameObject("/T"): TextStringObject(leaf),
+                NameObject("/FT"): NameObject(_FT[kind]),
+                NameObject("/Ff"): NumberObject(
+                    (_REQUIRED if spec.get("required") else 0)
+                    | (_RADIO if kind == "radio" else 0)
+                    | (_COMBO if kind == "choice" else 0)
+                ),
+            }
+        )
+        if spec.get("label"):
+            field[NameObject("/TU")] = TextStringObject(spec["label"])
+        value = spec.get("value")
+        if kind == "choice":
+            field[NameObject("/Opt")] = ArrayObject(TextStringObject(o) for o in spec.get("options", []))
+        if value is not None:
+            field[NameObject("/V")] = NameObject("/" + value) if kind in ("checkbox", "radio") else TextStringObject(value)
+        ref = writer._add_object(field)
+        if parent is not None:
+            field[NameObject("/Parent")] = parent
+            parent.get_object()["/Kids"].append(ref)
+        else:
+            roots.append(ref)
+        y = 700 - 30 * (i % 20)
+        if kind == "radio":  # one widget per option, as kids of the field
+            kids = ArrayObject()
+            for j, option in enumerate(spec.get("options", [])):
+                widget = _widget(writer, page, [300 + 40 * j, y, 320 + 40 * j, y + 20], option)
+                widget[NameObject("/Parent")] = ref
+                kids.append(writer._add_object(widget))
+                page[NameObject("/Annots")].append(kids[-1])
+            field[NameObject("/Kids")] = kids
+        else:  # merged field/widget
+            field.update(_widget(writer, page, [300, y, 500, y + 20], "Yes" if kind == "checkbox" else None))
+            page[NameObject("/Annots")].append(ref)
+    writer._root_object[NameObject("/AcroForm")] = writer._add_object(
+        DictionaryObject({NameObject("/Fields"): roots, NameObject("/NeedAppearances"): BooleanObject(True)})
+    )
+
+
+def _parent(writer: PdfWriter, parents: dict[str, Any], roots: ArrayObject, path: list[str]) -> Any:
+    ref = None
+    for depth in range(len(path)):
+        key = ".".join(path[: depth + 1])
+        if key not in parents:
+            node = DictionaryObject({NameObject("/T"): TextStringObject(path[depth]), NameObject("/Kids"): ArrayObject()})
+            parents[key] = writer._add_object(node)
+            if ref is None:
+                roots.append(parents[key])
+            else:
+                node[NameObject("/Parent")] = ref
+                ref.get_object()["/Kids"].append(parents[key])
+        ref = parents[key]
+    return ref
+
+
+def _widget(writer: PdfWriter, page: Any, rect: list[float], on_state: str | None) -> DictionaryObject:
+    if "/Annots" not in page:
+        page[NameObject("/Annots")] = ArrayObject()
+    widget = DictionaryObject(
+        {
+            NameObject("/Type"): NameObject("/Annot"),
+            NameObject("/Subtype"): NameObject("/Widget"),
+            NameObject("/Rect"): ArrayObject(FloatObject(v) for v in rect),
+            NameObject("/P"): page.indirect_reference,
+        }
+    )
+    if on_state is not None:  # a check box or radio button: its on-state is named by its appearance
+        widget[NameObject("/AP")] = DictionaryObject(
+            {
+                NameObject("/N"): DictionaryObject(
+                    {NameObject("/" + on_state): writer._add_object(DecodedStreamObject()), NameObject("/Off"): writer._add_object(DecodedStreamObject())}
+                )
+            }
+        )
+    return widget
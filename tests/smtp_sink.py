@@ -0,0 +1,144 @@
+"""Local SMTP sink: accepts mail on a loopback port and keeps it in memory, for tests and benchmarks.
+
+Speaks just enough SMTP for smtplib (EHLO/HELO, MAIL, RCPT, DATA, RSET, NOOP, QUIT) and can
+misbehave the way real city mail servers do: temporary 4xx failures, rejected domains, and
+connections that drop after the message body was received.
+"""
+
+import socketserver
+import threading
+import time
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class SmtpSinkConfig:
+    temp_fail_every: int = 0  # every Nth DATA answers 451; 0 disables
+    reject_domains: tuple[str, ...] = ()  # RCPT to these domains answers 550
+    drop_after_data_every: int = 0  # every Nth DATA is received, then the connection closes unanswered
+    delay: float = 0.0  # seconds to wait before answering DATA
+
+
+@dataclass
+class SinkMessage:
+    sender: str
+    recipients: list[str]
+    data: bytes
+    received_at: float = field(default_factory=time.time)
+
+
+class SmtpSink:
+    """Threaded SMTP server on 127.0.0.1; use as a context manager."""
+
+    def __init__(self, config: SmtpSinkConfig | None = None):
+        self.config = config or SmtpSinkConfig()
+        self.messages: list[SinkMessage] = []
+        self.data_count = 0
+        self.connections = 0
+        self._lock = threading.Lock()
+        self._server: socketserver.ThreadingTCPServer | None = None
+
+    @property
+    def port(self) -> int:
+        if self._server is None:
+            raise RuntimeError("SmtpSink is not running")
+        return self._server.server_address[1]
+
+    def start(self) -> "SmtpSink":
+        sink = self
+
+        class Handler(_SmtpHandler):
+            pass
+
+        Handler.sink = sink
+        self._server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "SmtpSink":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _next_data(self) -> int:
+        with self._lock:
+            self.data_count += 1
+            return self.data_count
+
+
+class _SmtpHandler(socketserver.StreamRequestHandler):
+    sink: SmtpSink
+
+    def reply(self, line: str) -> None:
+        self.wfile.write(line.encode() + b"\r\n")
+
+    def handle(self) -> None:
+        sink = self.sink
+        with sink._lock:
+            sink.connections += 1
+        self.reply("220 sink ESMTP")
+        sender, recipients = None, []
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode(errors="replace").strip()
+            verb = command[:4].upper()
+            if verb in ("EHLO", "HELO"):
+                self.reply("250 sink")
+            elif verb == "MAIL":
+                sender, recipients = _address(command), []
+                self.reply("250 OK")
+            elif verb == "RCPT":
+                recipient = _address(command)
+                if recipient.rpartition("@")[2].lower() in sink.config.reject_domains:
+                    self.reply("550 mailbox unavailable")
+                else:
+                    recipients.append(recipient)
+                    self.reply("250 OK")
+            elif verb == "DATA":
+                self.reply("354 end with <CRLF>.<CRLF>")
+                data = self._read_data()
+                n = sink._next_data()
+                config = sink.config
+                if config.delay:
+                    time.sleep(config.delay)
+                if config.drop_after_data_every and n % config.drop_after_data_every == 0:
+                    return
+                if config.temp_fail_every and n % config.temp_fail_every == 0:
+                    self.reply("451 try again later")
+                    continue
+                with sink._lock:
+                    sink.messages.append(SinkMessage(sender, recipients, data))
+                self.reply(f"250 queued as {n}")
+            elif verb == "RSET":
+                sender, recipients = None, []
+                self.reply("250 OK")
+            elif verb == "NOOP":
+                self.reply("250 OK")
+            elif verb == "QUIT":
+                self.reply("221 bye")
+                return
+            else:
+                self.reply("502 command not implemented")
+
+    def _read_data(self) -> bytes:
+        lines = []
+        while True:
+            line = self.rfile.readline()
+            if not line or line == b".\r\n":
+                break
+            lines.append(line[1:] if line.startswith(b"..") else line)
+        return b"".join(lines)
+
+
+def _address(command: str) -> str:
+    return command.partition(":")[2].strip().split(" ")[0].strip("<>")
@@ -0,0 +1,124 @@
+"""Tests for declarative adapters and compiled adapter bundles."""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from permitting_agent.adapters import get_adapter, list_adapters, register_bundle
+from permitting_agent.adapters import registry
+from permitting_agent.adapters.bundle import AdapterBundle, BundleError, compile_bundle
+from permitting_agent.adapters.declarative import DeclarativeAdapter, load_spec_file
+from permitting_agent.models.intake import ScopeKind
+
+REPO_SPECS = Path(__file__).resolve().parent.parent / "config" / "jurisdictions"
+
+
+def _spec(jurisdiction_id: str, name: str, **extra) -> dict:
+    return {
+        "jurisdiction_id": jurisdiction_id,
+        "name": name,
+        "checklists": {"default": [{"id": "app_form", "label": "Permit application form"}]},
+        "portal_url": f"https://{jurisdiction_id}.example.gov/apply",
+        **extra,
+    }
+
+
+@pytest.fixture
+def spec_dir(tmp_path: Path) -> Path:
+    d = tmp_path / "specs"
+    d.mkdir()
+    for i in range(20):
+        (d / f"town_{i}.json").write_text(json.dumps(_spec(f"town_of_bench_{i}", f"Town of Bench {i}", state="TX")))
+    return d
+
+
+@pytest.fixture
+def clean_registry(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(registry, "_REGISTRY", {})
+    monkeypatch.setattr(registry, "_ALIASES", {})
+    monkeypatch.setattr(registry, "_INSTANCES", {})
+    monkeypatch.setattr(registry, "_INDEX", None)
+    monkeypatch.setattr(registry, "_discovered", False)
+    monkeypatch.delenv(registry.BUNDLES_ENV, raising=False)
+
+
+def test_repo_spec_files_are_valid() -> None:
+    """Shipped spec files validate (YAML needs PyYAML)."""
+    pytest.importorskip("yaml")
+    spec = load_spec_file(REPO_SPECS / "county_of_sample.yaml")
+    adapter = DeclarativeAdapter(spec)
+    assert adapter.jurisdiction_id == "county_of_sample"
+    assert [i.id for i in adapter.get_checklist(ScopeKind.FIBER).items] == ["app_form", "traffic_control"]
+    assert len(adapter.get_checklist(ScopeKind.SMALL_CELL).items) == 3
+    assert adapter.research_portal().portal_url is not None
+    assert adapter.discover_contacts().source_urls
+
+
+def test_compile_and_load_one(spec_dir: Path, tmp_path: Path) -> None:
+    """A bundle lists every id from its index and decodes only the requested spec."""
+    out = tmp_path / "adapters.bundle"
+    ids = compile_bundle(spec_dir, out)
+    assert len(ids) == 20
+    bundle = AdapterBundle(out)
+    try:
+        assert len(bundle) == 20
+        assert bundle.metadata("town_of_bench_3") == ("Town of Bench 3", "TX", [])
+        adapter = bundle.adapter("town_of_bench_3")
+        assert adapter.research_portal().portal_url == "https://town_of_bench_3.example.gov/apply"
+        assert list(bundle._specs) == ["town_of_bench_3"]
+    finally:
+        bundle.close()
+
+
+def test_compile_reports_all_errors(spec_dir: Path, tmp_path: Path) -> None:
+    """Validation errors and duplicate ids are all reported and no bundle is written."""
+    (spec_dir / "dup.json").write_text(json.dumps(_spec("town_of_bench_1", "Duplicate")))
+    (spec_dir / "bad.json").write_text(json.dumps({"jurisdiction_id": "Bad Id", "name": "Bad", "checklists": {"roof": []}}))
+    out = tmp_path / "adapters.bundle"
+    with pytest.raises(BundleError) as exc:
+        compile_bundle(spec_dir, out)
+    message = str(exc.value)
+    assert "duplicate jurisdiction_id 'town_of_bench_1'" in message
+    assert "jurisdiction_id" in message and "checklists" in message
+    assert not out.exists()
+
+
+def test_open_rejects_non_bundle(tmp_path: Path) -> None:
+    """Opening a file that is not a bundle raises BundleError."""
+    path = tmp_path / "not.bundle"
+    path.write_bytes(b"x" * 64)
+    with pytest.raises(BundleError):
+        AdapterBundle(path)
+
+
+def test_registry_bundle(spec_dir: Path, tmp_path: Path, clean_registry: None) -> None:
+    """Bundle jurisdictions appear in list_adapters and resolve by name; Python adapters win clashes."""
+    (spec_dir / "sample.json").write_text(json.dumps(_spec("city_of_sample", "City of Sample")))
+    out = tmp_path / "adapters.bundle"
+    compile_bundle(spec_dir, out)
+    added = register_bundle(out)
+    assert "city_of_sample" not in added
+    assert "town_of_bench_7" in list_adapters()
+    adapter = get_adapter("Bench 7 Town, Texas")
+    assert isinstance(adapter, DeclarativeAdapter)
+    assert adapter.jurisdiction_id == "town_of_bench_7"
+    assert not isinstance(get_adapter("City of Sample"), DeclarativeAdapter)
+
+
+def test_registry_skips_bad_env_bundle(
+    spec_dir: Path, tmp_path: Path, clean_registry: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A missing or corrupt bundle in the environment is skipped with a warning; later bundles still load."""
+    out = tmp_path / "adapters.bundle"
+    compile_bundle(spec_dir, out)
+    corrupt = tmp_path / "corrupt.bundle"
+    corrupt.write_bytes(b"not a bundle at all")
+    paths = [str(tmp_path / "missing.bundle"), str(corrupt), str(out)]
+    monkeypatch.setenv(registry.BUNDLES_ENV, os.pathsep.join(paths))
+    with pytest.warns(RuntimeWarning, match="skipping adapter bundle") as caught:
+        ids = list_adapters()
+    assert ["missing.bundle" in str(w.message) for w in caught] == [True, False]
+    assert "town_of_bench_7" in ids and "city_of_sample" in ids
+    assert list_adapters() == ids
@@ -1,10 +1,26 @@
 """Tests for jurisdiction adapters and registry."""
 
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
 import pytest
 
-from permitting_agent.adapters import get_adapter, list_adapters
+from permitting_agent.adapters import (
+    AsyncJurisdictionAdapter,
+    get_adapter,
+    get_async_adapter,
+    list_adapters,
+    match_jurisdiction,
+    resolve_jurisdiction_id,
+)
 from permitting_agent.adapters.sample_jurisdiction import SampleJurisdictionAdapter
 from permitting_agent.models.intake import ScopeKind
+from permitting_agent.outreach import OutreachService
+from permitting_agent.portal_research import PortalResearchService
 
 
 def test_list_adapters() -> None:
@@ -22,6 +38,32 @@ def test_get_adapter_city_of_sample() -> None:
     assert adapter.jurisdiction_id == "city_of_sample"
 
 
+def test_get_adapter_name_variants() -> None:
+    """Common spellings of the jurisdiction resolve to the same cached adapter instance."""
+    adapter = get_adapter("City of Sample")
+    for name in ("Sample City", "City of Sample, CA", "CITY OF SAMPLE", "city-of-sample"):
+        assert get_adapter(name) is adapter, name
+
+
+@pytest.mark.parametrize(
+    "name",
+    ["Sampleton", "City of Simple", "City of Ample", "City of Samples", "City of Sampel", "Sample, TX", "City of Sample, TX"],
+)
+def test_get_adapter_refuses_uncertain_names(name: str) -> None:
+    """Similar names may be other jurisdictions, and a different state is one: get_adapter doesn't guess."""
+    assert get_adapter(name) is None
+
+
+def test_match_jurisdiction_suggests_fuzzy_matches() -> None:
+    """A misspelling comes back as a scored suggestion rather than a resolved id."""
+    match = match_jurisdiction("City of Sampel")
+    assert match.jurisdiction_id == "city_of_sample" and match.method == "fuzzy"
+    assert not match.certain and 0 < match.score < 1
+    assert resolve_jurisdiction_id("City of Sampel") is None
+    assert resolve_jurisdiction_id("City of Sampel", fuzzy=True) == "city_of_sample"
+    assert match_jurisdiction("City of Sample, TX").jurisdiction_id is None
+
+
 def test_get_adapter_unknown() -> None:
     """Unknown jurisdiction returns None."""
     assert get_adapter("Unknown City") is None
@@ -56,3 +98,126 @@ def test_sample_adapter_discover_contacts() -> None:
     assert contacts.jurisdiction == "City of Sample"
     assert len(contacts.contacts) >= 1
     assert len(contacts.source_urls) >= 1
+
+
+def _src_env() -> dict[str, str]:
+    src = Path(__file__).resolve().parent.parent / "src"
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (str(src), env.get("PYTHONPATH")) if p)
+    return env
+
+
+def test_list_adapters_imports_no_adapter_modules() -> None:
+    """list_adapters reads the manifest without importing adapter modules."""
+    code = (
+        "import sys\n"
+        "from permitting_agent.adapters import list_adapters\n"
+        "assert 'city_of_sample' in list_adapters()\n"
+        "assert 'permitting_agent.adapters.sample_jurisdiction' not in sys.modules\n"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], env=_src_env(), capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
+
+
+def test_entry_point_adapter_loaded_lazily(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Adapters from installed entry points are listed, and imported only on get_adapter."""
+    from permitting_agent.adapters import registry
+
+    (tmp_path / "lazy_city_adapter.py").write_text(
+        "from permitting_agent.adapters.sample_jurisdiction import SampleJurisdictionAdapter\n"
+        "class LazyCityAdapter(SampleJurisdictionAdapter):\n"
+        "    pass\n"
+    )
+    dist = tmp_path / "lazy_city_adapter-0.1.dist-info"
+    dist.mkdir()
+    (dist / "METADATA").write_text("Metadata-Version: 2.1\nName: lazy-city-adapter\nVersion: 0.1\n")
+    (dist / "entry_points.txt").write_text(
+        f"[{registry.ENTRY_POINT_GROUP}]\nlazy_city = lazy_city_adapter:LazyCityAdapter\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(registry, "_REGISTRY", {})
+    monkeypatch.setattr(registry, "_discovered", False)
+    monkeypatch.setattr(registry, "_INSTANCES", {})
+    monkeypatch.setattr(registry, "_INDEX", None)
+
+    assert "lazy_city" in list_adapters()
+    assert "lazy_city_adapter" not in sys.modules
+    adapter = get_adapter("Lazy City")
+    assert adapter is not None
+    assert type(adapter).__name__ == "LazyCityAdapter"
+    assert "lazy_city_adapter" in sys.modules
+    monkeypatch.delitem(sys.modules, "lazy_city_adapter")
+
+
+class _SlowAsyncAdapter(AsyncJurisdictionAdapter):
+    """Async adapter whose research/contacts each wait on simulated I/O."""
+
+    delay = 0.2
+
+    def __init__(self) -> None:
+        self._sample = SampleJurisdictionAdapter()
+
+    @property
+    def jurisdiction_name(self) -> str:
+        return "Town of Async"
+
+    @property
+    def jurisdiction_id(self) -> str:
+        return "town_of_async"
+
+    async def get_checklist(self, scope: ScopeKind):
+        return self._sample.get_checklist(scope)
+
+    async def research_portal(self):
+        await asyncio.sleep(self.delay)
+        return self._sample.research_portal().model_copy(update={"jurisdiction": self.jurisdiction_name})
+
+    async def discover_contacts(self):
+        await asyncio.sleep(self.delay)
+        return self._sample.discover_contacts().model_copy(update={"jurisdiction": self.jurisdiction_name})
+
+
+@pytest.fixture
+def async_registry(monkeypatch: pytest.MonkeyPatch) -> None:
+    from permitting_agent.adapters import registry
+
+    monkeypatch.setattr(registry, "_REGISTRY", dict(registry._discover()))
+    monkeypatch.setattr(registry, "_INSTANCES", {})
+    monkeypatch.setattr(registry, "_INDEX", None)
+    registry.register_adapter("town_of_async", _SlowAsyncAdapter)
+
+
+async def test_sync_adapter_through_async_contract() -> None:
+    """Sync adapters are usable through get_async_adapter (calls run in a worker thread)."""
+    adapter = get_async_adapter("City of Sample")
+    assert isinstance(adapter, AsyncJurisdictionAdapter)
+    assert adapter.jurisdiction_id == "city_of_sample"
+    result = await adapter.research_portal()
+    assert result.portal_url is not None
+    assert (await adapter.get_checklist(ScopeKind.SMALL_CELL)).items
+
+
+def test_async_adapter_for_sync_callers(async_registry: None) -> None:
+    """Async adapters registered in the registry still serve sync get_adapter callers."""
+    adapter = get_adapter("Town of Async")
+    assert adapter is not None
+    assert adapter.jurisdiction_id == "town_of_async"
+    assert adapter.research_portal().jurisdiction == "Town of Async"
+
+
+async def test_research_and_contacts_overlap(async_registry: None, tmp_path: Path) -> None:
+    """Research and contact discovery for many jurisdictions run concurrently on one loop."""
+    research_svc = PortalResearchService(output_dir=tmp_path)
+    outreach_svc = OutreachService(output_dir=tmp_path)
+    names = ["Town of Async"] * 5 + ["City of Sample", "Unknown City"]
+    start = time.perf_counter()
+    research, contacts = await asyncio.gather(
+        research_svc.research_many(names),
+        outreach_svc.discover_many(names),
+    )
+    elapsed = time.perf_counter() - start
+    # 10 slow calls of 0.2s each; sequential would take >= 2s
+    assert elapsed < 1.0
+    assert [r.jurisdiction for r in research] == ["Town of Async"] * 5 + ["City of Sample", "Unknown City"]
+    assert research[-1].requirements == [] and "uncertain" in research[-1].raw_notes
+    assert all(c.contacts for c in contacts[:6]) and contacts[-1].contacts == []
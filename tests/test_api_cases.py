@@ -0,0 +1,99 @@
+"""Tests for the /api/cases query endpoint and keyset pagination."""
+
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from permitting_agent.intake import IntakeService
+from permitting_agent.models import IntakeCase, IntakeRequest, ScopeKind, ScopeOfWork, SiteDetails
+
+T0 = datetime(2025, 3, 1, 8, 0, 0)
+
+
+def _case(i: int) -> IntakeCase:
+    jurisdiction = "City of Sample" if i % 2 else "County of Sample"
+    created = T0 + timedelta(hours=i // 3)  # several cases share a created_at; the id breaks ties
+    return IntakeCase(
+        id=f"c{i:03d}",
+        request=IntakeRequest(
+            jurisdiction=jurisdiction,
+            site=SiteDetails(address=f"{i} Main St", jurisdiction=jurisdiction),
+            scope=ScopeOfWork(kind=ScopeKind.FIBER if i % 5 == 0 else ScopeKind.SMALL_CELL),
+        ),
+        created_at=created,
+        updated_at=created,
+    )
+
+
+@pytest.fixture
+def client(tmp_data_dir: Path, monkeypatch: pytest.MonkeyPatch):
+    import app as web
+
+    monkeypatch.setenv("DATA_DIR", str(tmp_data_dir))
+    monkeypatch.setattr(web, "_intake_services", {})
+    web._intake_service().save_cases([_case(i) for i in range(40)])
+    return web.app.test_client()
+
+
+def test_list_cases_pages_cover_everything_once(tmp_data_dir: Path) -> None:
+    """Walking cursors visits every case exactly once, in order, in both directions."""
+    svc = IntakeService(data_dir=tmp_data_dir)
+    svc.save_cases([_case(i) for i in range(40)])
+    for descending in (False, True):
+        seen, cursor = [], None
+        while True:
+            page, cursor = svc.list_cases(limit=7, cursor=cursor, descending=descending)
+            seen.extend(c.id for c in page)
+            if cursor is None:
+                break
+        expected = sorted((c.created_at, c.id) for c in map(_case, range(40)))
+        if descending:
+            expected.reverse()
+        assert seen == [case_id for _, case_id in expected]
+
+
+def test_keyset_page_uses_index(tmp_data_dir: Path) -> None:
+    """A filtered next-page query seeks in the index instead of scanning the table."""
+    svc = IntakeService(data_dir=tmp_data_dir)
+    plan = svc.store._conn().execute(
+        "EXPLAIN QUERY PLAN SELECT data FROM cases WHERE jurisdiction = ? AND (created_at, id) > (?, ?)"
+        " ORDER BY created_at, id LIMIT 51",
+        ("City of Sample", "2025-01-01T00:00:00.000000", "x"),
+    ).fetchall()
+    details = " ".join(row[-1] for row in plan)
+    assert "USING INDEX cases_by_jurisdiction" in details and "TEMP B-TREE" not in details
+
+
+def test_api_cases_filters_and_cursor(client) -> None:
+    """Filters apply server-side and next_cursor continues the same query."""
+    first = client.get("/api/cases?jurisdiction=city%20of%20sample&limit=8").get_json()
+    assert first["count"] == 8 and first["next_cursor"]
+    assert all(c["request"]["jurisdiction"] == "City of Sample" for c in first["cases"])
+    rest = client.get(f"/api/cases?jurisdiction=City%20of%20Sample&limit=50&cursor={first['next_cursor']}").get_json()
+    assert rest["count"] == 12 and rest["next_cursor"] is None
+    fiber = client.get("/api/cases?scope=fiber&created_from=2025-03-01T10:00:00&created_to=2025-03-01T13:00:00").get_json()
+    assert [c["id"] for c in fiber["cases"]] == ["c010"]
+    newest = client.get("/api/cases?order=desc&limit=1").get_json()
+    assert newest["cases"][0]["id"] == "c039"
+
+
+def test_api_cases_etag(client) -> None:
+    """An unchanged page answers 304 to If-None-Match; a change to the page gives a new ETag."""
+    first = client.get("/api/cases?limit=5")
+    etag = first.headers["ETag"]
+    assert client.get("/api/cases?limit=5", headers={"If-None-Match": etag}).status_code == 304
+    import app as web
+
+    svc = web._intake_service()
+    svc.save_cases([svc.get_case("c000").model_copy(update={"status": "submitted"})])
+    changed = client.get("/api/cases?limit=5", headers={"If-None-Match": etag})
+    assert changed.status_code == 200 and changed.headers["ETag"] != etag
+
+
+def test_api_cases_bad_params(client) -> None:
+    """Malformed cursor, dates and limits are 400s."""
+    for query in ("cursor=nope", "created_from=yesterday", "limit=0", "order=sideways"):
+        response = client.get(f"/api/cases?{query}")
+        assert response.status_code == 400, query
+        assert "error" in response.get_json()
@@ -0,0 +1,121 @@
+"""Tests for bulk intake from CSV / GeoJSON with batched, resumable imports."""
+
+import csv
+import json
+from pathlib import Path
+
+import pytest
+
+from permitting_agent.intake import IntakeService, import_cases
+from permitting_agent.intake import bulk
+from permitting_agent.intake.bulk import iter_rows, row_case_id
+from permitting_agent.geo import JurisdictionResolver
+from tests.test_geo import SAMPLE_BOUNDARIES
+
+
+def _write_csv(path: Path, rows: list[dict]) -> Path:
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+    return path
+
+
+def _pole_rows(n: int) -> list[dict]:
+    return [
+        {"Jurisdiction": "City of Sample", "Address": f"{i} Pole Rd", "Scope": "fiber" if i % 2 else "small_cell",
+         "Latitude": "34.01", "Longitude": "-118.29", "Pole ID": f"P-{i}"}
+        for i in range(n)
+    ]
+
+
+def test_csv_import(tmp_data_dir: Path, tmp_path: Path) -> None:
+    """CSV rows become cases with deterministic ids; bad rows go to the error report, not the store."""
+    rows = _pole_rows(10)
+    rows[3]["Address"] = ""
+    rows[6]["Scope"] = "roof"
+    src = _write_csv(tmp_path / "rollout.csv", rows)
+    svc = IntakeService(data_dir=tmp_data_dir)
+    report = import_cases(svc, src, batch_size=4)
+    assert (report.rows_read, report.created, report.errors) == (10, 8, 2)
+    # Every row is the same pole location, so all but the first are flagged
+    assert report.possible_duplicates == 7
+    case = svc.get_case(row_case_id(report.import_key, 2))
+    assert case.request.site.address == "1 Pole Rd"
+    assert case.request.scope.kind.value == "fiber"
+    assert case.request.site.lat == pytest.approx(34.01)
+    assert case.request.site.extra == {"pole_id": "P-1"}
+    with open(report.error_report) as f:
+        errors = list(csv.DictReader(f))
+    assert [e["row"] for e in errors] == ["4", "7"]
+    assert "address is required" in errors[0]["error"]
+    assert "unknown scope 'roof'" in errors[1]["error"]
+
+
+def test_import_resumes_after_interruption(tmp_data_dir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """An import that dies mid-way resumes after the last committed batch without duplicates."""
+    src = _write_csv(tmp_path / "rollout.csv", _pole_rows(25))
+    svc = IntakeService(data_dir=tmp_data_dir)
+    real_save = svc.save_cases
+    calls = {"n": 0}
+
+    def flaky_save(cases):
+        calls["n"] += 1
+        if calls["n"] == 3:
+            raise RuntimeError("disk full")
+        return real_save(cases)
+
+    monkeypatch.setattr(svc, "save_cases", flaky_save)
+    with pytest.raises(RuntimeError):
+        import_cases(svc, src, batch_size=5)
+    assert len(svc.store) == 10
+
+    monkeypatch.setattr(svc, "save_cases", real_save)
+    report = import_cases(svc, src, batch_size=5)
+    assert report.resumed_from_row == 10
+    assert (report.skipped, report.rows_read, report.created) == (10, 15, 15)
+    assert len(svc.store) == 25
+    again = import_cases(svc, src, batch_size=5)
+    assert again.created == 0 and len(svc.store) == 25
+
+
+def test_geojson_import_resolves_jurisdiction(tmp_data_dir: Path, tmp_path: Path) -> None:
+    """GeoJSON Point features supply coordinates; a missing jurisdiction is resolved from boundaries."""
+    features = [
+        {"type": "Feature", "properties": {"address": f"{i} Fiber Way", "scope": "fiber"},
+         "geometry": {"type": "Point", "coordinates": [-118.29, 34.01]}}
+        for i in range(3)
+    ]
+    features.append({"type": "Feature", "properties": {"address": "Far away"},
+                     "geometry": {"type": "Point", "coordinates": [-100.0, 40.0]}})
+    src = tmp_path / "rollout.geojson"
+    src.write_text(json.dumps({"type": "FeatureCollection", "name": "rollout", "features": features}, indent=1))
+    svc = IntakeService(data_dir=tmp_data_dir, resolver=JurisdictionResolver.from_geojson(SAMPLE_BOUNDARIES))
+    report = import_cases(svc, src)
+    assert (report.created, report.errors) == (3, 1)
+    case = svc.get_case(row_case_id(report.import_key, 1))
+    assert case.request.jurisdiction == "City of Sample"
+    assert case.meta["resolved_jurisdictions"][0]["jurisdiction_id"] == "city_of_sample"
+
+
+def test_feature_collection_streams_in_small_chunks(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """The FeatureCollection reader decodes features across read-chunk boundaries."""
+    monkeypatch.setattr(bulk, "_READ_CHUNK", 7)
+    features = [
+        {"type": "Feature", "properties": {"address": f"{i} Main", "n": 10**i}, "geometry": None} for i in range(6)
+    ]
+    src = tmp_path / "fc.geojson"
+    src.write_text(json.dumps({"crs": {"type": "name"}, "features": features, "type": "FeatureCollection"}))
+    rows = list(iter_rows(src))
+    assert [n for n, _ in rows] == [1, 2, 3, 4, 5, 6]
+    assert [r["n"] for _, r in rows] == [10**i for i in range(6)]
+
+
+def test_geojson_seq_bad_line_is_row_error(tmp_path: Path) -> None:
+    """A malformed GeoJSONSeq line is reported for that row and the rest still parse."""
+    src = tmp_path / "rollout.geojsons"
+    good = json.dumps({"type": "Feature", "properties": {"address": "1 A St"}, "geometry": None})
+    src.write_text(f"\x1e{good}\n{{broken\n{good}\n")
+    rows = list(iter_rows(src))
+    assert len(rows) == 3
+    assert "_error" in rows[1][1] and rows[2][1]["address"] == "1 A St"
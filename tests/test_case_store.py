@@ -0,0 +1,146 @@
+"""Tests for case stores: SQLite backend, legacy JSON directory, migration."""
+
+import json
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from permitting_agent.intake import IntakeService, JsonCaseStore, SqliteCaseStore, migrate_json_cases
+from permitting_agent.models import IntakeCase, IntakeRequest, ScopeKind, ScopeOfWork, SiteDetails
+
+T0 = datetime(2025, 1, 1, 9, 0, 0)
+
+
+def _case(i: int, jurisdiction: str = "City of Sample", kind: ScopeKind = ScopeKind.SMALL_CELL) -> IntakeCase:
+    request = IntakeRequest(
+        jurisdiction=jurisdiction,
+        site=SiteDetails(address=f"{i} Main St", jurisdiction=jurisdiction),
+        scope=ScopeOfWork(kind=kind),
+        existing_doc_paths=[Path(f"/docs/{i}.pdf")],
+    )
+    created = T0 + timedelta(minutes=i)
+    return IntakeCase(id=f"case{i:04d}", request=request, created_at=created, updated_at=created)
+
+
+@pytest.fixture
+def store(tmp_path: Path):
+    s = SqliteCaseStore(tmp_path / "cases.db")
+    yield s
+    s.close()
+
+
+def test_sqlite_roundtrip(store: SqliteCaseStore) -> None:
+    """Saved cases load back identically; saving again replaces rather than duplicates."""
+    case = _case(1)
+    store.save(case)
+    assert store.get("case0001") == case
+    assert store.get("missing") is None
+    store.save(case.model_copy(update={"status": "submitted"}))
+    assert len(store) == 1
+    assert store.get("case0001").status == "submitted"
+
+
+def test_sqlite_query_filters(store: SqliteCaseStore) -> None:
+    """Filters combine; jurisdiction match is case-insensitive; results are oldest first."""
+    cases = [_case(i, "City of Sample" if i % 2 else "County of Sample", ScopeKind.FIBER if i % 3 == 0 else ScopeKind.SMALL_CELL) for i in range(30)]
+    assert store.save_many(cases) == 30
+    sample = store.query(jurisdiction="city of sample")
+    assert [c.id for c in sample] == [c.id for c in cases if c.request.jurisdiction == "City of Sample"]
+    fiber_sample = store.query(jurisdiction="City of Sample", scope="fiber")
+    assert {c.id for c in fiber_sample} == {"case0003", "case0009", "case0015", "case0021", "case0027"}
+    window = store.query(created_from=T0 + timedelta(minutes=10), created_to=T0 + timedelta(minutes=13))
+    assert [c.id for c in window] == ["case0010", "case0011", "case0012"]
+    assert len(store.query(limit=5)) == 5
+    assert store.query(status="closed") == []
+
+
+def test_sqlite_query_within_old_variable_limit(store: SqliteCaseStore) -> None:
+    """Large pages are replayed in batches that fit SQLite's 999-variable limit (pre-3.32 builds)."""
+    import sqlite3
+
+    store.save_many(_case(i) for i in range(1200))
+    store._conn().setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 999)
+    assert len(store.query(limit=1200)) == 1200
+    assert sum(1 for _ in store.iter_cases()) == 1200
+
+
+def test_sqlite_queries_use_indexes(store: SqliteCaseStore) -> None:
+    """Filtered queries are answered from an index, not a table scan."""
+    conn = store._conn()
+    for column in ("jurisdiction", "scope", "status"):
+        plan = conn.execute(
+            f"EXPLAIN QUERY PLAN SELECT data FROM cases WHERE {column} = ? ORDER BY created_at, id LIMIT 10", ("x",)
+        ).fetchall()
+        assert any("USING INDEX" in row[-1] for row in plan), plan
+
+
+def test_sqlite_concurrent_readers(store: SqliteCaseStore) -> None:
+    """Reads from several threads run alongside a writer (WAL, connection per thread)."""
+    store.save_many(_case(i) for i in range(50))
+    errors: list[BaseException] = []
+
+    def read() -> None:
+        try:
+            for i in range(50):
+                assert store.get(f"case{i:04d}") is not None
+        except BaseException as e:  # surfaced in the main thread
+            errors.append(e)
+
+    threads = [threading.Thread(target=read) for _ in range(4)]
+    for t in threads:
+        t.start()
+    store.save_many(_case(i) for i in range(50, 100))
+    for t in threads:
+        t.join()
+    assert not errors
+    assert len(store) == 100
+    assert store._conn().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_migrate_json_cases(tmp_path: Path, store: SqliteCaseStore) -> None:
+    """Legacy JSON case files migrate in batches; unreadable files are reported; re-runs are idempotent."""
+    legacy = JsonCaseStore(tmp_path / "cases")
+    legacy.save_many(_case(i) for i in range(7))
+    (legacy.cases_dir / "broken.json").write_text("{not json")
+    migrated, errors = migrate_json_cases(legacy.cases_dir, store, batch_size=3)
+    assert migrated == 7
+    assert len(errors) == 1 and "broken.json" in errors[0]
+    assert store.get("case0004") == legacy.get("case0004")
+    migrate_json_cases(legacy.cases_dir, store)
+    assert len(store) == 7
+
+
+def test_intake_service_reads_legacy_cases(tmp_data_dir: Path) -> None:
+    """IntakeService writes to SQLite and still finds cases left in data/cases/<id>.json."""
+    cases_dir = tmp_data_dir / "cases"
+    cases_dir.mkdir(parents=True)
+    legacy = _case(1).model_dump(mode="json")
+    del legacy["status"]  # written before cases had a status
+    (cases_dir / "case0001.json").write_text(json.dumps(legacy))
+    svc = IntakeService(data_dir=tmp_data_dir)
+    assert svc.get_case("case0001").status == "open"
+    new = svc.create_case(_case(2).request)
+    assert not (cases_dir / f"{new.id}.json").exists()
+    page, cursor = svc.list_cases(jurisdiction="City of Sample")
+    assert [c.id for c in page] == [new.id] and cursor is None
+
+
+def test_first_write_imports_a_legacy_case(tmp_data_dir: Path) -> None:
+    """Recording an event on a case only in data/cases/<id>.json imports it into the event log first."""
+    from permitting_agent.models import CaseEventKind
+
+    cases_dir = tmp_data_dir / "cases"
+    cases_dir.mkdir(parents=True)
+    (cases_dir / "case0001.json").write_text(_case(1).model_dump_json())
+    svc = IntakeService(data_dir=tmp_data_dir)
+    svc.record_event("case0001", CaseEventKind.REVIEW_COMPLETED, {"report": "r.md"}, actor="cli")
+    svc.set_status("case0001", "submitted")
+    assert [e.kind for e in svc.case_history("case0001")] == [
+        CaseEventKind.INTAKE_CREATED, CaseEventKind.REVIEW_COMPLETED, CaseEventKind.STATUS_CHANGED
+    ]
+    assert svc.store.get("case0001").status == "submitted"
+    assert len(svc.site_index) == 1
+    with pytest.raises(KeyError):
+        svc.set_status("missing", "submitted")
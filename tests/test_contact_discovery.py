@@ -0,0 +1,97 @@
+"""Tests for contact discovery: single-pass extraction and the concurrent directory crawler."""
+
+import asyncio
+
+from permitting_agent.models import Contact
+from permitting_agent.outreach import ContactCrawler, OutreachService, extract_contacts
+from permitting_agent.outreach.discovery import merge_contacts
+from tests.mock_portal import MockPortal, MockPortalConfig
+
+PAGE = """<html><head><style>td { color: red }</style><script>var x = "js@example.gov";</script></head><body>
+<h2>Community Development</h2>
+<table>
+  <tr><td>Jane Park</td><td>Senior Planner</td><td>jpark@city.example.gov</td><td>(555) 210-3344</td></tr>
+  <tr><td>Omar Okafor</td><td>Traffic Engineer</td><td><a href="mailto:OOkafor@City.example.gov?subject=Hi">Email</a></td></tr>
+</table>
+<h2>ROW Permits</h2>
+<ul><li>Permit desk: <a href="tel:+15552100000">555.210.0000</a></li></ul>
+<h2>About this site</h2><p>Sort by row number. Webmaster: web@city.example.gov</p>
+<a href="/departments/clerk">City Clerk</a> <a href="https://other.example.com/staff">Elsewhere</a>
+</body></html>"""
+
+
+def test_extracts_contacts_in_one_pass() -> None:
+    """Rows take their section heading's role unless their own title names another; scripts are skipped."""
+    page = extract_contacts(PAGE, "https://city.example.gov/staff")
+    by_email = {c.email or c.phone: c for c in page.contacts}
+    assert set(by_email) == {"jpark@city.example.gov", "ookafor@city.example.gov", "555.210.0000"}
+    assert page.unmatched == 1  # the webmaster, under a heading with no role
+    jane = by_email["jpark@city.example.gov"]
+    assert (jane.name, jane.role, jane.phone, jane.department) == ("Jane Park", "planning", "(555) 210-3344", "Community Development")
+    assert by_email["ookafor@city.example.gov"].role == "engineering"
+    assert by_email["555.210.0000"].role == "row" and by_email["555.210.0000"].email is None
+    assert all(c.source_url == "https://city.example.gov/staff" for c in page.contacts)
+    assert ("https://city.example.gov/departments/clerk", "City Clerk") in page.links
+
+
+def test_row_titles_apply_to_their_own_row() -> None:
+    """A job title in one row doesn't carry over to the rows after it; a department label block does."""
+    page = extract_contacts(
+        """<h2>Community Development</h2><table>
+        <tr><td>Omar Okafor, Traffic Engineer</td><td>ookafor@city.example.gov</td></tr>
+        <tr><td>Jane Park, Administrative Assistant</td><td>jpark@city.example.gov</td></tr>
+        </table><h2>Staff</h2><div>City Clerk's Office</div>
+        <div><strong>Ann Lee</strong> alee@city.example.gov</div>""",
+        "https://city.example.gov/staff",
+    )
+    by_email = {c.email: c for c in page.contacts}
+    omar, jane = by_email["ookafor@city.example.gov"], by_email["jpark@city.example.gov"]
+    assert (omar.role, omar.department) == ("engineering", "Omar Okafor, Traffic Engineer")
+    assert (jane.role, jane.department) == ("planning", "Community Development")
+    assert by_email["alee@city.example.gov"].role == "clerk"
+
+
+def test_contacts_without_a_role_are_counted_not_kept() -> None:
+    """An email on a page with no planning/engineering/ROW/clerk keyword is reported as unmatched."""
+    page = extract_contacts("<p>Parks and Recreation: parks@city.example.gov, row 4</p>", "https://city.example.gov/")
+    assert page.contacts == [] and page.unmatched == 1
+
+
+def test_merge_fills_gaps_from_later_sightings() -> None:
+    """The same person found on two pages is one contact with the union of their details."""
+    merged = merge_contacts(
+        [
+            Contact(role="planning", email="a@city.gov", source_url="https://city.gov/1"),
+            Contact(role="planning", email="A@city.gov", name="Ann Lee", phone="555-210-1111", source_url="https://city.gov/2"),
+            Contact(role="row", phone="(555) 210-2222"),
+            Contact(role="row", phone="555.210.2222", name="ROW desk"),
+        ]
+    )
+    assert len(merged) == 2
+    assert (merged[0].name, merged[0].phone, merged[0].source_url) == ("Ann Lee", "555-210-1111", "https://city.gov/1")
+
+
+def test_crawl_finds_every_directory_contact() -> None:
+    """The crawler reaches all department pages from the home page, honours robots.txt and dedupes."""
+    with MockPortal(MockPortalConfig(page_count=10, directory_pages=40, staff_per_page=6)) as portal:
+        crawler = ContactCrawler(concurrency=8)
+        contact_list = asyncio.run(crawler.crawl("City of Sample", [portal.url + "/"]))
+        expected = {(role, name, email, phone) for role, name, email, phone in portal.directory_contacts() if role}
+    got = {(c.role, c.name, c.email, c.phone) for c in contact_list.contacts}
+    assert got == expected
+    stats = crawler.stats
+    assert stats.robots_skipped > 0 and stats.failed == 0
+    assert stats.unmatched >= 8 * 6  # Parks and Recreation staff
+    assert len(contact_list.source_urls) == 32 and all("/directory/" in u for u in contact_list.source_urls)
+
+
+def test_crawl_retries_throttled_pages_and_respects_budget(tmp_path) -> None:
+    """429 responses are retried after Retry-After; max_pages bounds the fetch count."""
+    config = MockPortalConfig(page_count=5, directory_pages=10, staff_per_page=2, throttle_every=7, retry_after=0)
+    with MockPortal(config) as portal:
+        svc = OutreachService(output_dir=tmp_path)
+        full, stats = asyncio.run(svc.discover_from_site("City of Sample", [portal.url + "/directory/"], concurrency=4))
+        _, small = asyncio.run(svc.discover_from_site("City of Sample", [portal.url + "/directory/"], max_pages=3))
+    assert stats.throttled > 0 and stats.failed == 0
+    assert len(full.contacts) == 16
+    assert small.fetched <= 3
@@ -0,0 +1,111 @@
+"""Tests for the global contact index: normalization, cross-jurisdiction merge, conditional refresh."""
+
+import asyncio
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from permitting_agent.models import Contact, ContactList
+from permitting_agent.outreach import ContactCrawler, ContactIndex
+from permitting_agent.outreach.contact_index import normalize_email, normalize_phone
+from tests.mock_portal import MockPortal, MockPortalConfig
+
+T0 = datetime(2026, 1, 1, 12, 0)
+
+
+@pytest.fixture
+def index(tmp_path: Path) -> ContactIndex:
+    idx = ContactIndex(tmp_path / "contacts.db")
+    yield idx
+    idx.close()
+
+
+def test_normalization() -> None:
+    """Emails ignore case and mailto:; phones ignore formatting and the US country code."""
+    assert normalize_email(" <MAILTO:Row.Eng@County.GOV?subject=x> ") == "row.eng@county.gov"
+    assert normalize_email("not an email") is None
+    assert normalize_phone("+1 (555) 210-3344") == normalize_phone("555.210.3344") == "5552103344"
+    assert normalize_phone("555-210-3344 ext. 12") == "5552103344x12"
+    assert normalize_phone("x12") is None
+
+
+def test_regional_contact_is_one_row_across_jurisdictions(index: ContactIndex) -> None:
+    """A county engineer listed by two cities merges; each city keeps its own role for them."""
+    county = "https://county.example.gov/row"
+    index.add(ContactList(jurisdiction="City A", contacts=[
+        Contact(role="row", email="ROW.Eng@county.example.gov", source_url=county),
+        Contact(role="planning", email="plan@a.example.gov", name="Ann Lee"),
+    ]), now=T0)
+    added, merged = index.add(ContactList(jurisdiction="City B", contacts=[
+        Contact(role="engineering", email="row.eng@county.example.gov", name="Rob Eng", phone="555-210-0001"),
+    ]), now=T0)
+    assert (added, merged) == (0, 1)
+    assert index.roles(email="row.eng@COUNTY.example.gov") == [("City A", "row"), ("City B", "engineering")]
+    [shared] = index.contact_list("City B").contacts
+    assert (shared.name, shared.phone, shared.source_url) == ("Rob Eng", "555-210-0001", county)
+    assert shared.last_verified == T0
+    assert index.counts(now=T0)["active"] == 2
+
+
+def test_phone_sightings_merge_by_rule(index: ContactIndex) -> None:
+    """Phone-only sightings join a desk line; an emailed sighting takes over a phone-only contact."""
+    index.add(ContactList(jurisdiction="City A", contacts=[Contact(role="clerk", phone="(555) 210-7000")]), now=T0)
+    index.add(ContactList(jurisdiction="City A", contacts=[Contact(role="clerk", phone="555.210.7000", name="Clerk desk")]), now=T0)
+    index.add(ContactList(jurisdiction="City A", contacts=[Contact(role="clerk", email="clerk@a.gov", phone="+1 555 210 7000")]), now=T0)
+    [clerk] = index.contact_list("City A").contacts
+    assert (clerk.email, clerk.name, clerk.phone) == ("clerk@a.gov", "Clerk desk", "(555) 210-7000")
+    # Two people behind one switchboard number: a phone-only sighting stays separate
+    index.add(ContactList(jurisdiction="City A", contacts=[Contact(role="clerk", email="deputy@a.gov", phone="555-210-7000")]), now=T0)
+    index.add(ContactList(jurisdiction="City A", contacts=[Contact(role="clerk", phone="555-210-7000")]), now=T0)
+    assert len(index.contact_list("City A").contacts) == 3
+
+
+def test_phone_merges_need_the_same_origin(index: ContactIndex) -> None:
+    """A shared number doesn't merge people from another page or role with a desk line, either way."""
+    desk = "https://city.example.gov/row"
+    staff = "https://city.example.gov/staff"
+    index.add(ContactList(jurisdiction="City A", contacts=[Contact(role="row", phone="555-210-0000", source_url=desk)]), now=T0)
+    index.add(ContactList(jurisdiction="City A", contacts=[
+        Contact(role="planning", name="Jane Park", email="jpark@a.gov", phone="555.210.0000", source_url=staff),
+    ]), now=T0)
+    contacts = {c.role: c for c in index.contact_list("City A").contacts}
+    assert contacts["row"].email is None and contacts["row"].source_url == desk
+    assert contacts["planning"].name == "Jane Park"
+    # A phone-only sighting joins the desk line, not Jane, though she is the only emailed contact with the number
+    index.add(ContactList(jurisdiction="City B", contacts=[Contact(role="planning", phone="555 210 0000", source_url=staff)]), now=T0)
+    assert index.roles(email="jpark@a.gov") == [("City A", "planning")]
+    # Emailed and phone-only sightings of the same page and role still merge
+    index.add(ContactList(jurisdiction="City A", contacts=[
+        Contact(role="row", name="ROW desk", email="row@a.gov", phone="555-210-0000", source_url=desk),
+    ]), now=T0)
+    assert len(index.contact_list("City A").contacts) == 2
+    index.add(ContactList(jurisdiction="City C", contacts=[Contact(role="clerk", email="clerk@c.gov", phone="555-210-5000")]), now=T0)
+    index.add(ContactList(jurisdiction="City C", contacts=[Contact(role="row", phone="555-210-5000")]), now=T0)
+    assert len(index.contact_list("City C").contacts) == 2
+
+
+def test_refresh_uses_one_conditional_get_per_stale_page(index: ContactIndex) -> None:
+    """Only stale pages are re-fetched, once each; 304s verify, edits remove dropped staff."""
+    with MockPortal(MockPortalConfig(directory_pages=10, staff_per_page=4)) as portal:
+        crawler = ContactCrawler(concurrency=4)
+        contact_list = asyncio.run(crawler.crawl("City of Sample", [portal.url + "/directory/"]))
+        index.add(contact_list, now=T0, validators=crawler.stats.validators)
+        active = index.counts(now=T0)["active"]
+        pages = len(index.stale_sources(timedelta(days=30), now=T0 + timedelta(days=31)))
+        assert active == 32 and pages == 8
+
+        fresh = asyncio.run(index.refresh(timedelta(days=30), crawler, now=T0 + timedelta(days=1)))
+        assert fresh.sources_checked == 0
+
+        requests = portal.request_count
+        first = asyncio.run(index.refresh(timedelta(days=30), crawler, now=T0 + timedelta(days=31)))
+        assert (first.sources_checked, first.not_modified, first.verified) == (8, 8, 32)
+        assert portal.request_count - requests == 8 + 1  # one GET per page, plus robots.txt
+        assert portal.not_modified_count == 8
+
+        portal.remove_staff(0, 1)
+        second = asyncio.run(index.refresh(timedelta(days=30), crawler, now=T0 + timedelta(days=62)))
+        assert (second.not_modified, second.changed, second.removed) == (7, 1, 1)
+    assert index.counts(now=T0 + timedelta(days=62)) == {"active": 31, "stale": 0, "removed": 1, "sources": 8}
+    assert "staff0.1@sample.example.gov" not in {c.email for c in index.contact_list("City of Sample").contacts}
@@ -8,6 +8,7 @@ from permitting_agent.models import Checklist, ChecklistItem, WhatsNeededReport
 from permitting_agent.document_review import DocumentReviewService
 from permitting_agent.adapters import get_adapter
 from permitting_agent.models.intake import ScopeKind
+from tests.pdf_forms import write_plan_set
 
 
 @pytest.fixture
@@ -49,3 +50,12 @@ def test_save_report(tmp_output_dir: Path, sample_checklist: Checklist) -> None:
     content = (tmp_output_dir / "report.md").read_text()
     assert "What's Needed" in content
     assert "case1" in content
+
+
+def test_report_names_pages_not_machine_read(tmp_output_dir: Path, sample_checklist: Checklist, tmp_path: Path) -> None:
+    """Sheets without a text layer are listed in the summary (and so in the Markdown report)."""
+    plans = write_plan_set(tmp_path / "plans.pdf", "tiiigtg", path_ops=50)
+    svc = DocumentReviewService(output_dir=tmp_output_dir)
+    _, report = svc.run_review("case1", [plans], sample_checklist)
+    assert "5 page(s) have no text layer" in report.summary
+    assert "plans.pdf p. 2-5, 7" in report.summary
@@ -0,0 +1,57 @@
+"""Tests for spatial jurisdiction resolution from GeoJSON boundaries."""
+
+from pathlib import Path
+
+import pytest
+
+from permitting_agent.geo import JurisdictionResolver
+
+SAMPLE_BOUNDARIES = Path(__file__).resolve().parent.parent / "config" / "boundaries" / "sample.geojson"
+
+
+@pytest.fixture
+def resolver() -> JurisdictionResolver:
+    return JurisdictionResolver.from_geojson(SAMPLE_BOUNDARIES)
+
+
+def test_resolve_city_inside_county(resolver: JurisdictionResolver) -> None:
+    """A point in the city returns city first, then county."""
+    matches = resolver.resolve(34.01, -118.29)
+    assert [m.jurisdiction_id for m in matches] == ["city_of_sample", "county_of_sample"]
+    assert matches[0].level == "municipal"
+
+
+def test_resolve_enclave_and_outside(resolver: JurisdictionResolver) -> None:
+    """Holes (unincorporated islands) belong only to the county; far points match nothing."""
+    assert [m.jurisdiction_id for m in resolver.resolve(34.04, -118.25)] == ["county_of_sample"]
+    assert resolver.resolve(40.0, -100.0) == []
+
+
+def test_resolve_many_matches_brute_force() -> None:
+    """Grid answers agree with a full ray cast on an irregular multipolygon."""
+    import math
+    import random
+
+    rng = random.Random(3)
+    parts = []
+    for cx in (0.0, 3.0):
+        ring = []
+        for i in range(200):
+            a = 2 * math.pi * i / 200
+            r = 1.0 + 0.4 * rng.random()
+            ring.append([cx + r * math.cos(a), r * math.sin(a)])
+        parts.append([ring])
+    feature = {"type": "Feature", "properties": {"jurisdiction_id": "blob"}, "geometry": {"type": "MultiPolygon", "coordinates": parts}}
+    resolver = JurisdictionResolver([feature], cell_size=0.05)
+
+    def ray_cast(x: float, y: float) -> bool:
+        inside = False
+        for (ring,) in parts:
+            for (ax, ay), (bx, by) in zip(ring, ring[1:] + ring[:1]):
+                if (ay > y) != (by > y) and x < ax + (y - ay) * (bx - ax) / (by - ay):
+                    inside = not inside
+        return inside
+
+    points = [(rng.uniform(-2, 2), rng.uniform(-2, 5)) for _ in range(3000)]
+    results = resolver.resolve_many(points)
+    assert [bool(r) for r in results] == [ray_cast(lon, lat) for lat, lon in points]
@@ -40,3 +40,32 @@ def test_resolve_adapter(intake_service: IntakeService) -> None:
     adapter = intake_service.resolve_adapter("City of Sample")
     assert adapter is not None
     assert adapter.jurisdiction_name == "City of Sample"
+
+
+def test_build_case_records_jurisdiction_suggestion(intake_service: IntakeService) -> None:
+    """A misspelled jurisdiction isn't resolved, but its closest match is recorded as a suggestion."""
+    site = SiteDetails(address="123 Main St", jurisdiction="City of Sampel")
+    case = intake_service.build_case(IntakeRequest(jurisdiction="City of Sampel", site=site))
+    assert case.meta["jurisdiction_suggestion"]["jurisdiction_id"] == "city_of_sample"
+    assert 0 < case.meta["jurisdiction_suggestion"]["score"] < 1
+    assert intake_service.resolve_adapter("City of Sampel") is None
+    exact = intake_service.build_case(IntakeRequest(jurisdiction="City of Sample", site=site))
+    assert "jurisdiction_suggestion" not in exact.meta
+
+
+def test_create_case_resolves_boundaries(tmp_data_dir: Path) -> None:
+    """With a resolver, coordinates are resolved and a wrong entered jurisdiction is flagged."""
+    from permitting_agent.geo import JurisdictionResolver
+    from tests.test_geo import SAMPLE_BOUNDARIES
+
+    svc = IntakeService(data_dir=tmp_data_dir, resolver=JurisdictionResolver.from_geojson(SAMPLE_BOUNDARIES))
+    site = SiteDetails(address="1 Edge Rd", jurisdiction="County of Sample", lat=34.01, lon=-118.29)
+    case = svc.create_case(IntakeRequest(jurisdiction="County of Sample", site=site))
+    assert [m["jurisdiction_id"] for m in case.meta["resolved_jurisdictions"]] == ["city_of_sample", "county_of_sample"]
+    assert "jurisdiction_mismatch" not in case.meta
+    adapter = svc.resolve_site_adapter(site)
+    assert adapter is not None and adapter.jurisdiction_id == "city_of_sample"
+
+    outside = SiteDetails(address="9 Far Rd", jurisdiction="City of Sample", lat=34.20, lon=-118.45)
+    case = svc.create_case(IntakeRequest(jurisdiction="City of Sample", site=outside))
+    assert case.meta["jurisdiction_mismatch"] is True
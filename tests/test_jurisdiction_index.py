@@ -0,0 +1,78 @@
+"""Tests for the jurisdiction name index: parsing, aliases, state qualifiers, fuzzy fallback."""
+
+import pytest
+
+from permitting_agent.adapters.index import JurisdictionIndex, NameMatch, ParsedName, parse_jurisdiction_name
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("City of Sample", ParsedName("city", "sample", None)),
+        ("Sample City", ParsedName("city", "sample", None)),
+        ("CITY OF SAMPLE", ParsedName("city", "sample", None)),
+        ("City of Sample, CA", ParsedName("city", "sample", "ca")),
+        ("Sample County, California", ParsedName("county", "sample", "ca")),
+        ("city_of_kansas_city_mo", ParsedName("city", "kansas city", "mo")),
+        ("St. Louis County", ParsedName("county", "saint louis", None)),
+        ("New York", ParsedName(None, "new york", None)),
+    ],
+)
+def test_parse_jurisdiction_name(name: str, expected: ParsedName) -> None:
+    """Names reduce to (kind, core, state)."""
+    assert parse_jurisdiction_name(name) == expected
+
+
+@pytest.fixture
+def index() -> JurisdictionIndex:
+    idx = JurisdictionIndex()
+    idx.add("city_of_springfield_il", ["City of Springfield"], state="IL")
+    idx.add("city_of_springfield_mo", ["City of Springfield"], state="MO")
+    idx.add("sangamon_county_il", ["Sangamon County"], state="IL")
+    idx.add("city_of_los_angeles", ["City of Los Angeles", "LA"], state="CA")
+    idx.add("los_angeles_county", ["County of Los Angeles"], state="CA")
+    return idx
+
+
+def test_lookup_state_qualifier(index: JurisdictionIndex) -> None:
+    """State disambiguates same-named cities; without it the lookup is ambiguous."""
+    assert index.lookup("Springfield, IL") == "city_of_springfield_il"
+    assert index.lookup("City of Springfield, Missouri") == "city_of_springfield_mo"
+    assert index.lookup("Springfield") is None
+
+
+def test_lookup_kind_and_alias(index: JurisdictionIndex) -> None:
+    """Kind separates city from county; aliases are exact hits."""
+    assert index.lookup("Los Angeles City") == "city_of_los_angeles"
+    assert index.lookup("Los Angeles County, CA") == "los_angeles_county"
+    assert index.lookup("LA") == "city_of_los_angeles"
+
+
+def test_lookup_fuzzy(index: JurisdictionIndex) -> None:
+    """Misspellings fall back to trigram similarity; unrelated names miss."""
+    assert index.lookup("Sangamom County") == "sangamon_county_il"
+    assert index.lookup("Sangamom County", fuzzy=False) is None
+    assert index.lookup("Metropolis") is None
+
+
+def test_lookup_requires_state_and_kind_agreement(index: JurisdictionIndex) -> None:
+    """A state or kind in the query rules out entries with another (or no) state or kind, fuzzy or not."""
+    assert index.lookup("Springfield, TX") is None
+    assert index.lookup("Sangamon City") is None
+    assert index.lookup("Sangamom County, TX") is None
+    idx = JurisdictionIndex()
+    idx.add("city_of_sample")
+    assert idx.lookup("City of Sample, CA") is None
+    assert idx.lookup("City of Sample") == "city_of_sample"
+
+
+def test_match_scores(index: JurisdictionIndex) -> None:
+    """Exact and parsed-name matches are certain; fuzzy ones carry their score; ties list the candidates."""
+    assert index.match("LA") == NameMatch("city_of_los_angeles", 1.0, "exact")
+    assert index.match("Springfield, IL") == NameMatch("city_of_springfield_il", 1.0, "name")
+    fuzzy = index.match("Sangamom County")
+    assert fuzzy.jurisdiction_id == "sangamon_county_il" and fuzzy.method == "fuzzy"
+    assert 0 < fuzzy.score < 1 and not fuzzy.certain
+    assert index.lookup("Sangamom County", min_score=0.95) is None
+    tied = index.match("Springfield")
+    assert tied.ambiguous and set(tied.candidates) == {"city_of_springfield_il", "city_of_springfield_mo"}
@@ -0,0 +1,63 @@
+"""Tests for the local mock portal server against the crawler utilities."""
+
+import time
+
+import httpx
+
+from permitting_agent.portal_crawl import crawl_form_fields
+from permitting_agent.portal_research.crawler import can_fetch, fetch_page, get_robots_parser
+from tests.mock_portal import MockPortal, MockPortalConfig
+
+
+def test_robots_disallow(mock_portal: MockPortal) -> None:
+    """robots.txt served by the mock blocks /private/ but allows regular pages."""
+    parser = get_robots_parser(mock_portal.url)
+    assert can_fetch(parser, mock_portal.page_url(1)) is True
+    assert can_fetch(parser, f"{mock_portal.url}/private/1") is False
+
+
+def test_page_tree_respects_depth() -> None:
+    """Every page is reachable from the root within link_depth hops."""
+    with MockPortal(MockPortalConfig(page_count=40, link_depth=2)) as portal:
+        depth = {0: 0}
+        frontier = [0]
+        while frontier:
+            nxt = []
+            for i in frontier:
+                for c in portal.children(i):
+                    depth[c] = depth[i] + 1
+                    nxt.append(c)
+            frontier = nxt
+        assert len(depth) == 40
+        assert max(depth.values()) <= 2
+
+
+def test_throttle_returns_429() -> None:
+    """throttle_every=2 makes every second request return 429 with Retry-After."""
+    with MockPortal(MockPortalConfig(throttle_every=2)) as portal, httpx.Client() as client:
+        statuses = [client.get(portal.page_url(0)).status_code for _ in range(4)]
+        assert statuses == [200, 429, 200, 429]
+        assert portal.throttled_count == 2
+        body, _ = fetch_page(portal.page_url(0), client=client, rate_limit_rps=0)
+        assert body is not None
+
+
+def test_slow_endpoint_and_large_pdf() -> None:
+    """Slow paths are delayed; the PDF has the configured size."""
+    cfg = MockPortalConfig(slow_delay=0.1, pdf_bytes=100_000)
+    with MockPortal(cfg) as portal, httpx.Client() as client:
+        start = time.monotonic()
+        assert client.get(f"{portal.url}/slow/1").status_code == 200
+        assert time.monotonic() - start >= 0.1
+        r = client.get(f"{portal.url}/docs/plans.pdf")
+        assert r.headers["content-type"] == "application/pdf"
+        assert len(r.content) == 100_000
+
+
+def test_crawl_form_fields_big_form() -> None:
+    """crawl_form_fields finds every visible field of a large form."""
+    with MockPortal(MockPortalConfig(form_field_count=200)) as portal:
+        fields = crawl_form_fields(f"{portal.url}/apply")
+        assert len(fields) == 200
+        assert fields[0]["label"] == "Field 0"
+        assert fields[0]["required"] is True
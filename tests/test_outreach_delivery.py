@@ -0,0 +1,123 @@
+"""Tests for the outreach send queue against a local SMTP sink."""
+
+import mailbox
+from email import message_from_bytes
+from pathlib import Path
+
+import pytest
+
+from permitting_agent.models import DeliveryStatus, OutreachDraft
+from permitting_agent.outreach import MboxWriter
+from permitting_agent.outreach.delivery import (
+    DeliveryPolicy,
+    DeliveryQueue,
+    SmtpSettings,
+    parse_message,
+    send_queued,
+)
+from permitting_agent.outreach.mailbox import draft_key
+from tests.smtp_sink import SmtpSink, SmtpSinkConfig
+
+FAST = DeliveryPolicy(domain_interval=0.0, concurrency=4, backoff_base=0.01, backoff_max=0.05)
+
+
+def _drafts(domains: int, per_domain: int) -> list[OutreachDraft]:
+    return [
+        OutreachDraft(
+            to_role=role,
+            subject=f"Permit inquiry {d}-{role}",
+            body="Hello,\n\nA question about permits.\n",
+            contact_ids=[f"{role}@city{d}.gov"],
+            jurisdiction=f"City {d}",
+        )
+        for d in range(domains)
+        for role in ("planning", "engineering", "row", "clerk")[:per_domain]
+    ]
+
+
+@pytest.fixture
+def queue(tmp_path: Path) -> DeliveryQueue:
+    q = DeliveryQueue(tmp_path / "outbox.db")
+    yield q
+    q.close()
+
+
+def _settings(sink: SmtpSink) -> SmtpSettings:
+    return SmtpSettings(host="127.0.0.1", port=sink.port, timeout=5)
+
+
+def test_enqueue_is_idempotent(queue: DeliveryQueue, tmp_path: Path) -> None:
+    """Queueing the same drafts again (directly or via an mbox) adds nothing."""
+    drafts = _drafts(3, 2)
+    assert queue.enqueue_drafts(drafts, "permits@acme.example") == 6
+    assert queue.enqueue_drafts(drafts, "permits@acme.example") == 0
+    with MboxWriter(tmp_path / "drafts.mbox", sender="permits@acme.example") as writer:
+        for draft in drafts:
+            writer.write(draft)
+    parsed = [parse_message(m.as_bytes()) for m in mailbox.mbox(tmp_path / "drafts.mbox")]
+    assert [key for _, _, key in parsed] == [draft_key(d) for d in drafts]
+    assert queue.enqueue_many((b"x", s, r, k) for s, r, k in parsed) == 0
+    assert queue.counts()["queued"] == 6
+
+
+def test_sends_everything_once_with_domain_spacing(queue: DeliveryQueue) -> None:
+    """All messages arrive once; messages to one domain are spaced by the policy interval."""
+    queue.enqueue_drafts(_drafts(3, 3), "permits@acme.example")
+    policy = DeliveryPolicy(domain_interval=0.15, concurrency=4)
+    with SmtpSink() as sink:
+        report = send_queued(queue, _settings(sink), policy)
+        again = send_queued(queue, _settings(sink), policy)
+    assert (report.sent, report.failed, report.remaining) == (9, 0, 0)
+    assert again.sent == 0 and len(sink.messages) == 9
+    assert sink.connections <= 4  # connections are pooled, not opened per message
+    by_domain: dict[str, list[float]] = {}
+    for m in sink.messages:
+        by_domain.setdefault(m.recipients[0].split("@")[1], []).append(m.received_at)
+    for times in by_domain.values():
+        gaps = [b - a for a, b in zip(times, times[1:])]
+        assert len(times) == 3 and min(gaps) >= 0.12
+    msg = message_from_bytes(sink.messages[0].data)
+    assert msg["Message-ID"].startswith("<") and msg["From"] == "permits@acme.example"
+
+
+def test_temporary_failures_are_retried(queue: DeliveryQueue) -> None:
+    """451 replies are retried with backoff until they succeed."""
+    queue.enqueue_drafts(_drafts(4, 2), "permits@acme.example")
+    with SmtpSink(SmtpSinkConfig(temp_fail_every=3)) as sink:
+        report = send_queued(queue, _settings(sink), FAST)
+    assert report.sent == 8 and report.retried >= 2
+    assert len({m.data for m in sink.messages}) == 8
+
+
+def test_rejected_recipient_fails_permanently(queue: DeliveryQueue) -> None:
+    """A 550 for every recipient fails the message without retries; other domains still send."""
+    queue.enqueue_drafts(_drafts(2, 2), "permits@acme.example")
+    with SmtpSink(SmtpSinkConfig(reject_domains=("city1.gov",))) as sink:
+        report = send_queued(queue, _settings(sink), FAST)
+    assert (report.sent, report.failed, report.retried) == (2, 2, 0)
+    assert queue.counts()["failed"] == 2
+
+
+def test_interrupted_sends_are_never_repeated(queue: DeliveryQueue) -> None:
+    """A connection lost after DATA, or a row left 'sending' by a crash, becomes 'unknown', not a resend."""
+    queue.enqueue_drafts(_drafts(3, 1), "permits@acme.example")
+    crashed = queue.claim("city2.gov", now=float("inf"))
+    assert crashed is not None
+    with SmtpSink(SmtpSinkConfig(drop_after_data_every=2)) as sink:
+        report = send_queued(queue, _settings(sink), FAST)
+        again = send_queued(queue, _settings(sink), FAST)
+    assert (report.sent, report.unknown) == (1, 2)
+    assert again.sent == 0 and sink.data_count == 2
+    counts = queue.counts()
+    assert (counts["sent"], counts["unknown"]) == (1, 2)
+
+
+def test_unreachable_server_defers_messages(queue: DeliveryQueue) -> None:
+    """With the relay down, messages stay queued for a later run instead of failing."""
+    queue.enqueue_drafts(_drafts(2, 1), "permits@acme.example")
+    with SmtpSink() as sink:
+        port = sink.port
+    policy = DeliveryPolicy(domain_interval=1.0, backoff_base=30.0)
+    report = send_queued(queue, SmtpSettings(host="127.0.0.1", port=port, timeout=1), policy)
+    assert (report.sent, report.retried, report.remaining) == (0, 2, 2)
+    assert queue.counts()[DeliveryStatus.QUEUED.value] == 2
@@ -0,0 +1,119 @@
+"""Tests for outreach templates (lookup, caching) and streaming .eml / mbox draft output."""
+
+import mailbox
+import os
+from email import message_from_binary_file, message_from_bytes, policy
+from pathlib import Path
+
+import pytest
+
+from permitting_agent.models import Contact, ContactList, OutreachDraft
+from permitting_agent.outreach import EmlWriter, MboxWriter, OutreachService, TemplateError, TemplateLibrary
+from permitting_agent.outreach.mailbox import draft_bytes
+
+
+def _write(path: Path, text: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return path
+
+
+def _contacts(jurisdiction: str, *roles: str) -> ContactList:
+    return ContactList(
+        jurisdiction=jurisdiction,
+        contacts=[Contact(role=r, email=f"{r}@{jurisdiction.split()[-1].lower()}.gov", name=f"{r.title()} Lead") for r in roles],
+    )
+
+
+@pytest.fixture
+def template_dir(tmp_path: Path) -> Path:
+    root = tmp_path / "templates"
+    _write(root / "default.txt", "Subject: Inquiry - $jurisdiction\n\nHello $contact_name,\nre: $role\n")
+    _write(root / "row.txt", "Subject: ROW - $jurisdiction\n\nROW body for $jurisdiction\n")
+    _write(root / "city_of_sample" / "planning.txt", "Subject: Sample planning\n\nHi $contact_name from $company\n")
+    return root
+
+
+def test_lookup_prefers_jurisdiction_then_role(template_dir: Path) -> None:
+    """Jurisdiction+role beats role beats default; unknown dirs fall back to the built-in template."""
+    lib = TemplateLibrary(template_dir)
+    assert lib.get("City of Sample", "planning").name == "city_of_sample/planning"
+    assert lib.get("City of Sample", "row").name == "row"
+    assert lib.get("Town of Elsewhere", "clerk").name == "default"
+    assert TemplateLibrary(template_dir / "missing").get("City of Sample", "clerk").name == "builtin"
+
+
+def test_drafts_render_variables(template_dir: Path) -> None:
+    """Drafts are rendered per role with contact and caller-supplied variables."""
+    svc = OutreachService(templates=TemplateLibrary(template_dir))
+    drafts = svc.draft_emails(_contacts("City of Sample", "planning", "row", "clerk"), {"company": "Acme Fiber"})
+    by_role = {d.to_role: d for d in drafts}
+    assert by_role["planning"].body == "Hi Planning Lead from Acme Fiber"
+    assert by_role["row"].subject == "ROW - City of Sample"
+    assert by_role["clerk"].body.startswith("Hello Clerk Lead,")
+    with pytest.raises(TemplateError, match=r"\$company"):
+        svc.draft_emails(_contacts("City of Sample", "planning"))
+
+
+def test_reload_recompiles_changed_template(template_dir: Path) -> None:
+    """Compiled templates are reused until their file changes and the library reloads."""
+    lib = TemplateLibrary(template_dir)
+    first = lib.get("Town of Elsewhere", "clerk")
+    assert lib.get("Town of Elsewhere", "engineering") is first
+    path = _write(template_dir / "default.txt", "Subject: Changed\n\nNew body\n")
+    os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 10**9))
+    _write(template_dir / "county_of_sample" / "default.txt", "Subject: County\n\nCounty body\n")
+    lib.reload()
+    assert lib.get("Town of Elsewhere", "clerk").subject.template == "Changed"
+    assert lib.get("County of Sample", "clerk").name == "county_of_sample/default"
+
+
+def test_bad_template_is_reported_per_jurisdiction(template_dir: Path, tmp_path: Path) -> None:
+    """A malformed template skips only its jurisdiction in a batch run."""
+    _write(template_dir / "town_of_bad" / "default.txt", "no subject line here\n")
+    svc = OutreachService(output_dir=tmp_path, templates=TemplateLibrary(template_dir))
+    with MboxWriter(tmp_path / "drafts.mbox") as writer:
+        report = svc.write_drafts(
+            [_contacts("Town of Bad", "clerk"), _contacts("Town of Good", "clerk"), ContactList(jurisdiction="Empty")], writer
+        )
+    assert report.drafts == 1 and report.jurisdictions == 3
+    assert report.without_contacts == ["Empty"]
+    assert "Town of Bad" in report.errors[0]
+
+
+def test_mbox_streams_all_drafts(template_dir: Path, tmp_path: Path) -> None:
+    """Bulk drafts for many jurisdictions land in one mbox readable by the stdlib."""
+    lists = (_contacts(f"Town of T{i}", "planning", "engineering") for i in range(50))
+    svc = OutreachService(output_dir=tmp_path, templates=TemplateLibrary(template_dir))
+    with MboxWriter(tmp_path / "drafts.mbox", sender="permits@acme.example") as writer:
+        report = svc.write_drafts(lists, writer)
+    assert report.drafts == 100 and report.templates_used == {"default": 100}
+    box = mailbox.mbox(tmp_path / "drafts.mbox")
+    messages = list(box)
+    assert len(messages) == 100
+    assert messages[0]["To"] == "planning@t0.gov"
+    assert messages[0]["X-Permitting-Jurisdiction"] == "Town of T0"
+    assert messages[-1]["From"] == "permits@acme.example"
+
+
+def test_eml_writer_one_file_per_draft(template_dir: Path, tmp_path: Path) -> None:
+    """Each draft becomes its own .eml file named after jurisdiction and role."""
+    svc = OutreachService(output_dir=tmp_path, templates=TemplateLibrary(template_dir))
+    with EmlWriter(tmp_path / "eml") as writer:
+        svc.write_drafts([_contacts("City of Sample", "row"), _contacts("City of Sample", "row")], writer)
+    names = sorted(p.name for p in (tmp_path / "eml").iterdir())
+    assert names == ["City_of_Sample_row.eml", "City_of_Sample_row_2.eml"]
+    with open(tmp_path / "eml" / names[0], "rb") as f:
+        msg = message_from_binary_file(f, policy=policy.default)
+    assert msg["Subject"] == "ROW - City of Sample"
+    assert msg.get_content().strip() == "ROW body for City of Sample"
+
+
+def test_draft_bytes_encoding_round_trip() -> None:
+    """Non-ASCII subjects, 'From ' body lines and over-long lines survive a stdlib parse."""
+    body = "From the applicant – café permits\n" + "x" * 1200
+    draft = OutreachDraft(to_role="row", subject="Permit inquiry – Ciudad de Señora " * 3, body=body, contact_ids=["a@b.gov", "Jane"])
+    msg = message_from_bytes(draft_bytes(draft, mbox=False), policy=policy.default)
+    assert msg["Subject"] == draft.subject and msg["To"] == "a@b.gov"
+    assert msg.get_content().rstrip("\n") == body
+    assert b"\n>From the applicant" in draft_bytes(draft.model_copy(update={"body": "From the applicant"}), mbox=True)
@@ -10,8 +10,16 @@ from permitting_agent.document_review.parsers import (
     parse_document,
     _extract_fields_from_text,
     _read_pdf_text,
+    classify_page,
+    read_form_fields,
 )
 from permitting_agent.models.document import Confidence
+from tests.pdf_forms import sample_fields, write_pdf, write_plan_set
+
+
+@pytest.fixture
+def fillable_pdf(tmp_path: Path) -> Path:
+    return write_pdf(tmp_path / "application.pdf", sample_fields(10, pages=2), pages=2)
 
 
 def test_parse_pdf_blank(sample_pdf_path: Path) -> None:
@@ -67,3 +75,85 @@ def test_parse_pdf_missing_file() -> None:
     result = parse_pdf(Path("/nonexistent/file.pdf"))
     # Pypdf or file open may raise or return empty
     assert result.success is False or result.artifact is not None
+
+
+def test_read_form_fields(fillable_pdf: Path) -> None:
+    """AcroForm fields come back with qualified names, types, options, values, flags and pages, in form order."""
+    fields = {f.name: f for f in read_form_fields(fillable_pdf)}
+    assert list(fields)[:3] == ["applicant.name", "applicant.email", "site.address"]
+    assert len(fields) == 10
+    name = fields["applicant.name"]
+    assert (name.label, name.type, name.value, name.required, name.page) == (
+        "Applicant / company name", "text", "Acme Telecom", True, 1
+    )
+    assert fields["scope"].options == ["Small cell", "Fiber", "Both"] and fields["scope"].value == "Small cell"
+    assert (fields["fee_acknowledged"].type, fields["fee_acknowledged"].value) == ("checkbox", "Yes")
+    assert fields["pole_owner"].options == ["City", "Utility"] and fields["pole_owner"].value is None
+    assert fields["signature"].type == "signature" and fields["extra_9"].page == 2
+
+
+def test_parse_modes(fillable_pdf: Path, tmp_path: Path) -> None:
+    """auto reads fillable PDFs from the form without text extraction and falls back to text for flat ones."""
+    form = parse_pdf(fillable_pdf, mode="auto").artifact
+    assert form.raw_text_preview is None and len(form.form_fields) == 10
+    assert {f.name: f.value for f in form.extracted_fields} == {
+        "applicant.name": "Acme Telecom", "site.address": "123 Main St", "scope": "Small cell", "fee_acknowledged": "Yes"
+    }
+    assert all(f.confidence == Confidence.CERTAIN for f in form.extracted_fields)
+
+    flat = write_pdf(tmp_path / "flat.pdf", pages=1)
+    fallback = parse_document(flat, mode="auto").artifact
+    assert fallback.form_fields == [] and "application_form" in [f.name for f in fallback.extracted_fields]
+    assert parse_pdf(flat, mode="form").artifact.extracted_fields == []
+    # the default stays text extraction, so document review sees the same fields as before
+    assert parse_pdf(fillable_pdf).artifact.form_fields == []
+    with pytest.raises(ValueError):
+        parse_pdf(flat, mode="fast")
+
+
+def test_fill_application_uses_form_fields(fillable_pdf: Path) -> None:
+    """Uploading a fillable PDF offers its exact fields, with choices as selects."""
+    import app as web
+
+    client = web.app.test_client()
+    with open(fillable_pdf, "rb") as f:
+        res = client.post("/fill-application/parse", data={"form_file": (f, "application.pdf")})
+    assert res.status_code == 302
+    with client.session_transaction() as sess:
+        fields = {f["name"]: f for f in sess["fill_fields"]}
+    assert "signature" not in fields and "applicant_name" not in fields
+    assert fields["site.address"]["value"] == "123 Main St"
+    page = client.get("/fill-application/fields").get_data(as_text=True)
+    assert 'name="field_scope"' in page and '<option value="Small cell" selected>' in page
+
+
+def test_image_only_pages_are_not_extracted(tmp_path: Path) -> None:
+    """Scanned and vector-only sheets are classified from their content streams and never extracted;
+    a title block drawn from a Form XObject makes a scanned sheet mixed, and its text is read.
+    """
+    plans = write_plan_set(tmp_path / "plans.pdf", "tiimg", path_ops=200)
+    artifact = parse_pdf(plans).artifact
+    assert [(p.number, p.kind, p.extracted) for p in artifact.pages] == [
+        (1, "text", True), (2, "image", False), (3, "image", False), (4, "mixed", True), (5, "graphics", False)
+    ]
+    assert artifact.pages[3].images == 1 and artifact.pages[3].text_ops == 1
+    assert "title block" in _read_pdf_text(plans)
+    assert any(f.name == "application_form" for f in artifact.extracted_fields)
+
+
+def test_classify_page_content_tokens() -> None:
+    """Text objects are found without spaces after BT and inline images count as images; names that
+    merely contain BT or Do do not count.
+    """
+    from pypdf import PdfWriter
+    from pypdf.generic import DecodedStreamObject, NameObject
+
+    writer = PdfWriter()
+    kinds = []
+    for ops in (b"BT/F1 9 Tf (x)Tj ET", b"q BI /W 1 /H 1 /CS /G /BPC 8 ID \x00BT EI Q", b"/GS_BT gs 0 0 m 1 1 l S", b""):
+        page = writer.add_blank_page(612, 792)
+        content = DecodedStreamObject()
+        content.set_data(ops)
+        page[NameObject("/Contents")] = writer._add_object(content)
+        kinds.append(classify_page(page).kind)
+    assert kinds == ["text", "image", "graphics", "graphics"]
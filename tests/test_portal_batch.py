@@ -0,0 +1,113 @@
+"""Tests for batch portal submissions: per-portal limits, the shared approval queue, resume."""
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from permitting_agent.models import SubmissionStatus
+from permitting_agent.portal_automation.batch import ApprovalQueue, BatchScheduler, BatchStore
+from tests.test_portal_engine import FakeEngine
+
+PORTALS = ["https://a.example.gov/apply", "https://b.example.gov/apply"]
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> BatchStore:
+    s = BatchStore(tmp_path / "portal_batches.db")
+    yield s
+    s.close()
+
+
+def _start(scheduler: BatchScheduler, batch: str) -> tuple[threading.Thread, list]:
+    out: list = []
+    thread = threading.Thread(target=lambda: out.append(scheduler.run(batch)))
+    thread.start()
+    return thread, out
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def test_portal_limit_and_single_approval_queue(store: BatchStore) -> None:
+    """Flows from every portal wait in one queue, never more than portal_limit per portal at once."""
+    store.add("rollout", [(f"case{i}", PORTALS[i % 2], {}) for i in range(8)])
+    approvals = ApprovalQueue()
+    scheduler = BatchScheduler(store, approvals, portal_limit=2, workers=8)
+    thread, out = _start(scheduler, "rollout")
+
+    _wait_for(lambda: len(approvals.pending()) == 4)
+    time.sleep(0.1)  # nobody else gets in while those four wait
+    waiting = approvals.pending()
+    assert len(waiting) == 4
+    assert sorted(r.portal for r in waiting) == ["https://a.example.gov"] * 2 + ["https://b.example.gov"] * 2
+
+    while thread.is_alive():
+        req = approvals.get(timeout=0.05)
+        if req is not None and not approvals.approve_matching(req.step["id"]):
+            approvals.resolve(req.id, True)  # submit: one at a time
+    report = out[0]
+    assert report.counts["completed"] == 8
+    assert report.max_parallel == 4
+    assert report.approvals == 8 * 6
+
+
+def test_bulk_approval_never_approves_submit() -> None:
+    """approve_matching leaves final submits for a person to approve one by one."""
+    approvals = ApprovalQueue()
+    threading.Thread(target=approvals.request, args=("c1", "p", {"id": "submit", "danger": "final"}), daemon=True).start()
+    _wait_for(lambda: approvals.pending())
+    assert approvals.approve_matching("submit") == 0
+    approvals.close()
+    assert approvals.pending() == []
+
+
+def test_interrupted_batch_resumes_at_step(store: BatchStore) -> None:
+    """A stopped batch keeps completed steps; the next run redoes them in the browser without asking again."""
+    store.add("rollout", [("case1", PORTALS[0], {"application": Path("app.pdf")})])
+    approvals = ApprovalQueue()
+    scheduler = BatchScheduler(store, approvals, engine=FakeEngine())
+    thread, _ = _start(scheduler, "rollout")
+    while (req := approvals.get(timeout=5)).step["id"] != "upload_site_plan":
+        approvals.resolve(req.id, True)
+    scheduler.stop()
+    thread.join()
+    [job] = store.jobs("rollout")
+    assert job.status is SubmissionStatus.QUEUED
+    assert job.completed_steps == ["navigate", "login", "upload_application"]
+
+    engine = FakeEngine()
+    approvals = ApprovalQueue()
+    asked: list[str] = []
+    thread, out = _start(BatchScheduler(store, approvals, engine=engine), "rollout")
+    while thread.is_alive():
+        if (req := approvals.get(timeout=0.05)) is not None:
+            asked.append(req.step["id"])
+            approvals.resolve(req.id, True)
+    assert asked == ["upload_site_plan", "pay_fee", "submit"]
+    assert engine.ran == ["navigate", "login", "upload_application", "upload_site_plan", "pay_fee", "submit"]
+    assert engine.sessions == [{"application": Path("app.pdf")}]
+    assert out[0].resumed == 1
+    [job] = store.jobs("rollout")
+    assert job.status is SubmissionStatus.COMPLETED
+    assert job.confirmation == "Confirmation number: SUB-0001"
+
+
+def test_crash_during_submit_is_not_resubmitted(store: BatchStore) -> None:
+    """A job found mid-submit after a crash becomes unknown and is left alone."""
+    store.add("rollout", [("case1", PORTALS[0], {}), ("case2", PORTALS[1], {})])
+    crashed = store.jobs("rollout")[0]
+    store.set_status(crashed.id, SubmissionStatus.SUBMITTING, completed_steps=["navigate", "login"])
+    scheduler = BatchScheduler(store, ApprovalQueue(), approve_each_step=False)
+    thread, out = _start(scheduler, "rollout")
+    while thread.is_alive():
+        if (req := scheduler.approvals.get(timeout=0.05)) is not None:
+            scheduler.approvals.resolve(req.id, True)
+    counts = out[0].counts
+    assert counts["unknown"] == 1 and counts["completed"] == 1
+    assert store.jobs("rollout", SubmissionStatus.UNKNOWN)[0].case_id == "case1"
@@ -0,0 +1,111 @@
+"""Tests for multi-page form discovery: wizard links, tabs, budgets and the schema cache."""
+
+import asyncio
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import httpx
+import pytest
+from bs4 import BeautifulSoup
+
+from permitting_agent import portal_crawl
+from permitting_agent.portal_crawl import FormDiscovery, FormSchemaCache, discover_form_schema, extract_form_fields
+from tests.mock_portal import MockPortal, MockPortalConfig
+
+
+@pytest.mark.parametrize("step_nav", [True, False])
+def test_discovers_every_wizard_step_in_order(step_nav: bool) -> None:
+    """Step lists and chains of Next links / Continue forms both yield all steps in wizard order."""
+    with MockPortal(MockPortalConfig(wizard_pages=5, wizard_step_nav=step_nav)) as portal:
+        discovery = FormDiscovery()
+        schema = asyncio.run(discovery.discover(f"{portal.url}/wizard/0"))
+    assert [p.title for p in schema.pages] == [f"Step {i} of 5" for i in range(1, 6)]
+    assert [f.name for f in schema.fields if f.page == 2] == ["s2_f0", "s2_f1", "s2_f2"]
+    assert len(schema.fields) == 5 * 3 + 3
+    # cancel, log out and the final POST form were never requested
+    assert discovery.stats.fetched == 6 and discovery.stats.failed == 0
+
+
+def test_tabs_merge_into_their_page() -> None:
+    """Inline and URL-loaded tab panels belong to the page that shows them, labelled by their tab."""
+    with MockPortal(MockPortalConfig(wizard_pages=2)) as portal:
+        schema = asyncio.run(FormDiscovery().discover(f"{portal.url}/wizard/0"))
+    first = {f.name: f for f in schema.fields if f.page == 0}
+    assert first["site_address"].section == "Site" and first["site_address"].required
+    assert first["contact_email"].section == "Contact" and first["contact_email"].type == "email"
+    assert len(schema.pages) == 2
+
+
+def test_page_budget() -> None:
+    """max_pages caps the fetches; links beyond it are counted, not followed."""
+    with MockPortal(MockPortalConfig(wizard_pages=8)) as portal:
+        discovery = FormDiscovery(max_pages=3)
+        schema = asyncio.run(discovery.discover(f"{portal.url}/wizard/0"))
+    assert discovery.stats.fetched == 3
+    assert discovery.stats.budget_skipped > 0
+    assert len(schema.pages) <= 3
+
+
+def test_bad_pages_and_links_do_not_stall_the_crawl(monkeypatch: pytest.MonkeyPatch) -> None:
+    """An unparseable href is ignored, and a page that fails to process is counted, not fatal."""
+    pages = {
+        "/apply": '<form><input name="applicant"></form><a href="http://[bad/x">Next</a> <a href="/step2">Next</a>',
+        "/step2": '<form><input name="site"></form><a href="/step3">Next</a>',
+        "/step3": '<form><input name="fee"></form>',
+    }
+
+    def serve(request: httpx.Request) -> httpx.Response:
+        body = pages.get(request.url.path)
+        return httpx.Response(200, html=body) if body else httpx.Response(404)
+
+    real_links = portal_crawl.wizard_links
+
+    def flaky_links(soup, page_url):
+        if page_url.endswith("/step3"):
+            raise RuntimeError("parser blew up")
+        return real_links(soup, page_url)
+
+    monkeypatch.setattr(portal_crawl, "wizard_links", flaky_links)
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(serve)) as client:
+            discovery = FormDiscovery(concurrency=1, client=client)
+            return discovery, await asyncio.wait_for(discovery.discover("https://portal.example.gov/apply"), 5)
+
+    discovery, schema = asyncio.run(run())
+    assert [p.url for p in schema.pages] == ["https://portal.example.gov/apply", "https://portal.example.gov/step2"]
+    assert discovery.stats.failed == 1
+
+
+def test_schema_cache_skips_the_crawl(tmp_path: Path) -> None:
+    """A cached schema is served without a request until it expires or --refresh is asked for."""
+    cache = FormSchemaCache(tmp_path)
+    with MockPortal(MockPortalConfig(wizard_pages=3)) as portal:
+        url = f"{portal.url}/wizard/0"
+        first = discover_form_schema(url, cache=cache)
+        requests = portal.request_count
+        assert discover_form_schema(url, cache=cache) == first
+        assert portal.request_count == requests
+        discover_form_schema(url, cache=cache, refresh=True)
+        assert portal.request_count > requests
+    assert cache.get(url, now=datetime.utcnow() + timedelta(days=8)) is None
+
+
+def test_labels_by_for_wrapping_and_aria() -> None:
+    """Labels come from <label for>, a wrapping <label> or aria-label; fieldsets name the section."""
+    soup = BeautifulSoup(
+        "<form><fieldset><legend>Applicant</legend>"
+        "<label for='a'>Name</label><input id='a' name='applicant'>"
+        "<label>Email <input name='email' type='email'></label></fieldset>"
+        "<input name='apn' aria-label='Parcel number' aria-required='true'>"
+        "<input type='hidden' name='csrf'><select name='scope'></select></form>",
+        "html.parser",
+    )
+    fields = extract_form_fields(soup)
+    assert [(f["name"], f["label"], f["section"]) for f in fields] == [
+        ("applicant", "Name", "Applicant"),
+        ("email", "Email", "Applicant"),
+        ("apn", "Parcel number", None),
+        ("scope", "Scope", None),
+    ]
+    assert fields[2]["required"] is True and fields[3]["type"] == "select"
@@ -0,0 +1,189 @@
+"""Tests for the Playwright portal engine: approval gating, pooled contexts, a full mock submission."""
+
+from pathlib import Path
+
+from urllib.parse import urljoin
+
+import httpx
+import pytest
+from bs4 import BeautifulSoup
+
+from permitting_agent.models import IntakeCase, IntakeRequest, ScopeKind, ScopeOfWork, SiteDetails
+from permitting_agent.portal_automation import BrowserPool, PlaywrightEngine, PortalAutomationService
+from permitting_agent.portal_automation.engine import (
+    DEFAULT_SELECTORS,
+    EngineError,
+    FlowSession,
+    StepResult,
+    chromium_available,
+)
+from permitting_agent.portal_automation.service import case_documents, default_steps
+from tests.mock_portal import MockPortal, MockPortalConfig
+
+needs_chromium = pytest.mark.skipif(not chromium_available(), reason="Chromium not installed (playwright install chromium)")
+
+LOGIN = ("permits@example.com", "s3cret")
+
+
+class FakeEngine:
+    """Records the steps it is asked to run instead of driving a browser."""
+
+    def __init__(self, fail_at: str | None = None):
+        self.fail_at = fail_at
+        self.ran: list[str] = []
+        self.sessions: list[dict] = []
+        self.closed = 0
+
+    def open_session(self, documents, credentials=None, **options):
+        self.sessions.append(dict(documents))
+        return FlowSession(None, None, dict(documents), credentials, "storage_state" in options)
+
+    def run_step(self, session, step):
+        if step["id"] == self.fail_at:
+            raise EngineError("selector not found")
+        self.ran.append(step["id"])
+        if step["id"] == "login" and session.restored:
+            return StepResult("login", "skipped", 0.0, "http://portal/", "saved session accepted")
+        detail = "Confirmation number: SUB-0001" if step["id"] == "submit" else None
+        return StepResult(step["id"], "done", 1.0, "http://portal/", detail)
+
+    def storage_state(self, session):
+        return {"cookies": [{"name": "portal_session", "value": "abc123", "expires": -1}], "origins": []}
+
+    def close_session(self, session) -> None:
+        self.closed += 1
+
+
+def test_submit_always_needs_approval() -> None:
+    """With approve_each_step off only submit is asked for, and declining it runs nothing past pay_fee."""
+    asked: list[str] = []
+
+    def decline_submit(name: str, step: dict) -> bool:
+        asked.append(step["id"])
+        return step["id"] != "submit"
+
+    engine = FakeEngine()
+    svc = PortalAutomationService(approve_each_step=False, approval_callback=decline_submit, engine=engine)
+    result = svc.run_flow("case1", portal_url="http://portal/apply")
+    assert asked == ["submit"]
+    assert result["status"] == "aborted" and result["aborted_at"] == "submit"
+    assert "submit" not in engine.ran
+    assert engine.closed == 1
+
+
+def test_engine_requires_approval_callback() -> None:
+    """A browser run without an approval callback is refused outright."""
+    with pytest.raises(ValueError):
+        PortalAutomationService(engine=FakeEngine())
+
+
+def test_step_failure_reports_step_and_closes_session() -> None:
+    """An engine error stops the flow at that step; the context is still given back."""
+    engine = FakeEngine(fail_at="upload_site_plan")
+    svc = PortalAutomationService(approval_callback=lambda name, step: True, engine=engine)
+    result = svc.run_flow("case1")
+    assert result["status"] == "failed"
+    assert result["failed_at"] == "upload_site_plan"
+    assert result["completed_steps"] == ["navigate", "login", "upload_application"]
+    assert engine.closed == 1
+
+
+def test_case_documents_mapped_by_name() -> None:
+    """The case's application form and site plan are picked out of its documents by file name."""
+    case = IntakeCase(
+        id="case1",
+        request=IntakeRequest(
+            jurisdiction="City of Sample",
+            site=SiteDetails(address="123 Main St", jurisdiction="City of Sample"),
+            scope=ScopeOfWork(kind=ScopeKind.SMALL_CELL),
+            existing_doc_paths=[Path("docs/SitePlan_rev2.pdf"), Path("docs/permit_application.pdf")],
+        ),
+    )
+    assert case_documents(case) == {
+        "site_plan": Path("docs/SitePlan_rev2.pdf"),
+        "application": Path("docs/permit_application.pdf"),
+    }
+    engine = FakeEngine()
+    PortalAutomationService(approval_callback=lambda name, step: True, engine=engine).run_flow("case1", case=case)
+    assert engine.sessions == [case_documents(case)]
+    assert engine.ran[-1] == "submit"
+
+
+def test_mock_portal_records_multipart_submission(upload_documents: dict[str, Path]) -> None:
+    """The mock portal's login and apply endpoints behave like a real portal (checked without a browser)."""
+    with MockPortal(MockPortalConfig(portal_login=LOGIN)) as portal:
+        with httpx.Client(base_url=portal.url) as client:
+            assert client.get("/portal/apply").status_code == 303
+            client.post("/portal/login", data={"username": LOGIN[0], "password": LOGIN[1]})
+            files = {name: (path.name, path.read_bytes(), "application/pdf") for name, path in (
+                ("application_pdf", upload_documents["application"]), ("site_plan", upload_documents["site_plan"]))}
+            response = client.post("/portal/apply", data={"site_address": "123 Main St", "fee_acknowledged": "on"}, files=files)
+        assert "SUB-0001" in response.text
+        assert portal.submissions[0]["application_pdf"]["filename"] == "application.pdf"
+
+
+def test_default_steps_match_mock_portal_pages(upload_documents: dict[str, Path]) -> None:
+    """Without a browser: every default step's selector finds its element on the mock portal's pages, and
+    posting what those elements would send (their names, the checkbox's own value) completes a submission.
+    """
+    steps = {s["id"]: s for s in default_steps()}
+    with MockPortal(MockPortalConfig(portal_login=LOGIN)) as portal:
+        with httpx.Client(base_url=portal.url, follow_redirects=True) as client:
+            page = client.get("/portal/apply")
+            soup = BeautifulSoup(page.text, "html.parser")
+            assert soup.select(DEFAULT_SELECTORS["password"]), "navigate should land on the login form"
+            form = soup.select_one(DEFAULT_SELECTORS["login_submit"]).find_parent("form")
+            user = soup.select_one(DEFAULT_SELECTORS["username"])["name"]
+            password = soup.select_one(DEFAULT_SELECTORS["password"])["name"]
+            page = client.post(urljoin(str(page.url), form["action"]), data={user: LOGIN[0], password: LOGIN[1]})
+
+            soup = BeautifulSoup(page.text, "html.parser")
+            assert not soup.select(DEFAULT_SELECTORS["password"]), "login should reach the application form"
+            files = {}
+            for step_id, document in (("upload_application", "application"), ("upload_site_plan", "site_plan")):
+                field = soup.select_one(steps[step_id]["selector"])
+                path = upload_documents[document]
+                files[field["name"]] = (path.name, path.read_bytes(), "application/pdf")
+            fee = soup.select_one(steps["pay_fee"]["selector"])
+            form = soup.select_one(steps["submit"]["selector"]).find_parent("form")
+            data = {"site_address": "123 Main St", fee["name"]: fee.get("value", "on")}
+            page = client.post(urljoin(str(page.url), form["action"]), data=data, files=files)
+
+        confirmation = BeautifulSoup(page.text, "html.parser").select_one(DEFAULT_SELECTORS["confirmation"])
+        assert confirmation.get_text(strip=True) == "Confirmation number: SUB-0001"
+        submission = portal.submissions[0]
+        assert submission["application_pdf"]["filename"] == "application.pdf"
+        assert submission["site_plan"]["filename"] == "site_plan.pdf"
+        assert submission["fee_acknowledged"] == "yes"
+
+
+@needs_chromium
+def test_browser_flow_submits_to_mock_portal(upload_documents: dict[str, Path]) -> None:
+    """A real Chromium run logs in, uploads both documents, acknowledges the fee and submits once approved."""
+    with MockPortal(MockPortalConfig(portal_login=LOGIN)) as portal, PlaywrightEngine(BrowserPool(size=2)) as engine:
+        svc = PortalAutomationService(approval_callback=lambda name, step: True, engine=engine, credentials=LOGIN)
+        result = svc.run_flow("case1", portal_url=portal.url + "/portal/apply", documents=upload_documents)
+        assert result["status"] == "completed", result
+        assert result["confirmation"] == "Confirmation number: SUB-0001"
+        submission = portal.submissions[0]
+        assert submission["application_pdf"]["filename"] == "application.pdf"
+        assert submission["site_plan"]["filename"] == "site_plan.pdf"
+        assert submission["fee_acknowledged"] == "yes"
+
+        second = svc.run_flow("case2", portal_url=portal.url + "/portal/apply", documents=upload_documents)
+        assert second["status"] == "completed"
+        # each flow had its own context: the second one had to log in again
+        assert portal.logins == 2
+        assert engine.pool.stats.launches == 1
+        assert engine.pool.stats.warm_hits >= 1
+
+
+@needs_chromium
+def test_browser_flow_without_credentials_needs_login(upload_documents: dict[str, Path]) -> None:
+    """A portal that asks for a login stops the flow before any upload when no credentials were supplied."""
+    with MockPortal(MockPortalConfig(portal_login=LOGIN)) as portal, PlaywrightEngine() as engine:
+        svc = PortalAutomationService(approval_callback=lambda name, step: True, engine=engine)
+        result = svc.run_flow("case1", portal_url=portal.url + "/portal/apply", documents=upload_documents)
+        assert result["status"] == "needs_login"
+        assert result["failed_at"] == "login"
+        assert portal.submissions == []
@@ -0,0 +1,145 @@
+"""Tests for the portal network policy: blocking, the static asset cache, per-step savings."""
+
+import time
+from pathlib import Path
+
+from permitting_agent.portal_automation import (
+    AssetCache,
+    BrowserPool,
+    NetworkPolicy,
+    PlaywrightEngine,
+    PortalAutomationService,
+)
+from permitting_agent.portal_automation.network import NetworkStats, sum_network
+from tests.mock_portal import MockPortal, MockPortalConfig
+from tests.test_portal_engine import needs_chromium
+
+
+class FakeRequest:
+    def __init__(self, url: str, resource_type: str, method: str = "GET"):
+        self.url, self.resource_type, self.method = url, resource_type, method
+
+
+class FakeResponse:
+    def __init__(self, body: bytes, headers: dict[str, str]):
+        self.status, self.headers, self._body = 200, headers, body
+
+    async def body(self) -> bytes:
+        return self._body
+
+
+class FakeRoute:
+    """Records what the policy did with one request."""
+
+    def __init__(self, fetched: list[str], url: str):
+        self.fetched, self.url, self.outcome = fetched, url, None
+
+    async def abort(self, reason: str) -> None:
+        self.outcome = "aborted"
+
+    async def continue_(self) -> None:
+        self.outcome = "continued"
+
+    async def fetch(self) -> FakeResponse:
+        self.fetched.append(self.url)
+        return FakeResponse(b"/* theme */" * 100, {"content-type": "text/css", "cache-control": "max-age=60"})
+
+    async def fulfill(self, **kwargs) -> None:
+        self.outcome = "cache" if "response" not in kwargs else "fetched"
+
+
+class FakeContext:
+    async def route(self, pattern: str, handler) -> None:
+        self.handler = handler
+
+
+async def _load(policy: NetworkPolicy, urls: list[tuple[str, str]], fetched: list[str]):
+    context = FakeContext()
+    stats = await policy.install(context)
+    outcomes = []
+    for url, kind in urls:
+        route = FakeRoute(fetched, url)
+        await context.handler(route, FakeRequest(url, kind))
+        outcomes.append(route.outcome)
+    return stats, outcomes
+
+
+PAGE = [
+    ("https://portal.example.gov/apply", "document"),
+    ("https://portal.example.gov/static/theme.css", "stylesheet"),
+    ("https://portal.example.gov/static/logo.png", "image"),
+    ("https://www.googletagmanager.com/gtag/js?id=G-1", "script"),
+    ("https://services.arcgisonline.com/tile/12/1583/655", "fetch"),
+]
+
+
+async def test_policy_blocks_and_caches_across_contexts(tmp_path: Path) -> None:
+    """Images, analytics and tiles never leave the browser; the stylesheet is fetched once and then served from disk."""
+    policy = NetworkPolicy(cache=AssetCache(tmp_path / "assets"))
+    fetched: list[str] = []
+    first, outcomes = await _load(policy, PAGE, fetched)
+    assert outcomes == ["continued", "fetched", "aborted", "aborted", "aborted"]
+    assert first.blocked_by_type == {"image": 1, "script": 1, "fetch": 1}
+
+    second, outcomes = await _load(policy, PAGE, fetched)
+    assert outcomes[1] == "cache"
+    assert fetched == ["https://portal.example.gov/static/theme.css"]
+    step = second.since(NetworkStats())
+    assert step["requests"] == 5 and step["blocked"] == 3
+    assert step["cache_hits"] == 1 and step["bytes_saved"] == 1100 and step["fetched_bytes"] == 0
+
+
+class FailingRoute(FakeRoute):
+    async def fetch(self) -> FakeResponse:
+        raise ConnectionResetError("connection reset by peer")
+
+
+async def test_policy_falls_back_when_cache_fill_fails(tmp_path: Path) -> None:
+    """A failed fetch for the cache hands the request back to the browser and caches nothing."""
+    policy = NetworkPolicy(cache=AssetCache(tmp_path / "assets"))
+    context = FakeContext()
+    stats = await policy.install(context)
+    route = FailingRoute([], PAGE[1][0])
+    await context.handler(route, FakeRequest(*PAGE[1]))
+    assert route.outcome == "continued"
+    assert stats.fetched == 0 and policy.cache.get(PAGE[1][0]) is None
+
+
+def test_asset_cache_respects_no_store_and_age(tmp_path: Path) -> None:
+    """Errors and no-store/private responses aren't kept; entries expire after max_age."""
+    cache = AssetCache(tmp_path, max_age_s=60)
+    assert not cache.put("https://a/x.js", 200, {"cache-control": "no-store"}, b"x", 5.0)
+    assert not cache.put("https://a/y.js", 404, {}, b"x", 5.0)
+    assert cache.put("https://a/z.js", 200, {"content-type": "application/javascript", "set-cookie": "s=1"}, b"z", 5.0)
+    meta, body = cache.get("https://a/z.js")
+    assert body == b"z" and meta["headers"] == {"content-type": "application/javascript"}
+    assert cache.get("https://a/x.js") is None
+    assert cache.get("https://a/z.js", now=time.time() + 61) is None
+
+
+def test_sum_network() -> None:
+    """Per-step savings add up to flow totals."""
+    steps = [
+        {"requests": 5, "blocked": 3, "blocked_by_type": {"image": 3}, "cache_hits": 0, "bytes_saved": 0, "ms_saved": 0.0, "fetched_bytes": 900},
+        {"requests": 4, "blocked": 2, "blocked_by_type": {"image": 1, "font": 1}, "cache_hits": 2, "bytes_saved": 900, "ms_saved": 12.25, "fetched_bytes": 0},
+    ]
+    total = sum_network(steps)
+    assert total["blocked"] == 5 and total["blocked_by_type"] == {"image": 4, "font": 1}
+    assert total["bytes_saved"] == 900 and total["ms_saved"] == 12.2
+
+
+@needs_chromium
+def test_browser_flow_skips_heavy_assets(tmp_path: Path, upload_documents: dict[str, Path]) -> None:
+    """Against an asset-heavy mock portal no image, tile or analytics request reaches the server, and theme files are fetched once."""
+    config = MockPortalConfig(portal_assets=8, asset_bytes=32 * 1024)
+    policy = NetworkPolicy(cache=AssetCache(tmp_path / "assets"))
+    with MockPortal(config) as portal, PlaywrightEngine(BrowserPool(size=1), network=policy) as engine:
+        svc = PortalAutomationService(approval_callback=lambda name, step: True, engine=engine)
+        for case_id in ("case1", "case2"):
+            result = svc.run_flow(case_id, portal_url=portal.url + "/portal/apply", documents=upload_documents)
+            assert result["status"] == "completed", result
+        assert set(portal.asset_requests) == {"/static/portal.css", "/static/portal.js"}
+        assert all(n == 1 for n in portal.asset_requests.values())
+        assert result["network"]["cache_hits"] >= 2
+        assert result["network"]["blocked_by_type"]["image"] >= 8
+        assert result["steps"][0]["network"]["bytes_saved"] >= 64 * 1024
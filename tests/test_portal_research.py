@@ -42,6 +42,14 @@ def test_portal_research_service_unknown() -> None:
     assert "uncertain" in (result.raw_notes or "").lower() or result.raw_notes is not None
 
 
+def test_research_and_save_names_file_after_input(tmp_path: Path) -> None:
+    """The default output file is named after the jurisdiction as the caller wrote it."""
+    svc = PortalResearchService(output_dir=tmp_path)
+    result = svc.research_and_save("Sample City")
+    assert result.jurisdiction == "City of Sample"
+    assert (tmp_path / "portal_research" / "Sample_City.json").exists()
+
+
 def test_save_sources(tmp_path: Path) -> None:
     """save_sources writes JSONL of ResearchSource for audit."""
     from datetime import datetime
@@ -0,0 +1,189 @@
+"""Tests for persisted portal runs: suspend at each approval, resume in another worker, the web API."""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from permitting_agent.models import IntakeCase, IntakeRequest, RunStatus, ScopeKind, ScopeOfWork, SiteDetails
+from permitting_agent.portal_automation import PortalRunner, RunStore, TimingStore
+from permitting_agent.portal_automation.runs import RunStateError
+from tests.test_portal_engine import FakeEngine
+
+PORTAL = "https://a.example.gov/apply"
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> RunStore:
+    s = RunStore(tmp_path / "portal_runs.db")
+    yield s
+    s.close()
+
+
+def test_run_suspends_and_resumes_on_other_workers(store: RunStore) -> None:
+    """Each approval suspends the run; a fresh runner picks it up and redoes completed steps unasked."""
+    run = PortalRunner(store).start("case1", portal_url=PORTAL, documents={"application": Path("app.pdf")})
+    engines = []
+    for step in ["navigate", "login", "upload_application", "upload_site_plan", "pay_fee", "submit"]:
+        engine = FakeEngine()
+        engines.append(engine)
+        run = PortalRunner(store, engine=engine).advance()
+        assert run.status is RunStatus.AWAITING_APPROVAL and run.pending_step == step
+        store.decide(run.id, step, True, actor="reviewer")
+
+    engine = FakeEngine()
+    run = PortalRunner(store, engine=engine).advance()
+    assert run.status is RunStatus.COMPLETED
+    assert run.confirmation == "Confirmation number: SUB-0001"
+    assert engine.ran == ["navigate", "login", "upload_application", "upload_site_plan", "pay_fee", "submit"]
+    assert engines[0].ran == []  # the first suspension happened before any browser work
+    assert engines[3].ran == ["navigate", "login", "upload_application"]
+    assert [d.actor for d in run.decisions] == ["reviewer"] * 6
+    assert PortalRunner(store).advance() is None
+
+
+def test_resumed_run_is_timed_as_one_flow(store: RunStore, tmp_path: Path) -> None:
+    """Every segment of a run adds to one flow under the run's id; approval waits span suspension to decision."""
+    timings = TimingStore(tmp_path / "portal_timings.db")
+    run = PortalRunner(store).start("case1", portal_url=PORTAL, documents={"application": Path("app.pdf")})
+    while run.status is not RunStatus.COMPLETED:
+        run = PortalRunner(store, engine=FakeEngine(), timing_store=timings).advance()
+        if run.status is RunStatus.AWAITING_APPROVAL:
+            time.sleep(0.02)
+            store.decide(run.id, run.pending_step, True)
+    [flow] = timings.flows()
+    assert (flow["run_id"], flow["status"]) == (run.id, "completed")
+    assert flow["approval_ms"] >= 6 * 20
+    steps = {s["step"]: s for s in timings.step_summary()}
+    assert all(s["count"] == 1 and s["approval_p50_ms"] >= 20 for s in steps.values())
+    timings.close()
+
+
+def test_wrong_step_conflicts_and_reject_ends_run(store: RunStore) -> None:
+    """Only the pending step can be decided, once; a rejection ends the run without running it."""
+    runner = PortalRunner(store, engine=FakeEngine())
+    run = runner.start("case1", portal_url=PORTAL, approve_each_step=False)
+    run = runner.advance(run.id)
+    assert run.pending_step == "submit"
+    assert run.completed_steps == ["navigate", "login", "upload_application", "upload_site_plan", "pay_fee"]
+    with pytest.raises(RunStateError):
+        store.decide(run.id, "pay_fee", True)
+    run = store.decide(run.id, "submit", False)
+    assert run.status is RunStatus.REJECTED
+    with pytest.raises(RunStateError):
+        store.decide(run.id, "submit", True)
+    with pytest.raises(KeyError):
+        store.decide("missing", "submit", True)
+    assert runner.advance(run.id) is None
+
+
+def test_lost_worker_recovery(tmp_path: Path) -> None:
+    """Expired leases: a running run is ready again, one caught mid-submit becomes unknown."""
+    store = RunStore(tmp_path / "portal_runs.db", lease_s=0.0)
+    runner = PortalRunner(store)
+    running = runner.start("case1", portal_url=PORTAL)
+    submitting = runner.start("case2", portal_url=PORTAL)
+    store.claim(running.id)
+    run, token = store.claim(submitting.id)
+    run.status = RunStatus.SUBMITTING
+    store.save(run, token)
+    assert store.recover(now=time.time() + 1) == 2
+    assert store.get(running.id).status is RunStatus.READY
+    assert store.get(submitting.id).status is RunStatus.UNKNOWN
+    with pytest.raises(RunStateError):
+        store.save(run, token)  # the lost worker can no longer write
+    assert store.retry(submitting.id).status is RunStatus.READY
+    store.close()
+
+
+def test_failed_submit_is_unknown(store: RunStore) -> None:
+    """An error during the final submit may have reached the portal, so the run is unknown, not failed."""
+    runner = PortalRunner(store, engine=FakeEngine(fail_at="submit"))
+    run = runner.advance(runner.start("case1", portal_url=PORTAL, approve_each_step=False).id)
+    store.decide(run.id, "submit", True)
+    run = runner.advance(run.id)
+    assert run.status is RunStatus.UNKNOWN
+    assert run.error == "selector not found"
+
+
+def test_retried_unknown_run_asks_again_before_submit(tmp_path: Path) -> None:
+    """A worker lost mid-submit used up the submit approval: recover -> retry -> advance waits for a new one."""
+    store = RunStore(tmp_path / "portal_runs.db", lease_s=0.0)
+    runner = PortalRunner(store, engine=FakeEngine())
+    run = runner.advance(runner.start("case1", portal_url=PORTAL, approve_each_step=False).id)
+    store.decide(run.id, "submit", True)
+    run, token = store.claim(run.id)
+    run.status = RunStatus.SUBMITTING  # the worker clicked submit and vanished
+    store.save(run, token)
+    assert store.recover(now=time.time() + 1) == 1
+    assert store.get(run.id).pending_step is None
+    store.retry(run.id)
+    engine = FakeEngine()
+    run = PortalRunner(store, engine=engine).advance(run.id)
+    assert (run.status, run.pending_step) == (RunStatus.AWAITING_APPROVAL, "submit")
+    assert "submit" not in engine.ran
+    store.close()
+
+
+def test_browser_error_clears_the_pending_approval(store: RunStore) -> None:
+    """A run that failed outside a step doesn't keep the approval of the step it was on."""
+    class BrokenEngine(FakeEngine):
+        def open_session(self, *args, **kwargs):
+            raise RuntimeError("browser crashed")
+
+    runner = PortalRunner(store, engine=FakeEngine())
+    run = runner.advance(runner.start("case1", portal_url=PORTAL, approve_each_step=False).id)
+    store.decide(run.id, "submit", True)
+    run = PortalRunner(store, engine=BrokenEngine()).advance(run.id)
+    assert (run.status, run.pending_step) == (RunStatus.FAILED, None)
+
+
+@pytest.fixture
+def client(tmp_data_dir: Path, monkeypatch: pytest.MonkeyPatch):
+    import app as web
+
+    monkeypatch.setenv("DATA_DIR", str(tmp_data_dir))
+    monkeypatch.setattr(web, "_intake_services", {})
+    monkeypatch.setattr(web, "_portal_runners", {})
+    web._intake_service().save_cases(
+        [
+            IntakeCase(
+                id="c001",
+                request=IntakeRequest(
+                    jurisdiction="City of Sample",
+                    site=SiteDetails(address="1 Main St", jurisdiction="City of Sample"),
+                    scope=ScopeOfWork(kind=ScopeKind.SMALL_CELL),
+                ),
+            )
+        ]
+    )
+    yield web.app.test_client()
+    for runner in web._portal_runners.values():
+        runner.store.close()
+
+
+def test_api_approval_cycle(client) -> None:
+    """The API creates runs and records decisions without executing anything; a worker advances them."""
+    import app as web
+
+    resp = client.post("/api/portal-runs", json={"case_id": "c001", "portal_url": PORTAL, "approve_each_step": False})
+    assert resp.status_code == 201
+    run_id = resp.get_json()["id"]
+    assert resp.get_json()["status"] == "ready"
+    assert client.post("/api/portal-runs", json={"case_id": "nope"}).status_code == 404
+
+    web._portal_runner().advance(run_id)
+    waiting = client.get("/api/portal-runs?status=awaiting_approval").get_json()
+    assert [r["pending_step"] for r in waiting["runs"]] == ["submit"]
+    assert client.post(f"/api/portal-runs/{run_id}/approve", json={"step": "pay_fee"}).status_code == 409
+    resp = client.post(f"/api/portal-runs/{run_id}/approve", json={"step": "submit", "actor": "pat"})
+    assert resp.status_code == 200 and resp.get_json()["status"] == "ready"
+    assert client.get("/api/portal-runs?status=bogus").status_code == 400
+    for limit in ("-1", "0", "501", "ten"):
+        assert client.get(f"/api/portal-runs?limit={limit}").status_code == 400, limit
+    assert client.get("/api/portal-runs?limit=500").status_code == 200
+
+    web._portal_runner().advance(run_id)
+    assert client.get(f"/api/portal-runs/{run_id}").get_json()["status"] == "completed"
+    history = web._intake_service().case_history("c001")
+    assert history[-1].kind.value == "submission_step_approved" and history[-1].actor == "pat"
@@ -0,0 +1,77 @@
+"""Tests for saved portal logins: encryption at rest, expiry, reuse across flows."""
+
+import time
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("cryptography")
+
+from cryptography.fernet import Fernet
+
+from permitting_agent.portal_automation import BrowserPool, PlaywrightEngine, PortalAutomationService, SessionStore
+from tests.mock_portal import MockPortal, MockPortalConfig
+from tests.test_portal_engine import LOGIN, FakeEngine, needs_chromium
+
+STATE = {"cookies": [{"name": "portal_session", "value": "tok-9f2c", "domain": "portal.example.gov", "expires": -1}], "origins": []}
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> SessionStore:
+    return SessionStore(tmp_path, key=Fernet.generate_key())
+
+
+def test_state_encrypted_and_scoped(store: SessionStore, tmp_path: Path) -> None:
+    """Saved state is unreadable on disk and keyed by portal host and username."""
+    path = store.save("https://portal.example.gov/apply", "Permits@Example.com", STATE)
+    assert b"tok-9f2c" not in path.read_bytes()
+    assert store.load("https://portal.example.gov/other/page", "permits@example.com") == STATE
+    assert store.load("https://other.example.gov/apply", "permits@example.com") is None
+    assert store.load("https://portal.example.gov/apply", "someone@example.com") is None
+    assert SessionStore(tmp_path, key=Fernet.generate_key()).load("https://portal.example.gov/", "permits@example.com") is None
+    with pytest.raises(ValueError):
+        SessionStore(tmp_path, key="")
+
+
+def test_state_expires_with_cookie_or_max_age(tmp_path: Path) -> None:
+    """A state is dropped once its earliest persistent cookie expires, and never outlives max_age."""
+    store = SessionStore(tmp_path, key=Fernet.generate_key(), max_age_s=3600)
+    now = time.time()
+    cookie = {"name": "auth", "value": "x", "expires": now + 600}
+    store.save("https://a.example.gov/", "u", {"cookies": [cookie], "origins": []}, now=now)
+    assert store.load("https://a.example.gov/", "u", now=now + 300) is not None
+    assert store.load("https://a.example.gov/", "u", now=now + 700) is None
+    store.save("https://a.example.gov/", "u", STATE, now=now)
+    assert store.load("https://a.example.gov/", "u", now=now + 3599) is not None
+    assert store.load("https://a.example.gov/", "u", now=now + 3601) is None
+
+
+def test_second_flow_reuses_login(store: SessionStore) -> None:
+    """The login saved by the first flow is handed to the next one, which skips logging in."""
+    engine = FakeEngine()
+    svc = PortalAutomationService(approval_callback=lambda name, step: True, engine=engine, credentials=LOGIN, session_store=store)
+    first = svc.run_flow("case1", portal_url="https://portal.example.gov/apply")
+    second = svc.run_flow("case2", portal_url="https://portal.example.gov/apply")
+    assert first["session_reused"] is False
+    assert second["session_reused"] is True
+    assert second["steps"][1]["detail"] == "saved session accepted"
+
+
+def test_failed_login_forgets_saved_state(store: SessionStore) -> None:
+    """A saved state that ends in a rejected login is removed so the next flow starts clean."""
+    store.save("https://portal.example.gov/apply", LOGIN[0], STATE)
+    svc = PortalAutomationService(approval_callback=lambda name, step: True, engine=FakeEngine(fail_at="login"), credentials=LOGIN, session_store=store)
+    assert svc.run_flow("case1", portal_url="https://portal.example.gov/apply")["status"] == "failed"
+    assert store.load("https://portal.example.gov/apply", LOGIN[0]) is None
+
+
+@needs_chromium
+def test_browser_reuses_saved_login(store: SessionStore, upload_documents: dict[str, Path]) -> None:
+    """Against the mock portal only the first of three flows logs in."""
+    with MockPortal(MockPortalConfig(portal_login=LOGIN)) as portal, PlaywrightEngine(BrowserPool(size=1)) as engine:
+        svc = PortalAutomationService(approval_callback=lambda name, step: True, engine=engine, credentials=LOGIN, session_store=store)
+        results = [svc.run_flow(f"case{i}", portal_url=portal.url + "/portal/apply", documents=upload_documents) for i in range(3)]
+        assert [r["status"] for r in results] == ["completed"] * 3
+        assert [r["session_reused"] for r in results] == [False, True, True]
+        assert portal.logins == 1
+        assert len(portal.submissions) == 3
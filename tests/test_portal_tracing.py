@@ -0,0 +1,140 @@
+"""Tests for portal flow timing spans, the per-portal timing store and artifact capture."""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from permitting_agent.portal_automation import (
+    BrowserPool,
+    CaptureOptions,
+    PlaywrightEngine,
+    PortalAutomationService,
+    TimingStore,
+)
+from permitting_agent.portal_automation.tracing import percentile
+from tests.mock_portal import MockPortal
+from tests.test_portal_engine import FakeEngine, needs_chromium
+
+
+class SlowEngine(FakeEngine):
+    """A FakeEngine whose uploads take ``upload_s``."""
+
+    def __init__(self, upload_s: float, **kwargs):
+        super().__init__(**kwargs)
+        self.upload_s = upload_s
+        self.options: list[dict] = []
+
+    def open_session(self, documents, credentials=None, **options):
+        self.options.append(options)
+        return super().open_session(documents, credentials, **options)
+
+    def run_step(self, session, step):
+        if step["action"] == "upload":
+            time.sleep(self.upload_s)
+        return super().run_step(session, step)
+
+
+@pytest.fixture
+def timings(tmp_path: Path) -> TimingStore:
+    store = TimingStore(tmp_path / "portal_timings.db")
+    yield store
+    store.close()
+
+
+def test_spans_separate_approval_wait_from_step_time() -> None:
+    """A slow reviewer shows up in approval_ms, a slow portal in run_ms, never the other way round."""
+
+    def slow_reviewer(name: str, step: dict) -> bool:
+        if step["id"] == "pay_fee":
+            time.sleep(0.05)
+        return True
+
+    svc = PortalAutomationService(approval_callback=slow_reviewer, engine=SlowEngine(upload_s=0.03))
+    result = svc.run_flow("case1", portal_url="https://a.example.gov/apply")
+    spans = {s["step"]: s for s in result["timings"]}
+    assert list(spans) == ["navigate", "login", "upload_application", "upload_site_plan", "pay_fee", "submit"]
+    assert spans["pay_fee"]["approval_ms"] >= 50 and spans["pay_fee"]["run_ms"] < 30
+    assert spans["upload_site_plan"]["run_ms"] >= 30 and spans["upload_site_plan"]["approval_ms"] < 30
+    timing = result["timing"]
+    assert timing["approval_ms"] >= 50 and timing["run_ms"] >= 60
+    assert timing["total_ms"] >= timing["setup_ms"] + timing["run_ms"] + timing["approval_ms"] - 1
+
+
+def test_declined_and_failed_steps_are_timed(timings: TimingStore) -> None:
+    """Flows that stop early still record their spans, with the stopping step's status."""
+    svc = PortalAutomationService(
+        approval_callback=lambda name, step: step["id"] != "submit", engine=FakeEngine(), timing_store=timings
+    )
+    aborted = svc.run_flow("case1", portal_url="https://a.example.gov/apply")
+    last = aborted["timings"][-1]
+    assert (last["step"], last["status"], last["run_ms"]) == ("submit", "declined", 0.0)
+
+    svc = PortalAutomationService(
+        approval_callback=lambda name, step: True, engine=FakeEngine(fail_at="pay_fee"), timing_store=timings
+    )
+    failed = svc.run_flow("case2", portal_url="https://a.example.gov/apply")
+    assert failed["timings"][-1]["step"] == "pay_fee" and failed["timings"][-1]["status"] == "failed"
+    [portal] = timings.portal_summary()
+    assert portal["portal"] == "https://a.example.gov"
+    assert portal["flows"] == 2 and portal["failed"] == 1
+
+
+def test_summaries_rank_portals_and_steps(timings: TimingStore) -> None:
+    """The slow portal comes first, and its slow step is visible per step; replays are not counted twice."""
+    approve = lambda name, step: True  # noqa: E731
+    for engine, url in ((SlowEngine(0.02), "https://slow.example.gov/apply"), (FakeEngine(), "https://fast.example.gov/apply")):
+        svc = PortalAutomationService(approval_callback=approve, engine=engine, timing_store=timings)
+        for i in range(3):
+            svc.run_flow(f"case{i}", portal_url=url)
+    svc.run_flow("case9", portal_url="https://fast.example.gov/apply", resume_after=["navigate", "login"])
+
+    ranked = timings.portal_summary()
+    assert [p["portal"] for p in ranked] == ["https://slow.example.gov", "https://fast.example.gov"]
+    assert ranked[0]["p50_ms"] >= 40
+    steps = {s["step"]: s for s in timings.step_summary(portal="https://slow.example.gov")}
+    assert steps["upload_application"]["p50_ms"] >= 20 and steps["navigate"]["p50_ms"] < 20
+    fast = {s["step"]: s["count"] for s in timings.step_summary(portal="https://fast.example.gov")}
+    assert fast["navigate"] == 3 and fast["submit"] == 4
+    assert timings.portal_summary(since=time.time() + 60) == []
+
+
+def test_capture_options_reach_the_engine(tmp_path: Path) -> None:
+    """Capture asks the engine for a per-run artifacts directory; without capture nothing is passed."""
+    engine = SlowEngine(0.0)
+    svc = PortalAutomationService(
+        approval_callback=lambda name, step: True,
+        engine=engine,
+        artifacts_dir=tmp_path / "artifacts",
+        capture=CaptureOptions(screenshots=True),
+    )
+    result = svc.run_flow("case1")
+    assert engine.options[0]["artifacts_dir"] == tmp_path / "artifacts" / result["run_id"]
+    assert result["artifacts"] == str(tmp_path / "artifacts" / result["run_id"])
+    svc.capture = CaptureOptions()
+    assert "artifacts" not in svc.run_flow("case2") and engine.options[1] == {}
+
+
+def test_percentile() -> None:
+    """Nearest rank: p50 of 1..10 is 5, p95 is 10."""
+    assert percentile(list(range(10, 0, -1)), 50) == 5
+    assert percentile(list(range(1, 11)), 95) == 10
+    assert percentile([], 50) == 0.0
+
+
+@needs_chromium
+def test_browser_flow_writes_artifacts(tmp_path: Path, upload_documents: dict[str, Path]) -> None:
+    """A captured browser run leaves a trace, a HAR and one screenshot per executed step."""
+    with MockPortal() as portal, PlaywrightEngine(BrowserPool(size=1)) as engine:
+        svc = PortalAutomationService(
+            approval_callback=lambda name, step: True,
+            engine=engine,
+            artifacts_dir=tmp_path,
+            capture=CaptureOptions(trace=True, screenshots=True, har=True),
+        )
+        result = svc.run_flow("case1", portal_url=portal.url + "/portal/apply", documents=upload_documents)
+    assert result["status"] == "completed", result
+    out = Path(result["artifacts"])
+    assert (out / "trace.zip").stat().st_size > 0
+    assert (out / "network.har").stat().st_size > 0
+    assert sorted(p.stem for p in out.glob("*.png")) == sorted(s["step"] for s in result["timings"])
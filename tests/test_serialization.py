@@ -0,0 +1,70 @@
+"""Tests for the shared serialization module."""
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from permitting_agent import serialization
+from permitting_agent.models import IntakeCase, IntakeRequest, ResearchSource, SiteDetails
+from permitting_agent.serialization import (
+    dump_json,
+    dumps,
+    load_json,
+    load_json_lines,
+    read_model,
+    write_json_lines,
+    write_model,
+)
+
+
+def _case() -> IntakeCase:
+    return IntakeCase(
+        id="abc",
+        request=IntakeRequest(
+            jurisdiction="City of Sample",
+            site=SiteDetails(address="1 Main St", jurisdiction="City of Sample"),
+            existing_doc_paths=[Path("/docs/plan.pdf")],
+        ),
+    )
+
+
+def test_model_round_trip_with_paths() -> None:
+    """Path and datetime fields survive bytes -> model without manual patching."""
+    case = _case()
+    data = dump_json(case)
+    assert isinstance(data, bytes)
+    loaded = load_json(IntakeCase, data)
+    assert loaded == case
+    assert loaded.request.existing_doc_paths == [Path("/docs/plan.pdf")]
+
+
+def test_compact_mode(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Artifacts are indented by default and compact with PERMITTING_COMPACT_JSON=1; explicit pretty wins."""
+    case = _case()
+    assert b"\n  " in dump_json(case)
+    monkeypatch.setenv(serialization.COMPACT_ENV, "1")
+    assert b"\n" not in dump_json(case)
+    assert b"\n  " in dump_json(case, pretty=True)
+    path = write_model(tmp_path / "out" / "case.json", case)
+    assert b"\n" not in path.read_bytes()
+    assert read_model(path, IntakeCase) == case
+    assert not list(path.parent.glob("*.tmp"))
+
+
+def test_dumps_values_with_models() -> None:
+    """dumps handles dicts containing models, datetimes and Paths."""
+    payload = {"case": _case(), "when": datetime(2025, 1, 2, 3, 4, 5), "path": Path("/x")}
+    decoded = json.loads(dumps(payload, pretty=False))
+    assert decoded["case"]["id"] == "abc"
+    assert decoded["when"] == "2025-01-02T03:04:05"
+    assert decoded["path"] == "/x"
+
+
+def test_json_lines(tmp_path: Path) -> None:
+    """Sources audit files are one compact model per line."""
+    sources = [ResearchSource(url=f"https://example.gov/{i}", fetched_at=datetime(2025, 1, 1)) for i in range(3)]
+    path = write_json_lines(tmp_path / "sources.jsonl", sources)
+    assert len(path.read_bytes().splitlines()) == 3
+    assert load_json_lines(ResearchSource, path.read_bytes()) == sources
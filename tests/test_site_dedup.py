@@ -0,0 +1,84 @@
+"""Tests for site deduplication: geohash buckets and normalized address keys."""
+
+from pathlib import Path
+
+import pytest
+
+from permitting_agent.geo import geohash
+from permitting_agent.intake import IntakeService, SiteIndex, normalize_address
+from permitting_agent.models import IntakeRequest, SiteDetails
+
+
+def _request(address: str, lat: float | None = None, lon: float | None = None) -> IntakeRequest:
+    site = SiteDetails(address=address, jurisdiction="City of Sample", lat=lat, lon=lon)
+    return IntakeRequest(jurisdiction="City of Sample", site=site)
+
+
+def test_geohash_encode_and_neighbors() -> None:
+    """Known geohash vector; neighbors are the 3x3 block, wrapping at the antimeridian."""
+    assert geohash.encode(57.64911, 10.40744, 11) == "u4pruydqqvj"
+    assert sorted(geohash.neighbors("u4pruyd")) == sorted(
+        ["u4pruyd", "u4pruyf", "u4pruy9", "u4pruye", "u4pruy6", "u4pruy3", "u4pruyc", "u4pruyg", "u4pruy7"]
+    )
+    east = geohash.encode(0.0, 179.9999, 5)
+    assert geohash.encode(0.0, -179.9999, 5) in geohash.neighbors(east)
+    assert geohash.haversine_m(34.0, -118.0, 34.0001, -118.0) == pytest.approx(11.1, abs=0.1)
+
+
+def test_normalize_address() -> None:
+    """Case, punctuation and suffix/directional spellings don't change the key."""
+    assert normalize_address("123 North Main Street, Suite #4") == normalize_address("123 N. main st ste # 4")
+    assert normalize_address("123 Main Street") != normalize_address("125 Main Street")
+
+
+def test_create_case_flags_duplicates(intake_service: IntakeService) -> None:
+    """Same pole a few meters off, or re-spelled address, is flagged; 100 m away is not."""
+    first = intake_service.create_case(_request("100 Oak Avenue", 34.0100, -118.2900))
+    assert "possible_duplicates" not in first.meta
+    near = intake_service.create_case(_request("Pole at Oak & 1st", 34.01003, -118.29002))
+    assert near.meta["possible_duplicates"] == [
+        {"case_id": first.id, "reason": "location", "distance_m": pytest.approx(3.8, abs=0.2)}
+    ]
+    respelled = intake_service.create_case(_request("100 oak ave."))
+    assert respelled.meta["possible_duplicates"] == [{"case_id": first.id, "reason": "address", "distance_m": None}]
+    far = intake_service.create_case(_request("200 Oak Avenue", 34.0109, -118.2900))
+    assert "possible_duplicates" not in far.meta
+    both = intake_service.create_case(_request("100 Oak Ave", 34.0100, -118.2900))
+    reasons = {d["case_id"]: d["reason"] for d in both.meta["possible_duplicates"]}
+    assert reasons[first.id] == "location_and_address" and reasons[respelled.id] == "address"
+    assert intake_service.get_case(both.id).meta["possible_duplicates"]
+
+
+def test_build_case_is_read_only(intake_service: IntakeService) -> None:
+    """Building a case doesn't index its site; it is indexed once the case is saved."""
+    built = intake_service.build_case(_request("100 Oak Avenue", 34.0100, -118.2900))
+    assert len(intake_service.site_index) == 0
+    again = intake_service.build_case(_request("100 Oak Avenue", 34.0100, -118.2900))
+    assert "possible_duplicates" not in again.meta
+    paired = intake_service.build_case(_request("100 Oak Avenue", 34.0100, -118.2900), pending=[built])
+    assert [d["case_id"] for d in paired.meta["possible_duplicates"]] == [built.id]
+    intake_service.save_cases([built])
+    assert len(intake_service.site_index) == 1
+    later = intake_service.build_case(_request("100 oak ave."))
+    assert [d["case_id"] for d in later.meta["possible_duplicates"]] == [built.id]
+
+
+def test_address_key_uses_the_registered_jurisdiction(tmp_path: Path) -> None:
+    """Two spellings of one jurisdiction share an address scope; unregistered names keep their own."""
+    index = SiteIndex(tmp_path / "sites.db")
+    index.add("a", SiteDetails(address="123 Main Street", jurisdiction="City of Sample"))
+    respelled = SiteDetails(address="123 Main St.", jurisdiction="Sample City")
+    assert [(d.case_id, d.reason) for d in index.find(respelled)] == [("a", "address")]
+    assert index.find(SiteDetails(address="123 Main St", jurisdiction="Town of Elsewhere")) == []
+    index.close()
+
+
+def test_site_index_rebuild(tmp_path: Path, intake_service: IntakeService) -> None:
+    """rebuild() indexes existing cases so they are found by later checks."""
+    case = intake_service.create_case(_request("1 Elm St", 34.02, -118.25))
+    index = SiteIndex(tmp_path / "fresh.db")
+    assert index.find(case.request.site) == []
+    assert index.rebuild(intake_service.store.iter_cases()) == 1
+    assert [d.case_id for d in index.find(case.request.site)] == [case.id]
+    assert index.find(case.request.site, exclude=case.id) == []
+    index.close()